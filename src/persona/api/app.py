@@ -13,9 +13,15 @@ from persona import __version__
 from persona.api.config import APIConfig
 from persona.api.middleware.logging import LoggingMiddleware
 from persona.api.middleware.rate_limit import RateLimitMiddleware
-from persona.api.routes import generate_router, health_router, webhooks_router
+from persona.api.routes import (
+    generate_router,
+    health_router,
+    metrics_router,
+    webhooks_router,
+)
 from persona.api.services.generation import GenerationService
 from persona.api.services.webhook import WebhookManager
+from persona.core.logging.tracing import Tracer, get_tracer, set_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +63,10 @@ def create_app(config: APIConfig | None = None) -> FastAPI:
     app.state.generation_service = generation_service
     app.state.webhook_manager = webhook_manager
 
+    # Record span timings unless a tracer is already installed
+    if config.metrics_enabled and not get_tracer().enabled:
+        set_tracer(Tracer())
+
     # Add middleware
     if config.cors_enabled:
         app.add_middleware(
@@ -75,6 +85,8 @@ def create_app(config: APIConfig | None = None) -> FastAPI:
     app.include_router(health_router)
     app.include_router(generate_router)
     app.include_router(webhooks_router)
+    if config.metrics_enabled:
+        app.include_router(metrics_router)
 
     # Root endpoint
     @app.get("/")
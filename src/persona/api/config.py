@@ -69,6 +69,11 @@ class APIConfig(BaseSettings):
         default=1.0, ge=0.1, description="Initial retry delay (seconds)"
     )
 
+    # Metrics
+    metrics_enabled: bool = Field(
+        default=True, description="Record span timings and serve /metrics"
+    )
+
     class Config:
         """Pydantic configuration."""
 
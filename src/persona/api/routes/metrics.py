@@ -0,0 +1,43 @@
+"""
+Metrics endpoint.
+
+This module exposes span timings recorded by the process-wide tracer
+and the adaptive provider concurrency limits.
+"""
+
+from typing import Any, Literal
+
+from fastapi import APIRouter, Query
+from fastapi.responses import PlainTextResponse
+
+from persona.core.logging.tracing import get_tracer
+from persona.core.security.adaptive import get_rate_controller
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_model=None)
+async def metrics(
+    format: Literal["prometheus", "json"] = Query(
+        default="prometheus", description="Response format"
+    ),
+) -> PlainTextResponse | dict[str, Any]:
+    """
+    Metrics endpoint.
+
+    Returns per-span counts and timings (load, render, provider call,
+    parse, scoring and persistence) and the adaptive in-flight limit for
+    each provider, model and key, in Prometheus text format, or as JSON
+    with ?format=json.
+
+    Returns:
+        Prometheus exposition text or a JSON summary.
+    """
+    summary = get_tracer().summary
+    controller = get_rate_controller()
+    if format == "json":
+        return {**summary.to_dict(), "rate_limits": controller.get_status()}
+    return PlainTextResponse(
+        summary.to_prometheus() + controller.to_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
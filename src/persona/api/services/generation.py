@@ -216,6 +216,7 @@ class GenerationService:
             job.completed_at = datetime.now()
             job.result = {
                 "personas": [p.model_dump() for p in result.personas],
+                "truncated": result.truncated,
                 "metadata": result.metadata,
             }
 
@@ -6,6 +6,10 @@ Provides context budget management and warnings for LLM interactions.
 
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from persona.core.data.loader import LoadResult
 
 
 class WarningLevel(Enum):
@@ -211,6 +215,35 @@ class ContextManager:
             reserved_output_tokens=reserved,
         )
 
+    def calculate_load_budget(
+        self,
+        model: str,
+        load_result: "LoadResult",
+        system_tokens: int = 0,
+        output_reservation: int | None = None,
+    ) -> ContextBudget:
+        """
+        Calculate context budget for loaded data.
+
+        Uses the token counts computed while loading rather than
+        encoding the combined content again.
+
+        Args:
+            model: Model identifier.
+            load_result: Result of DataLoader.load_path_parallel().
+            system_tokens: Tokens used by system prompt.
+            output_reservation: Tokens reserved for output.
+
+        Returns:
+            ContextBudget instance.
+        """
+        return self.calculate_budget(
+            model,
+            system_tokens=system_tokens,
+            input_tokens=load_result.total_tokens,
+            output_reservation=output_reservation,
+        )
+
     def check_warning(
         self,
         budget: ContextBudget,
@@ -5,6 +5,8 @@ This module provides the BatchProcessor class for processing
 multiple files and generating personas in batch operations.
 """
 
+import json
+import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,11 +14,14 @@ from pathlib import Path
 from typing import Any
 
 from persona.core.data import DataLoader
+from persona.core.data.manifest import FileManifest
 from persona.core.generation import (
     GenerationConfig,
     GenerationPipeline,
 )
 from persona.core.generation.parser import Persona
+from persona.core.lineage.hashing import hash_dict
+from persona.core.logging.tracing import traced
 from persona.core.providers import LLMProvider, ProviderFactory
 
 
@@ -33,6 +38,10 @@ class BatchConfig:
         parallel: Whether to process files in parallel (future).
         continue_on_error: Whether to continue if a file fails.
         output_dir: Directory for batch outputs.
+        incremental: Whether to skip files unchanged since the last run
+            and reuse their previous results.
+        manifest_path: Location of the incremental manifest (defaults to
+            ".persona-manifest.json" in output_dir).
     """
 
     provider: str = "anthropic"
@@ -42,6 +51,40 @@ class BatchConfig:
     parallel: bool = False
     continue_on_error: bool = True
     output_dir: Path | None = None
+    incremental: bool = False
+    manifest_path: Path | None = None
+
+    def get_manifest_path(self) -> Path:
+        """
+        Get the incremental manifest location.
+
+        Raises:
+            ValueError: If neither manifest_path nor output_dir is set.
+        """
+        if self.manifest_path is not None:
+            return Path(self.manifest_path)
+        if self.output_dir is not None:
+            return Path(self.output_dir) / ".persona-manifest.json"
+        raise ValueError("Incremental mode requires output_dir or manifest_path")
+
+    def fingerprint(self) -> str:
+        """
+        Hash the settings that determine generated output.
+
+        Incremental runs regenerate files whose stored results were
+        produced with a different fingerprint.
+
+        Returns:
+            Hash string in format "sha256:<hex_digest>".
+        """
+        return hash_dict(
+            {
+                "provider": self.provider,
+                "model": self.model,
+                "personas_per_file": self.personas_per_file,
+                "workflow": self.workflow,
+            }
+        )
 
 
 @dataclass
@@ -56,6 +99,9 @@ class FileResult:
         error: Error message (if failed).
         tokens_used: Total tokens used.
         processing_time: Time taken in seconds.
+        skipped: Whether the file was unchanged and its previous
+            results were reused (incremental mode).
+        run_id: Run that produced the personas.
     """
 
     file_path: Path
@@ -64,6 +110,8 @@ class FileResult:
     error: str | None = None
     tokens_used: int = 0
     processing_time: float = 0.0
+    skipped: bool = False
+    run_id: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -74,6 +122,8 @@ class FileResult:
             "error": self.error,
             "tokens_used": self.tokens_used,
             "processing_time": self.processing_time,
+            "skipped": self.skipped,
+            "run_id": self.run_id,
         }
 
 
@@ -90,6 +140,9 @@ class BatchResult:
         total_time: Total processing time.
         started_at: When processing started.
         completed_at: When processing completed.
+        run_id: Identifier for this run.
+        removed_files: Previously processed files no longer present
+            (incremental mode).
     """
 
     config: BatchConfig
@@ -99,6 +152,13 @@ class BatchResult:
     total_time: float = 0.0
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    removed_files: list[str] = field(default_factory=list)
+
+    @property
+    def skipped_count(self) -> int:
+        """Number of unchanged files whose previous results were reused."""
+        return sum(1 for r in self.file_results if r.skipped)
 
     @property
     def success_count(self) -> int:
@@ -122,9 +182,12 @@ class BatchResult:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
+            "run_id": self.run_id,
             "total_files": len(self.file_results),
             "success_count": self.success_count,
             "failure_count": self.failure_count,
+            "skipped_count": self.skipped_count,
+            "removed_files": self.removed_files,
             "total_personas": self.total_personas,
             "total_tokens": self.total_tokens,
             "total_time_seconds": self.total_time,
@@ -181,13 +244,22 @@ class BatchProcessor:
         self,
         files: list[Path],
         config: BatchConfig | None = None,
+        root: Path | None = None,
     ) -> BatchResult:
         """
         Process a list of files.
 
+        In incremental mode, files unchanged since the previous run are
+        not re-read or regenerated; their stored personas are merged into
+        the result instead. The manifest is saved after each generated
+        file, so an interrupted run resumes where it stopped, and stored
+        results no longer referenced by the manifest are deleted.
+
         Args:
             files: List of file paths to process.
             config: Optional config override.
+            root: Directory manifest paths are recorded relative to
+                (incremental mode).
 
         Returns:
             BatchResult with all file results.
@@ -198,11 +270,25 @@ class BatchProcessor:
             started_at=datetime.now(),
         )
 
+        manifest = None
+        unchanged: set[Path] = set()
+        if cfg.incremental:
+            manifest = FileManifest(cfg.get_manifest_path(), root=root)
+            changes = manifest.diff(files, cfg.fingerprint())
+            unchanged = set(changes.unchanged)
+            result.removed_files = changes.removed
+            if changes.removed:
+                entries = manifest.entries
+                stale = [entries[key].output for key in changes.removed]
+                manifest.forget(changes.removed)
+                manifest.save()
+                self._delete_stale_outputs(manifest, stale)
+
         # Get or create provider
         provider = self._provider or ProviderFactory.create(cfg.provider)
 
         # Create pipeline
-        pipeline = GenerationPipeline(provider)
+        pipeline = GenerationPipeline(provider=provider)
 
         import time
 
@@ -212,6 +298,13 @@ class BatchProcessor:
 
             start_time = time.time()
 
+            if file_path in unchanged:
+                reused = self._load_previous_result(file_path, manifest)
+                if reused is not None:
+                    result.file_results.append(reused)
+                    result.total_personas += len(reused.personas)
+                    continue
+
             try:
                 file_result = self._process_single_file(
                     file_path=file_path,
@@ -219,8 +312,18 @@ class BatchProcessor:
                     config=cfg,
                 )
                 file_result.processing_time = time.time() - start_time
+                file_result.run_id = result.run_id
                 result.file_results.append(file_result)
 
+                if manifest is not None:
+                    old_entry = manifest.get(file_path)
+                    self._store_result(file_result, manifest, cfg.fingerprint())
+                    # Save before deleting so the manifest never points at
+                    # a missing result
+                    manifest.save()
+                    if old_entry is not None:
+                        self._delete_stale_outputs(manifest, [old_entry.output])
+
                 result.total_personas += len(file_result.personas)
                 result.total_tokens += file_result.tokens_used
 
@@ -236,6 +339,9 @@ class BatchProcessor:
                 if not cfg.continue_on_error:
                     break
 
+        if manifest is not None:
+            manifest.save()
+
         result.completed_at = datetime.now()
         result.total_time = (result.completed_at - result.started_at).total_seconds()
 
@@ -263,8 +369,78 @@ class BatchProcessor:
         if pattern != "*":
             files = [f for f in files if f.match(pattern)]
 
-        return self.process_files(files, config)
+        return self.process_files(files, config, root=directory)
 
+    def _store_result(
+        self,
+        file_result: FileResult,
+        manifest: FileManifest,
+        config_hash: str,
+    ) -> None:
+        """Persist a file's personas and record it in the manifest."""
+        entry = manifest.record(
+            file_result.file_path,
+            run_id=file_result.run_id,
+            config_hash=config_hash,
+        )
+
+        # Key results by content and settings so files regenerated under
+        # new settings never overwrite results other entries still use
+        digest = entry.content_hash.split(":", 1)[-1]
+        config_digest = config_hash.split(":", 1)[-1][:12]
+        output = Path("results") / f"{digest}-{config_digest}.json"
+        output_path = manifest.path.parent / output
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(
+            json.dumps(
+                {
+                    "file": entry.path,
+                    "run_id": file_result.run_id,
+                    "tokens_used": file_result.tokens_used,
+                    "personas": [p.to_dict() for p in file_result.personas],
+                },
+                indent=2,
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        entry.output = output.as_posix()
+
+    def _delete_stale_outputs(
+        self, manifest: FileManifest, outputs: list[str | None]
+    ) -> None:
+        """Delete stored results that no manifest entry references."""
+        referenced = {entry.output for entry in manifest.entries.values()}
+        for output in outputs:
+            if output is not None and output not in referenced:
+                (manifest.path.parent / output).unlink(missing_ok=True)
+
+    def _load_previous_result(
+        self,
+        file_path: Path,
+        manifest: FileManifest | None,
+    ) -> FileResult | None:
+        """Load stored personas for an unchanged file, if available."""
+        if manifest is None:
+            return None
+        entry = manifest.get(file_path)
+        if entry is None or entry.output is None:
+            return None
+
+        output_path = manifest.path.parent / entry.output
+        if not output_path.exists():
+            return None
+
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        return FileResult(
+            file_path=file_path,
+            success=True,
+            personas=[Persona.from_dict(p) for p in data.get("personas", [])],
+            skipped=True,
+            run_id=entry.run_id,
+        )
+
+    @traced("batch.file")
     def _process_single_file(
         self,
         file_path: Path,
@@ -272,9 +448,6 @@ class BatchProcessor:
         config: BatchConfig,
     ) -> FileResult:
         """Process a single file."""
-        # Load data
-        data = self._loader.load_file(file_path)
-
         # Create generation config
         gen_config = GenerationConfig(
             data_path=file_path,
@@ -285,11 +458,7 @@ class BatchProcessor:
         )
 
         # Generate
-        gen_result = pipeline.generate(
-            data=data,
-            config=gen_config,
-            source_files=[file_path],
-        )
+        gen_result = pipeline.generate(gen_config)
 
         return FileResult(
             file_path=file_path,
@@ -306,6 +475,9 @@ class BatchProcessor:
         """
         Estimate cost and tokens for a batch operation.
 
+        Files are streamed record by record, so estimating a large batch
+        never holds a whole file in memory.
+
         Args:
             files: List of files to estimate.
             config: Optional config override.
@@ -319,8 +491,9 @@ class BatchProcessor:
 
         for file_path in files:
             try:
-                data = self._loader.load_file(file_path)
-                tokens = self._loader.count_tokens(data)
+                tokens = 0
+                for record in self._loader.iter_records(file_path):
+                    tokens = record.total_tokens
                 total_tokens += tokens
 
                 file_estimates.append(
@@ -5,9 +5,11 @@ This module provides the PersonaComparator class for comparing
 personas and identifying similarities and differences.
 """
 
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
+from persona.core.generation.compact import CompactPersona
 from persona.core.generation.parser import Persona
 
 
@@ -130,10 +132,18 @@ class PersonaComparator:
         """
         self._case_sensitive = case_sensitive
 
-    def compare(self, persona_a: Persona, persona_b: Persona) -> ComparisonResult:
+    def compare(
+        self,
+        persona_a: Persona | CompactPersona,
+        persona_b: Persona | CompactPersona,
+    ) -> ComparisonResult:
         """
         Compare two personas.
 
+        Accepts Persona or CompactPersona; the batch methods compare
+        compact copies, whose interned demographic values compare by
+        identity.
+
         Args:
             persona_a: First persona.
             persona_b: Second persona.
@@ -181,12 +191,13 @@ class PersonaComparator:
         Returns:
             List of ComparisonResult for each pair.
         """
+        compact = self._to_compact(personas)
         results = []
-        n = len(personas)
+        n = len(compact)
 
         for i in range(n):
             for j in range(i + 1, n):
-                result = self.compare(personas[i], personas[j])
+                result = self.compare(compact[i], compact[j])
                 results.append(result)
 
         return results
@@ -240,13 +251,15 @@ class PersonaComparator:
         Returns:
             List of (persona_a, persona_b, comparison) tuples.
         """
+        compact = self._to_compact(personas)
         duplicates = []
+        n = len(compact)
 
-        for i, persona_a in enumerate(personas):
-            for persona_b in personas[i + 1 :]:
-                result = self.compare(persona_a, persona_b)
+        for i in range(n):
+            for j in range(i + 1, n):
+                result = self.compare(compact[i], compact[j])
                 if result.similarity.overall >= threshold:
-                    duplicates.append((persona_a, persona_b, result))
+                    duplicates.append((personas[i], personas[j], result))
 
         return duplicates
 
@@ -269,10 +282,11 @@ class PersonaComparator:
             return []
 
         # Simple greedy clustering
+        compact = self._to_compact(personas)
         assigned = set()
         groups = []
 
-        for persona in personas:
+        for i, persona in enumerate(personas):
             if persona.id in assigned:
                 continue
 
@@ -281,11 +295,11 @@ class PersonaComparator:
             assigned.add(persona.id)
 
             # Find similar personas
-            for other in personas:
+            for j, other in enumerate(personas):
                 if other.id in assigned:
                     continue
 
-                result = self.compare(persona, other)
+                result = self.compare(compact[i], compact[j])
                 if result.similarity.overall >= threshold:
                     group.append(other)
                     assigned.add(other.id)
@@ -294,7 +308,11 @@ class PersonaComparator:
 
         return groups
 
-    def _normalise_list(self, items: list[str]) -> list[str]:
+    def _to_compact(self, personas: list[Persona]) -> list[CompactPersona]:
+        """Create compact copies for repeated pairwise comparison."""
+        return [CompactPersona.from_persona(p) for p in personas]
+
+    def _normalise_list(self, items: Iterable[str]) -> list[str]:
         """Normalise list items for comparison."""
         if self._case_sensitive:
             return [s.strip() for s in items]
@@ -312,8 +330,8 @@ class PersonaComparator:
 
     def _compare_demographics(
         self,
-        demo_a: dict[str, Any],
-        demo_b: dict[str, Any],
+        demo_a: Mapping[str, Any],
+        demo_b: Mapping[str, Any],
     ) -> list[FieldDifference]:
         """Compare demographic dictionaries."""
         differences = []
@@ -363,8 +381,8 @@ class PersonaComparator:
 
     def _calculate_similarity(
         self,
-        persona_a: Persona,
-        persona_b: Persona,
+        persona_a: Persona | CompactPersona,
+        persona_b: Persona | CompactPersona,
         result: ComparisonResult,
     ) -> SimilarityScore:
         """Calculate similarity scores."""
@@ -7,9 +7,10 @@ This module provides template management for custom Jinja2 prompt templates.
 from pathlib import Path
 from typing import ClassVar
 
-from jinja2 import BaseLoader, Environment, meta
 from pydantic import BaseModel, ConfigDict, Field
 
+from persona.core.prompts.cache import get_template_cache
+
 
 class TemplateMetadata(BaseModel):
     """Metadata for a prompt template."""
@@ -199,7 +200,7 @@ class TemplateLoader:
             FileNotFoundError: If template not found.
         """
         info = self.get_info(template_id)
-        return info.path.read_text(encoding="utf-8")
+        return get_template_cache().read_text(info.path)
 
     def get_variables(self, template_id: str) -> list[str]:
         """
@@ -212,9 +213,7 @@ class TemplateLoader:
             List of variable names.
         """
         content = self.load(template_id)
-        env = Environment(loader=BaseLoader())
-        ast = env.parse(content)
-        return list(meta.find_undeclared_variables(ast))
+        return get_template_cache().variables(content)
 
     def validate_template(
         self, template_id: str, **variables
@@ -247,8 +246,7 @@ class TemplateLoader:
         # Try to render
         if not errors:
             try:
-                env = Environment(loader=BaseLoader())
-                template = env.from_string(content)
+                template = get_template_cache().compile(content, strict=False)
                 template.render(**variables)
             except Exception as e:
                 errors.append(f"Render error: {e}")
@@ -407,10 +405,8 @@ class TemplateLoader:
 
                     # Extract metadata and variables
                     metadata = TemplateMetadata.from_template(content)
-                    env = Environment(loader=BaseLoader())
                     try:
-                        ast = env.parse(content)
-                        variables = list(meta.find_undeclared_variables(ast))
+                        variables = get_template_cache().variables(content)
                     except Exception:
                         variables = []
 
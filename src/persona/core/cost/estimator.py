@@ -7,10 +7,13 @@ costs before running generation.
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from persona.core.cost.pricing import ModelPricing, PricingData
 
+if TYPE_CHECKING:
+    from persona.core.data.loader import LoadResult
+
 
 @dataclass
 class CostEstimate:
@@ -161,6 +164,35 @@ class CostEstimator:
             persona_count=persona_count,
         )
 
+    def estimate_from_load(
+        self,
+        load_result: "LoadResult",
+        model: str,
+        provider: str | None = None,
+        persona_count: int = 3,
+    ) -> CostEstimate:
+        """
+        Estimate cost from a DataLoader.load_path_parallel() result.
+
+        Uses the token counts computed while loading rather than
+        encoding the combined content again.
+
+        Args:
+            load_result: Result of loading the data.
+            model: Model to use for estimation.
+            provider: Provider name hint.
+            persona_count: Number of personas to generate.
+
+        Returns:
+            CostEstimate for processing this data.
+        """
+        return self.estimate(
+            model=model,
+            input_tokens=load_result.total_tokens,
+            provider=provider,
+            persona_count=persona_count,
+        )
+
     def compare_models(
         self,
         input_tokens: int,
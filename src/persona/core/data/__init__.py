@@ -17,13 +17,25 @@ from persona.core.data.empathy_map import (
 from persona.core.data.formats import (
     CSVLoader,
     HTMLLoader,
+    JSONLLoader,
     JSONLoader,
     MarkdownLoader,
     OrgLoader,
     TextLoader,
     YAMLLoader,
 )
-from persona.core.data.loader import DataLoader
+from persona.core.data.loader import (
+    DataLoader,
+    DataRecord,
+    FileLoadResult,
+    LoadResult,
+)
+from persona.core.data.manifest import (
+    ChangeSet,
+    FileChange,
+    FileManifest,
+    ManifestEntry,
+)
 from persona.core.data.url import (
     SourceType,
     TermsNotAcceptedError,
@@ -34,6 +46,7 @@ from persona.core.data.url import (
 )
 from persona.core.data.url_cache import CacheEntry, URLCache
 from persona.core.data.workshop import (
+    ExtractionCache,
     LLMVisionExtractor,
     MockVisionExtractor,
     PostItNote,
@@ -41,17 +54,27 @@ from persona.core.data.workshop import (
     WorkshopExtractionResult,
     WorkshopImportConfig,
     WorkshopImporter,
+    prepare_image,
 )
 
 __all__ = [
     "DataLoader",
+    "DataRecord",
+    "LoadResult",
+    "FileLoadResult",
     "CSVLoader",
     "HTMLLoader",
     "JSONLoader",
+    "JSONLLoader",
     "MarkdownLoader",
     "OrgLoader",
     "TextLoader",
     "YAMLLoader",
+    # Incremental manifest
+    "FileManifest",
+    "ManifestEntry",
+    "FileChange",
+    "ChangeSet",
     # Attribution
     "Attribution",
     # URL data loading
@@ -78,4 +101,6 @@ __all__ = [
     "WorkshopImporter",
     "MockVisionExtractor",
     "LLMVisionExtractor",
+    "ExtractionCache",
+    "prepare_image",
 ]
@@ -6,7 +6,9 @@ in qualitative research data.
 """
 
 import csv
+import io
 import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -28,12 +30,17 @@ class CSVLoader(FormatLoader):
 
         Each row is converted to a readable format with field names.
         """
-        path = Path(path)
+        return self.RECORD_SEPARATOR.join(self.iter_records(path))
 
-        with open(path, newline="", encoding="utf-8") as f:
-            content = f.read()
+    def iter_records(self, path: Path) -> Iterator[str]:
+        """
+        Stream formatted rows from a CSV file.
 
-        return self.load_content(content)
+        Rows are read one at a time, so memory use does not grow with
+        the size of the file.
+        """
+        with open(Path(path), newline="", encoding="utf-8") as f:
+            yield from self._format_rows(csv.DictReader(f))
 
     def load_content(self, content: str) -> str:
         """
@@ -45,29 +52,30 @@ class CSVLoader(FormatLoader):
         Returns:
             Formatted readable text.
         """
-        import io
-
         reader = csv.DictReader(io.StringIO(content))
-        rows = list(reader)
+        return self.RECORD_SEPARATOR.join(self._format_rows(reader))
 
-        if not rows:
-            return ""
-
-        # Convert to readable text format
-        output = []
+    def _format_rows(self, rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+        """Format CSV rows as readable entries."""
         for i, row in enumerate(rows, 1):
-            output.append(f"## Entry {i}")
+            output = [f"## Entry {i}"]
             for key, value in row.items():
                 if value:  # Skip empty values
                     output.append(f"**{key}**: {value}")
             output.append("")  # Blank line between entries
+            yield "\n".join(output)
+
 
-        return "\n".join(output)
+# Characters that may follow a value inside a JSON array
+_ARRAY_DELIMITERS = frozenset(" \t\r\n,]")
 
 
 class JSONLoader(FormatLoader):
     """Loader for JSON files."""
 
+    # Characters read per step when streaming top-level arrays
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     @property
     def extensions(self) -> list[str]:
         return [".json"]
@@ -98,6 +106,98 @@ class JSONLoader(FormatLoader):
         data = json.loads(content)
         return self._format_json(data)
 
+    def iter_records(self, path: Path) -> Iterator[str]:
+        """
+        Stream formatted items from a JSON file.
+
+        Top-level arrays are decoded one item at a time, so only the
+        current item is held in memory. Other documents are formatted
+        whole.
+
+        Raises:
+            ValueError: If the file is not valid JSON.
+        """
+        decoder = json.JSONDecoder()
+
+        with open(Path(path), encoding="utf-8") as f:
+            buffer = f.read(self.STREAM_CHUNK_SIZE).lstrip()
+            if not buffer.startswith("["):
+                yield self._format_json(json.loads(buffer + f.read()))
+                return
+
+            buffer = buffer[1:]
+            index = 0
+            eof = False
+            # What the array grammar allows next: "first" (a value or "]"),
+            # "value" (after a comma) or "separator" ("," or "]")
+            expect = "first"
+
+            while True:
+                buffer = buffer.lstrip()
+                if not buffer:
+                    if eof:
+                        raise ValueError(f"Invalid JSON array in: {path}")
+                    chunk = f.read(self.STREAM_CHUNK_SIZE)
+                    eof = not chunk
+                    buffer = chunk
+                    continue
+
+                if expect == "separator":
+                    if buffer.startswith(","):
+                        buffer = buffer[1:]
+                        expect = "value"
+                        continue
+                    if buffer.startswith("]"):
+                        buffer = buffer[1:]
+                        break
+                    raise ValueError(f"Invalid JSON array in: {path}")
+
+                if buffer.startswith("]"):
+                    if expect == "value":
+                        raise ValueError(f"Invalid JSON array in: {path}")
+                    buffer = buffer[1:]
+                    break
+
+                item = None
+                end = 0
+                try:
+                    item, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    end = 0
+
+                # A value ending at the buffer end, or a number not yet
+                # followed by a delimiter ("3." of "3.5"), may be truncated
+                truncated = end == len(buffer) or (
+                    isinstance(item, (int, float))
+                    and buffer[end] not in _ARRAY_DELIMITERS
+                )
+                if end == 0 or (truncated and not eof):
+                    if eof:
+                        raise ValueError(f"Invalid JSON array in: {path}")
+                    chunk = f.read(self.STREAM_CHUNK_SIZE)
+                    eof = not chunk
+                    buffer += chunk
+                    continue
+
+                index += 1
+                yield self._format_item(index, item, depth=0)
+                buffer = buffer[end:]
+                expect = "separator"
+
+            # Only whitespace may follow the closing bracket
+            while buffer or not eof:
+                if buffer.strip():
+                    raise ValueError(f"Invalid JSON array in: {path}")
+                buffer = f.read(self.STREAM_CHUNK_SIZE)
+                eof = not buffer
+
+    def _format_item(self, index: int, item: Any, depth: int) -> str:
+        """Format a single list item."""
+        indent = "  " * depth
+        return "\n".join(
+            [f"{indent}### Item {index}", self._format_json(item, depth + 1), ""]
+        )
+
     def _format_json(self, data: Any, depth: int = 0) -> str:
         """Recursively format JSON data as readable text."""
         indent = "  " * depth
@@ -113,17 +213,63 @@ class JSONLoader(FormatLoader):
             return "\n".join(lines)
 
         elif isinstance(data, list):
-            lines = []
-            for i, item in enumerate(data, 1):
-                lines.append(f"{indent}### Item {i}")
-                lines.append(self._format_json(item, depth + 1))
-                lines.append("")
-            return "\n".join(lines)
+            return "\n".join(
+                self._format_item(i, item, depth) for i, item in enumerate(data, 1)
+            )
 
         else:
             return f"{indent}{data}"
 
 
+class JSONLLoader(JSONLoader):
+    """Loader for JSON Lines files (one JSON document per line)."""
+
+    @property
+    def extensions(self) -> list[str]:
+        return [".jsonl", ".ndjson"]
+
+    def load(self, path: Path) -> str:
+        """Load JSON Lines file and convert to readable text format."""
+        return self.RECORD_SEPARATOR.join(self.iter_records(path))
+
+    def iter_records(self, path: Path) -> Iterator[str]:
+        """
+        Stream formatted records from a JSON Lines file.
+
+        Raises:
+            ValueError: If a line is not valid JSON.
+        """
+        with open(Path(path), encoding="utf-8") as f:
+            yield from self._format_lines(f)
+
+    def load_content(self, content: str) -> str:
+        """
+        Load JSON Lines content from string and convert to readable text.
+
+        Args:
+            content: Raw JSON Lines content.
+
+        Returns:
+            Formatted readable text.
+        """
+        lines = io.StringIO(content)
+        return self.RECORD_SEPARATOR.join(self._format_lines(lines))
+
+    def _format_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Parse and format non-blank lines as records."""
+        index = 0
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+
+            index += 1
+            yield "\n".join([f"### Record {index}", self._format_json(data, 1), ""])
+
+
 class MarkdownLoader(FormatLoader):
     """Loader for Markdown files."""
 
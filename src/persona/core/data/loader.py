@@ -8,12 +8,20 @@ qualitative research data from various file formats and remote URLs.
 from __future__ import annotations
 
 import asyncio
+import os
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import tiktoken
 
+from persona.core.utils.async_helpers import run_blocking
+
 if TYPE_CHECKING:
     from persona.core.data.attribution import Attribution
     from persona.core.data.url import URLFetcher, URLFetchResult, URLSource
@@ -23,6 +31,9 @@ if TYPE_CHECKING:
 class FormatLoader(ABC):
     """Abstract base class for format-specific loaders."""
 
+    # Separator placed between records when they are joined
+    RECORD_SEPARATOR = "\n"
+
     @property
     @abstractmethod
     def extensions(self) -> list[str]:
@@ -61,11 +72,152 @@ class FormatLoader(ABC):
         """
         return content
 
+    def iter_records(self, path: Path) -> Iterator[str]:
+        """
+        Stream formatted records from a file.
+
+        Joining the records with RECORD_SEPARATOR gives the same text as
+        load(). The default implementation yields the whole file as a
+        single record; override for formats that can be read
+        incrementally (CSV, JSON arrays, JSON Lines).
+
+        Args:
+            path: Path to the file to load.
+
+        Yields:
+            Formatted record text.
+        """
+        yield self.load(path)
+
     def can_load(self, path: Path) -> bool:
         """Check if this loader can handle the given file."""
         return path.suffix.lower() in self.extensions
 
 
+@dataclass
+class DataRecord:
+    """
+    A formatted record streamed by DataLoader.iter_records().
+
+    Concatenating ``separator + content`` for every record reproduces
+    the text returned by DataLoader.load_path().
+
+    Attributes:
+        source: File the record was read from.
+        index: Position of the record within its file.
+        content: Formatted text, prefixed with the source header for the
+            first record of each file.
+        separator: Text joining this record to the previous one.
+        tokens: Token count of the separator and content.
+        total_tokens: Running token count across all records so far.
+    """
+
+    source: Path
+    index: int
+    content: str
+    separator: str = ""
+    tokens: int = 0
+    total_tokens: int = 0
+
+    @property
+    def text(self) -> str:
+        """Return separator and content together."""
+        return self.separator + self.content
+
+
+@dataclass
+class FileLoadResult:
+    """
+    Content and token count for a single loaded file.
+
+    Attributes:
+        path: File that was loaded.
+        content: Formatted content with its source header, or None if
+            the file failed to load.
+        tokens: Token count of the content.
+        size_bytes: Size of the file on disk.
+        error: Error message if the file failed to load.
+    """
+
+    path: Path
+    content: str | None = None
+    tokens: int = 0
+    size_bytes: int = 0
+    error: str | None = None
+
+
+@dataclass
+class LoadResult:
+    """
+    Combined output of DataLoader.load_path_parallel().
+
+    Token counts are computed per file as the files are loaded, so
+    callers can budget context and estimate cost without encoding the
+    combined text again. The total is the sum of the per-file counts and
+    may differ by a few tokens from encoding the combined text at once.
+
+    Attributes:
+        content: Combined content, as returned by load_path().
+        files: Files that were discovered.
+        file_tokens: Token count for each loaded file, in load order.
+        separator_tokens: Tokens used by separators between files.
+        bytes_read: Total size of the loaded files.
+        elapsed_seconds: Wall-clock time spent loading.
+        workers: Number of workers used.
+        errors: Error messages for files that failed to load.
+    """
+
+    content: str
+    files: list[Path]
+    file_tokens: dict[Path, int] = field(default_factory=dict)
+    separator_tokens: int = 0
+    bytes_read: int = 0
+    elapsed_seconds: float = 0.0
+    workers: int = 1
+    errors: dict[Path, str] = field(default_factory=dict)
+
+    @property
+    def total_tokens(self) -> int:
+        """Total tokens across all loaded files and separators."""
+        return sum(self.file_tokens.values()) + self.separator_tokens
+
+    @property
+    def files_per_second(self) -> float:
+        """Load throughput in files per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return len(self.file_tokens) / self.elapsed_seconds
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Load throughput in megabytes per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_read / 1_000_000 / self.elapsed_seconds
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Tokenisation throughput in tokens per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_tokens / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (excluding content)."""
+        return {
+            "files": [str(f) for f in self.files],
+            "file_tokens": {str(f): t for f, t in self.file_tokens.items()},
+            "total_tokens": self.total_tokens,
+            "bytes_read": self.bytes_read,
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+            "workers": self.workers,
+            "files_per_second": round(self.files_per_second, 2),
+            "megabytes_per_second": round(self.megabytes_per_second, 2),
+            "tokens_per_second": round(self.tokens_per_second, 2),
+            "errors": {str(f): e for f, e in self.errors.items()},
+        }
+
+
 class DataLoader:
     """
     Main data loader that discovers and combines files from various formats.
@@ -83,6 +235,10 @@ class DataLoader:
             "https://example.com/data.csv",
             accept_terms=True
         )
+
+        # Stream large corpora without holding them in memory
+        for chunk in loader.iter_chunks("./data", max_tokens=50_000):
+            process(chunk)
     """
 
     # File separator used when combining multiple files
@@ -91,11 +247,17 @@ class DataLoader:
     # Default encoding model for token counting
     DEFAULT_ENCODING = "cl100k_base"
 
+    # Inputs smaller than this are loaded in-process by load_path_parallel().
+    # Starting a process pool and copying content back measured 25-100 ms,
+    # against a few milliseconds to load under 1 MB in-process.
+    PARALLEL_MIN_BYTES = 1_000_000
+
     def __init__(self) -> None:
         """Initialise the data loader with format-specific handlers."""
         from persona.core.data.formats import (
             CSVLoader,
             HTMLLoader,
+            JSONLLoader,
             JSONLoader,
             MarkdownLoader,
             OrgLoader,
@@ -107,6 +269,7 @@ class DataLoader:
             CSVLoader(),
             HTMLLoader(),
             JSONLoader(),
+            JSONLLoader(),
             MarkdownLoader(),
             OrgLoader(),
             TextLoader(),
@@ -253,13 +416,7 @@ class DataLoader:
 
         # Handle local file/directory
         path = Path(path)
-        files = self.discover_files(path, recursive=recursive)
-
-        if not files:
-            raise ValueError(
-                f"No loadable files found in: {path}. "
-                f"Supported formats: {', '.join(self.supported_extensions)}"
-            )
+        files = self._resolve_files(path, recursive=recursive)
 
         contents = []
         for file_path in files:
@@ -269,8 +426,7 @@ class DataLoader:
                 header = f"# Source: {file_path.name}\n\n"
                 contents.append(header + file_content)
             except Exception:
-                # Skip files that fail to load, but log the error
-                # TODO: Add proper logging
+                # Skip files that fail to load
                 pass
 
         if not contents:
@@ -279,6 +435,260 @@ class DataLoader:
         combined = self.FILE_SEPARATOR.join(contents)
         return combined, files
 
+    def load_path_parallel(
+        self,
+        path: str | Path,
+        recursive: bool = True,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        count_tokens: bool = True,
+    ) -> LoadResult:
+        """
+        Load, format and token-count local files across a worker pool.
+
+        Parsing and tokenisation are CPU-bound, so by default files are
+        processed in separate processes. Inputs totalling less than
+        PARALLEL_MIN_BYTES are loaded in-process, as a pool would cost
+        more than it saves. Results are combined in discovery order, so
+        the content is identical to load_path().
+
+        Args:
+            path: File or directory path.
+            recursive: Whether to search subdirectories (default: True).
+            max_workers: Maximum workers (defaults to the CPU count).
+            use_processes: Use a process pool rather than a thread pool.
+            count_tokens: Whether to count tokens for each file.
+
+        Returns:
+            LoadResult with combined content, per-file token counts and
+            throughput figures.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            ValueError: If no loadable files are found, or none could be read.
+        """
+        started = time.perf_counter()
+        path = Path(path)
+        files = self._resolve_files(path, recursive=recursive)
+
+        workers = max(1, min(len(files), max_workers or os.cpu_count() or 1))
+        if sum(f.stat().st_size for f in files) < self.PARALLEL_MIN_BYTES:
+            workers = 1
+
+        if workers == 1:
+            results = [self._load_file_with_tokens(f, count_tokens) for f in files]
+        elif use_processes:
+            chunksize = max(1, len(files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        partial(_load_file_in_worker, count_tokens=count_tokens),
+                        files,
+                        chunksize=chunksize,
+                    )
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        partial(self._load_file_with_tokens, count_tokens=count_tokens),
+                        files,
+                    )
+                )
+
+        loaded = [r for r in results if r.content is not None]
+        if not loaded:
+            raise ValueError(f"Failed to load any files from: {path}")
+
+        separator_tokens = 0
+        if count_tokens and len(loaded) > 1:
+            separator_tokens = self.count_tokens(self.FILE_SEPARATOR) * (
+                len(loaded) - 1
+            )
+
+        return LoadResult(
+            content=self.FILE_SEPARATOR.join(r.content for r in loaded),
+            files=files,
+            file_tokens={r.path: r.tokens for r in loaded},
+            separator_tokens=separator_tokens,
+            bytes_read=sum(r.size_bytes for r in loaded),
+            elapsed_seconds=time.perf_counter() - started,
+            workers=workers,
+            errors={r.path: r.error for r in results if r.error is not None},
+        )
+
+    def _load_file_with_tokens(
+        self, path: Path, count_tokens: bool = True
+    ) -> FileLoadResult:
+        """Load a file with its source header and count its tokens."""
+        try:
+            content = f"# Source: {path.name}\n\n" + self.load_file(path)
+        except Exception as e:
+            return FileLoadResult(path=path, error=str(e))
+
+        return FileLoadResult(
+            path=path,
+            content=content,
+            tokens=self.count_tokens(content) if count_tokens else 0,
+            size_bytes=path.stat().st_size,
+        )
+
+    def iter_records(
+        self,
+        path: str | Path,
+        recursive: bool = True,
+        count_tokens: bool = True,
+    ) -> Iterator[DataRecord]:
+        """
+        Stream formatted records from a file or directory.
+
+        Files are read incrementally where the format allows, so memory
+        use is bounded by the largest record rather than the corpus.
+        Files that fail to load are skipped, as in load_path(); a file
+        that fails part-way through raises instead of being truncated.
+
+        Args:
+            path: File or directory path.
+            recursive: Whether to search subdirectories (default: True).
+            count_tokens: Whether to count tokens for each record.
+
+        Yields:
+            DataRecord for each formatted record, with running token totals.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            ValueError: If no loadable files are found, none could be read,
+                or a file fails part-way through.
+        """
+        path = Path(path)
+        files = self._resolve_files(path, recursive=recursive)
+
+        total_tokens = 0
+        loaded_any = False
+
+        for file_path in files:
+            loader = self._get_loader(file_path)
+            if loader is None:
+                continue
+
+            separator = self.FILE_SEPARATOR if loaded_any else ""
+            contents = self._iter_file_contents(loader, file_path)
+
+            for index, content in enumerate(contents):
+                record = DataRecord(
+                    source=file_path,
+                    index=index,
+                    content=content,
+                    separator=loader.RECORD_SEPARATOR if index else separator,
+                )
+                if count_tokens:
+                    record.tokens = self.count_tokens(record.text)
+                    total_tokens += record.tokens
+                record.total_tokens = total_tokens
+                loaded_any = True
+                yield record
+
+        if not loaded_any:
+            raise ValueError(f"Failed to load any files from: {path}")
+
+    def iter_chunks(
+        self,
+        path: str | Path,
+        max_tokens: int,
+        recursive: bool = True,
+    ) -> Iterator[str]:
+        """
+        Stream content in chunks of at most max_tokens tokens.
+
+        Chunks are built from whole records, so a single record larger
+        than max_tokens forms a chunk on its own. Use
+        ContextManager.suggest_chunk_size() to pick max_tokens for a model.
+
+        Args:
+            path: File or directory path.
+            max_tokens: Maximum tokens per chunk.
+            recursive: Whether to search subdirectories (default: True).
+
+        Yields:
+            Chunk text.
+
+        Raises:
+            ValueError: If max_tokens is not positive.
+        """
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+
+        parts: list[str] = []
+        chunk_tokens = 0
+
+        for record in self.iter_records(path, recursive=recursive):
+            if parts and chunk_tokens + record.tokens > max_tokens:
+                yield "".join(parts)
+                parts = []
+                chunk_tokens = 0
+
+            parts.append(record.text if parts else record.content)
+            chunk_tokens += record.tokens
+
+        if parts:
+            yield "".join(parts)
+
+    def _iter_file_contents(
+        self, loader: FormatLoader, file_path: Path
+    ) -> Iterator[str]:
+        """
+        Stream a file's records, the first prefixed with its source header.
+
+        Files that fail before their first record yield nothing, as in
+        load_path(). Records already yielded cannot be withdrawn, so a
+        failure part-way through a file is raised rather than silently
+        truncating it.
+
+        Raises:
+            ValueError: If the file fails after its first record.
+        """
+        try:
+            records = loader.iter_records(file_path)
+            # Empty files still contribute their source header
+            first = next(records, "")
+        except Exception:
+            # Skip files that fail to load
+            return
+
+        yield f"# Source: {file_path.name}\n\n" + first
+
+        yielded = 1
+        try:
+            for record in records:
+                yield record
+                yielded += 1
+        except Exception as e:
+            raise ValueError(
+                f"Failed to read {file_path} after {yielded} records: {e}"
+            ) from e
+
+    def _resolve_files(
+        self,
+        path: Path,
+        recursive: bool = True,
+    ) -> list[Path]:
+        """
+        Discover loadable files.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            ValueError: If no loadable files are found.
+        """
+        files = self.discover_files(path, recursive=recursive)
+
+        if not files:
+            raise ValueError(
+                f"No loadable files found in: {path}. "
+                f"Supported formats: {', '.join(self.supported_extensions)}"
+            )
+
+        return files
+
     def _load_from_url(
         self,
         url: str,
@@ -466,9 +876,8 @@ class DataLoader:
                 f"Supported formats: {', '.join(self.supported_extensions)}"
             )
 
-        # Run synchronous loader in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: loader.load(path))
+        # Run synchronous loader on the shared blocking executor
+        return await run_blocking(loader.load, path)
 
     async def load_path_async(
         self,
@@ -509,13 +918,7 @@ class DataLoader:
 
         # Handle local file/directory
         path = Path(path)
-        files = self.discover_files(path, recursive=recursive)
-
-        if not files:
-            raise ValueError(
-                f"No loadable files found in: {path}. "
-                f"Supported formats: {', '.join(self.supported_extensions)}"
-            )
+        files = self._resolve_files(path, recursive=recursive)
 
         # Load all files concurrently
         async def load_with_header(file_path: Path) -> str | None:
@@ -635,3 +1038,15 @@ class DataLoader:
 
         header = f"# Source: {url}\n\n"
         return header + content, [result.source]
+
+
+# Per-process loader reused across files handled by a pool worker
+_worker_loader: DataLoader | None = None
+
+
+def _load_file_in_worker(path: Path, count_tokens: bool = True) -> FileLoadResult:
+    """Load a file in a pool worker process."""
+    global _worker_loader
+    if _worker_loader is None:
+        _worker_loader = DataLoader()
+    return _worker_loader._load_file_with_tokens(path, count_tokens)
@@ -0,0 +1,310 @@
+"""
+Incremental input manifest.
+
+Records the size, modification time and content hash of every input
+file processed in a run, together with the output it produced. Later
+runs compare the current files against the manifest so only new or
+modified inputs are re-read and regenerated.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from persona.core.lineage.hashing import hash_file
+
+# Manifest format version, bumped on incompatible changes
+MANIFEST_VERSION = 1
+
+
+class FileChange(Enum):
+    """Change status of an input file relative to the manifest."""
+
+    NEW = "new"
+    MODIFIED = "modified"
+    UNCHANGED = "unchanged"
+
+
+@dataclass
+class ManifestEntry:
+    """
+    Manifest record for a single input file.
+
+    Attributes:
+        path: File path relative to the manifest root.
+        size_bytes: File size when last processed.
+        mtime_ns: Modification time (nanoseconds) when last processed.
+        content_hash: Content hash in "sha256:<hex>" form.
+        output: Location of the output produced from the file, if any.
+        run_id: Identifier of the run that produced the output.
+        config_hash: Fingerprint of the settings the output was produced
+            with, if the caller supplied one.
+        updated_at: When the entry was recorded.
+    """
+
+    path: str
+    size_bytes: int
+    mtime_ns: int
+    content_hash: str
+    output: str | None = None
+    run_id: str | None = None
+    config_hash: str | None = None
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "path": self.path,
+            "size_bytes": self.size_bytes,
+            "mtime_ns": self.mtime_ns,
+            "content_hash": self.content_hash,
+            "output": self.output,
+            "run_id": self.run_id,
+            "config_hash": self.config_hash,
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ManifestEntry":
+        """Create from dictionary."""
+        return cls(
+            path=data["path"],
+            size_bytes=data["size_bytes"],
+            mtime_ns=data["mtime_ns"],
+            content_hash=data["content_hash"],
+            output=data.get("output"),
+            run_id=data.get("run_id"),
+            config_hash=data.get("config_hash"),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
+
+
+@dataclass
+class ChangeSet:
+    """
+    Input files grouped by change status.
+
+    Attributes:
+        new: Files not present in the manifest.
+        modified: Files whose content changed since they were recorded.
+        unchanged: Files whose content matches the manifest.
+        removed: Manifest paths no longer present in the inputs.
+    """
+
+    new: list[Path] = field(default_factory=list)
+    modified: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> list[Path]:
+        """New and modified files, sorted by path."""
+        return sorted(self.new + self.modified)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any file was added, modified or removed."""
+        return bool(self.new or self.modified or self.removed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "new": [str(p) for p in self.new],
+            "modified": [str(p) for p in self.modified],
+            "unchanged": [str(p) for p in self.unchanged],
+            "removed": self.removed,
+        }
+
+
+class FileManifest:
+    """
+    Persistent manifest of processed input files.
+
+    Change detection first compares size and modification time, which
+    needs only a stat call; files whose stat differs are hashed so
+    that touched-but-identical files are still treated as unchanged.
+
+    Example:
+        manifest = FileManifest("./outputs/.persona-manifest.json", root="./data")
+        changes = manifest.diff(files)
+        for path in changes.changed:
+            output = generate(path)
+            manifest.record(path, output=str(output), run_id=run_id)
+        manifest.save()
+    """
+
+    def __init__(self, path: str | Path, root: str | Path | None = None) -> None:
+        """
+        Initialise the manifest, loading it if it exists.
+
+        Args:
+            path: Location of the manifest JSON file.
+            root: Directory input paths are recorded relative to
+                (defaults to the manifest's directory).
+        """
+        self._path = Path(path)
+        self._root = Path(root) if root is not None else self._path.parent
+        self._entries: dict[str, ManifestEntry] = {}
+        self._pending_hashes: dict[str, str] = {}
+
+        if self._path.exists():
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            for item in data.get("files", []):
+                entry = ManifestEntry.from_dict(item)
+                self._entries[entry.path] = entry
+
+    @property
+    def path(self) -> Path:
+        """Location of the manifest file."""
+        return self._path
+
+    @property
+    def entries(self) -> dict[str, ManifestEntry]:
+        """Recorded entries keyed by relative path."""
+        return dict(self._entries)
+
+    def key(self, path: Path) -> str:
+        """Get the manifest key for a file path."""
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self._root.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def get(self, path: Path) -> ManifestEntry | None:
+        """Get the entry recorded for a file, if any."""
+        return self._entries.get(self.key(path))
+
+    def check(self, path: Path, config_hash: str | None = None) -> FileChange:
+        """
+        Determine whether a file changed since it was recorded.
+
+        Args:
+            path: File to check.
+            config_hash: Fingerprint of the current settings. An entry
+                recorded with different settings counts as modified.
+
+        Returns:
+            FileChange status for the file.
+        """
+        key = self.key(path)
+        entry = self._entries.get(key)
+        if entry is None:
+            return FileChange.NEW
+
+        if config_hash is not None and entry.config_hash != config_hash:
+            return FileChange.MODIFIED
+
+        stat = Path(path).stat()
+        if stat.st_size == entry.size_bytes and stat.st_mtime_ns == entry.mtime_ns:
+            return FileChange.UNCHANGED
+
+        if stat.st_size == entry.size_bytes:
+            content_hash = hash_file(path)
+            self._pending_hashes[key] = content_hash
+            if content_hash == entry.content_hash:
+                # Touched but identical: refresh the stat fast path
+                entry.mtime_ns = stat.st_mtime_ns
+                return FileChange.UNCHANGED
+
+        return FileChange.MODIFIED
+
+    def diff(self, files: list[Path], config_hash: str | None = None) -> ChangeSet:
+        """
+        Group files by change status.
+
+        Args:
+            files: Current input files.
+            config_hash: Fingerprint of the current settings (see check).
+
+        Returns:
+            ChangeSet describing new, modified, unchanged and removed files.
+        """
+        changes = ChangeSet()
+        current = set()
+
+        for path in files:
+            current.add(self.key(path))
+            status = self.check(path, config_hash)
+            if status == FileChange.NEW:
+                changes.new.append(path)
+            elif status == FileChange.MODIFIED:
+                changes.modified.append(path)
+            else:
+                changes.unchanged.append(path)
+
+        changes.removed = sorted(k for k in self._entries if k not in current)
+        return changes
+
+    def record(
+        self,
+        path: Path,
+        output: str | None = None,
+        run_id: str | None = None,
+        config_hash: str | None = None,
+    ) -> ManifestEntry:
+        """
+        Record a processed file.
+
+        Args:
+            path: Input file that was processed.
+            output: Location of the output produced from it.
+            run_id: Identifier of the producing run.
+            config_hash: Fingerprint of the settings used.
+
+        Returns:
+            The new manifest entry.
+        """
+        key = self.key(path)
+        stat = Path(path).stat()
+        content_hash = self._pending_hashes.pop(key, None) or hash_file(path)
+
+        entry = ManifestEntry(
+            path=key,
+            size_bytes=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            content_hash=content_hash,
+            output=output,
+            run_id=run_id,
+            config_hash=config_hash,
+        )
+        self._entries[key] = entry
+        return entry
+
+    def forget(self, keys: list[str]) -> None:
+        """Remove entries, e.g. for inputs that no longer exist."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def save(self) -> Path:
+        """
+        Write the manifest atomically.
+
+        Returns:
+            Path to the manifest file.
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "files": [self._entries[k].to_dict() for k in sorted(self._entries)],
+        }
+
+        fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_name, self._path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        return self._path
+
+    def __len__(self) -> int:
+        """Return number of recorded files."""
+        return len(self._entries)
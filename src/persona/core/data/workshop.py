@@ -6,15 +6,48 @@ from photos of post-it notes on boards, using vision LLMs to extract
 text and map it to empathy map categories.
 """
 
+import asyncio
 import base64
+import io
 import json
+import os
+import tempfile
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Protocol, TextIO
 
 import yaml
 
+from persona.core.lineage.hashing import hash_content
+from persona.core.utils.async_helpers import run_sync
+
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# Longest image edge sent to vision models; larger photos are downscaled
+DEFAULT_MAX_IMAGE_DIMENSION = 1568
+
+# JPEG quality used when recompressing downscaled images
+DEFAULT_JPEG_QUALITY = 85
+
+# Default number of images extracted at once
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Media types for supported image formats
+IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+}
+
 
 class WorkshopCategory(Enum):
     """Categories for workshop post-it notes (Boag empathy map dimensions)."""
@@ -56,6 +89,18 @@ class PostItNote:
             "colour": self.colour,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PostItNote":
+        """Create from dictionary."""
+        position = data.get("position")
+        return cls(
+            text=data["text"],
+            confidence=data.get("confidence", 1.0),
+            category=WorkshopCategory(data.get("category", "uncategorised")),
+            position=tuple(position) if position else None,
+            colour=data.get("colour"),
+        )
+
 
 @dataclass
 class WorkshopExtractionResult:
@@ -85,6 +130,17 @@ class WorkshopExtractionResult:
             "overall_confidence": self.overall_confidence,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WorkshopExtractionResult":
+        """Create from dictionary."""
+        return cls(
+            source_image=Path(data["source_image"]),
+            post_its=[PostItNote.from_dict(p) for p in data.get("post_its", [])],
+            clusters=data.get("clusters", []),
+            raw_response=data.get("raw_response", ""),
+            overall_confidence=data.get("overall_confidence", 0.0),
+        )
+
 
 @dataclass
 class WorkshopImportConfig:
@@ -96,6 +152,9 @@ class WorkshopImportConfig:
         auto_categorise: Whether to auto-assign categories.
         detect_clusters: Whether to detect spatial clusters.
         supported_formats: Supported image formats.
+        max_concurrency: Maximum number of images extracted at once.
+        cache_dir: Directory for per-image extraction results keyed by
+            content hash, or None to disable caching.
     """
 
     confidence_threshold: float = 0.5
@@ -104,6 +163,125 @@ class WorkshopImportConfig:
     supported_formats: list[str] = field(
         default_factory=lambda: [".jpg", ".jpeg", ".png", ".webp"]
     )
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    cache_dir: Path | None = None
+
+
+def prepare_image(
+    path: Path,
+    max_dimension: int | None = DEFAULT_MAX_IMAGE_DIMENSION,
+    quality: int = DEFAULT_JPEG_QUALITY,
+) -> tuple[bytes, str]:
+    """
+    Read an image, downscaling and recompressing it for upload.
+
+    Images whose longest edge exceeds max_dimension are resized and
+    re-encoded as JPEG. Smaller images are sent unchanged. Resizing
+    requires Pillow; without it the original bytes are returned.
+
+    Args:
+        path: Image file.
+        max_dimension: Longest edge in pixels, or None to disable resizing.
+        quality: JPEG quality for re-encoded images.
+
+    Returns:
+        Tuple of (image bytes, media type).
+    """
+    data = path.read_bytes()
+    media_type = IMAGE_MEDIA_TYPES.get(path.suffix.lower(), "image/jpeg")
+
+    if not PIL_AVAILABLE or max_dimension is None:
+        return data, media_type
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if max(image.size) <= max_dimension:
+                return data, media_type
+
+            image.thumbnail((max_dimension, max_dimension))
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+
+            buffer = io.BytesIO()
+            image.save(buffer, format="JPEG", quality=quality, optimize=True)
+    except OSError:
+        # Not a decodable image: let the provider report the problem
+        return data, media_type
+
+    return buffer.getvalue(), "image/jpeg"
+
+
+def _response_text(response: Any) -> str:
+    """Return the text of a provider response (LLMResponse or plain str)."""
+    return str(getattr(response, "content", response))
+
+
+class ExtractionCache:
+    """
+    On-disk cache of extraction results keyed by image content.
+
+    Re-running an import over the same photos, or over a folder where
+    only a few photos were added, skips the vision call for every image
+    that was already extracted.
+
+    Example:
+        cache = ExtractionCache("./.workshop-cache")
+        result = cache.get(image_bytes, "anthropic")
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        """
+        Initialise the cache.
+
+        Args:
+            directory: Directory holding cached results.
+        """
+        self._directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, content: bytes, namespace: str = "") -> str:
+        """Get the cache key for image content and an extractor namespace."""
+        digest = hash_content(content).split(":", 1)[-1]
+        if not namespace:
+            return digest
+        return hash_content(f"{namespace}:{digest}").split(":", 1)[-1]
+
+    def get(self, key: str, image_path: Path) -> WorkshopExtractionResult | None:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from key().
+            image_path: Path to report as the result's source image.
+
+        Returns:
+            Cached result, or None on a miss.
+        """
+        path = self._directory / f"{key}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        data["source_image"] = str(image_path)
+        return WorkshopExtractionResult.from_dict(data)
+
+    def put(self, key: str, result: WorkshopExtractionResult) -> None:
+        """Store a result atomically."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        data = {**result.to_dict(), "raw_response": result.raw_response}
+
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, self._directory / f"{key}.json")
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
 
 
 class VisionExtractor(Protocol):
@@ -234,14 +412,31 @@ Return a JSON object with this structure:
 Be thorough but only extract clearly visible text. Mark uncertain extractions
 with lower confidence scores."""
 
-    def __init__(self, provider: Any) -> None:
+    def __init__(
+        self,
+        provider: Any,
+        max_dimension: int | None = DEFAULT_MAX_IMAGE_DIMENSION,
+        quality: int = DEFAULT_JPEG_QUALITY,
+    ) -> None:
         """
         Initialise with an LLM provider.
 
         Args:
             provider: An LLM provider with vision capabilities.
+            max_dimension: Longest image edge sent to the model; larger
+                images are downscaled (requires Pillow).
+            quality: JPEG quality for downscaled images.
         """
         self.provider = provider
+        self.max_dimension = max_dimension
+        self.quality = quality
+
+    @property
+    def cache_namespace(self) -> str:
+        """Identify the settings that affect extraction results."""
+        provider = getattr(self.provider, "name", type(self.provider).__name__)
+        prompt = hash_content(self.EXTRACTION_PROMPT)[-12:]
+        return f"{provider}:{self.max_dimension}:{self.quality}:{prompt}"
 
     def extract_from_image(self, image_path: Path) -> WorkshopExtractionResult:
         """
@@ -254,27 +449,64 @@ with lower confidence scores."""
             Extraction result with post-its and clusters.
         """
         # Read and encode image
-        image_data = self._encode_image(image_path)
+        image_data, media_type = self._encode_image(image_path)
 
         # Call vision LLM
-        response = self._call_vision_llm(image_data)
+        response = self._call_vision_llm(image_data, media_type)
 
         # Parse response
         return self._parse_response(image_path, response)
 
-    def _encode_image(self, path: Path) -> str:
-        """Encode image as base64."""
-        with open(path, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
+    async def extract_from_image_async(
+        self,
+        image_path: Path,
+    ) -> WorkshopExtractionResult:
+        """
+        Extract post-it content using the provider's async vision API.
+
+        Image preparation runs in a worker thread. Providers without an
+        async vision method are called in a worker thread too.
+
+        Args:
+            image_path: Path to the workshop image.
+
+        Returns:
+            Extraction result with post-its and clusters.
+        """
+        image_data, media_type = await asyncio.to_thread(
+            self._encode_image, image_path
+        )
+
+        if hasattr(self.provider, "generate_with_image_async"):
+            response = _response_text(
+                await self.provider.generate_with_image_async(
+                    self.EXTRACTION_PROMPT,
+                    image_data,
+                    media_type=media_type,
+                )
+            )
+        else:
+            response = await asyncio.to_thread(
+                self._call_vision_llm, image_data, media_type
+            )
+
+        return self._parse_response(image_path, response)
+
+    def _encode_image(self, path: Path) -> tuple[str, str]:
+        """Downscale if needed and encode image as base64 with its media type."""
+        data, media_type = prepare_image(path, self.max_dimension, self.quality)
+        return base64.b64encode(data).decode("utf-8"), media_type
 
-    def _call_vision_llm(self, image_data: str) -> str:
+    def _call_vision_llm(self, image_data: str, media_type: str) -> str:
         """Call the vision LLM with the image."""
-        # This would use the provider's vision API
-        # For now, return empty to allow structure testing
+        # Providers without vision support yield an empty extraction
         if hasattr(self.provider, "generate_with_image"):
-            return self.provider.generate_with_image(
-                self.EXTRACTION_PROMPT,
-                image_data,
+            return _response_text(
+                self.provider.generate_with_image(
+                    self.EXTRACTION_PROMPT,
+                    image_data,
+                    media_type=media_type,
+                )
             )
         return "{}"
 
@@ -340,6 +572,14 @@ class WorkshopImporter:
         yaml_content = importer.to_editable_yaml(result)
     """
 
+    # Comment header for editable YAML output
+    YAML_HEADER = """# Workshop Import Results
+# Review and edit the extracted content below
+# Delete any incorrectly extracted items
+# Add missing items manually
+
+"""
+
     def __init__(
         self,
         config: WorkshopImportConfig | None = None,
@@ -354,40 +594,98 @@ class WorkshopImporter:
         """
         self.config = config or WorkshopImportConfig()
         self.extractor = extractor or MockVisionExtractor()
+        self._cache = (
+            ExtractionCache(self.config.cache_dir)
+            if self.config.cache_dir is not None
+            else None
+        )
 
     def import_images(
         self,
         image_paths: list[Path],
+        on_result: Callable[[WorkshopExtractionResult], None] | None = None,
     ) -> list[WorkshopExtractionResult]:
         """
         Import multiple workshop images.
 
+        Images are extracted concurrently (up to config.max_concurrency
+        at a time). Must not be called from a running event loop; use
+        import_images_async() there instead.
+
         Args:
             image_paths: List of image paths to process.
+            on_result: Optional callback invoked with each result as soon
+                as it is available (in completion order).
 
         Returns:
-            List of extraction results.
+            List of extraction results, in input order.
+
+        Raises:
+            RuntimeError: If called from within a running event loop.
         """
-        results = []
+        return run_sync(self.import_images_async, image_paths, on_result)
 
-        for path in image_paths:
-            path = Path(path)
+    async def import_images_async(
+        self,
+        image_paths: list[Path],
+        on_result: Callable[[WorkshopExtractionResult], None] | None = None,
+    ) -> list[WorkshopExtractionResult]:
+        """
+        Import multiple workshop images asynchronously.
 
-            if not path.exists():
-                continue
+        Args:
+            image_paths: List of image paths to process.
+            on_result: Optional callback invoked with each result as soon
+                as it is available (in completion order).
 
-            if path.suffix.lower() not in self.config.supported_formats:
-                continue
+        Returns:
+            List of extraction results, in input order.
+        """
+        paths = [
+            Path(path)
+            for path in image_paths
+            if Path(path).exists()
+            and Path(path).suffix.lower() in self.config.supported_formats
+        ]
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+
+        async def extract(path: Path) -> WorkshopExtractionResult:
+            async with semaphore:
+                result = await self._extract(path)
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        return list(await asyncio.gather(*(extract(path) for path in paths)))
+
+    async def _extract(self, path: Path) -> WorkshopExtractionResult:
+        """Extract one image, using the result cache when configured."""
+        key = None
+        if self._cache is not None:
+            content = await asyncio.to_thread(path.read_bytes)
+            namespace = getattr(
+                self.extractor, "cache_namespace", type(self.extractor).__name__
+            )
+            key = self._cache.key(content, namespace)
+            cached = self._cache.get(key, path)
+            if cached is not None:
+                return cached
 
-            result = self.extractor.extract_from_image(path)
-            results.append(result)
+        if hasattr(self.extractor, "extract_from_image_async"):
+            result = await self.extractor.extract_from_image_async(path)
+        else:
+            result = await asyncio.to_thread(self.extractor.extract_from_image, path)
 
-        return results
+        # Only cache successful extractions so failures are retried
+        if key is not None and result.overall_confidence > 0:
+            self._cache.put(key, result)
+        return result
 
     def import_directory(
         self,
         directory: Path,
         recursive: bool = False,
+        on_result: Callable[[WorkshopExtractionResult], None] | None = None,
     ) -> list[WorkshopExtractionResult]:
         """
         Import all images from a directory.
@@ -395,6 +693,8 @@ class WorkshopImporter:
         Args:
             directory: Directory to scan for images.
             recursive: Whether to search subdirectories.
+            on_result: Optional callback invoked with each result as soon
+                as it is available.
 
         Returns:
             List of extraction results.
@@ -410,7 +710,7 @@ class WorkshopImporter:
         for fmt in self.config.supported_formats:
             image_paths.extend(directory.glob(f"{pattern}{fmt}"))
 
-        return self.import_images(sorted(image_paths))
+        return self.import_images(sorted(image_paths), on_result)
 
     def to_editable_yaml(
         self,
@@ -428,29 +728,7 @@ class WorkshopImporter:
             YAML string for manual editing.
         """
         # Aggregate post-its by category
-        categories: dict[str, list[str]] = {
-            "tasks": [],
-            "feelings": [],
-            "influences": [],
-            "pain_points": [],
-            "goals": [],
-        }
-
-        total_confidence = 0.0
-        count = 0
-
-        for result in results:
-            for post_it in result.post_its:
-                if post_it.confidence < self.config.confidence_threshold:
-                    continue
-
-                category = post_it.category.value
-                if category in categories:
-                    categories[category].append(post_it.text)
-                    total_confidence += post_it.confidence
-                    count += 1
-
-        avg_confidence = total_confidence / count if count else 0.0
+        categories, avg_confidence = self._categorise(results)
 
         # Build YAML structure
         data = {
@@ -478,13 +756,76 @@ class WorkshopImporter:
         )
 
         # Add header comments
-        header = """# Workshop Import Results
-# Review and edit the extracted content below
-# Delete any incorrectly extracted items
-# Add missing items manually
+        return self.YAML_HEADER + yaml_content
 
-"""
-        return header + yaml_content
+    def write_result_yaml(
+        self,
+        result: WorkshopExtractionResult,
+        stream: TextIO,
+    ) -> None:
+        """
+        Append one image's extraction to a YAML stream.
+
+        Each image becomes its own YAML document, so results can be
+        written (and reviewed) as they arrive during a long import.
+
+        Example:
+            with open("workshop.yaml", "w") as f:
+                f.write(importer.YAML_HEADER)
+                importer.import_images(
+                    paths, on_result=lambda r: importer.write_result_yaml(r, f)
+                )
+
+        Args:
+            result: Extraction result to write.
+            stream: Text stream to append to.
+        """
+        categories, confidence = self._categorise([result])
+        document = {
+            "source_image": str(result.source_image),
+            "extraction_confidence": round(confidence, 2),
+            **{k: v for k, v in categories.items() if v},
+        }
+        stream.write("---\n")
+        stream.write(
+            yaml.dump(
+                document,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
+        )
+        stream.flush()
+
+    def _categorise(
+        self,
+        results: list[WorkshopExtractionResult],
+    ) -> tuple[dict[str, list[str]], float]:
+        """Group confident post-it texts by category with their mean confidence."""
+        categories: dict[str, list[str]] = {
+            "tasks": [],
+            "feelings": [],
+            "influences": [],
+            "pain_points": [],
+            "goals": [],
+        }
+
+        total_confidence = 0.0
+        count = 0
+
+        for result in results:
+            for post_it in result.post_its:
+                if post_it.confidence < self.config.confidence_threshold:
+                    continue
+
+                category = post_it.category.value
+                if category in categories:
+                    categories[category].append(post_it.text)
+                    total_confidence += post_it.confidence
+                    count += 1
+
+        avg_confidence = total_confidence / count if count else 0.0
+        return categories, avg_confidence
 
     def to_json(self, results: list[WorkshopExtractionResult]) -> str:
         """
@@ -17,9 +17,10 @@ from persona.core.evaluation.models import (
 from persona.core.evaluation.prompts import (
     EVALUATION_SYSTEM_PROMPT,
     build_batch_evaluation_prompt,
+    build_evaluation_prefix,
     build_single_evaluation_prompt,
 )
-from persona.core.providers import ProviderFactory
+from persona.core.providers import CachingProvider, ProviderFactory, ResponseCache
 
 
 class PersonaJudge:
@@ -42,6 +43,7 @@ class PersonaJudge:
         provider: str = "ollama",
         model: str | None = None,
         temperature: float = 0.0,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         """
         Initialise the persona judge.
@@ -50,9 +52,12 @@ class PersonaJudge:
             provider: LLM provider to use (default: "ollama").
             model: Model name to use (default: provider's default).
             temperature: Sampling temperature (default: 0.0 for consistent scoring).
+            response_cache: Optional cache for LLM responses.
         """
         self.provider_name = provider
         self.provider = ProviderFactory.create(provider)
+        if response_cache is not None:
+            self.provider = CachingProvider(self.provider, response_cache)
         self.model = model or self.provider.default_model
         self.temperature = temperature
 
@@ -94,12 +99,13 @@ class PersonaJudge:
         # Build prompt
         prompt = build_single_evaluation_prompt(persona, criteria)
 
-        # Call LLM
+        # Call LLM; the rubric opens every prompt and can be cached
         response = self.provider.generate(
             prompt=prompt,
             model=self.model,
             temperature=self.temperature,
             system_prompt=EVALUATION_SYSTEM_PROMPT,
+            cache_prefix=build_evaluation_prefix(criteria),
         )
 
         # Parse response
@@ -116,6 +122,7 @@ class PersonaJudge:
             model=self.model,
             provider=self.provider_name,
             raw_response=response.raw_response,
+            cached=response.cached,
         )
 
     def evaluate_batch(
@@ -201,12 +208,15 @@ class PersonaJudge:
             model=self.model,
             temperature=self.temperature,
             system_prompt=EVALUATION_SYSTEM_PROMPT,
+            cache_prefix=build_evaluation_prefix(criteria, batch=True),
         )
 
         # Parse batch response
         results = self._parse_batch_evaluation_response(
             response.content, personas, criteria
         )
+        for result in results:
+            result.cached = response.cached
 
         return results
 
@@ -46,6 +46,7 @@ class EvaluationResult(BaseModel):
         provider: Provider used for evaluation.
         evaluated_at: Timestamp of evaluation.
         raw_response: Raw LLM response for debugging.
+        cached: Whether the LLM response was served from the response cache.
     """
 
     persona_id: str = Field(..., description="ID of the evaluated persona")
@@ -63,6 +64,9 @@ class EvaluationResult(BaseModel):
     raw_response: dict[str, Any] | None = Field(
         None, description="Raw LLM response for debugging"
     )
+    cached: bool = Field(
+        False, description="Whether the response was served from the cache"
+    )
 
     def get_score(self, criterion: EvaluationCriteria) -> float | None:
         """Get score for a specific criterion."""
@@ -29,58 +29,102 @@ Provide scores from 0.0 to 1.0 where:
 Be objective and consistent in your evaluation."""
 
 
-def build_single_evaluation_prompt(
-    persona: dict[str, Any],
+def _criteria_text(criteria: list[EvaluationCriteria]) -> str:
+    """Number and describe each criterion."""
+    return "\n".join(
+        f"{i}. **{criterion.value.upper()}**: {criterion.description}"
+        for i, criterion in enumerate(criteria, 1)
+    )
+
+
+def _score_structure(criteria: list[EvaluationCriteria]) -> dict[str, Any]:
+    """Build the expected JSON scores for one persona."""
+    return {
+        criterion.value: {
+            "score": "0.0-1.0",
+            "reasoning": "Brief explanation",
+        }
+        for criterion in criteria
+    }
+
+
+def build_evaluation_prefix(
     criteria: list[EvaluationCriteria],
+    batch: bool = False,
 ) -> str:
     """
-    Build prompt for evaluating a single persona.
+    Build the fixed opening of an evaluation prompt.
+
+    The rubric and response format depend only on the criteria, so every
+    evaluation with the same criteria shares this prefix and providers
+    with prompt caching can reuse it.
 
     Args:
-        persona: Persona data to evaluate.
         criteria: List of criteria to evaluate.
+        batch: Whether the prompt evaluates a set of personas together.
 
     Returns:
-        Evaluation prompt for the LLM.
+        Leading text of the evaluation prompt.
     """
-    persona_json = json.dumps(persona, indent=2)
-
-    # Build criteria descriptions
-    criteria_lines = []
-    for i, criterion in enumerate(criteria, 1):
-        criteria_lines.append(
-            f"{i}. **{criterion.value.upper()}**: {criterion.description}"
-        )
+    criteria_text = _criteria_text(criteria)
 
-    criteria_text = "\n".join(criteria_lines)
-
-    # Build expected JSON structure
-    json_structure = {
-        criterion.value: {
-            "score": "0.0-1.0",
-            "reasoning": "Brief explanation",
-        }
-        for criterion in criteria
-    }
-    json_example = json.dumps(json_structure, indent=2)
-
-    prompt = f"""Evaluate the following user persona:
+    if not batch:
+        json_example = json.dumps(_score_structure(criteria), indent=2)
+        return f"""Evaluate user personas on these criteria:
+{criteria_text}
 
+Respond in JSON format with the following structure:
 ```json
-{persona_json}
+{json_example}
 ```
 
-Evaluate on these criteria:
+Provide objective scores and brief reasoning for each criterion.
+
+"""
+
+    json_example = json.dumps(
+        [{"persona_id": "ID from persona data", "scores": _score_structure(criteria)}],
+        indent=2,
+    )
+    return f"""Evaluate each persona in a set of user personas on these criteria:
 {criteria_text}
 
-Respond in JSON format with the following structure:
+For **DISTINCTIVENESS**, compare each persona against the others in the set to assess uniqueness.
+
+Respond in JSON format with an array containing one evaluation per persona, in this structure:
 ```json
 {json_example}
 ```
 
-Provide objective scores and brief reasoning for each criterion."""
+Provide objective scores and brief reasoning for each criterion. Ensure persona_id matches the ID from the input data.
 
-    return prompt
+"""
+
+
+def build_single_evaluation_prompt(
+    persona: dict[str, Any],
+    criteria: list[EvaluationCriteria],
+) -> str:
+    """
+    Build prompt for evaluating a single persona.
+
+    The prompt opens with build_evaluation_prefix(criteria) and ends with
+    the persona, so the rubric can be cached across personas.
+
+    Args:
+        persona: Persona data to evaluate.
+        criteria: List of criteria to evaluate.
+
+    Returns:
+        Evaluation prompt for the LLM.
+    """
+    persona_json = json.dumps(persona, indent=2)
+
+    return f"""{build_evaluation_prefix(criteria)}Persona to evaluate:
+
+```json
+{persona_json}
+```"""
 
 
 def build_batch_evaluation_prompt(
@@ -92,7 +136,8 @@ def build_batch_evaluation_prompt(
 
     For batch evaluation with DISTINCTIVENESS criterion, we need to
     provide context about all personas. Otherwise, we can evaluate
-    each persona independently.
+    each persona independently. Either way the prompts open with
+    build_evaluation_prefix().
 
     Args:
         personas: List of persona data to evaluate.
@@ -112,48 +157,11 @@ def build_batch_evaluation_prompt(
     # Build batch evaluation prompt with all personas for context
     personas_json = json.dumps(personas, indent=2)
 
-    # Build criteria descriptions
-    criteria_lines = []
-    for i, criterion in enumerate(criteria, 1):
-        criteria_lines.append(
-            f"{i}. **{criterion.value.upper()}**: {criterion.description}"
-        )
-
-    criteria_text = "\n".join(criteria_lines)
-
-    # Build expected JSON structure for all personas
-    json_structure = [
-        {
-            "persona_id": "ID from persona data",
-            "scores": {
-                criterion.value: {
-                    "score": "0.0-1.0",
-                    "reasoning": "Brief explanation",
-                }
-                for criterion in criteria
-            },
-        }
-        for _ in range(len(personas))
-    ]
-    json_example = json.dumps(json_structure, indent=2)
-
-    prompt = f"""Evaluate the following set of {len(personas)} user personas:
+    prompt = f"""{build_evaluation_prefix(criteria, batch=True)}Set of {len(personas)} personas to evaluate:
 
 ```json
 {personas_json}
-```
-
-Evaluate each persona on these criteria:
-{criteria_text}
-
-For **DISTINCTIVENESS**, compare each persona against the others in the set to assess uniqueness.
-
-Respond in JSON format with an array containing evaluation for each persona:
-```json
-{json_example}
-```
-
-Provide objective scores and brief reasoning for each criterion. Ensure persona_id matches the ID from the input data."""
+```"""
 
     return [prompt]
 
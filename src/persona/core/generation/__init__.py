@@ -5,6 +5,7 @@ This module provides the core generation pipeline that orchestrates
 data loading, prompt rendering, LLM calls, and output parsing.
 """
 
+from persona.core.generation.compact import CompactPersona, FieldsView, PersonaView
 from persona.core.generation.parser import Persona, PersonaParser
 from persona.core.generation.pipeline import (
     GenerationConfig,
@@ -32,6 +33,9 @@ __all__ = [
     "GenerationResult",
     "PersonaParser",
     "Persona",
+    "CompactPersona",
+    "FieldsView",
+    "PersonaView",
     # Variations (F-033, F-034, F-035)
     "ComplexityLevel",
     "DetailLevel",
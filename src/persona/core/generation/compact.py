@@ -0,0 +1,427 @@
+"""
+Memory-compact, immutable persona representation.
+
+Persona is a regular dataclass with an instance __dict__, mutable
+lists and its own demographics/additional dicts, which adds several
+hundred bytes of overhead per persona before any content. CompactPersona
+stores the same data in __slots__, keeps list fields as tuples and
+splits mapping fields into a key tuple shared by every persona with the
+same keys (interned once per process) plus a per-persona value tuple.
+Demographic string values are interned too, so the handful of distinct
+values a large collection repeats (age bands, locations, roles) are
+stored once and compare by identity.
+Because it is immutable, its content hash and normalised text are
+computed at most once, which suits clustering, deduplication and
+scoring over large collections.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from persona.core.generation.parser import Persona
+
+# Interned key tuples, shared by all personas with the same field names
+_KEY_TUPLES: dict[tuple[str, ...], tuple[str, ...]] = {}
+_KEY_TUPLES_LOCK = threading.Lock()
+
+# Top-level keys produced by to_dict(), before additional fields
+_CORE_KEYS = (
+    "id",
+    "name",
+    "demographics",
+    "goals",
+    "pain_points",
+    "behaviours",
+    "quotes",
+)
+
+
+def content_hash(data: Mapping[str, Any]) -> str:
+    """
+    Hash a persona's dictionary form.
+
+    Args:
+        data: Persona dictionary (as produced by to_dict()).
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON form, identical for
+        personas with the same content.
+    """
+    serialised = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+
+
+def intern_keys(keys: Iterable[str]) -> tuple[str, ...]:
+    """
+    Get the shared tuple for a sequence of field names.
+
+    Args:
+        keys: Field names, in order.
+
+    Returns:
+        Tuple of interned strings, identical (the same object) for every
+        call with the same names.
+    """
+    key_tuple = tuple(sys.intern(key) for key in keys)
+    shared = _KEY_TUPLES.get(key_tuple)
+    if shared is None:
+        with _KEY_TUPLES_LOCK:
+            shared = _KEY_TUPLES.setdefault(key_tuple, key_tuple)
+    return shared
+
+
+def intern_value(value: Any) -> Any:
+    """
+    Intern a field value if it is a string.
+
+    Args:
+        value: Field value.
+
+    Returns:
+        The interned string, or the value unchanged if it is not a string.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class FieldsView(Mapping[str, Any]):
+    """
+    Read-only mapping over a shared key tuple and a value tuple.
+
+    Lookups scan the keys, which is faster than hashing for the handful
+    of fields a persona mapping holds.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, keys: tuple[str, ...], values: tuple[Any, ...]) -> None:
+        """
+        Initialise the view.
+
+        Args:
+            keys: Field names.
+            values: Field values, aligned with keys.
+        """
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a field value."""
+        for index, name in enumerate(self._keys):
+            if name == key:
+                return self._values[index]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over field names."""
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Return number of fields."""
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation."""
+        return repr(dict(zip(self._keys, self._values, strict=True)))
+
+
+class PersonaView(Mapping[str, Any]):
+    """
+    Read-only dictionary view of a CompactPersona.
+
+    Exposes the keys and values of CompactPersona.to_dict() without
+    building a dictionary; list fields are returned as tuples and
+    mapping fields as FieldsViews.
+    """
+
+    __slots__ = ("_persona",)
+
+    def __init__(self, persona: "CompactPersona") -> None:
+        """
+        Initialise the view.
+
+        Args:
+            persona: Persona to view.
+        """
+        self._persona = persona
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a top-level field value."""
+        if key in _CORE_KEYS:
+            return getattr(self._persona, key)
+        return self._persona.additional[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over top-level field names."""
+        yield from _CORE_KEYS
+        yield from (k for k in self._persona.additional if k not in _CORE_KEYS)
+
+    def __len__(self) -> int:
+        """Return number of top-level fields."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation."""
+        return f"PersonaView({dict(self)!r})"
+
+
+class CompactPersona:
+    """
+    Immutable, slotted persona for holding large collections.
+
+    Converts to and from Persona and its dictionary form; equality and
+    hashing use the content hash, so compact personas can be placed in
+    sets and used as dictionary keys for deduplication.
+
+    Example:
+        compact = [CompactPersona.from_persona(p) for p in personas]
+        unique = set(compact)
+        texts = [p.normalised_text for p in unique]
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "goals",
+        "pain_points",
+        "behaviours",
+        "quotes",
+        "_demographic_keys",
+        "_demographic_values",
+        "_additional_keys",
+        "_additional_values",
+        "_content_hash",
+        "_normalised_text",
+    )
+
+    id: str
+    name: str
+    goals: tuple[str, ...]
+    pain_points: tuple[str, ...]
+    behaviours: tuple[str, ...]
+    quotes: tuple[str, ...]
+    _demographic_keys: tuple[str, ...]
+    _demographic_values: tuple[Any, ...]
+    _additional_keys: tuple[str, ...]
+    _additional_values: tuple[Any, ...]
+    _content_hash: str | None
+    _normalised_text: str | None
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        demographics: Mapping[str, Any] | None = None,
+        goals: Iterable[str] = (),
+        pain_points: Iterable[str] = (),
+        behaviours: Iterable[str] = (),
+        quotes: Iterable[str] = (),
+        additional: Mapping[str, Any] | None = None,
+    ) -> None:
+        """
+        Initialise a compact persona.
+
+        Args:
+            id: Unique identifier for the persona.
+            name: Display name for the persona.
+            demographics: Demographic information.
+            goals: User goals.
+            pain_points: Pain points or frustrations.
+            behaviours: Typical behaviours.
+            quotes: Representative quotes.
+            additional: Any additional fields.
+        """
+        demographics = demographics or {}
+        additional = additional or {}
+        init = object.__setattr__
+        init(self, "id", id)
+        init(self, "name", name)
+        init(self, "goals", tuple(goals or ()))
+        init(self, "pain_points", tuple(pain_points or ()))
+        init(self, "behaviours", tuple(behaviours or ()))
+        init(self, "quotes", tuple(quotes or ()))
+        init(self, "_demographic_keys", intern_keys(demographics))
+        init(
+            self,
+            "_demographic_values",
+            tuple(intern_value(value) for value in demographics.values()),
+        )
+        init(self, "_additional_keys", intern_keys(additional))
+        init(self, "_additional_values", tuple(additional.values()))
+        init(self, "_content_hash", None)
+        init(self, "_normalised_text", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute assignment."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def demographics(self) -> FieldsView:
+        """Demographic information."""
+        return FieldsView(self._demographic_keys, self._demographic_values)
+
+    @property
+    def additional(self) -> FieldsView:
+        """Additional fields from the LLM response."""
+        return FieldsView(self._additional_keys, self._additional_values)
+
+    @classmethod
+    def from_persona(cls, persona: Persona) -> "CompactPersona":
+        """
+        Create a compact copy of a Persona.
+
+        Args:
+            persona: Persona to convert.
+
+        Returns:
+            CompactPersona sharing the persona's field values.
+        """
+        return cls(
+            id=persona.id,
+            name=persona.name,
+            demographics=persona.demographics,
+            goals=persona.goals,
+            pain_points=persona.pain_points,
+            behaviours=persona.behaviours,
+            quotes=persona.quotes,
+            additional=persona.additional,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CompactPersona":
+        """
+        Create a compact persona from a dictionary.
+
+        Accepts the same alternate field names as Persona.from_dict,
+        without modifying the dictionary.
+
+        Args:
+            data: Dictionary with persona fields.
+
+        Returns:
+            CompactPersona instance.
+        """
+        pain_points = data.get("pain_points", data.get("painPoints", ()))
+        behaviours = data.get("behaviours", data.get("behaviors", ()))
+        skip = set(_CORE_KEYS)
+        if "pain_points" not in data:
+            skip.add("painPoints")
+        if "behaviours" not in data:
+            skip.add("behaviors")
+
+        return cls(
+            id=data.get("id", ""),
+            name=data.get("name", ""),
+            demographics=data.get("demographics"),
+            goals=data.get("goals", ()),
+            pain_points=pain_points,
+            behaviours=behaviours,
+            quotes=data.get("quotes", ()),
+            additional={k: v for k, v in data.items() if k not in skip},
+        )
+
+    def to_persona(self) -> Persona:
+        """
+        Convert to a mutable Persona.
+
+        Returns:
+            Persona with its own lists and dictionaries.
+        """
+        return Persona(
+            id=self.id,
+            name=self.name,
+            demographics=dict(self.demographics),
+            goals=list(self.goals),
+            pain_points=list(self.pain_points),
+            behaviours=list(self.behaviours),
+            quotes=list(self.quotes),
+            additional=dict(self.additional),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert persona to dictionary (same layout as Persona.to_dict)."""
+        result = {
+            "id": self.id,
+            "name": self.name,
+            "demographics": dict(self.demographics),
+            "goals": list(self.goals),
+            "pain_points": list(self.pain_points),
+            "behaviours": list(self.behaviours),
+            "quotes": list(self.quotes),
+        }
+        result.update(self.additional)
+        return result
+
+    def as_dict(self) -> PersonaView:
+        """
+        Get a read-only dictionary view without copying.
+
+        Returns:
+            PersonaView over this persona.
+        """
+        return PersonaView(self)
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the persona's canonical JSON form (cached)."""
+        digest = self._content_hash
+        if digest is None:
+            digest = content_hash(self.to_dict())
+            object.__setattr__(self, "_content_hash", digest)
+        return digest
+
+    @property
+    def normalised_text(self) -> str:
+        """Lower-cased, whitespace-collapsed text content (cached)."""
+        text = self._normalised_text
+        if text is None:
+            parts: list[str] = [self.name] if self.name else []
+            for value in (*self._demographic_values, *self._additional_values):
+                if isinstance(value, (list, tuple)):
+                    parts.extend(str(v) for v in value)
+                elif value is not None:
+                    parts.append(str(value))
+            for items in (self.goals, self.pain_points, self.behaviours, self.quotes):
+                parts.extend(str(item) for item in items)
+            text = " ".join(" ".join(parts).lower().split())
+            object.__setattr__(self, "_normalised_text", text)
+        return text
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by content."""
+        if not isinstance(other, CompactPersona):
+            return NotImplemented
+        return self.content_hash == other.content_hash
+
+    def __hash__(self) -> int:
+        """Hash by content."""
+        return hash(self.content_hash)
+
+    def __repr__(self) -> str:
+        """Return a short representation."""
+        return f"CompactPersona(id={self.id!r}, name={self.name!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling despite the immutable attributes."""
+        return (
+            type(self),
+            (
+                self.id,
+                self.name,
+                dict(self.demographics),
+                self.goals,
+                self.pain_points,
+                self.behaviours,
+                self.quotes,
+                dict(self.additional),
+            ),
+        )
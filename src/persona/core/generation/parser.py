@@ -9,7 +9,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-from persona.core.utils import JSONExtractor
+from persona.core.utils import JSONExtractor, StreamingJSONParser
 
 
 @dataclass
@@ -104,12 +104,15 @@ class ParseResult:
         reasoning: Optional reasoning from the LLM.
         raw_output: The raw output section.
         full_response: The complete LLM response.
+        truncated: Whether the response was cut off before the JSON
+            closed; personas holds only those completed before the cut.
     """
 
     personas: list[Persona]
     reasoning: str | None = None
     raw_output: str = ""
     full_response: str = ""
+    truncated: bool = False
 
 
 class PersonaParser:
@@ -117,7 +120,9 @@ class PersonaParser:
     Parser for extracting personas from LLM responses.
 
     Handles various response formats and extracts structured
-    persona data from JSON within the response.
+    persona data from JSON within the response. The JSON is scanned
+    once, so personas completed before a truncated tail are still
+    recovered.
 
     Example:
         parser = PersonaParser()
@@ -134,12 +139,14 @@ class PersonaParser:
         r"<reasoning>\s*(.*?)\s*</reasoning>", re.DOTALL | re.IGNORECASE
     )
 
-    def parse(self, response: str) -> ParseResult:
+    def parse(self, response: str, finish_reason: str | None = None) -> ParseResult:
         """
         Parse an LLM response to extract personas.
 
         Args:
             response: The full LLM response text.
+            finish_reason: Provider stop reason, if known. "length" marks
+                the result as truncated even if the JSON happened to close.
 
         Returns:
             ParseResult with extracted personas and metadata.
@@ -150,19 +157,39 @@ class PersonaParser:
         # Extract output section
         raw_output = self._extract_output(response)
 
-        # Parse JSON from output using unified extractor
-        json_data = JSONExtractor.extract_json(raw_output or response)
+        # Scan the JSON once, keeping personas completed before any cut-off
+        text = raw_output or response
+        scanner = StreamingJSONParser()
+        personas = self._from_records(scanner.feed(text))
+        root = self._from_root(scanner.close())
 
-        # Convert to personas
-        personas = self._parse_personas(json_data)
+        if not personas:
+            # No persona array was found. A lone object may be an example
+            # ahead of the real payload, so let the tolerant extractor
+            # decide, keeping the scanned object if it finds nothing
+            json_data = JSONExtractor.extract_json(text)
+            personas = self._parse_personas(json_data) or root
 
         return ParseResult(
             personas=personas,
             reasoning=reasoning,
             raw_output=raw_output,
             full_response=response,
+            truncated=scanner.truncated or finish_reason == "length",
         )
 
+    @staticmethod
+    def _from_records(records: list[dict[str, Any]]) -> list[Persona]:
+        """Convert records from a persona array."""
+        return [Persona.from_dict(record) for record in records]
+
+    def _from_root(self, records: list[dict[str, Any]]) -> list[Persona]:
+        """Convert a single top-level object if it looks like a persona."""
+        personas: list[Persona] = []
+        for record in records:
+            personas.extend(self._parse_personas(record))
+        return personas
+
     def _extract_reasoning(self, response: str) -> str | None:
         """Extract reasoning section from response."""
         match = self.REASONING_PATTERN.search(response)
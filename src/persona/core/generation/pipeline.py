@@ -5,15 +5,27 @@ This module provides the main orchestration class that combines
 data loading, prompt rendering, LLM generation, and output parsing.
 """
 
-import asyncio
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
-from persona.core.data import DataLoader
+from persona.core.data import DataLoader, LoadResult
 from persona.core.generation.parser import ParseResult, Persona, PersonaParser
+from persona.core.logging.tracing import span, traced
 from persona.core.prompts import Workflow, WorkflowLoader
-from persona.core.providers import LLMProvider, LLMResponse, ProviderFactory
+from persona.core.providers import (
+    CachingProvider,
+    LLMProvider,
+    LLMResponse,
+    ProviderFactory,
+    ResponseCache,
+)
+from persona.core.utils.async_helpers import run_blocking
+
+# Responses up to this size are parsed directly on the event loop;
+# larger ones are parsed on the shared blocking executor
+PARSE_INLINE_MAX_CHARS = 64_000
 
 
 @dataclass
@@ -63,6 +75,12 @@ class GenerationResult:
         prompt: The rendered prompt used.
         raw_response: The full LLM response.
         config: The generation configuration used.
+        cached: Whether the LLM response was served from the response cache.
+        cache_read_tokens: Input tokens the provider served from its
+            prompt cache.
+        cache_stats: Response cache statistics, when a cache is in use.
+        truncated: Whether the response was cut off before its JSON
+            closed; personas holds only those completed before the cut.
     """
 
     personas: list[Persona]
@@ -76,6 +94,10 @@ class GenerationResult:
     prompt: str = ""
     raw_response: str = ""
     config: "GenerationConfig | None" = None
+    cached: bool = False
+    cache_read_tokens: int = 0
+    cache_stats: dict | None = None
+    truncated: bool = False
 
 
 class GenerationPipeline:
@@ -105,6 +127,8 @@ class GenerationPipeline:
         data_loader: DataLoader | None = None,
         workflow_loader: WorkflowLoader | None = None,
         parser: PersonaParser | None = None,
+        response_cache: ResponseCache | None = None,
+        provider: LLMProvider | None = None,
     ) -> None:
         """
         Initialise the generation pipeline.
@@ -113,11 +137,19 @@ class GenerationPipeline:
             data_loader: Optional custom data loader.
             workflow_loader: Optional custom workflow loader.
             parser: Optional custom persona parser.
+            response_cache: Optional cache for LLM responses. Identical
+                requests are served from the cache instead of the provider.
+            provider: Optional provider instance to use instead of creating
+                one from the configured provider name.
         """
         self._data_loader = data_loader or DataLoader()
         self._workflow_loader = workflow_loader or WorkflowLoader()
         self._parser = parser or PersonaParser()
+        self._response_cache = response_cache
+        self._provider = provider
         self._progress_callback: Callable[[str], None] | None = None
+        # Resolved built-in workflows, by requested name
+        self._workflows: dict[str, Workflow] = {}
 
     def set_progress_callback(self, callback: Callable[[str], None]) -> None:
         """
@@ -133,12 +165,17 @@ class GenerationPipeline:
         if self._progress_callback:
             self._progress_callback(message)
 
-    def generate(self, config: GenerationConfig) -> GenerationResult:
+    @traced("generation.generate")
+    def generate(
+        self, config: GenerationConfig, loaded: LoadResult | None = None
+    ) -> GenerationResult:
         """
         Generate personas based on configuration.
 
         Args:
             config: Generation configuration.
+            loaded: Data already loaded for config.data_path; when given
+                it is used as-is instead of reading the data again.
 
         Returns:
             GenerationResult with generated personas.
@@ -149,20 +186,26 @@ class GenerationPipeline:
             RuntimeError: If LLM generation fails.
         """
         self._progress("Loading input data...")
-        data_content, source_files = self._load_data(config.data_path)
+        if loaded is None:
+            data_content, source_files = self._load_data(config.data_path)
+        else:
+            data_content, source_files = loaded.content, loaded.files
 
         self._progress("Loading workflow configuration...")
         workflow = self._load_workflow(config.workflow)
 
         self._progress("Rendering prompt...")
         prompt = self._render_prompt(workflow, config, data_content)
+        cache_prefix = self._cache_prefix(prompt, data_content)
 
         self._progress(f"Generating with {config.provider}...")
         provider = self._create_provider(config)
-        llm_response = self._call_llm(provider, prompt, config)
+        llm_response = self._call_llm(provider, prompt, config, cache_prefix)
 
         self._progress("Parsing response...")
-        parse_result = self._parse_response(llm_response.content)
+        parse_result = self._parse_response(
+            llm_response.content, llm_response.finish_reason
+        )
 
         self._progress("Generation complete!")
 
@@ -176,24 +219,42 @@ class GenerationPipeline:
             source_files=source_files,
             prompt=prompt,
             raw_response=llm_response.content,
+            cached=llm_response.cached,
+            cache_read_tokens=llm_response.cache_read_tokens,
+            truncated=parse_result.truncated,
+            cache_stats=(
+                self._response_cache.stats.to_dict()
+                if self._response_cache is not None
+                else None
+            ),
         )
 
     def _load_data(self, path: str | Path) -> tuple[str, list[Path]]:
         """Load and combine input data."""
-        return self._data_loader.load_path(path)
+        with span("generation.load", path=str(path)) as s:
+            content, files = self._data_loader.load_path(path)
+            s.set_attributes({"files": len(files), "chars": len(content)})
+        return content, files
 
     def _load_workflow(self, workflow: str) -> Workflow:
         """Load workflow configuration."""
-        # Check if it's a file path
-        if Path(workflow).exists():
-            return self._workflow_loader.load(workflow)
-
-        # Try as built-in workflow
-        try:
-            return self._workflow_loader.load_builtin(workflow)
-        except ValueError:
-            # Default to 'default' workflow
-            return self._workflow_loader.load_builtin("default")
+        with span("generation.workflow", workflow=workflow):
+            # Check if it's a file path
+            if Path(workflow).exists():
+                return self._workflow_loader.load(workflow)
+
+            cached = self._workflows.get(workflow)
+            if cached is not None:
+                return cached
+
+            # Try as built-in workflow
+            try:
+                loaded = self._workflow_loader.load_builtin(workflow)
+            except ValueError:
+                # Default to 'default' workflow
+                loaded = self._workflow_loader.load_builtin("default")
+            self._workflows[workflow] = loaded
+            return loaded
 
     def _render_prompt(
         self,
@@ -202,42 +263,90 @@ class GenerationPipeline:
         data: str,
     ) -> str:
         """Render the prompt template with variables."""
-        return workflow.render_prompt(
-            count=config.count,
-            data=data,
-            complexity=config.complexity,
-            detail_level=config.detail_level,
-            include_reasoning=config.include_reasoning,
-        )
+        with span("generation.render") as s:
+            prompt = workflow.render_prompt(
+                count=config.count,
+                data=data,
+                complexity=config.complexity,
+                detail_level=config.detail_level,
+                include_reasoning=config.include_reasoning,
+            )
+            s.set_attribute("prompt_chars", len(prompt))
+        return prompt
 
     def _create_provider(self, config: GenerationConfig) -> LLMProvider:
         """Create the LLM provider."""
-        return ProviderFactory.create(config.provider)
+        provider = self._provider or ProviderFactory.create(config.provider)
+        if self._response_cache is not None:
+            provider = CachingProvider(provider, self._response_cache)
+        return provider
+
+    @staticmethod
+    def _cache_prefix(prompt: str, data: str) -> str:
+        """
+        Get the stable prompt prefix ending with the source data.
+
+        Everything up to and including the data is identical across
+        variants, counts and retries of the same corpus, so providers can
+        serve it from their prompt cache.
+        """
+        if not data:
+            return ""
+        index = prompt.find(data)
+        if index < 0:
+            return ""
+        return prompt[: index + len(data)]
 
     def _call_llm(
         self,
         provider: LLMProvider,
         prompt: str,
         config: GenerationConfig,
+        cache_prefix: str = "",
     ) -> LLMResponse:
         """Call the LLM provider."""
-        return provider.generate(
-            prompt=prompt,
-            model=config.model,
-            max_tokens=config.max_tokens,
-            temperature=config.temperature,
-        )
-
-    def _parse_response(self, response: str) -> ParseResult:
+        with span("provider.call", provider=config.provider) as s:
+            response = provider.generate(
+                prompt=prompt,
+                model=config.model,
+                max_tokens=config.max_tokens,
+                temperature=config.temperature,
+                cache_prefix=cache_prefix,
+            )
+            s.set_attributes(self._response_attributes(response))
+        return response
+
+    @staticmethod
+    def _response_attributes(response: LLMResponse) -> dict[str, Any]:
+        """Span attributes describing a provider response."""
+        return {
+            "model": response.model,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "cached": response.cached,
+        }
+
+    def _parse_response(
+        self, response: str, finish_reason: str | None = None
+    ) -> ParseResult:
         """Parse the LLM response."""
-        return self._parser.parse(response)
+        with span("generation.parse") as s:
+            result = self._parser.parse(response, finish_reason)
+            s.set_attributes(
+                {"personas": len(result.personas), "truncated": result.truncated}
+            )
+        return result
 
-    async def generate_async(self, config: GenerationConfig) -> GenerationResult:
+    @traced("generation.generate")
+    async def generate_async(
+        self, config: GenerationConfig, loaded: LoadResult | None = None
+    ) -> GenerationResult:
         """
         Generate personas asynchronously based on configuration.
 
         Args:
             config: Generation configuration.
+            loaded: Data already loaded for config.data_path (see generate).
 
         Returns:
             GenerationResult with generated personas.
@@ -248,20 +357,30 @@ class GenerationPipeline:
             RuntimeError: If LLM generation fails.
         """
         self._progress("Loading input data...")
-        data_content, source_files = await self._load_data_async(config.data_path)
+        if loaded is None:
+            data_content, source_files = await self._load_data_async(
+                config.data_path
+            )
+        else:
+            data_content, source_files = loaded.content, loaded.files
 
         self._progress("Loading workflow configuration...")
         workflow = await self._load_workflow_async(config.workflow)
 
         self._progress("Rendering prompt...")
         prompt = self._render_prompt(workflow, config, data_content)
+        cache_prefix = self._cache_prefix(prompt, data_content)
 
         self._progress(f"Generating with {config.provider}...")
         provider = self._create_provider(config)
-        llm_response = await self._call_llm_async(provider, prompt, config)
+        llm_response = await self._call_llm_async(
+            provider, prompt, config, cache_prefix
+        )
 
         self._progress("Parsing response...")
-        parse_result = await self._parse_response_async(llm_response.content)
+        parse_result = await self._parse_response_async(
+            llm_response.content, llm_response.finish_reason
+        )
 
         self._progress("Generation complete!")
 
@@ -275,37 +394,76 @@ class GenerationPipeline:
             source_files=source_files,
             prompt=prompt,
             raw_response=llm_response.content,
+            cached=llm_response.cached,
+            cache_read_tokens=llm_response.cache_read_tokens,
+            truncated=parse_result.truncated,
+            cache_stats=(
+                self._response_cache.stats.to_dict()
+                if self._response_cache is not None
+                else None
+            ),
         )
 
     async def _load_data_async(self, path: str | Path) -> tuple[str, list[Path]]:
         """Load and combine input data asynchronously."""
-        return await self._data_loader.load_path_async(path)
+        with span("generation.load", path=str(path)) as s:
+            content, files = await self._data_loader.load_path_async(path)
+            s.set_attributes({"files": len(files), "chars": len(content)})
+        return content, files
 
     async def _load_workflow_async(self, workflow: str) -> Workflow:
-        """Load workflow configuration asynchronously."""
-        # Run synchronous workflow loading in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self._load_workflow(workflow))
+        """
+        Load workflow configuration asynchronously.
+
+        Built-in workflows are resolved on the event loop (their templates
+        come from the compiled template cache) and then reused by this
+        pipeline; workflow files are read on the shared blocking executor.
+        """
+        cached = self._workflows.get(workflow)
+        if cached is not None:
+            return cached
+        if workflow in self._workflow_loader.list_builtin():
+            return self._load_workflow(workflow)
+        return await run_blocking(self._load_workflow, workflow)
 
     async def _call_llm_async(
         self,
         provider: LLMProvider,
         prompt: str,
         config: GenerationConfig,
+        cache_prefix: str = "",
     ) -> LLMResponse:
         """Call the LLM provider asynchronously."""
-        return await provider.generate_async(
-            prompt=prompt,
-            model=config.model,
-            max_tokens=config.max_tokens,
-            temperature=config.temperature,
-        )
+        with span("provider.call", provider=config.provider) as s:
+            response = await provider.generate_async(
+                prompt=prompt,
+                model=config.model,
+                max_tokens=config.max_tokens,
+                temperature=config.temperature,
+                cache_prefix=cache_prefix,
+            )
+            s.set_attributes(self._response_attributes(response))
+        return response
+
+    async def _parse_response_async(
+        self, response: str, finish_reason: str | None = None
+    ) -> ParseResult:
+        """
+        Parse the LLM response asynchronously.
 
-    async def _parse_response_async(self, response: str) -> ParseResult:
-        """Parse the LLM response asynchronously."""
-        # Run synchronous parsing in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self._parser.parse(response))
+        Typical responses parse in well under a millisecond, so they are
+        parsed inline; only responses over PARSE_INLINE_MAX_CHARS are
+        handed to the shared blocking executor.
+        """
+        if len(response) <= PARSE_INLINE_MAX_CHARS:
+            return self._parse_response(response, finish_reason)
+
+        with span("generation.parse", offloaded=True) as s:
+            result = await run_blocking(self._parser.parse, response, finish_reason)
+            s.set_attributes(
+                {"personas": len(result.personas), "truncated": result.truncated}
+            )
+        return result
 
     async def generate_batch_async(
         self,
@@ -31,12 +31,21 @@ PROVIDER_PRICING = {
     },
 }
 
+# Prompt-cache pricing as multiples of the input token price
+PROMPT_CACHE_PRICING = {
+    "anthropic": {"read": 0.1, "write": 1.25},
+    "openai": {"read": 0.5, "write": 1.0},
+    "gemini": {"read": 0.25, "write": 1.0},
+}
+
 
 def estimate_cost(
     provider: str,
     model: str,
     input_tokens: int = 0,
     output_tokens: int = 0,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
 ) -> float:
     """
     Estimate cost for API call.
@@ -44,8 +53,10 @@ def estimate_cost(
     Args:
         provider: Provider name (anthropic, openai, gemini, ollama).
         model: Model identifier.
-        input_tokens: Number of input tokens.
+        input_tokens: Number of input tokens (including cached tokens).
         output_tokens: Number of output tokens.
+        cache_read_tokens: Input tokens read from the provider's prompt cache.
+        cache_write_tokens: Input tokens written to the provider's prompt cache.
 
     Returns:
         Estimated cost in USD.
@@ -78,8 +89,17 @@ def estimate_cost(
         # Unknown model, return 0 but warn
         return 0.0
 
+    # Cached input tokens are billed at the provider's cache rates
+    cache_pricing = PROMPT_CACHE_PRICING.get(provider, {"read": 1.0, "write": 1.0})
+    uncached_tokens = max(0, input_tokens - cache_read_tokens - cache_write_tokens)
+    weighted_input = (
+        uncached_tokens
+        + cache_read_tokens * cache_pricing["read"]
+        + cache_write_tokens * cache_pricing["write"]
+    )
+
     # Calculate cost per million tokens
-    input_cost = (input_tokens / 1_000_000) * model_pricing["input"]
+    input_cost = (weighted_input / 1_000_000) * model_pricing["input"]
     output_cost = (output_tokens / 1_000_000) * model_pricing["output"]
 
     return input_cost + output_cost
@@ -98,6 +118,17 @@ class CostTracker:
         frontier_output_tokens: Tokens used for frontier model output.
         judge_input_tokens: Tokens used for judge model input.
         judge_output_tokens: Tokens used for judge model output.
+        frontier_cache_read_tokens: Frontier input tokens read from the
+            provider's prompt cache.
+        frontier_cache_write_tokens: Frontier input tokens written to the
+            provider's prompt cache.
+        judge_cache_read_tokens: Judge input tokens read from the
+            provider's prompt cache.
+        judge_cache_write_tokens: Judge input tokens written to the
+            provider's prompt cache.
+        cache_hits: Number of calls served from the response cache.
+        cached_input_tokens: Input tokens not billed thanks to cache hits.
+        cached_output_tokens: Output tokens not billed thanks to cache hits.
 
     Example:
         tracker = CostTracker(max_budget=5.0)
@@ -115,6 +146,13 @@ class CostTracker:
     frontier_output_tokens: int = 0
     judge_input_tokens: int = 0
     judge_output_tokens: int = 0
+    frontier_cache_read_tokens: int = 0
+    frontier_cache_write_tokens: int = 0
+    judge_cache_read_tokens: int = 0
+    judge_cache_write_tokens: int = 0
+    cache_hits: int = 0
+    cached_input_tokens: int = 0
+    cached_output_tokens: int = 0
 
     # Provider/model tracking
     local_provider: str = "ollama"
@@ -129,15 +167,37 @@ class CostTracker:
         self.local_input_tokens += input_tokens
         self.local_output_tokens += output_tokens
 
-    def add_frontier_usage(self, input_tokens: int, output_tokens: int) -> None:
+    def add_frontier_usage(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> None:
         """Add frontier model token usage."""
         self.frontier_input_tokens += input_tokens
         self.frontier_output_tokens += output_tokens
-
-    def add_judge_usage(self, input_tokens: int, output_tokens: int) -> None:
+        self.frontier_cache_read_tokens += cache_read_tokens
+        self.frontier_cache_write_tokens += cache_write_tokens
+
+    def add_judge_usage(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> None:
         """Add judge model token usage."""
         self.judge_input_tokens += input_tokens
         self.judge_output_tokens += output_tokens
+        self.judge_cache_read_tokens += cache_read_tokens
+        self.judge_cache_write_tokens += cache_write_tokens
+
+    def add_cached_usage(self, input_tokens: int, output_tokens: int) -> None:
+        """Record a call served from the response cache (not billed)."""
+        self.cache_hits += 1
+        self.cached_input_tokens += input_tokens
+        self.cached_output_tokens += output_tokens
 
     @property
     def local_cost(self) -> float:
@@ -160,6 +220,8 @@ class CostTracker:
             self.frontier_model,
             self.frontier_input_tokens,
             self.frontier_output_tokens,
+            self.frontier_cache_read_tokens,
+            self.frontier_cache_write_tokens,
         )
 
     @property
@@ -170,6 +232,8 @@ class CostTracker:
             self.judge_model,
             self.judge_input_tokens,
             self.judge_output_tokens,
+            self.judge_cache_read_tokens,
+            self.judge_cache_write_tokens,
         )
 
     @property
@@ -222,17 +286,26 @@ class CostTracker:
             "frontier": {
                 "input_tokens": self.frontier_input_tokens,
                 "output_tokens": self.frontier_output_tokens,
+                "cache_read_tokens": self.frontier_cache_read_tokens,
+                "cache_write_tokens": self.frontier_cache_write_tokens,
                 "cost": round(self.frontier_cost, 4),
             },
             "judge": {
                 "input_tokens": self.judge_input_tokens,
                 "output_tokens": self.judge_output_tokens,
+                "cache_read_tokens": self.judge_cache_read_tokens,
+                "cache_write_tokens": self.judge_cache_write_tokens,
                 "cost": round(self.judge_cost, 4),
             },
             "total": {
                 "tokens": self.total_tokens,
                 "cost": round(self.total_cost, 4),
             },
+            "cache": {
+                "hits": self.cache_hits,
+                "input_tokens": self.cached_input_tokens,
+                "output_tokens": self.cached_output_tokens,
+            },
             "budget": {
                 "max": self.max_budget,
                 "remaining": (
@@ -13,6 +13,7 @@ from typing import Any
 from persona.core.hybrid.config import HybridConfig
 from persona.core.hybrid.cost import CostTracker
 from persona.core.hybrid.stages import draft_personas, filter_personas, refine_personas
+from persona.core.providers import ResponseCache
 
 
 @dataclass
@@ -99,14 +100,22 @@ class HybridPipeline:
         result = await pipeline.generate(input_data=data, count=10)
     """
 
-    def __init__(self, config: HybridConfig) -> None:
+    def __init__(
+        self,
+        config: HybridConfig,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
         """
         Initialise hybrid pipeline.
 
         Args:
             config: Pipeline configuration.
+            response_cache: Optional cache for draft, judge and refinement
+                responses. Cache hits are recorded separately from billed
+                usage in the cost tracker.
         """
         self.config = config
+        self.response_cache = response_cache
 
     async def generate(
         self,
@@ -162,6 +171,7 @@ class HybridPipeline:
             config=self.config,
             count=count,
             cost_tracker=cost_tracker,
+            response_cache=self.response_cache,
         )
 
         draft_count = len(draft_personas_list)
@@ -171,6 +181,7 @@ class HybridPipeline:
             personas=draft_personas_list,
             config=self.config,
             cost_tracker=cost_tracker,
+            response_cache=self.response_cache,
         )
 
         passing_count = len(passing_personas)
@@ -182,6 +193,7 @@ class HybridPipeline:
                 personas=needs_refinement,
                 config=self.config,
                 cost_tracker=cost_tracker,
+                response_cache=self.response_cache,
             )
 
         refined_count = len([p for p in refined_personas if p.get("_refined", False)])
@@ -201,6 +213,8 @@ class HybridPipeline:
             "needs_refinement_count": len(needs_refinement),
             "budget_exceeded": cost_tracker.is_over_budget,
         }
+        if self.response_cache is not None:
+            metadata["response_cache"] = self.response_cache.stats.to_dict()
 
         return HybridResult(
             personas=final_personas,
@@ -9,15 +9,18 @@ from typing import Any
 
 from persona.core.hybrid.config import HybridConfig
 from persona.core.hybrid.cost import CostTracker
-from persona.core.providers import ProviderFactory
+from persona.core.logging.tracing import traced
+from persona.core.providers import CachingProvider, ProviderFactory, ResponseCache
 from persona.core.utils import JSONExtractor
 
 
+@traced("hybrid.draft")
 async def draft_personas(
     input_data: str,
     config: HybridConfig,
     count: int,
     cost_tracker: CostTracker,
+    response_cache: ResponseCache | None = None,
 ) -> list[dict[str, Any]]:
     """
     Generate draft personas using local model.
@@ -27,6 +30,7 @@ async def draft_personas(
         config: Hybrid pipeline configuration.
         count: Number of personas to generate.
         cost_tracker: Cost tracker for recording token usage.
+        response_cache: Optional cache for LLM responses.
 
     Returns:
         List of generated persona dictionaries.
@@ -41,6 +45,8 @@ async def draft_personas(
     """
     # Create local provider
     provider = ProviderFactory.create(config.local_provider)
+    if response_cache is not None:
+        provider = CachingProvider(provider, response_cache)
 
     # Verify provider is configured
     if not provider.is_configured():
@@ -58,8 +64,9 @@ async def draft_personas(
         remaining = count - len(all_personas)
         batch_count = min(config.batch_size, remaining)
 
-        # Build generation prompt
-        prompt = _build_draft_prompt(input_data, batch_count)
+        # Build generation prompt; the research data is a stable prefix
+        # shared by every batch, the batch number keeps each request distinct
+        prompt = _build_draft_prompt(input_data, batch_count, batch_idx, batches)
 
         # Generate with local model
         response = await provider.generate_async(
@@ -68,13 +75,20 @@ async def draft_personas(
             temperature=config.local_temperature,
             max_tokens=4096,
             system_prompt=_get_system_prompt(),
+            cache_prefix=_build_draft_prefix(input_data),
         )
 
         # Track costs
-        cost_tracker.add_local_usage(
-            input_tokens=response.input_tokens,
-            output_tokens=response.output_tokens,
-        )
+        if response.cached:
+            cost_tracker.add_cached_usage(
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+            )
+        else:
+            cost_tracker.add_local_usage(
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+            )
 
         # Parse personas from response
         batch_personas = _parse_personas(response.content, batch_idx)
@@ -101,15 +115,32 @@ Each persona should be coherent, believable, and useful for design decisions.
 CRITICAL: Generate personas as valid JSON only. Do not include any explanatory text."""
 
 
-def _build_draft_prompt(input_data: str, count: int) -> str:
+def _build_draft_prefix(input_data: str) -> str:
+    """Build the stable, cacheable opening of the draft prompt."""
+    return "\n".join(["# Research Data", "", input_data, ""])
+
+
+def _build_draft_prompt(
+    input_data: str,
+    count: int,
+    batch_idx: int = 0,
+    batches: int = 1,
+) -> str:
     """Build prompt for draft generation."""
     prompt_parts = [
-        f"Based on the following research data, generate {count} distinct user personas.",
-        "",
-        "# Research Data",
-        "",
-        input_data,
+        _build_draft_prefix(input_data),
+        f"Based on the research data above, generate {count} distinct user personas.",
         "",
+    ]
+    if batches > 1:
+        prompt_parts.extend(
+            [
+                f"This is batch {batch_idx + 1} of {batches}. Make these personas "
+                "distinct from those generated in other batches.",
+                "",
+            ]
+        )
+    prompt_parts += [
         "# Output Format",
         "",
         "Generate personas as a JSON array with the following structure:",
@@ -163,11 +194,11 @@ def _parse_personas(
 
         # Ensure ID exists
         if "id" not in persona:
-            persona["id"] = f"persona-{batch_idx}-{i+1}"
+            persona["id"] = f"persona-{batch_idx}-{i + 1}"
 
         # Ensure basic fields exist
         if "name" not in persona:
-            persona["name"] = f"User {i+1}"
+            persona["name"] = f"User {i + 1}"
 
         validated_personas.append(persona)
 
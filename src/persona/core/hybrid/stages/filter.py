@@ -11,12 +11,16 @@ from persona.core.evaluation.criteria import EvaluationCriteria
 from persona.core.evaluation.judge import PersonaJudge
 from persona.core.hybrid.config import HybridConfig
 from persona.core.hybrid.cost import CostTracker
+from persona.core.logging.tracing import traced
+from persona.core.providers import ResponseCache
 
 
+@traced("hybrid.filter")
 async def filter_personas(
     personas: list[dict[str, Any]],
     config: HybridConfig,
     cost_tracker: CostTracker,
+    response_cache: ResponseCache | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Filter personas based on quality threshold.
@@ -28,6 +32,7 @@ async def filter_personas(
         personas: List of persona dictionaries to evaluate.
         config: Hybrid pipeline configuration.
         cost_tracker: Cost tracker for recording token usage.
+        response_cache: Optional cache for judge responses.
 
     Returns:
         Tuple of (passing_personas, needs_refinement_personas).
@@ -53,6 +58,7 @@ async def filter_personas(
         provider=config.judge_provider,
         model=config.judge_model,
         temperature=0.0,  # Consistent scoring
+        response_cache=response_cache,
     )
 
     # Evaluate personas
@@ -76,7 +82,10 @@ async def filter_personas(
                 # (Actual tracking would require provider-specific logic)
                 estimated_input = len(str(persona)) // 4  # Rough estimate
                 estimated_output = len(str(result.to_dict())) // 4
-                cost_tracker.add_judge_usage(estimated_input, estimated_output)
+                if result.cached:
+                    cost_tracker.add_cached_usage(estimated_input, estimated_output)
+                else:
+                    cost_tracker.add_judge_usage(estimated_input, estimated_output)
 
             # Store evaluation result in persona
             persona["_evaluation"] = result.to_dict()
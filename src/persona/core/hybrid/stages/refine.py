@@ -12,14 +12,17 @@ from typing import Any
 from persona.core.hybrid.config import HybridConfig
 from persona.core.hybrid.cost import CostTracker
 from persona.core.hybrid.stages.filter import get_evaluation_feedback
-from persona.core.providers import ProviderFactory
+from persona.core.logging.tracing import traced
+from persona.core.providers import CachingProvider, ProviderFactory, ResponseCache
 from persona.core.utils import JSONExtractor
 
 
+@traced("hybrid.refine")
 async def refine_personas(
     personas: list[dict[str, Any]],
     config: HybridConfig,
     cost_tracker: CostTracker,
+    response_cache: ResponseCache | None = None,
 ) -> list[dict[str, Any]]:
     """
     Refine personas using frontier model.
@@ -31,6 +34,7 @@ async def refine_personas(
         personas: List of persona dictionaries to refine.
         config: Hybrid pipeline configuration.
         cost_tracker: Cost tracker for recording token usage.
+        response_cache: Optional cache for LLM responses.
 
     Returns:
         List of refined persona dictionaries.
@@ -56,6 +60,8 @@ async def refine_personas(
 
     # Create frontier provider
     provider = ProviderFactory.create(config.frontier_provider)
+    if response_cache is not None:
+        provider = CachingProvider(provider, response_cache)
 
     if not provider.is_configured():
         raise RuntimeError(
@@ -72,7 +78,8 @@ async def refine_personas(
             refined_personas.append(persona)
             continue
 
-        # Build refinement prompt with feedback
+        # Build refinement prompt with feedback; the instructions are a
+        # stable prefix shared by every persona, the persona follows them
         feedback = get_evaluation_feedback(persona)
         prompt = _build_refinement_prompt(persona, feedback)
 
@@ -84,13 +91,22 @@ async def refine_personas(
                 temperature=config.frontier_temperature,
                 max_tokens=2048,
                 system_prompt=_get_refinement_system_prompt(),
+                cache_prefix=_build_refinement_prefix(),
             )
 
             # Track costs
-            cost_tracker.add_frontier_usage(
-                input_tokens=response.input_tokens,
-                output_tokens=response.output_tokens,
-            )
+            if response.cached:
+                cost_tracker.add_cached_usage(
+                    input_tokens=response.input_tokens,
+                    output_tokens=response.output_tokens,
+                )
+            else:
+                cost_tracker.add_frontier_usage(
+                    input_tokens=response.input_tokens,
+                    output_tokens=response.output_tokens,
+                    cache_read_tokens=response.cache_read_tokens,
+                    cache_write_tokens=response.cache_write_tokens,
+                )
 
             # Parse refined persona
             refined = _parse_refined_persona(response.content, persona)
@@ -122,45 +138,50 @@ Focus on:
 CRITICAL: Return only valid JSON, no additional text."""
 
 
+def _build_refinement_prefix() -> str:
+    """Build the stable, cacheable opening of the refinement prompt."""
+    return "\n".join(
+        [
+            "Improve the persona below based on the evaluation feedback that "
+            "follows it.",
+            "",
+            "# Instructions",
+            "",
+            "Improve this persona by:",
+            "1. Addressing the specific issues mentioned in the feedback",
+            "2. Enhancing coherence - ensure all details are consistent",
+            "3. Improving realism - make it more believable and grounded",
+            "4. Adding useful details - include actionable information for designers",
+            "",
+            "Maintain the same structure and ID, but improve the content.",
+            "Return ONLY the improved persona as valid JSON, no additional text.",
+            "",
+        ]
+    )
+
+
 def _build_refinement_prompt(
     persona: dict[str, Any],
     feedback: dict[str, str],
 ) -> str:
     """Build prompt for persona refinement."""
     prompt_parts = [
-        "Improve the following persona based on the evaluation feedback below.",
-        "",
+        _build_refinement_prefix(),
         "# Original Persona",
         "",
         json.dumps(persona, indent=2),
-        "",
     ]
 
     if feedback:
         prompt_parts.extend(
             [
+                "",
                 "# Evaluation Feedback",
                 "",
             ]
         )
         for criterion, reasoning in feedback.items():
             prompt_parts.append(f"**{criterion}**: {reasoning}")
-        prompt_parts.append("")
-
-    prompt_parts.extend(
-        [
-            "# Instructions",
-            "",
-            "Improve this persona by:",
-            "1. Addressing the specific issues mentioned in the feedback",
-            "2. Enhancing coherence - ensure all details are consistent",
-            "3. Improving realism - make it more believable and grounded",
-            "4. Adding useful details - include actionable information for designers",
-            "",
-            "Maintain the same structure and ID, but improve the content.",
-            "Return ONLY the improved persona as valid JSON, no additional text.",
-        ]
-    )
 
     return "\n".join(prompt_parts)
 
@@ -90,6 +90,7 @@ from persona.core.lineage.models import (
 
 # SQLite store
 from persona.core.lineage.sqlite_store import (
+    LineageBatch,
     SQLiteLineageStore,
     get_default_lineage_db_path,
 )
@@ -97,6 +98,14 @@ from persona.core.lineage.sqlite_store import (
 # Abstract store
 from persona.core.lineage.store import LineageStore
 
+# Verification
+from persona.core.lineage.verification import (
+    HashCache,
+    IntegrityVerifier,
+    VerificationStats,
+    get_default_hash_cache_path,
+)
+
 __all__ = [
     # Hashing
     "hash_content",
@@ -121,5 +130,11 @@ __all__ = [
     "LineageStore",
     # SQLite store
     "SQLiteLineageStore",
+    "LineageBatch",
     "get_default_lineage_db_path",
+    # Verification
+    "IntegrityVerifier",
+    "HashCache",
+    "VerificationStats",
+    "get_default_hash_cache_path",
 ]
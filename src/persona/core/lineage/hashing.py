@@ -7,12 +7,20 @@ tamper detection across the lineage graph.
 
 import hashlib
 import json
+import mmap
+import os
 from pathlib import Path
 from typing import Any
 
 HASH_ALGORITHM = "sha256"
 HASH_PREFIX = f"{HASH_ALGORITHM}:"
 
+# Read buffer for hashing files
+HASH_BUFFER_SIZE = 1024 * 1024
+
+# Files at least this large are hashed through a memory map
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
 
 def hash_content(content: str | bytes) -> str:
     """
@@ -61,9 +69,17 @@ def hash_file(path: Path | str) -> str:
 
     hasher = hashlib.sha256()
     with path.open("rb") as f:
-        # Read in chunks for large files
-        for chunk in iter(lambda: f.read(65536), b""):
-            hasher.update(chunk)
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            # Hash straight from the page cache without copying
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            # Read in chunks into a reused buffer
+            buffer = bytearray(HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while read := f.readinto(buffer):
+                hasher.update(view[:read])
 
     return f"{HASH_PREFIX}{hasher.hexdigest()}"
 
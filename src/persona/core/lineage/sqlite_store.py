@@ -14,7 +14,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from persona.core.lineage.hashing import hash_file
 from persona.core.lineage.models import (
     ActivityType,
     AgentType,
@@ -26,6 +25,30 @@ from persona.core.lineage.models import (
     LineageRelation,
 )
 from persona.core.lineage.store import LineageStore
+from persona.core.lineage.verification import IntegrityVerifier
+
+# Seconds a connection waits for another writer before failing
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+_INSERT_ENTITY = """
+    INSERT INTO lineage_entities
+    (entity_id, entity_type, name, hash, path, size_bytes,
+     metadata_json, generated_by, generated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ACTIVITY = """
+    INSERT INTO lineage_activities
+    (activity_id, activity_type, name, agent_id, run_id,
+     parameters_json, started_at, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, 'running')
+"""
+
+_INSERT_RELATION = """
+    INSERT OR IGNORE INTO lineage_relations
+    (relation_type, source_id, target_id, metadata_json)
+    VALUES (?, ?, ?, ?)
+"""
 
 
 def get_default_lineage_db_path() -> Path:
@@ -33,6 +56,189 @@ def get_default_lineage_db_path() -> Path:
     return Path.home() / ".persona" / "lineage.db"
 
 
+def _generate_id(prefix: str) -> str:
+    """Generate unique ID with prefix."""
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+
+
+class LineageBatch:
+    """
+    Buffered unit of work for recording lineage in bulk.
+
+    Entities, activities, relations and used/generated links are kept
+    in memory (IDs are assigned immediately) and written with
+    executemany in a single transaction when the batch is flushed, so
+    recording a large run costs one commit instead of one per row.
+
+    Example:
+        ```python
+        with store.batch() as batch:
+            activity_id = batch.create_activity(
+                activity_type="llm_generation",
+                name="Generate personas",
+                agent_id=agent_id,
+                used_entities=[input_id],
+            )
+            outputs = [
+                batch.create_entity(
+                    entity_type="persona",
+                    name=persona.name,
+                    hash=hash_persona(persona.to_dict()),
+                    generated_by=activity_id,
+                )
+                for persona in personas
+            ]
+            batch.complete_activity(activity_id, generated_entities=outputs)
+        ```
+    """
+
+    def __init__(self, store: "SQLiteLineageStore") -> None:
+        """
+        Initialise an empty batch.
+
+        Args:
+            store: Store the batch is written to.
+        """
+        self._store = store
+        self._clear()
+
+    def _clear(self) -> None:
+        """Discard all buffered rows."""
+        self.entities: list[tuple[Any, ...]] = []
+        self.activities: list[tuple[Any, ...]] = []
+        self.used: list[tuple[str, str]] = []
+        self.generated: list[tuple[str, str]] = []
+        self.completions: list[tuple[str, str, str]] = []
+        self.generated_by: list[tuple[str, str]] = []
+        self.relations: list[tuple[str, str, str, str]] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows."""
+        return (
+            len(self.entities)
+            + len(self.activities)
+            + len(self.used)
+            + len(self.generated)
+            + len(self.completions)
+            + len(self.generated_by)
+            + len(self.relations)
+        )
+
+    def create_entity(
+        self,
+        entity_type: str,
+        name: str,
+        hash: str,
+        *,
+        path: str | None = None,
+        size_bytes: int | None = None,
+        metadata: dict[str, Any] | None = None,
+        generated_by: str | None = None,
+    ) -> str:
+        """Buffer a new entity (see LineageStore.create_entity)."""
+        entity_id = _generate_id("ent")
+        self.entities.append(
+            (
+                entity_id,
+                entity_type,
+                name,
+                hash,
+                path,
+                size_bytes,
+                json.dumps(metadata or {}),
+                generated_by,
+                datetime.now(UTC).isoformat(),
+            )
+        )
+        return entity_id
+
+    def create_activity(
+        self,
+        activity_type: str,
+        name: str,
+        agent_id: str,
+        *,
+        run_id: str | None = None,
+        used_entities: list[str] | None = None,
+        generated_entities: list[str] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> str:
+        """Buffer a new activity (see LineageStore.create_activity)."""
+        activity_id = _generate_id("act")
+        self.activities.append(
+            (
+                activity_id,
+                activity_type,
+                name,
+                agent_id,
+                run_id,
+                json.dumps(parameters or {}),
+                datetime.now(UTC).isoformat(),
+            )
+        )
+
+        for entity_id in used_entities or []:
+            self.used.append((activity_id, entity_id))
+            self.add_relation("used", activity_id, entity_id)
+
+        for entity_id in generated_entities or []:
+            self.generated.append((activity_id, entity_id))
+            self.add_relation("wasGeneratedBy", entity_id, activity_id)
+
+        self.add_relation("wasAssociatedWith", activity_id, agent_id)
+        return activity_id
+
+    def complete_activity(
+        self,
+        activity_id: str,
+        *,
+        status: str = "completed",
+        generated_entities: list[str] | None = None,
+    ) -> None:
+        """Buffer completion of an activity (see LineageStore.complete_activity)."""
+        self.completions.append((status, datetime.now(UTC).isoformat(), activity_id))
+
+        for entity_id in generated_entities or []:
+            self.generated.append((activity_id, entity_id))
+            self.generated_by.append((activity_id, entity_id))
+            self.add_relation("wasGeneratedBy", entity_id, activity_id)
+
+    def add_relation(
+        self,
+        relation_type: str,
+        source_id: str,
+        target_id: str,
+        *,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Buffer a relationship (see LineageStore.add_relation)."""
+        self.relations.append(
+            (relation_type, source_id, target_id, json.dumps(metadata or {}))
+        )
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows in one transaction.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            sqlite3.IntegrityError: If a row references a missing node;
+                nothing from the batch is written in that case.
+        """
+        written = self.pending
+        if written:
+            self._store._write_batch(self)
+            self._clear()
+        return written
+
+    def discard(self) -> None:
+        """Drop all buffered rows without writing them."""
+        self._clear()
+
+
 class SQLiteLineageStore(LineageStore):
     """
     SQLite implementation of LineageStore.
@@ -57,18 +263,29 @@ class SQLiteLineageStore(LineageStore):
         ```
     """
 
-    def __init__(self, db_path: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+    ) -> None:
         """
         Initialise SQLite lineage store.
 
+        The database uses write-ahead logging, so readers (such as
+        `persona lineage` queries) are not blocked while a batch is
+        being written, and writers wait up to busy_timeout seconds for
+        one another instead of failing immediately.
+
         Args:
             db_path: Path to SQLite database. Defaults to ~/.persona/lineage.db.
+            busy_timeout: Seconds to wait for a lock held by another connection.
         """
         if db_path is None:
             db_path = get_default_lineage_db_path()
 
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._busy_timeout = busy_timeout
         self._conn: sqlite3.Connection | None = None
         self._init_schema()
 
@@ -79,12 +296,85 @@ class SQLiteLineageStore(LineageStore):
             self._conn = sqlite3.connect(
                 str(self._db_path),
                 detect_types=sqlite3.PARSE_DECLTYPES,
+                timeout=self._busy_timeout,
             )
             self._conn.row_factory = sqlite3.Row
             self._conn.execute("PRAGMA foreign_keys = ON")
+            # WAL lets readers proceed during writes; NORMAL sync is
+            # durable across application crashes and skips per-commit fsync
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
 
         yield self._conn
 
+    @contextmanager
+    def batch(self) -> Generator[LineageBatch, None, None]:
+        """
+        Record lineage in bulk.
+
+        Rows added to the batch are written in a single transaction
+        when the block exits normally, and discarded if it raises.
+        Call LineageBatch.flush() inside the block to write
+        intermediate results for very large runs.
+
+        Yields:
+            LineageBatch buffering the writes.
+        """
+        batch = LineageBatch(self)
+        try:
+            yield batch
+        except BaseException:
+            batch.discard()
+            raise
+        batch.flush()
+
+    def _write_batch(self, batch: LineageBatch) -> None:
+        """Write a batch's buffered rows in one transaction."""
+        with self._get_connection() as conn:
+            # Take the write lock up front rather than upgrading mid-batch
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Activities first: entities reference their generating activity
+                conn.executemany(_INSERT_ACTIVITY, batch.activities)
+                conn.executemany(_INSERT_ENTITY, batch.entities)
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO activity_used_entities
+                    (activity_id, entity_id)
+                    VALUES (?, ?)
+                    """,
+                    batch.used,
+                )
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO activity_generated_entities
+                    (activity_id, entity_id)
+                    VALUES (?, ?)
+                    """,
+                    batch.generated,
+                )
+                conn.executemany(
+                    """
+                    UPDATE lineage_activities
+                    SET status = ?, ended_at = ?
+                    WHERE activity_id = ?
+                    """,
+                    batch.completions,
+                )
+                conn.executemany(
+                    """
+                    UPDATE lineage_entities
+                    SET generated_by = ?
+                    WHERE entity_id = ? AND generated_by IS NULL
+                    """,
+                    batch.generated_by,
+                )
+                conn.executemany(_INSERT_RELATION, batch.relations)
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
     def _init_schema(self) -> None:
         """Initialise database schema."""
         with self._get_connection() as conn:
@@ -195,7 +485,7 @@ class SQLiteLineageStore(LineageStore):
 
     def _generate_id(self, prefix: str) -> str:
         """Generate unique ID with prefix."""
-        return f"{prefix}-{uuid.uuid4().hex[:12]}"
+        return _generate_id(prefix)
 
     # =========================================================================
     # Entity Operations
@@ -218,12 +508,7 @@ class SQLiteLineageStore(LineageStore):
 
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO lineage_entities
-                (entity_id, entity_type, name, hash, path, size_bytes,
-                 metadata_json, generated_by, generated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_ENTITY,
                 (
                     entity_id,
                     entity_type,
@@ -360,12 +645,7 @@ class SQLiteLineageStore(LineageStore):
 
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO lineage_activities
-                (activity_id, activity_type, name, agent_id, run_id,
-                 parameters_json, started_at, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, 'running')
-                """,
+                _INSERT_ACTIVITY,
                 (
                     activity_id,
                     activity_type,
@@ -641,9 +921,7 @@ class SQLiteLineageStore(LineageStore):
                 return str(row["agent_id"])
 
         # Create new
-        return self.create_agent(
-            agent_type, name, version=version, provider=provider
-        )
+        return self.create_agent(agent_type, name, version=version, provider=provider)
 
     def list_agents(
         self,
@@ -717,11 +995,7 @@ class SQLiteLineageStore(LineageStore):
     ) -> None:
         """Add relation without committing."""
         conn.execute(
-            """
-            INSERT OR IGNORE INTO lineage_relations
-            (relation_type, source_id, target_id, metadata_json)
-            VALUES (?, ?, ?, ?)
-            """,
+            _INSERT_RELATION,
             (relation_type, source_id, target_id, json.dumps(metadata)),
         )
 
@@ -1039,7 +1313,12 @@ class SQLiteLineageStore(LineageStore):
     # Verification
     # =========================================================================
 
-    def verify_entity(self, entity_id: str) -> dict[str, Any]:
+    def verify_entity(
+        self,
+        entity_id: str,
+        *,
+        verifier: IntegrityVerifier | None = None,
+    ) -> dict[str, Any]:
         """Verify entity integrity."""
         entity = self.get_entity(entity_id)
 
@@ -1050,72 +1329,34 @@ class SQLiteLineageStore(LineageStore):
                 "error": "Entity not found",
             }
 
-        if not entity.path:
-            return {
-                "verified": True,
-                "entity_id": entity_id,
-                "stored_hash": entity.hash,
-                "note": "No file path - hash not verifiable",
-            }
-
-        path = Path(entity.path)
-        if not path.exists():
-            return {
-                "verified": False,
-                "entity_id": entity_id,
-                "stored_hash": entity.hash,
-                "error": f"File not found: {entity.path}",
-            }
-
-        try:
-            current_hash = hash_file(path)
-            verified = current_hash == entity.hash
+        return (verifier or IntegrityVerifier()).verify_entity(entity)
 
-            result: dict[str, Any] = {
-                "verified": verified,
-                "entity_id": entity_id,
-                "stored_hash": entity.hash,
-                "current_hash": current_hash,
-            }
-
-            if not verified:
-                result["error"] = "Hash mismatch - file has been modified"
-
-            return result
-
-        except (OSError, PermissionError) as e:
-            return {
-                "verified": False,
-                "entity_id": entity_id,
-                "stored_hash": entity.hash,
-                "error": f"Cannot read file: {e}",
-            }
+    def verify_chain(
+        self,
+        entity_id: str,
+        *,
+        verifier: IntegrityVerifier | None = None,
+    ) -> dict[str, Any]:
+        """
+        Verify integrity of entire lineage chain.
 
-    def verify_chain(self, entity_id: str) -> dict[str, Any]:
-        """Verify integrity of entire lineage chain."""
+        Entities come straight from the ancestor graph and each distinct
+        file is hashed once, concurrently. Pass a verifier with a
+        persistent HashCache to skip files unchanged since the last run.
+        """
         graph = self.get_ancestors(entity_id)
+        verifier = verifier or IntegrityVerifier()
+        details = verifier.verify_entities(graph.entities)
 
-        entities_checked = 0
-        entities_valid = 0
-        entities_invalid: list[str] = []
-        details: list[dict[str, Any]] = []
-
-        for entity in graph.entities:
-            result = self.verify_entity(entity.entity_id)
-            details.append(result)
-            entities_checked += 1
-
-            if result["verified"]:
-                entities_valid += 1
-            else:
-                entities_invalid.append(entity.entity_id)
+        entities_invalid = [r["entity_id"] for r in details if not r["verified"]]
 
         return {
             "verified": len(entities_invalid) == 0,
-            "entities_checked": entities_checked,
-            "entities_valid": entities_valid,
+            "entities_checked": len(details),
+            "entities_valid": len(details) - len(entities_invalid),
             "entities_invalid": entities_invalid,
             "details": details,
+            "stats": verifier.stats.to_dict(),
         }
 
     # =========================================================================
@@ -0,0 +1,356 @@
+"""
+Integrity verification for lineage entities.
+
+Verifying a chain used to re-fetch every entity and re-hash its file
+in turn, even when many entities share one large source file or
+nothing changed since the last check. IntegrityVerifier hashes each
+distinct file once, spreads the hashing across a thread pool (SHA-256
+releases the GIL), and consults a HashCache keyed by file identity so
+repeated runs only re-hash files that actually changed.
+"""
+
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from persona.core.lineage.hashing import hash_file
+from persona.core.lineage.models import LineageEntity
+from persona.core.platform import get_cache_dir
+
+# Hash cache format version, bumped on incompatible changes
+HASH_CACHE_VERSION = 1
+
+# Maximum threads hashing files concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# Files modified this close to being hashed are re-hashed on the next
+# check, since a same-size rewrite within the filesystem's timestamp
+# granularity would otherwise go unnoticed
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def get_default_hash_cache_path() -> Path:
+    """Get default location of the lineage hash cache."""
+    return get_cache_dir() / "lineage-hashes.json"
+
+
+class HashCache:
+    """
+    Cache of file hashes keyed by file identity.
+
+    An entry is reused only while the file's size, modification time
+    and inode all match what was recorded when it was hashed.
+
+    Example:
+        cache = HashCache(get_default_hash_cache_path())
+        verifier = IntegrityVerifier(cache=cache)
+        result = store.verify_chain(entity_id, verifier=verifier)
+        cache.save()
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        """
+        Initialise the cache, loading it if the file exists.
+
+        Args:
+            path: JSON file the cache is persisted to, or None to keep
+                it in memory only.
+        """
+        self._path = Path(path) if path is not None else None
+        self._entries: dict[str, tuple[int, int, int, int, str]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        if self._path is not None and self._path.exists():
+            try:
+                data = json.loads(self._path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                # Unreadable cache: start empty and overwrite on save
+                data = {}
+            if data.get("version") == HASH_CACHE_VERSION:
+                self._entries = {
+                    key: tuple(entry) for key, entry in data.get("files", {}).items()
+                }
+
+    @property
+    def path(self) -> Path | None:
+        """Location of the cache file, if persisted."""
+        return self._path
+
+    def get(self, path: Path, stat: os.stat_result) -> str | None:
+        """
+        Get the cached hash of a file if it is unchanged.
+
+        Args:
+            path: Resolved file path.
+            stat: Current stat result for the file.
+
+        Returns:
+            Hash string, or None if the file must be hashed.
+        """
+        entry = self._entries.get(str(path))
+        if entry is not None:
+            size, mtime_ns, inode, hashed_ns, digest = entry
+            if (
+                size == stat.st_size
+                and mtime_ns == stat.st_mtime_ns
+                and inode == stat.st_ino
+                and mtime_ns + RACY_WINDOW_NS < hashed_ns
+            ):
+                self.hits += 1
+                return digest
+
+        self.misses += 1
+        return None
+
+    def put(
+        self, path: Path, stat: os.stat_result, digest: str, hashed_ns: int
+    ) -> None:
+        """
+        Record the hash of a file.
+
+        Args:
+            path: Resolved file path.
+            stat: Stat result taken before the file was hashed.
+            digest: Hash string.
+            hashed_ns: Wall-clock time (nanoseconds) hashing started.
+        """
+        self._entries[str(path)] = (
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
+            hashed_ns,
+            digest,
+        )
+        self._dirty = True
+
+    def save(self) -> Path | None:
+        """
+        Write the cache atomically if it changed.
+
+        Returns:
+            Path to the cache file, or None if the cache is in memory only.
+        """
+        if self._path is None:
+            return None
+        if not self._dirty:
+            return self._path
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": HASH_CACHE_VERSION, "files": self._entries}
+
+        fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, self._path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self._dirty = False
+        return self._path
+
+    def __len__(self) -> int:
+        """Return number of cached files."""
+        return len(self._entries)
+
+
+@dataclass
+class VerificationStats:
+    """
+    Statistics for one verification run.
+
+    Attributes:
+        entities: Entities verified.
+        files: Distinct files referenced by the entities.
+        files_hashed: Files that had to be read and hashed.
+        cache_hits: Files whose hash was served from the cache.
+        elapsed_seconds: Wall-clock duration of the run.
+    """
+
+    entities: int = 0
+    files: int = 0
+    files_hashed: int = 0
+    cache_hits: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "entities": self.entities,
+            "files": self.files,
+            "files_hashed": self.files_hashed,
+            "cache_hits": self.cache_hits,
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+        }
+
+
+class IntegrityVerifier:
+    """
+    Verifies stored entity hashes against current file contents.
+
+    Example:
+        verifier = IntegrityVerifier(cache=HashCache(), max_workers=4)
+        results = verifier.verify_entities(graph.entities)
+        print(verifier.stats.to_dict())
+    """
+
+    def __init__(
+        self,
+        cache: HashCache | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Initialise the verifier.
+
+        Args:
+            cache: Hash cache to consult and update (defaults to an
+                in-memory cache).
+            max_workers: Maximum hashing threads (defaults to
+                DEFAULT_MAX_WORKERS, capped at the CPU count).
+        """
+        self.cache = cache if cache is not None else HashCache()
+        self.max_workers = max_workers or min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        self.stats = VerificationStats()
+
+    def verify_entity(self, entity: LineageEntity) -> dict[str, Any]:
+        """
+        Verify a single entity.
+
+        Args:
+            entity: Entity to verify.
+
+        Returns:
+            Verification result (see LineageStore.verify_entity).
+        """
+        return self.verify_entities([entity])[0]
+
+    def verify_entities(self, entities: list[LineageEntity]) -> list[dict[str, Any]]:
+        """
+        Verify entities, hashing each distinct file once.
+
+        Args:
+            entities: Entities to verify.
+
+        Returns:
+            Verification results in the same order as the entities.
+        """
+        started = time.perf_counter()
+        paths = {
+            entity.entity_id: Path(entity.path).resolve()
+            for entity in entities
+            if entity.path
+        }
+        hashes = self.hash_files(set(paths.values()))
+
+        results = [
+            self._result(entity, hashes.get(paths.get(entity.entity_id)))
+            for entity in entities
+        ]
+
+        self.stats.entities = len(entities)
+        self.stats.elapsed_seconds = time.perf_counter() - started
+        return results
+
+    def hash_files(self, paths: set[Path]) -> dict[Path, str | OSError]:
+        """
+        Hash files, reusing cached hashes for unchanged files.
+
+        Args:
+            paths: Resolved file paths.
+
+        Returns:
+            Hash string (or the error raised reading it) for each path.
+        """
+        results: dict[Path, str | OSError] = {}
+        pending: list[tuple[Path, os.stat_result]] = []
+        cache_hits = 0
+
+        for path in sorted(paths):
+            try:
+                stat = path.stat()
+            except OSError as e:
+                results[path] = e
+                continue
+
+            digest = self.cache.get(path, stat)
+            if digest is not None:
+                results[path] = digest
+                cache_hits += 1
+            else:
+                pending.append((path, stat))
+
+        hashed_ns = time.time_ns()
+        workers = max(1, min(len(pending), self.max_workers))
+        if workers == 1:
+            hashed = [self._hash(path) for path, _ in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                hashed = list(executor.map(self._hash, [p for p, _ in pending]))
+
+        for (path, stat), digest in zip(pending, hashed, strict=True):
+            results[path] = digest
+            if isinstance(digest, str):
+                self.cache.put(path, stat, digest, hashed_ns)
+
+        self.stats = VerificationStats(
+            files=len(paths),
+            files_hashed=len(pending),
+            cache_hits=cache_hits,
+        )
+        return results
+
+    @staticmethod
+    def _hash(path: Path) -> str | OSError:
+        """Hash a file, returning the error instead of raising."""
+        try:
+            return hash_file(path)
+        except OSError as e:
+            return e
+
+    @staticmethod
+    def _result(entity: LineageEntity, current: str | OSError | None) -> dict[str, Any]:
+        """Build the verification result for an entity."""
+        if not entity.path:
+            return {
+                "verified": True,
+                "entity_id": entity.entity_id,
+                "stored_hash": entity.hash,
+                "note": "No file path - hash not verifiable",
+            }
+
+        if isinstance(current, FileNotFoundError):
+            return {
+                "verified": False,
+                "entity_id": entity.entity_id,
+                "stored_hash": entity.hash,
+                "error": f"File not found: {entity.path}",
+            }
+
+        if isinstance(current, OSError) or current is None:
+            return {
+                "verified": False,
+                "entity_id": entity.entity_id,
+                "stored_hash": entity.hash,
+                "error": f"Cannot read file: {current}",
+            }
+
+        verified = current == entity.hash
+        result: dict[str, Any] = {
+            "verified": verified,
+            "entity_id": entity.entity_id,
+            "stored_hash": entity.hash,
+            "current_hash": current,
+        }
+
+        if not verified:
+            result["error"] = "Hash mismatch - file has been modified"
+
+        return result
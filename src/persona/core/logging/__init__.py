@@ -42,6 +42,20 @@ from persona.core.logging.token_usage import (
     TokenUsageLogger,
     log_token_usage,
 )
+from persona.core.logging.tracing import (
+    ConsoleSpanExporter,
+    JSONLSpanExporter,
+    NoOpTracer,
+    OpenTelemetrySpanExporter,
+    Span,
+    TimingSummary,
+    Tracer,
+    configure_tracing,
+    get_tracer,
+    set_tracer,
+    span,
+    traced,
+)
 
 __all__ = [
     # Experiment logger (F-073)
@@ -76,4 +90,17 @@ __all__ = [
     "CostRecord",
     "BudgetConfig",
     "track_cost",
+    # Span tracing
+    "Tracer",
+    "NoOpTracer",
+    "Span",
+    "TimingSummary",
+    "JSONLSpanExporter",
+    "ConsoleSpanExporter",
+    "OpenTelemetrySpanExporter",
+    "configure_tracing",
+    "get_tracer",
+    "set_tracer",
+    "span",
+    "traced",
 ]
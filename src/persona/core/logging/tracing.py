@@ -0,0 +1,577 @@
+"""Span tracing and hot-path timing.
+
+Provides a small span API for timing the stages of a generation run
+(load, render, provider call, parse, scoring, persistence). Span names
+and attributes follow OpenTelemetry conventions, so spans can be sent to
+an OpenTelemetry SDK when one is configured. By default tracing is a
+no-op; local runs can export spans to a JSONL file or the console and
+aggregate them into a per-stage timing summary.
+
+Example:
+    tracer = Tracer(exporters=[JSONLSpanExporter("trace.jsonl")])
+    set_tracer(tracer)
+
+    with span("generation.load", path=str(path)):
+        data = loader.load_path(path)
+
+    print(tracer.summary.to_dict())
+"""
+
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol, TextIO, TypeVar
+
+try:
+    from opentelemetry import trace as otel_trace
+
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """A timed operation.
+
+    Attributes:
+        name: Operation name (e.g. "provider.call").
+        trace_id: Identifier shared by all spans in one trace.
+        span_id: Unique span identifier.
+        parent_id: Identifier of the enclosing span, if any.
+        start_time: Wall-clock start time.
+        start_ns: Monotonic start time in nanoseconds.
+        end_ns: Monotonic end time in nanoseconds (0 while running).
+        attributes: Span attributes.
+        status: "ok" or "error".
+        error: Error message if the operation failed.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_time: datetime = field(default_factory=lambda: datetime.now(UTC))
+    start_ns: int = field(default_factory=time.perf_counter_ns)
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds (up to now if still running)."""
+        end = self.end_ns or time.perf_counter_ns()
+        return (end - self.start_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the span."""
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        """Set several attributes on the span."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time.isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NoOpSpan:
+    """Span stand-in used when tracing is disabled."""
+
+    name = ""
+    attributes: dict[str, Any] = {}
+    duration_ms = 0.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        """Ignore the attributes."""
+
+
+NOOP_SPAN = _NoOpSpan()
+
+
+class SpanExporter(Protocol):
+    """Protocol for span exporters."""
+
+    def export(self, span: Span) -> None:
+        """Export a finished span."""
+        ...
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+        ...
+
+
+class JSONLSpanExporter:
+    """Exporter appending one JSON object per finished span to a file."""
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialise the exporter.
+
+        Args:
+            path: JSONL file to append to.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: TextIO | None = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Append the span to the file."""
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            if self._file is None:
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        """Close the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ConsoleSpanExporter:
+    """Exporter printing one line per finished span."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        """Initialise the exporter.
+
+        Args:
+            stream: Output stream (defaults to stderr).
+        """
+        self._stream = stream
+
+    def export(self, span: Span) -> None:
+        """Print the span."""
+        stream = self._stream or sys.stderr
+        attributes = " ".join(f"{k}={v}" for k, v in span.attributes.items())
+        status = "" if span.status == "ok" else f" [{span.status}]"
+        stream.write(f"{span.duration_ms:10.1f}ms {span.name}{status} {attributes}\n")
+
+    def shutdown(self) -> None:
+        """Nothing to release."""
+
+
+class OpenTelemetrySpanExporter:
+    """Exporter re-emitting finished spans through the OpenTelemetry API.
+
+    Spans are recorded with their original start and end times on the
+    globally configured OpenTelemetry tracer provider, so any SDK
+    exporter (OTLP, Jaeger, ...) configured by the application receives
+    them. Without an SDK the OpenTelemetry API is itself a no-op.
+    """
+
+    def __init__(self, instrumentation_name: str = "persona") -> None:
+        """Initialise the exporter.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        if not OTEL_AVAILABLE:
+            raise ImportError(
+                "opentelemetry-api is required. "
+                "Install with: pip install persona[telemetry]"
+            )
+        self._tracer = otel_trace.get_tracer(instrumentation_name)
+        # Offset converting monotonic span times to epoch nanoseconds
+        self._epoch_offset = time.time_ns() - time.perf_counter_ns()
+
+    def export(self, span: Span) -> None:
+        """Record the span on the OpenTelemetry tracer."""
+        otel_span = self._tracer.start_span(
+            span.name,
+            start_time=span.start_ns + self._epoch_offset,
+            attributes={
+                k: v
+                for k, v in span.attributes.items()
+                if isinstance(v, str | bool | int | float)
+            },
+        )
+        if span.status == "error":
+            otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+        otel_span.end(end_time=span.end_ns + self._epoch_offset)
+
+    def shutdown(self) -> None:
+        """Nothing to release; the SDK owns flushing."""
+
+
+@dataclass
+class SpanStats:
+    """Aggregated timings for one span name.
+
+    Attributes:
+        count: Number of finished spans.
+        errors: Number of spans that ended with an error.
+        total_ms: Sum of durations.
+        max_ms: Longest duration.
+    """
+
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean duration."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class TimingSummary:
+    """Exporter aggregating span durations by name.
+
+    Millisecond attributes (those ending in "_ms", such as the provider
+    call's queue_wait_ms and network_ms) are summed alongside, so the
+    summary shows where time inside a span went.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty summary."""
+        self._lock = threading.Lock()
+        self._stats: dict[str, SpanStats] = {}
+        self._attribute_totals: dict[str, dict[str, float]] = {}
+
+    def export(self, span: Span) -> None:
+        """Add a finished span to the summary."""
+        with self._lock:
+            stats = self._stats.setdefault(span.name, SpanStats())
+            duration = span.duration_ms
+            stats.count += 1
+            stats.total_ms += duration
+            stats.max_ms = max(stats.max_ms, duration)
+            if span.status == "error":
+                stats.errors += 1
+
+            for key, value in span.attributes.items():
+                if key.endswith("_ms") and isinstance(value, int | float):
+                    totals = self._attribute_totals.setdefault(span.name, {})
+                    totals[key] = totals.get(key, 0.0) + value
+
+    def shutdown(self) -> None:
+        """Nothing to release."""
+
+    def stats(self) -> dict[str, SpanStats]:
+        """Get a copy of the per-name statistics."""
+        with self._lock:
+            return {
+                name: SpanStats(s.count, s.errors, s.total_ms, s.max_ms)
+                for name, s in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        with self._lock:
+            self._stats.clear()
+            self._attribute_totals.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary keyed by span name."""
+        with self._lock:
+            result = {}
+            for name in sorted(self._stats):
+                entry = self._stats[name].to_dict()
+                for key, total in self._attribute_totals.get(name, {}).items():
+                    entry[f"{key[:-3]}_total_ms"] = round(total, 3)
+                result[name] = entry
+            return result
+
+    def to_prometheus(self, prefix: str = "persona") -> str:
+        """Render the summary in Prometheus text exposition format."""
+        metric = f"{prefix}_span_duration_seconds"
+        lines = [
+            f"# HELP {metric} Time spent in instrumented operations.",
+            f"# TYPE {metric} summary",
+        ]
+        errors = [
+            f"# HELP {prefix}_span_errors_total Instrumented operations that failed.",
+            f"# TYPE {prefix}_span_errors_total counter",
+        ]
+        for name, stats in sorted(self.stats().items()):
+            label = f'{{span="{name}"}}'
+            lines.append(f"{metric}_count{label} {stats.count}")
+            lines.append(f"{metric}_sum{label} {stats.total_ms / 1000:.6f}")
+            errors.append(f"{prefix}_span_errors_total{label} {stats.errors}")
+        return "\n".join(lines + errors) + "\n"
+
+    def format_table(self) -> str:
+        """Render the summary as a plain-text table sorted by total time."""
+        stats = self.stats()
+        if not stats:
+            return "No spans recorded."
+
+        width = max(len(name) for name in stats)
+        lines = [f"{'span':<{width}}  {'count':>6}  {'total ms':>10}  {'mean ms':>9}"]
+        for name, s in sorted(stats.items(), key=lambda item: -item[1].total_ms):
+            lines.append(
+                f"{name:<{width}}  {s.count:>6}  {s.total_ms:>10.1f}  {s.mean_ms:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+_current_span: ContextVar[Span | None] = ContextVar("persona_span", default=None)
+
+
+class Tracer:
+    """Creates spans and passes finished spans to exporters.
+
+    The current span is tracked in a context variable, so nesting works
+    across threads started with contextvars.copy_context() and across
+    asyncio tasks.
+
+    Example:
+        tracer = Tracer(exporters=[ConsoleSpanExporter()])
+        with tracer.span("generation.parse", personas=3):
+            ...
+    """
+
+    def __init__(self, exporters: list[SpanExporter] | None = None) -> None:
+        """Initialise the tracer.
+
+        Args:
+            exporters: Exporters receiving finished spans. A TimingSummary
+                is always added and available as tracer.summary.
+        """
+        self.summary = TimingSummary()
+        self.exporters: list[SpanExporter] = [self.summary, *(exporters or [])]
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return True
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time a block of code.
+
+        Args:
+            name: Operation name.
+            **attributes: Initial span attributes.
+
+        Yields:
+            The running span, for adding attributes.
+        """
+        parent = _current_span.get()
+        current = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+        )
+        token = _current_span.set(current)
+        try:
+            yield current
+        except BaseException as e:
+            current.status = "error"
+            current.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            current.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            self._export(current)
+
+    def record(
+        self,
+        name: str,
+        duration_ms: float,
+        **attributes: Any,
+    ) -> None:
+        """Record an operation that was timed elsewhere.
+
+        Args:
+            name: Operation name.
+            duration_ms: Measured duration.
+            **attributes: Span attributes.
+        """
+        parent = _current_span.get()
+        end_ns = time.perf_counter_ns()
+        self._export(
+            Span(
+                name=name,
+                trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+                span_id=uuid.uuid4().hex[:16],
+                parent_id=parent.span_id if parent else None,
+                start_ns=end_ns - int(duration_ms * 1_000_000),
+                end_ns=end_ns,
+                attributes=attributes,
+            )
+        )
+
+    def current_span(self) -> Span | None:
+        """Get the innermost running span."""
+        return _current_span.get()
+
+    def shutdown(self) -> None:
+        """Shut down all exporters."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    def _export(self, span: Span) -> None:
+        """Pass a finished span to every exporter."""
+        for exporter in self.exporters:
+            exporter.export(span)
+
+
+class NoOpTracer(Tracer):
+    """Tracer that records nothing (the default)."""
+
+    def __init__(self) -> None:
+        """Initialise the no-op tracer."""
+        self.summary = TimingSummary()
+        self.exporters = []
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return False
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Any]:
+        """Run the block without timing it."""
+        yield NOOP_SPAN
+
+    def record(self, name: str, duration_ms: float, **attributes: Any) -> None:
+        """Discard the measurement."""
+
+    def current_span(self) -> Span | None:
+        """No span is ever running."""
+        return None
+
+
+_tracer: Tracer = NoOpTracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer (a NoOpTracer unless one was set)."""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> Tracer:
+    """Replace the process-wide tracer.
+
+    Args:
+        tracer: Tracer to use, or None to disable tracing.
+
+    Returns:
+        The previous tracer.
+    """
+    global _tracer
+    previous = _tracer
+    _tracer = tracer or NoOpTracer()
+    return previous
+
+
+def span(name: str, **attributes: Any):
+    """Time a block of code with the process-wide tracer.
+
+    Example:
+        with span("generation.render", workflow="default") as s:
+            prompt = workflow.render_prompt(...)
+            s.set_attribute("prompt_chars", len(prompt))
+    """
+    return _tracer.span(name, **attributes)
+
+
+def traced(name: str | None = None, **attributes: Any) -> Callable[[F], F]:
+    """Decorate a function or coroutine function so each call is a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name).
+        **attributes: Attributes added to every span.
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with _tracer.span(span_name, **attributes):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _tracer.span(span_name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def configure_tracing(
+    jsonl_path: Path | str | None = None,
+    console: bool = False,
+    opentelemetry: bool | None = None,
+) -> Tracer:
+    """Install a recording tracer with the requested exporters.
+
+    Args:
+        jsonl_path: File to append spans to, if any.
+        console: Whether to print each span to stderr.
+        opentelemetry: Whether to forward spans to OpenTelemetry. Defaults
+            to true when OTEL_EXPORTER_OTLP_ENDPOINT is set and the
+            OpenTelemetry API is installed.
+
+    Returns:
+        The installed tracer.
+    """
+    exporters: list[SpanExporter] = []
+    if jsonl_path is not None:
+        exporters.append(JSONLSpanExporter(jsonl_path))
+    if console:
+        exporters.append(ConsoleSpanExporter())
+    if opentelemetry is None:
+        opentelemetry = OTEL_AVAILABLE and bool(
+            os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
+        )
+    if opentelemetry:
+        exporters.append(OpenTelemetrySpanExporter())
+
+    tracer = Tracer(exporters)
+    set_tracer(tracer)
+    return tracer
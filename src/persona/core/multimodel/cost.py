@@ -175,6 +175,9 @@ class MultiModelCostEstimator:
             "gemini-2.0-flash-exp": {"input": 0.1, "output": 0.4},
             "default": {"input": 0.5, "output": 2.0},
         },
+        "ollama": {
+            "default": {"input": 0.0, "output": 0.0},
+        },
     }
 
     # Mode overhead multipliers
@@ -220,7 +223,7 @@ class MultiModelCostEstimator:
         output_tokens = persona_count * self.tokens_per_persona
 
         for model in models:
-            detail = self._estimate_model_cost(
+            detail = self.estimate_model_cost(
                 provider=model.provider,
                 model=model.model,
                 input_tokens=input_tokens,
@@ -264,14 +267,24 @@ class MultiModelCostEstimator:
             budget_limit=self.budget_limit,
         )
 
-    def _estimate_model_cost(
+    def estimate_model_cost(
         self,
         provider: str,
         model: str,
         input_tokens: int,
         output_tokens: int,
     ) -> ModelCostDetail:
-        """Estimate cost for a single model."""
+        """Estimate cost for a single model call.
+
+        Args:
+            provider: The LLM provider.
+            model: The model identifier.
+            input_tokens: Input tokens, estimated or as reported.
+            output_tokens: Output tokens, estimated or as reported.
+
+        Returns:
+            ModelCostDetail priced from PRICING.
+        """
         # Get pricing for provider/model
         provider_pricing = self.PRICING.get(provider, {})
         model_pricing = provider_pricing.get(
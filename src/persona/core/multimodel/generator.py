@@ -4,10 +4,15 @@ Enables generation using multiple LLM models simultaneously,
 supporting same-provider and cross-provider configurations.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from persona.core.multimodel.strategies import ExecutionStrategy
+    from persona.core.providers import LLMProvider
 
 
 @dataclass
@@ -89,6 +94,7 @@ class ModelOutput:
         cost: Estimated cost in USD.
         raw_response: Optional raw LLM response.
         error: Optional error message if generation failed.
+        prompt: The rendered prompt sent to the model.
     """
 
     model_spec: ModelSpec
@@ -99,6 +105,7 @@ class ModelOutput:
     cost: float = 0.0
     raw_response: str | None = None
     error: str | None = None
+    prompt: str | None = None
 
     @property
     def success(self) -> bool:
@@ -201,6 +208,8 @@ class MultiModelGenerator:
         default_temperature: float = 0.7,
         default_max_tokens: int = 4096,
         timeout_seconds: int = 300,
+        provider_factory: Callable[[str], "LLMProvider"] | None = None,
+        workflow: str = "default",
     ):
         """Initialise the multi-model generator.
 
@@ -208,10 +217,15 @@ class MultiModelGenerator:
             default_temperature: Default temperature for generation.
             default_max_tokens: Default max tokens for generation.
             timeout_seconds: Timeout for each model.
+            provider_factory: Callable creating a provider from its name
+                (defaults to ProviderFactory.create).
+            workflow: Built-in workflow name or workflow file path.
         """
         self.default_temperature = default_temperature
         self.default_max_tokens = default_max_tokens
         self.timeout_seconds = timeout_seconds
+        self.provider_factory = provider_factory
+        self.workflow = workflow
 
     def generate(
         self,
@@ -222,6 +236,9 @@ class MultiModelGenerator:
     ) -> MultiModelResult:
         """Generate personas using multiple models.
 
+        Must NOT be called from within an async context; use
+        generate_async() there instead.
+
         Args:
             data: Source data for persona generation.
             models: List of model specifications.
@@ -234,31 +251,40 @@ class MultiModelGenerator:
         Raises:
             ValueError: If models list is empty or mode is invalid.
         """
-        if not models:
-            raise ValueError("At least one model must be specified")
-
-        valid_modes = {"parallel", "sequential", "consensus"}
-        if mode not in valid_modes:
-            raise ValueError(f"Invalid mode: {mode}. Must be one of {valid_modes}")
+        strategy = self._create_strategy(models, mode)
 
-        # Import strategy classes here to avoid circular imports
-        from persona.core.multimodel.strategies import (
-            ConsensusStrategy,
-            ParallelStrategy,
-            SequentialStrategy,
+        return strategy.execute(
+            data=data,
+            models=models,
+            count=count,
+            temperature=self.default_temperature,
+            max_tokens=self.default_max_tokens,
         )
 
-        # Select execution strategy
-        strategy_map = {
-            "parallel": ParallelStrategy,
-            "sequential": SequentialStrategy,
-            "consensus": ConsensusStrategy,
-        }
-        strategy_class = strategy_map[mode]
-        strategy = strategy_class(timeout_seconds=self.timeout_seconds)
+    async def generate_async(
+        self,
+        data: str | Path,
+        models: list[ModelSpec],
+        count: int = 3,
+        mode: str = "parallel",
+    ) -> MultiModelResult:
+        """Generate personas using multiple models asynchronously.
+
+        Args:
+            data: Source data for persona generation.
+            models: List of model specifications.
+            count: Number of personas to generate per model.
+            mode: Execution mode (parallel, sequential, consensus).
+
+        Returns:
+            MultiModelResult with outputs from all models.
 
-        # Execute generation
-        result = strategy.execute(
+        Raises:
+            ValueError: If models list is empty or mode is invalid.
+        """
+        strategy = self._create_strategy(models, mode)
+
+        return await strategy.execute_async(
             data=data,
             models=models,
             count=count,
@@ -266,8 +292,6 @@ class MultiModelGenerator:
             max_tokens=self.default_max_tokens,
         )
 
-        return result
-
     def generate_single(
         self,
         data: str | Path,
@@ -284,73 +308,47 @@ class MultiModelGenerator:
         Returns:
             ModelOutput with generation results.
         """
-        import time
-
-        start_time = time.time()
-
-        # Simulate generation for now (actual LLM call would go here)
-        # In production, this would call the provider's API
-        personas = self._mock_generate(data, model, count)
-
-        latency_ms = (time.time() - start_time) * 1000
-
-        # Estimate tokens (simplified)
-        data_str = str(data) if isinstance(data, Path) else data
-        tokens_input = len(data_str.split()) * 2  # Rough estimate
-        tokens_output = count * 500  # Rough estimate per persona
-
-        # Estimate cost (simplified)
-        cost = self._estimate_cost(model, tokens_input, tokens_output)
-
-        return ModelOutput(
-            model_spec=model,
-            personas=personas,
-            tokens_input=tokens_input,
-            tokens_output=tokens_output,
-            latency_ms=latency_ms,
-            cost=cost,
+        strategy = self._create_strategy([model], "parallel")
+        return strategy._generate_single(
+            data,
+            model,
+            count,
+            self.default_temperature,
+            self.default_max_tokens,
         )
 
-    def _mock_generate(
+    def _create_strategy(
         self,
-        data: str | Path,
-        model: ModelSpec,
-        count: int,
-    ) -> list[dict[str, Any]]:
-        """Mock persona generation for testing."""
-        personas = []
-        for i in range(count):
-            personas.append(
-                {
-                    "id": f"persona-{i+1}",
-                    "name": f"Persona {i+1} ({model.model})",
-                    "role": "User",
-                    "goals": ["Goal 1", "Goal 2"],
-                    "frustrations": ["Frustration 1"],
-                    "model_source": f"{model.provider}:{model.model}",
-                }
-            )
-        return personas
+        models: list[ModelSpec],
+        mode: str,
+    ) -> "ExecutionStrategy":
+        """Validate arguments and create the execution strategy."""
+        if not models:
+            raise ValueError("At least one model must be specified")
 
-    def _estimate_cost(
-        self,
-        model: ModelSpec,
-        tokens_input: int,
-        tokens_output: int,
-    ) -> float:
-        """Estimate cost for a model call."""
-        # Simplified pricing (per 1M tokens)
-        pricing = {
-            "anthropic": {"input": 3.0, "output": 15.0},
-            "openai": {"input": 5.0, "output": 15.0},
-            "gemini": {"input": 0.5, "output": 1.5},
-        }
+        valid_modes = {"parallel", "sequential", "consensus"}
+        if mode not in valid_modes:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of {valid_modes}")
 
-        rates = pricing.get(model.provider, {"input": 3.0, "output": 15.0})
-        input_cost = (tokens_input / 1_000_000) * rates["input"]
-        output_cost = (tokens_output / 1_000_000) * rates["output"]
+        # Import strategy classes here to avoid circular imports
+        from persona.core.multimodel.strategies import (
+            ConsensusStrategy,
+            ParallelStrategy,
+            SequentialStrategy,
+        )
 
-        return round(input_cost + output_cost, 6)
+        # Select execution strategy
+        strategy_map = {
+            "parallel": ParallelStrategy,
+            "sequential": SequentialStrategy,
+            "consensus": ConsensusStrategy,
+        }
+        strategy_class = strategy_map[mode]
+        return strategy_class(
+            timeout_seconds=self.timeout_seconds,
+            provider_factory=self.provider_factory,
+            workflow=self.workflow,
+        )
 
 
 def generate_multi_model(
@@ -358,6 +356,7 @@ def generate_multi_model(
     models: list[str | ModelSpec],
     count: int = 3,
     mode: str = "parallel",
+    provider_factory: Callable[[str], "LLMProvider"] | None = None,
 ) -> MultiModelResult:
     """Convenience function for multi-model generation.
 
@@ -366,6 +365,7 @@ def generate_multi_model(
         models: List of model specs (strings or ModelSpec objects).
         count: Number of personas to generate per model.
         mode: Execution mode (parallel, sequential, consensus).
+        provider_factory: Optional callable creating providers by name.
 
     Returns:
         MultiModelResult with outputs from all models.
@@ -378,5 +378,5 @@ def generate_multi_model(
         else:
             model_specs.append(m)
 
-    generator = MultiModelGenerator()
+    generator = MultiModelGenerator(provider_factory=provider_factory)
     return generator.generate(data, model_specs, count, mode)
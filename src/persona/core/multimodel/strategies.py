@@ -4,14 +4,17 @@ Provides parallel, sequential, and consensus execution modes
 for generating personas with multiple LLM models.
 """
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from persona.core.providers import LLMProvider, ProviderFactory
+
 
 class ExecutionMode(Enum):
     """Execution mode for multi-model generation."""
@@ -42,18 +45,32 @@ class ExecutionStrategy(ABC):
     """Base class for execution strategies.
 
     Subclasses implement specific execution patterns for
-    multi-model persona generation.
+    multi-model persona generation. Model calls go through each
+    provider's async API on a single event loop, bounded by a per-model
+    timeout. Per-provider request limits come from the process-wide
+    adaptive rate controller that HTTP providers report to.
     """
 
-    def __init__(self, timeout_seconds: int = 300):
+    def __init__(
+        self,
+        timeout_seconds: int = 300,
+        provider_factory: Callable[[str], LLMProvider] | None = None,
+        workflow: str = "default",
+    ):
         """Initialise the strategy.
 
         Args:
             timeout_seconds: Timeout per model call.
+            provider_factory: Callable creating a provider from its name
+                (defaults to ProviderFactory.create).
+            workflow: Built-in workflow name or workflow file path used
+                to render the prompt.
         """
         self.timeout_seconds = timeout_seconds
+        self.provider_factory = provider_factory or ProviderFactory.create
+        self.workflow = workflow
+        self._providers: dict[str, LLMProvider] = {}
 
-    @abstractmethod
     def execute(
         self,
         data: str | Path,
@@ -64,6 +81,34 @@ class ExecutionStrategy(ABC):
     ):
         """Execute the generation strategy.
 
+        Synchronous wrapper around execute_async(). Must NOT be called
+        from within an async context.
+
+        Args:
+            data: Source data for generation.
+            models: List of ModelSpec objects.
+            count: Number of personas per model.
+            temperature: Temperature for generation.
+            max_tokens: Max tokens for generation.
+
+        Returns:
+            MultiModelResult with outputs from all models.
+        """
+        return _run_sync(
+            self.execute_async(data, models, count, temperature, max_tokens)
+        )
+
+    @abstractmethod
+    async def execute_async(
+        self,
+        data: str | Path,
+        models: list,
+        count: int,
+        temperature: float,
+        max_tokens: int,
+    ):
+        """Execute the generation strategy asynchronously.
+
         Args:
             data: Source data for generation.
             models: List of ModelSpec objects.
@@ -87,6 +132,8 @@ class ExecutionStrategy(ABC):
     ):
         """Generate personas using a single model.
 
+        Synchronous wrapper around _generate_single_async().
+
         Args:
             data: Source data.
             model: ModelSpec object.
@@ -95,100 +142,194 @@ class ExecutionStrategy(ABC):
             max_tokens: Max tokens override.
             context: Optional context from previous model.
 
+        Returns:
+            ModelOutput with generation results.
+        """
+        return _run_sync(
+            self._generate_single_async(
+                _load_data(data), model, count, temperature, max_tokens, context
+            )
+        )
+
+    async def _generate_single_async(
+        self,
+        data: str,
+        model,
+        count: int,
+        temperature: float,
+        max_tokens: int,
+        context: str | None = None,
+    ):
+        """Generate personas using a single model asynchronously.
+
+        Errors and timeouts are captured in the returned ModelOutput so
+        that one slow or failing model never discards the others.
+
+        Args:
+            data: Loaded source data.
+            model: ModelSpec object.
+            count: Number of personas.
+            temperature: Temperature override.
+            max_tokens: Max tokens override.
+            context: Optional context from previous model.
+
         Returns:
             ModelOutput with generation results.
         """
         from persona.core.multimodel.generator import ModelOutput
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Use model-specific settings or defaults
             temp = model.temperature if model.temperature is not None else temperature
             tokens = model.max_tokens if model.max_tokens is not None else max_tokens
 
-            # Simulate generation (in production, this calls the LLM)
-            personas = self._mock_generate(data, model, count, context)
-
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Estimate tokens
-            data_str = str(data) if isinstance(data, Path) else data
-            tokens_input = len(data_str.split()) * 2
-            tokens_output = count * 500
+            provider = self._get_provider(model.provider)
+            prompt = self._build_prompt(data, count, context)
+
+            response = await asyncio.wait_for(
+                provider.generate_async(
+                    prompt=prompt,
+                    model=model.model,
+                    max_tokens=tokens,
+                    temperature=temp,
+                ),
+                timeout=self.timeout_seconds,
+            )
 
-            # Estimate cost
-            cost = self._estimate_cost(model, tokens_input, tokens_output)
+            personas = self._parse_personas(response.content, model)
+            latency_ms = (time.monotonic() - start_time) * 1000
 
             return ModelOutput(
                 model_spec=model,
                 personas=personas,
-                tokens_input=tokens_input,
-                tokens_output=tokens_output,
+                tokens_input=response.input_tokens,
+                tokens_output=response.output_tokens,
                 latency_ms=latency_ms,
-                cost=cost,
+                cost=self._estimate_cost(
+                    model, response.input_tokens, response.output_tokens
+                ),
+                raw_response=response.content,
+                prompt=prompt,
+            )
+        except TimeoutError:
+            return ModelOutput(
+                model_spec=model,
+                error=f"Timed out after {self.timeout_seconds}s",
+                latency_ms=(time.monotonic() - start_time) * 1000,
             )
         except Exception as e:
             return ModelOutput(
                 model_spec=model,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic() - start_time) * 1000,
             )
 
-    def _mock_generate(
-        self,
-        data: str | Path,
-        model,
-        count: int,
-        context: str | None = None,
-    ) -> list[dict[str, Any]]:
-        """Mock persona generation."""
+    def _get_provider(self, provider_name: str) -> LLMProvider:
+        """Get a configured provider, creating it on first use."""
+        if provider_name not in self._providers:
+            provider = self.provider_factory(provider_name)
+            if not provider.is_configured():
+                raise RuntimeError(f"{provider_name} provider not configured")
+            self._providers[provider_name] = provider
+        return self._providers[provider_name]
+
+    def _build_prompt(self, data: str, count: int, context: str | None) -> str:
+        """Render the generation prompt for a model call."""
+        from persona.core.prompts import WorkflowLoader
+
+        if context:
+            data = f"{data}\n\n{context}"
+
+        loader = WorkflowLoader()
+        if Path(self.workflow).exists():
+            workflow = loader.load(self.workflow)
+        else:
+            workflow = loader.load_builtin(self.workflow)
+        return workflow.render_prompt(
+            count=count,
+            data=data,
+            complexity="moderate",
+            detail_level="standard",
+            include_reasoning=False,
+        )
+
+    def _parse_personas(self, content: str, model) -> list[dict[str, Any]]:
+        """Parse personas from a model response, tagging their source."""
+        from persona.core.generation.parser import PersonaParser
+
         personas = []
-        context_suffix = " (with context)" if context else ""
-        for i in range(count):
-            personas.append(
-                {
-                    "id": f"persona-{i+1}",
-                    "name": f"Persona {i+1} ({model.model}){context_suffix}",
-                    "role": "User",
-                    "goals": ["Goal 1", "Goal 2"],
-                    "frustrations": ["Frustration 1"],
-                    "model_source": f"{model.provider}:{model.model}",
-                }
-            )
+        for persona in PersonaParser().parse(content).personas:
+            persona_dict = persona.to_dict()
+            persona_dict["model_source"] = f"{model.provider}:{model.model}"
+            personas.append(persona_dict)
         return personas
 
     def _estimate_cost(self, model, tokens_input: int, tokens_output: int) -> float:
-        """Estimate cost for a model call."""
-        pricing = {
-            "anthropic": {"input": 3.0, "output": 15.0},
-            "openai": {"input": 5.0, "output": 15.0},
-            "gemini": {"input": 0.5, "output": 1.5},
-        }
-        rates = pricing.get(model.provider, {"input": 3.0, "output": 15.0})
-        input_cost = (tokens_input / 1_000_000) * rates["input"]
-        output_cost = (tokens_output / 1_000_000) * rates["output"]
-        return round(input_cost + output_cost, 6)
+        """Calculate cost for a model call from actual token usage."""
+        from persona.core.multimodel.cost import MultiModelCostEstimator
+
+        detail = MultiModelCostEstimator().estimate_model_cost(
+            provider=model.provider,
+            model=model.model,
+            input_tokens=tokens_input,
+            output_tokens=tokens_output,
+        )
+        return detail.total_cost
+
+
+def _load_data(data: str | Path) -> str:
+    """Load source data from a path, or return text unchanged."""
+    if isinstance(data, Path):
+        from persona.core.data import DataLoader
+
+        content, _files = DataLoader().load_path(data)
+        return content
+    return data
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    coro.close()
+    raise RuntimeError(
+        "Cannot run multi-model generation synchronously from an async "
+        "context. Await the async method instead."
+    )
 
 
 class ParallelStrategy(ExecutionStrategy):
     """Parallel execution strategy.
 
-    Runs all models simultaneously for maximum speed.
+    Runs all models concurrently on one event loop for maximum speed.
     Results are combined without modification.
     """
 
-    def __init__(self, timeout_seconds: int = 300, max_workers: int = 4):
+    def __init__(
+        self,
+        timeout_seconds: int = 300,
+        max_workers: int | None = None,
+        provider_factory: Callable[[str], LLMProvider] | None = None,
+        workflow: str = "default",
+    ):
         """Initialise parallel strategy.
 
         Args:
             timeout_seconds: Timeout per model.
-            max_workers: Maximum concurrent workers.
+            max_workers: Optional cap on concurrent model calls across all
+                providers (unlimited by default).
+            provider_factory: Callable creating a provider from its name.
+            workflow: Workflow used to render the prompt.
         """
-        super().__init__(timeout_seconds)
+        super().__init__(timeout_seconds, provider_factory, workflow)
         self.max_workers = max_workers
 
-    def execute(
+    async def execute_async(
         self,
         data: str | Path,
         models: list,
@@ -199,44 +340,23 @@ class ParallelStrategy(ExecutionStrategy):
         """Execute generation in parallel.
 
         All models run concurrently. Total latency is approximately
-        the latency of the slowest model.
+        the latency of the slowest model, bounded by the timeout.
         """
         from persona.core.multimodel.generator import MultiModelResult
 
-        start_time = time.time()
-        model_outputs = []
+        start_time = time.monotonic()
+        data = _load_data(data)
+        overall = asyncio.Semaphore(self.max_workers or max(len(models), 1))
+
+        async def run(model):
+            async with overall:
+                return await self._generate_single_async(
+                    data, model, count, temperature, max_tokens
+                )
+
+        model_outputs = list(await asyncio.gather(*(run(m) for m in models)))
 
-        with ThreadPoolExecutor(
-            max_workers=min(len(models), self.max_workers)
-        ) as executor:
-            futures = {
-                executor.submit(
-                    self._generate_single,
-                    data,
-                    model,
-                    count,
-                    temperature,
-                    max_tokens,
-                ): model
-                for model in models
-            }
-
-            for future in as_completed(futures, timeout=self.timeout_seconds):
-                try:
-                    output = future.result()
-                    model_outputs.append(output)
-                except Exception as e:
-                    model = futures[future]
-                    from persona.core.multimodel.generator import ModelOutput
-
-                    model_outputs.append(
-                        ModelOutput(
-                            model_spec=model,
-                            error=str(e),
-                        )
-                    )
-
-        total_latency = (time.time() - start_time) * 1000
+        total_latency = (time.monotonic() - start_time) * 1000
 
         return MultiModelResult(
             model_outputs=model_outputs,
@@ -255,17 +375,25 @@ class SequentialStrategy(ExecutionStrategy):
     Useful for refinement chains.
     """
 
-    def __init__(self, timeout_seconds: int = 300, pass_context: bool = True):
+    def __init__(
+        self,
+        timeout_seconds: int = 300,
+        pass_context: bool = True,
+        provider_factory: Callable[[str], LLMProvider] | None = None,
+        workflow: str = "default",
+    ):
         """Initialise sequential strategy.
 
         Args:
             timeout_seconds: Timeout per model.
             pass_context: Whether to pass output to next model.
+            provider_factory: Callable creating a provider from its name.
+            workflow: Workflow used to render the prompt.
         """
-        super().__init__(timeout_seconds)
+        super().__init__(timeout_seconds, provider_factory, workflow)
         self.pass_context = pass_context
 
-    def execute(
+    async def execute_async(
         self,
         data: str | Path,
         models: list,
@@ -280,12 +408,13 @@ class SequentialStrategy(ExecutionStrategy):
         """
         from persona.core.multimodel.generator import MultiModelResult
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        data = _load_data(data)
         model_outputs = []
         context = None
 
         for model in models:
-            output = self._generate_single(
+            output = await self._generate_single_async(
                 data,
                 model,
                 count,
@@ -299,7 +428,7 @@ class SequentialStrategy(ExecutionStrategy):
             if self.pass_context and output.success:
                 context = self._format_context(output.personas)
 
-        total_latency = (time.time() - start_time) * 1000
+        total_latency = (time.monotonic() - start_time) * 1000
 
         return MultiModelResult(
             model_outputs=model_outputs,
@@ -331,20 +460,24 @@ class ConsensusStrategy(ExecutionStrategy):
         self,
         timeout_seconds: int = 300,
         consensus_threshold: float = 0.7,
-        max_workers: int = 4,
+        max_workers: int | None = None,
+        provider_factory: Callable[[str], LLMProvider] | None = None,
+        workflow: str = "default",
     ):
         """Initialise consensus strategy.
 
         Args:
             timeout_seconds: Timeout per model.
             consensus_threshold: Similarity threshold for merging.
-            max_workers: Maximum concurrent workers.
+            max_workers: Optional cap on concurrent model calls.
+            provider_factory: Callable creating a provider from its name.
+            workflow: Workflow used to render the prompt.
         """
-        super().__init__(timeout_seconds)
+        super().__init__(timeout_seconds, provider_factory, workflow)
         self.consensus_threshold = consensus_threshold
         self.max_workers = max_workers
 
-    def execute(
+    async def execute_async(
         self,
         data: str | Path,
         models: list,
@@ -360,16 +493,24 @@ class ConsensusStrategy(ExecutionStrategy):
         """
         from persona.core.multimodel.generator import MultiModelResult
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Step 1: Parallel generation
-        parallel = ParallelStrategy(self.timeout_seconds, self.max_workers)
-        parallel_result = parallel.execute(data, models, count, temperature, max_tokens)
+        parallel = ParallelStrategy(
+            self.timeout_seconds,
+            self.max_workers,
+            self.provider_factory,
+            self.workflow,
+        )
+        parallel._providers = self._providers
+        parallel_result = await parallel.execute_async(
+            data, models, count, temperature, max_tokens
+        )
 
         # Step 2 & 3: Find consensus
         consolidated = self._find_consensus(parallel_result.all_personas, count)
 
-        total_latency = (time.time() - start_time) * 1000
+        total_latency = (time.monotonic() - start_time) * 1000
 
         return MultiModelResult(
             model_outputs=parallel_result.model_outputs,
@@ -5,6 +5,12 @@ This module provides functionality for formatting and saving
 generated personas to various output formats.
 """
 
+from persona.core.output.blob_store import (
+    BlobCompression,
+    BlobInfo,
+    BlobStore,
+    GarbageCollectionResult,
+)
 from persona.core.output.empathy_table import (
     EmpathyTableConfig,
     EmpathyTableFormatter,
@@ -16,7 +22,7 @@ from persona.core.output.formatters import (
     MarkdownFormatter,
     TextFormatter,
 )
-from persona.core.output.manager import OutputManager
+from persona.core.output.manager import BlobMigrationResult, OutputManager
 from persona.core.output.narrative import (
     FirstPersonNarrativeFormatter,
     NarrativeConfig,
@@ -75,6 +81,12 @@ __all__ = [
     "JSONFormatter",
     "MarkdownFormatter",
     "TextFormatter",
+    # Blob storage
+    "BlobCompression",
+    "BlobInfo",
+    "BlobMigrationResult",
+    "BlobStore",
+    "GarbageCollectionResult",
     # Empathy table output
     "EmpathyTableFormatter",
     "EmpathyTableRow",
@@ -0,0 +1,385 @@
+"""
+Content-addressed blob storage for generation outputs.
+
+Rendered prompts embed the full source data, so running the same corpus
+through many experiment variants writes identical multi-megabyte bodies
+into every output folder. The BlobStore keeps a single hash-named copy of
+each distinct body, optionally compressed, which output folders reference
+by digest.
+"""
+
+import gzip
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+
+from persona.core.lineage.hashing import HASH_PREFIX, hash_content
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Allowance for coarse filesystem timestamps (FAT and SMB use 2 seconds)
+MTIME_GRACE_SECONDS = 2.0
+
+
+class BlobCompression(Enum):
+    """Compression applied to stored blobs."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @property
+    def suffix(self) -> str:
+        """File suffix used for blobs stored with this compression."""
+        return {
+            BlobCompression.NONE: "",
+            BlobCompression.GZIP: ".gz",
+            BlobCompression.ZSTD: ".zst",
+        }[self]
+
+
+@dataclass
+class BlobInfo:
+    """
+    Information about a stored blob.
+
+    Attributes:
+        digest: Content digest in "sha256:<hex>" form.
+        path: Location of the blob on disk.
+        compression: Compression used for the stored bytes.
+        stored_bytes: Size of the blob on disk.
+    """
+
+    digest: str
+    path: Path
+    compression: BlobCompression
+    stored_bytes: int
+
+
+@dataclass
+class GarbageCollectionResult:
+    """
+    Result of a blob store garbage collection pass.
+
+    Attributes:
+        removed: Digests of blobs that were deleted.
+        kept: Number of blobs still referenced.
+        recent: Unreferenced blobs kept because they were written or
+            reused after collection started.
+        bytes_freed: Total on-disk bytes reclaimed.
+    """
+
+    removed: list[str] = field(default_factory=list)
+    kept: int = 0
+    recent: int = 0
+    bytes_freed: int = 0
+
+
+class BlobStore:
+    """
+    Content-addressed store for large output artefacts.
+
+    Blobs are named by the SHA-256 digest of their uncompressed content,
+    so storing the same content twice is a no-op regardless of the
+    compression setting used at the time.
+
+    Store layout:
+        <root>/
+            sha256/
+                ab/
+                    abcdef....gz
+
+    Example:
+        >>> store = BlobStore("./outputs/.blobs", compression="gzip")
+        >>> digest = store.put("rendered prompt ...")
+        >>> store.get_text(digest)
+        'rendered prompt ...'
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        compression: str | BlobCompression = BlobCompression.NONE,
+    ) -> None:
+        """
+        Initialise the blob store.
+
+        Args:
+            root: Directory holding the blobs.
+            compression: Compression for newly written blobs.
+
+        Raises:
+            ImportError: If zstd compression is requested but the
+                zstandard package is not installed.
+        """
+        self._root = Path(root)
+        self._compression = BlobCompression(compression)
+
+        if self._compression == BlobCompression.ZSTD and not ZSTD_AVAILABLE:
+            raise ImportError(
+                "zstd compression requires the zstandard package. "
+                "Install with: pip install zstandard"
+            )
+
+    @property
+    def root(self) -> Path:
+        """Root directory of the store."""
+        return self._root
+
+    @property
+    def compression(self) -> BlobCompression:
+        """Compression used for newly written blobs."""
+        return self._compression
+
+    def put(self, content: str | bytes) -> str:
+        """
+        Store content and return its digest.
+
+        Storing content that is already present refreshes the blob's
+        modification time, so a concurrent garbage collection treats it
+        as in use until the caller has recorded the reference.
+
+        Args:
+            content: Text or bytes to store.
+
+        Returns:
+            Digest string in format "sha256:<hex_digest>".
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        digest = hash_content(content)
+        info = self.find(digest)
+        if info is not None:
+            try:
+                os.utime(info.path)
+                return digest
+            except FileNotFoundError:
+                pass  # Collected since find(); write it again below
+
+        path = self._blob_path(digest, self._compression)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so readers never see partial blobs
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._compress(content, self._compression))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+        Read the content of a blob.
+
+        Args:
+            digest: Digest returned by put().
+
+        Returns:
+            Uncompressed blob content.
+
+        Raises:
+            FileNotFoundError: If no blob exists for the digest.
+        """
+        info = self.find(digest)
+        if info is None:
+            raise FileNotFoundError(f"Blob not found: {digest}")
+
+        return self._decompress(info.path.read_bytes(), info.compression)
+
+    def get_text(self, digest: str) -> str:
+        """
+        Read the content of a blob as UTF-8 text.
+
+        Args:
+            digest: Digest returned by put().
+
+        Returns:
+            Decoded blob content.
+        """
+        return self.get(digest).decode("utf-8")
+
+    def exists(self, digest: str) -> bool:
+        """Check whether a blob is stored for the digest."""
+        return self.find(digest) is not None
+
+    def find(self, digest: str) -> BlobInfo | None:
+        """
+        Locate a blob on disk.
+
+        Args:
+            digest: Digest to look up.
+
+        Returns:
+            BlobInfo if the blob exists, None otherwise.
+        """
+        for compression in BlobCompression:
+            path = self._blob_path(digest, compression)
+            if path.exists():
+                return BlobInfo(
+                    digest=digest,
+                    path=path,
+                    compression=compression,
+                    stored_bytes=path.stat().st_size,
+                )
+        return None
+
+    def delete(self, digest: str) -> bool:
+        """
+        Remove a blob from the store.
+
+        Args:
+            digest: Digest to remove.
+
+        Returns:
+            True if a blob was removed, False if not found.
+        """
+        info = self.find(digest)
+        if info is None:
+            return False
+
+        info.path.unlink()
+        return True
+
+    def iter_blobs(self) -> Iterator[BlobInfo]:
+        """
+        Iterate over all stored blobs.
+
+        Yields:
+            BlobInfo for each blob in the store.
+        """
+        algorithm_dir = self._root / HASH_PREFIX.rstrip(":")
+        if not algorithm_dir.exists():
+            return
+
+        for path in sorted(algorithm_dir.glob("*/*")):
+            if not path.is_file() or path.name.startswith(".tmp-"):
+                continue
+
+            compression = BlobCompression.NONE
+            hex_digest = path.name
+            for candidate in (BlobCompression.GZIP, BlobCompression.ZSTD):
+                if path.name.endswith(candidate.suffix):
+                    compression = candidate
+                    hex_digest = path.name[: -len(candidate.suffix)]
+                    break
+
+            yield BlobInfo(
+                digest=f"{HASH_PREFIX}{hex_digest}",
+                path=path,
+                compression=compression,
+                stored_bytes=path.stat().st_size,
+            )
+
+    def get_total_size(self) -> int:
+        """
+        Get the total on-disk size of the store.
+
+        Returns:
+            Total size in bytes.
+        """
+        return sum(info.stored_bytes for info in self.iter_blobs())
+
+    def collect_garbage(
+        self, referenced: set[str], started_at: float | None = None
+    ) -> GarbageCollectionResult:
+        """
+        Delete blobs that are no longer referenced.
+
+        A save writes its blobs before the manifest that references them,
+        so blobs modified after collection started are never deleted:
+        they may belong to a save that has not recorded them yet.
+
+        Args:
+            referenced: Digests that must be kept.
+            started_at: Time (as from time.time()) taken before the
+                referenced set was gathered. Defaults to now.
+
+        Returns:
+            GarbageCollectionResult describing what was removed.
+        """
+        if started_at is None:
+            started_at = time.time()
+        cutoff = started_at - MTIME_GRACE_SECONDS
+
+        result = GarbageCollectionResult()
+
+        for info in list(self.iter_blobs()):
+            if info.digest in referenced:
+                result.kept += 1
+                continue
+
+            # Re-check just before deleting to catch a put() reusing it
+            try:
+                if info.path.stat().st_mtime >= cutoff:
+                    result.recent += 1
+                    continue
+            except FileNotFoundError:
+                continue
+
+            info.path.unlink(missing_ok=True)
+            result.removed.append(info.digest)
+            result.bytes_freed += info.stored_bytes
+
+        # Tidy up empty fan-out directories
+        algorithm_dir = self._root / HASH_PREFIX.rstrip(":")
+        if algorithm_dir.exists():
+            for subdir in algorithm_dir.iterdir():
+                if subdir.is_dir() and not any(subdir.iterdir()):
+                    subdir.rmdir()
+
+        return result
+
+    def _blob_path(self, digest: str, compression: BlobCompression) -> Path:
+        """Get the on-disk path for a digest and compression."""
+        if not digest.startswith(HASH_PREFIX):
+            raise ValueError(f"Unsupported digest format: {digest}")
+
+        hex_digest = digest[len(HASH_PREFIX) :]
+        if len(hex_digest) < 3 or not all(
+            c in "0123456789abcdef" for c in hex_digest
+        ):
+            raise ValueError(f"Invalid digest: {digest}")
+
+        return (
+            self._root
+            / HASH_PREFIX.rstrip(":")
+            / hex_digest[:2]
+            / f"{hex_digest}{compression.suffix}"
+        )
+
+    @staticmethod
+    def _compress(content: bytes, compression: BlobCompression) -> bytes:
+        """Compress content for storage."""
+        if compression == BlobCompression.GZIP:
+            return gzip.compress(content, mtime=0)
+        if compression == BlobCompression.ZSTD:
+            return zstandard.ZstdCompressor().compress(content)
+        return content
+
+    @staticmethod
+    def _decompress(data: bytes, compression: BlobCompression) -> bytes:
+        """Decompress stored bytes."""
+        if compression == BlobCompression.GZIP:
+            return gzip.decompress(data)
+        if compression == BlobCompression.ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise ImportError(
+                    "Reading zstd blobs requires the zstandard package. "
+                    "Install with: pip install zstandard"
+                )
+            return zstandard.ZstdDecompressor().decompress(data)
+        return data
@@ -6,18 +6,44 @@ output directories and saving generation results.
 """
 
 import json
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from persona.core.generation.parser import Persona
 from persona.core.generation.pipeline import GenerationResult
+from persona.core.logging.tracing import traced
+from persona.core.output.blob_store import BlobStore, GarbageCollectionResult
 from persona.core.output.formatters import (
     JSONFormatter,
     MarkdownFormatter,
     TextFormatter,
 )
 
+# Large text artefacts that can be moved into a blob store
+BLOB_ARTEFACTS = ("prompt.txt", "full_response.txt", "reasoning.txt")
+
+# Blob store location within an output base directory
+BLOB_DIR_NAME = ".blobs"
+
+
+@dataclass
+class BlobMigrationResult:
+    """
+    Result of migrating output folders to blob storage.
+
+    Attributes:
+        outputs_migrated: Number of output folders that were changed.
+        files_migrated: Number of artefact files moved into the store.
+        bytes_migrated: Size of the migrated files before deduplication.
+    """
+
+    outputs_migrated: int = 0
+    files_migrated: int = 0
+    bytes_migrated: int = 0
+
 
 class OutputManager:
     """
@@ -28,8 +54,8 @@ class OutputManager:
     ```
     outputs/YYYYMMDD_HHMMSS/
     ├── metadata.json       # Generation parameters and stats
-    ├── prompt.txt          # The rendered prompt
-    ├── full_response.txt   # Complete LLM response
+    ├── prompt.txt          # The rendered prompt (or blob reference)
+    ├── full_response.txt   # Complete LLM response (or blob reference)
     └── personas/
         ├── 01/
         │   ├── persona.json
@@ -39,15 +65,23 @@ class OutputManager:
             └── persona.md
     ```
 
+    When a BlobStore is supplied, prompt.txt, full_response.txt and
+    reasoning.txt are written once to the store and referenced by digest
+    from the "artefacts" section of metadata.json instead.
+
     Example:
         manager = OutputManager("./outputs")
         output_dir = manager.save(result)
+
+        # Deduplicate prompts and responses across runs
+        manager = OutputManager.with_blob_store("./outputs")
     """
 
     def __init__(
         self,
         base_dir: str | Path = "./outputs",
         timestamp_folders: bool = True,
+        blob_store: BlobStore | None = None,
     ) -> None:
         """
         Initialise the output manager.
@@ -55,10 +89,43 @@ class OutputManager:
         Args:
             base_dir: Base directory for outputs.
             timestamp_folders: Whether to use timestamped folder names.
+            blob_store: Optional content-addressed store for large
+                artefacts. Files are written inline when None.
         """
         self._base_dir = Path(base_dir)
         self._timestamp_folders = timestamp_folders
+        self._blob_store = blob_store
+
+    @classmethod
+    def with_blob_store(
+        cls,
+        base_dir: str | Path = "./outputs",
+        compression: str = "gzip",
+        timestamp_folders: bool = True,
+    ) -> "OutputManager":
+        """
+        Create a manager that keeps artefacts in a shared blob store.
 
+        The store lives in a ".blobs" folder inside base_dir, so every
+        output under the same base directory shares it.
+
+        Args:
+            base_dir: Base directory for outputs.
+            compression: Compression for newly written blobs.
+            timestamp_folders: Whether to use timestamped folder names.
+
+        Returns:
+            OutputManager backed by the base directory's blob store.
+        """
+        store = BlobStore(Path(base_dir) / BLOB_DIR_NAME, compression=compression)
+        return cls(base_dir, timestamp_folders=timestamp_folders, blob_store=store)
+
+    @property
+    def blob_store(self) -> BlobStore | None:
+        """Blob store used for large artefacts, if any."""
+        return self._blob_store
+
+    @traced("output.save")
     def save(self, result: GenerationResult, name: str | None = None) -> Path:
         """
         Save generation results to output directory.
@@ -73,20 +140,35 @@ class OutputManager:
         # Create output directory
         output_dir = self._create_output_dir(name)
 
-        # Save metadata
-        self._save_metadata(output_dir, result)
+        artefacts = {
+            "prompt.txt": result.prompt,
+            "full_response.txt": result.raw_response,
+            "reasoning.txt": result.reasoning,
+        }
+
+        if self._blob_store is not None:
+            # Store large artefacts by digest, referenced from metadata
+            references = {
+                filename: self._blob_store.put(content)
+                for filename, content in artefacts.items()
+                if content
+            }
+            self._save_metadata(output_dir, result, references)
+        else:
+            # Save metadata
+            self._save_metadata(output_dir, result)
 
-        # Save prompt
-        if result.prompt:
-            self._save_prompt(output_dir, result.prompt)
+            # Save prompt
+            if result.prompt:
+                self._save_prompt(output_dir, result.prompt)
 
-        # Save full response
-        if result.raw_response:
-            self._save_full_response(output_dir, result.raw_response)
+            # Save full response
+            if result.raw_response:
+                self._save_full_response(output_dir, result.raw_response)
 
-        # Save reasoning if present
-        if result.reasoning:
-            self._save_reasoning(output_dir, result.reasoning)
+            # Save reasoning if present
+            if result.reasoning:
+                self._save_reasoning(output_dir, result.reasoning)
 
         # Save personas
         self._save_personas(output_dir, result.personas)
@@ -111,7 +193,12 @@ class OutputManager:
 
         return output_dir
 
-    def _save_metadata(self, output_dir: Path, result: GenerationResult) -> None:
+    def _save_metadata(
+        self,
+        output_dir: Path,
+        result: GenerationResult,
+        artefacts: dict[str, str] | None = None,
+    ) -> None:
         """Save generation metadata."""
         metadata: dict[str, Any] = {
             "generated_at": datetime.now().isoformat(),
@@ -124,15 +211,31 @@ class OutputManager:
             "source_files": [str(f) for f in result.source_files],
         }
 
+        # Record whether the response was reused from the response cache
+        if result.cached:
+            metadata["cached_response"] = True
+
+        # Record that only personas completed before a cut-off were kept
+        if result.truncated:
+            metadata["truncated"] = True
+
         # Include URL sources if present
         if result.url_sources:
             url_source_data = []
             for source in result.url_sources:
-                if hasattr(source, 'to_dict'):
+                if hasattr(source, "to_dict"):
                     url_source_data.append(source.to_dict())
             if url_source_data:
                 metadata["url_sources"] = url_source_data
 
+        # Include blob references for artefacts held in the blob store
+        if artefacts:
+            metadata["artefacts"] = artefacts
+
+        self._write_metadata(output_dir, metadata)
+
+    def _write_metadata(self, output_dir: Path, metadata: dict[str, Any]) -> None:
+        """Write metadata.json to an output directory."""
         metadata_path = output_dir / "metadata.json"
         metadata_path.write_text(
             json.dumps(metadata, indent=2, ensure_ascii=False),
@@ -210,12 +313,19 @@ class OutputManager:
         outputs = self.list_outputs()
         return outputs[-1] if outputs else None
 
-    def load_metadata(self, output_dir: Path) -> dict[str, Any]:
+    def load_metadata(
+        self,
+        output_dir: Path,
+        resolve_artefacts: bool = False,
+    ) -> dict[str, Any]:
         """
         Load metadata from an output directory.
 
         Args:
             output_dir: Path to output directory.
+            resolve_artefacts: Whether to include the text of prompt,
+                response and reasoning artefacts under "artefact_content",
+                reading them from the blob store or from inline files.
 
         Returns:
             Metadata dictionary.
@@ -225,7 +335,141 @@ class OutputManager:
             raise FileNotFoundError(f"Metadata not found: {metadata_path}")
 
         with open(metadata_path, encoding="utf-8") as f:
-            return json.load(f)
+            metadata = json.load(f)
+
+        if resolve_artefacts:
+            content: dict[str, str] = {}
+            for filename in BLOB_ARTEFACTS:
+                text = self._read_artefact(output_dir, filename, metadata)
+                if text is not None:
+                    content[filename] = text
+            metadata["artefact_content"] = content
+
+        return metadata
+
+    def load_artefact(self, output_dir: Path, filename: str) -> str | None:
+        """
+        Load a text artefact from an output directory.
+
+        Reads the inline file if present, otherwise resolves the digest
+        recorded in metadata.json through the blob store.
+
+        Args:
+            output_dir: Path to output directory.
+            filename: Artefact name, e.g. "prompt.txt".
+
+        Returns:
+            Artefact text, or None if the output has no such artefact.
+        """
+        return self._read_artefact(output_dir, filename, self.load_metadata(output_dir))
+
+    def _read_artefact(
+        self,
+        output_dir: Path,
+        filename: str,
+        metadata: dict[str, Any],
+    ) -> str | None:
+        """Read an artefact inline or from the blob store."""
+        inline_path = output_dir / filename
+        if inline_path.exists():
+            return inline_path.read_text(encoding="utf-8")
+
+        digest = metadata.get("artefacts", {}).get(filename)
+        if digest is None:
+            return None
+
+        if self._blob_store is None:
+            raise FileNotFoundError(
+                f"{filename} is stored as blob {digest} "
+                "but no blob store is configured"
+            )
+
+        return self._blob_store.get_text(digest)
+
+    def collect_garbage(self) -> GarbageCollectionResult:
+        """
+        Remove blobs no longer referenced by any output directory.
+
+        Only outputs under this manager's base directory are considered,
+        so the blob store should not be shared with other base directories.
+        Blobs written after collection starts are kept, so saves running
+        concurrently in other processes are not affected.
+
+        Returns:
+            GarbageCollectionResult describing what was removed.
+
+        Raises:
+            ValueError: If no blob store is configured.
+        """
+        if self._blob_store is None:
+            raise ValueError("No blob store configured")
+
+        started_at = time.time()
+        referenced: set[str] = set()
+        for output_dir in self.list_outputs():
+            metadata = self.load_metadata(output_dir)
+            referenced.update(metadata.get("artefacts", {}).values())
+
+        return self._blob_store.collect_garbage(referenced, started_at)
+
+    def migrate_output(self, output_dir: Path) -> BlobMigrationResult:
+        """
+        Move inline artefacts of an existing output into the blob store.
+
+        Args:
+            output_dir: Path to output directory.
+
+        Returns:
+            BlobMigrationResult for this directory.
+
+        Raises:
+            ValueError: If no blob store is configured.
+        """
+        if self._blob_store is None:
+            raise ValueError("No blob store configured")
+
+        result = BlobMigrationResult()
+        metadata = self.load_metadata(output_dir)
+        references = dict(metadata.get("artefacts", {}))
+
+        migrated_paths = []
+        for filename in BLOB_ARTEFACTS:
+            path = output_dir / filename
+            if not path.exists():
+                continue
+
+            content = path.read_bytes()
+            references[filename] = self._blob_store.put(content)
+            migrated_paths.append(path)
+            result.files_migrated += 1
+            result.bytes_migrated += len(content)
+
+        if not migrated_paths:
+            return result
+
+        # Record references before removing files so a crash loses nothing
+        metadata["artefacts"] = references
+        self._write_metadata(output_dir, metadata)
+        for path in migrated_paths:
+            path.unlink()
+
+        result.outputs_migrated = 1
+        return result
+
+    def migrate_all(self) -> BlobMigrationResult:
+        """
+        Move inline artefacts of all outputs into the blob store.
+
+        Returns:
+            Combined BlobMigrationResult.
+        """
+        total = BlobMigrationResult()
+        for output_dir in self.list_outputs():
+            result = self.migrate_output(output_dir)
+            total.outputs_migrated += result.outputs_migrated
+            total.files_migrated += result.files_migrated
+            total.bytes_migrated += result.bytes_migrated
+        return total
 
     def _save_attribution(self, output_dir: Path, url_sources: list) -> None:
         """
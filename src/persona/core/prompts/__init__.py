@@ -5,11 +5,19 @@ This module provides Jinja2-based prompt templating for persona generation
 workflows.
 """
 
+from persona.core.prompts.cache import (
+    TemplateCache,
+    get_template_cache,
+    set_template_cache,
+)
 from persona.core.prompts.template import PromptTemplate
 from persona.core.prompts.workflow import Workflow, WorkflowLoader
 
 __all__ = [
     "PromptTemplate",
+    "TemplateCache",
     "Workflow",
     "WorkflowLoader",
+    "get_template_cache",
+    "set_template_cache",
 ]
@@ -0,0 +1,368 @@
+"""
+Process-wide cache of compiled templates and parsed workflow files.
+
+Rendering a prompt used to build a new Jinja2 Environment and recompile
+the template every time, and workflow YAML was re-read for every
+generation. In batch and API modes that work is repeated thousands of
+times for the same handful of templates. TemplateCache keeps one shared
+Environment per undefined-handling mode, compiled templates keyed by
+source digest (with an optional on-disk bytecode cache so new processes
+skip compilation too) and file contents invalidated by modification time.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    StrictUndefined,
+    Template,
+    TemplateNotFound,
+    Undefined,
+    meta,
+)
+
+from persona.core.platform import get_cache_dir
+
+# Default maximum number of compiled templates kept in memory
+DEFAULT_MAX_TEMPLATES = 256
+
+# Files modified this close to being read are re-read on the next lookup,
+# since a same-size rewrite within the filesystem's timestamp granularity
+# would otherwise go unnoticed
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def get_default_bytecode_cache_dir() -> Path:
+    """Get default directory for compiled template bytecode."""
+    return get_cache_dir() / "templates"
+
+
+@dataclass
+class CompileCacheStats:
+    """
+    Hit/miss statistics for one part of the template cache.
+
+    Attributes:
+        hits: Lookups served from memory.
+        misses: Lookups that had to compile or read from disk.
+        invalidations: File entries discarded because the file changed.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Return total number of lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Return fraction of lookups served from memory."""
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class TemplateCacheStats:
+    """
+    Statistics for a TemplateCache.
+
+    Attributes:
+        templates: Compiled template lookups.
+        variables: Template variable extraction lookups.
+        files: File content lookups.
+    """
+
+    templates: CompileCacheStats = field(default_factory=CompileCacheStats)
+    variables: CompileCacheStats = field(default_factory=CompileCacheStats)
+    files: CompileCacheStats = field(default_factory=CompileCacheStats)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "templates": self.templates.to_dict(),
+            "variables": self.variables.to_dict(),
+            "files": self.files.to_dict(),
+        }
+
+
+class _DigestLoader(BaseLoader):
+    """Jinja2 loader serving sources registered under digest-based names."""
+
+    def __init__(self) -> None:
+        self.sources: dict[str, str] = {}
+
+    def get_source(self, environment: Environment, template: str):
+        """Return the source registered under a name."""
+        if template not in self.sources:
+            raise TemplateNotFound(template)
+        return self.sources[template], None, lambda: True
+
+
+class TemplateCache:
+    """
+    Thread-safe cache of compiled templates and parsed files.
+
+    Templates are keyed by a digest of their source, so identical
+    template strings share one compiled Template regardless of where
+    they came from. File lookups compare the file's size and
+    modification time and re-read the file only when either changed.
+
+    Example:
+        cache = get_template_cache()
+        template = cache.compile("Generate {{ count }} personas")
+        config = cache.load_file("workflow.yaml", yaml.safe_load)
+        print(cache.stats.to_dict())
+    """
+
+    def __init__(
+        self,
+        bytecode_dir: Path | str | None = None,
+        max_templates: int = DEFAULT_MAX_TEMPLATES,
+    ) -> None:
+        """
+        Initialise the template cache.
+
+        Args:
+            bytecode_dir: Directory for on-disk bytecode, or None to keep
+                compiled templates in memory only.
+            max_templates: Maximum compiled templates kept in memory;
+                least recently used templates are dropped first.
+        """
+        self._max_templates = max_templates
+        self._lock = threading.RLock()
+        self._templates: OrderedDict[tuple[str, bool], Template] = OrderedDict()
+        self._variables: dict[str, frozenset[str]] = {}
+        self._files: dict[tuple[Path, str], tuple[int, int, int, Any]] = {}
+        self._loader = _DigestLoader()
+        self.bytecode_dir = Path(bytecode_dir) if bytecode_dir else None
+        self.stats = TemplateCacheStats()
+
+        bytecode_cache = None
+        if self.bytecode_dir is not None:
+            try:
+                self.bytecode_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(self.bytecode_dir))
+            except OSError:
+                # Unwritable cache directory: fall back to memory only
+                self.bytecode_dir = None
+
+        self._environments = {
+            strict: Environment(
+                loader=self._loader,
+                undefined=StrictUndefined if strict else Undefined,
+                autoescape=False,
+                trim_blocks=strict,
+                lstrip_blocks=strict,
+                bytecode_cache=bytecode_cache,
+                cache_size=0,
+            )
+            for strict in (True, False)
+        }
+
+    def environment(self, strict: bool = True) -> Environment:
+        """
+        Get the shared environment.
+
+        Args:
+            strict: Whether to get the prompt environment (StrictUndefined,
+                trimmed blocks) or a default Jinja2 environment.
+
+        Returns:
+            Shared Environment instance.
+        """
+        return self._environments[strict]
+
+    def compile(self, source: str, strict: bool = True) -> Template:
+        """
+        Get a compiled template for a source string.
+
+        Args:
+            source: Jinja2 template source.
+            strict: Whether to compile for the prompt environment (see
+                environment()).
+
+        Returns:
+            Compiled Template.
+
+        Raises:
+            TemplateSyntaxError: If the source is not a valid template.
+        """
+        key = (self._digest(source), strict)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.stats.templates.hits += 1
+                return template
+
+            self.stats.templates.misses += 1
+            # The mode is part of the name so bytecode is stored per mode
+            name = f"{key[0]}.{'strict' if strict else 'default'}"
+            self._loader.sources[name] = source
+            try:
+                template = self._environments[strict].get_template(name)
+            finally:
+                del self._loader.sources[name]
+
+            self._templates[key] = template
+            while len(self._templates) > self._max_templates:
+                self._templates.popitem(last=False)
+            return template
+
+    def variables(self, source: str) -> list[str]:
+        """
+        Get the undeclared variables used by a template source.
+
+        Args:
+            source: Jinja2 template source.
+
+        Returns:
+            Sorted list of variable names.
+
+        Raises:
+            TemplateSyntaxError: If the source is not a valid template.
+        """
+        digest = self._digest(source)
+        with self._lock:
+            names = self._variables.get(digest)
+            if names is not None:
+                self.stats.variables.hits += 1
+                return sorted(names)
+
+            self.stats.variables.misses += 1
+            ast = self._environments[False].parse(source)
+            names = frozenset(meta.find_undeclared_variables(ast))
+            if len(self._variables) >= self._max_templates:
+                self._variables.clear()
+            self._variables[digest] = names
+            return sorted(names)
+
+    def load_file(
+        self,
+        path: Path | str,
+        parser: Callable[[str], Any],
+    ) -> Any:
+        """
+        Read and parse a file, reusing the result while it is unchanged.
+
+        Files modified within RACY_WINDOW_NS of being read are not served
+        from memory until a later read sees them as settled.
+
+        Args:
+            path: File to read.
+            parser: Function turning the file's text into a value. The
+                parser's qualified name is part of the cache key.
+
+        Returns:
+            Deep copy of the parsed value, so callers may mutate it.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (path, getattr(parser, "__qualname__", repr(parser)))
+
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None:
+                mtime_ns, size, read_ns, value = entry
+                if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+                    self.stats.files.invalidations += 1
+                elif mtime_ns + RACY_WINDOW_NS < read_ns:
+                    self.stats.files.hits += 1
+                    return copy.deepcopy(value)
+
+            self.stats.files.misses += 1
+
+        read_ns = time.time_ns()
+        value = parser(path.read_text(encoding="utf-8"))
+
+        with self._lock:
+            self._files[key] = (stat.st_mtime_ns, stat.st_size, read_ns, value)
+        return copy.deepcopy(value)
+
+    def read_text(self, path: Path | str) -> str:
+        """
+        Read a text file, reusing the content while it is unchanged.
+
+        Args:
+            path: File to read.
+
+        Returns:
+            File content.
+        """
+        return self.load_file(path, str)
+
+    def clear(self) -> None:
+        """Drop all cached templates and files (bytecode on disk is kept)."""
+        with self._lock:
+            self._templates.clear()
+            self._variables.clear()
+            self._files.clear()
+
+    def __len__(self) -> int:
+        """Return number of compiled templates held in memory."""
+        return len(self._templates)
+
+    @staticmethod
+    def _digest(source: str) -> str:
+        """Digest a template source."""
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+_cache: TemplateCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> TemplateCache:
+    """
+    Get the process-wide template cache.
+
+    The cache is created on first use with bytecode stored in the
+    platform cache directory.
+
+    Returns:
+        Shared TemplateCache instance.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TemplateCache(bytecode_dir=get_default_bytecode_cache_dir())
+    return _cache
+
+
+def set_template_cache(cache: TemplateCache | None) -> None:
+    """
+    Replace the process-wide template cache.
+
+    Args:
+        cache: Cache to use, or None to create a default one on next use.
+    """
+    global _cache
+    with _cache_lock:
+        _cache = cache
@@ -8,7 +8,9 @@ with variable injection.
 from pathlib import Path
 from typing import Any
 
-from jinja2 import BaseLoader, Environment, StrictUndefined, TemplateError
+from jinja2 import BaseLoader, Environment, TemplateError
+
+from persona.core.prompts.cache import get_template_cache
 
 
 class StringLoader(BaseLoader):
@@ -24,6 +26,8 @@ class PromptTemplate:
     Jinja2-based prompt template.
 
     Supports variable injection, conditional sections, and loops.
+    Templates are compiled once per process and shared through the
+    template cache, so constructing a PromptTemplate is cheap.
 
     Example:
         template = PromptTemplate('''
@@ -40,15 +44,10 @@ class PromptTemplate:
         Args:
             template_string: Jinja2 template string.
         """
+        cache = get_template_cache()
         self._template_string = template_string
-        self._env = Environment(
-            loader=StringLoader(),
-            undefined=StrictUndefined,
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        self._template = self._env.from_string(template_string)
+        self._env = cache.environment()
+        self._template = cache.compile(template_string)
 
     @classmethod
     def from_file(cls, path: str | Path) -> "PromptTemplate":
@@ -68,7 +67,7 @@ class PromptTemplate:
         if not path.exists():
             raise FileNotFoundError(f"Template file not found: {path}")
 
-        template_string = path.read_text(encoding="utf-8")
+        template_string = get_template_cache().read_text(path)
         return cls(template_string)
 
     def render(self, **variables: Any) -> str:
@@ -96,10 +95,7 @@ class PromptTemplate:
         Returns:
             List of variable names.
         """
-        from jinja2 import meta
-
-        ast = self._env.parse(self._template_string)
-        return list(meta.find_undeclared_variables(ast))
+        return get_template_cache().variables(self._template_string)
 
     def validate(self, **variables: Any) -> bool:
         """
@@ -132,14 +128,18 @@ class PromptTemplate:
 
 
 # Default prompt templates
+# The research data comes first so everything up to it is a stable prefix
+# that providers can serve from their prompt cache across runs.
 DEFAULT_PERSONA_TEMPLATE = """You are an expert UX researcher specialising in persona development.
 
-Analyse the following user research data and generate {{ count }} distinct user personas.
-
 ## Research Data
 
 {{ data }}
 
+## Task
+
+Analyse the user research data above and generate {{ count }} distinct user personas.
+
 ## Requirements
 
 Generate {{ count }} personas that:
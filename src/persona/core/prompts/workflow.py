@@ -11,6 +11,7 @@ from typing import Any
 
 import yaml
 
+from persona.core.prompts.cache import get_template_cache
 from persona.core.prompts.template import DEFAULT_PERSONA_TEMPLATE, PromptTemplate
 
 
@@ -63,6 +64,9 @@ class WorkflowLoader:
     """
     Loader for workflow configurations from YAML files.
 
+    Parsed YAML is kept in the process-wide template cache and re-read
+    only when the file's modification time or size changes.
+
     Example:
         loader = WorkflowLoader()
         workflow = loader.load("workflows/research.yaml")
@@ -127,8 +131,7 @@ class WorkflowLoader:
         if not path.exists():
             raise FileNotFoundError(f"Workflow file not found: {path}")
 
-        with open(path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = get_template_cache().load_file(path, yaml.safe_load)
 
         if not config:
             raise ValueError(f"Empty workflow file: {path}")
@@ -151,7 +154,7 @@ class WorkflowLoader:
         if name not in self.BUILTIN_WORKFLOWS:
             available = ", ".join(self.list_builtin())
             raise ValueError(
-                f"Unknown built-in workflow: {name}. " f"Available: {available}"
+                f"Unknown built-in workflow: {name}. Available: {available}"
             )
 
         config = self.BUILTIN_WORKFLOWS[name].copy()
@@ -7,6 +7,7 @@ LLM providers (OpenAI, Anthropic, Google Gemini, and custom vendors).
 
 from persona.core.providers.anthropic import AnthropicProvider
 from persona.core.providers.base import LLMProvider, LLMResponse
+from persona.core.providers.cache import CacheStats, CachingProvider, ResponseCache
 from persona.core.providers.custom import CustomVendorProvider
 from persona.core.providers.factory import ProviderFactory
 from persona.core.providers.gemini import GeminiProvider
@@ -24,4 +25,8 @@ __all__ = [
     "GeminiProvider",
     "OllamaProvider",
     "CustomVendorProvider",
+    # Response caching
+    "CacheStats",
+    "CachingProvider",
+    "ResponseCache",
 ]
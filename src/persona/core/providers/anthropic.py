@@ -14,6 +14,7 @@ from persona.core.providers.base import (
     LLMResponse,
     ModelNotFoundError,
     RateLimitError,
+    split_prompt_prefix,
 )
 from persona.core.providers.http_base import HTTPProvider
 
@@ -23,7 +24,10 @@ class AnthropicProvider(HTTPProvider):
     Anthropic provider implementation.
 
     Supports Claude 3.5, Claude 4, and Claude Opus 4.5 models.
-    Uses HTTP connection pooling for improved performance.
+    Uses HTTP connection pooling for improved performance. The system
+    prompt and any ``cache_prefix`` are marked with ``cache_control`` so
+    repeated calls over the same source material read them from
+    Anthropic's prompt cache.
 
     Example:
         provider = AnthropicProvider()
@@ -34,6 +38,9 @@ class AnthropicProvider(HTTPProvider):
     ENV_VAR = "ANTHROPIC_API_KEY"
     API_VERSION = "2023-06-01"
 
+    # Cache breakpoint applied to the system prompt and cache prefix
+    CACHE_CONTROL = {"type": "ephemeral"}
+
     # Available models with context windows
     MODELS = {
         "claude-opus-4-5-20251101": 200000,
@@ -64,6 +71,10 @@ class AnthropicProvider(HTTPProvider):
     def default_model(self) -> str:
         return "claude-sonnet-4-5-20250929"
 
+    @property
+    def api_key(self) -> str | None:
+        return self._api_key
+
     @property
     def available_models(self) -> list[str]:
         return list(self.MODELS.keys())
@@ -80,67 +91,21 @@ class AnthropicProvider(HTTPProvider):
         **kwargs: Any,
     ) -> LLMResponse:
         """Generate a response using Anthropic's API."""
-        if not self.is_configured():
-            raise AuthenticationError("Anthropic API key not configured")
-
-        model = model or self.default_model
-
-        if not self.validate_model(model):
-            raise ModelNotFoundError(f"Model not available: {model}")
-
-        headers = {
-            "x-api-key": self._api_key,
-            "anthropic-version": self.API_VERSION,
-            "Content-Type": "application/json",
-        }
-
-        payload = {
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
+        model = self._check_model(model)
+        payload = self._build_payload(prompt, model, max_tokens, temperature, kwargs)
 
         try:
             # Use pooled HTTP client
-            client = self.get_sync_client()
-            response = client.post(self.API_URL, headers=headers, json=payload)
-
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid Anthropic API key")
-
-            if response.status_code == 429:
-                raise RateLimitError("Anthropic rate limit exceeded")
-
-            if response.status_code != 200:
-                error_data = response.json().get("error", {})
-                raise RuntimeError(
-                    f"Anthropic API error: {error_data.get('message', response.text)}"
-                )
-
-            data = response.json()
-            content_blocks = data.get("content", [])
-            content = ""
-            for block in content_blocks:
-                if block.get("type") == "text":
-                    content += block.get("text", "")
-
-            usage = data.get("usage", {})
-
-            return LLMResponse(
-                content=content,
-                model=data["model"],
-                input_tokens=usage.get("input_tokens", 0),
-                output_tokens=usage.get("output_tokens", 0),
-                finish_reason=data.get("stop_reason", "end_turn"),
-                raw_response=data,
+            response = self._post(
+                self.API_URL, model=model, headers=self._headers(), json=payload
             )
-
         except httpx.TimeoutException:
             raise RuntimeError("Anthropic API request timed out")
         except httpx.RequestError as e:
             raise RuntimeError(f"Anthropic API request failed: {e}")
 
+        return self._handle_response(response)
+
     async def generate_async(
         self,
         prompt: str,
@@ -150,6 +115,101 @@ class AnthropicProvider(HTTPProvider):
         **kwargs: Any,
     ) -> LLMResponse:
         """Generate a response using Anthropic's API asynchronously."""
+        model = self._check_model(model)
+        payload = self._build_payload(prompt, model, max_tokens, temperature, kwargs)
+
+        try:
+            # Use pooled HTTP client
+            response = await self._post_async(
+                self.API_URL, model=model, headers=self._headers(), json=payload
+            )
+        except httpx.TimeoutException:
+            raise RuntimeError("Anthropic API request timed out")
+        except httpx.RequestError as e:
+            raise RuntimeError(f"Anthropic API request failed: {e}")
+
+        return self._handle_response(response)
+
+    def generate_with_image(
+        self,
+        prompt: str,
+        image_data: str,
+        media_type: str = "image/jpeg",
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+    ) -> LLMResponse:
+        """
+        Generate a response about an image using Anthropic's vision API.
+
+        Args:
+            prompt: Instructions for the model.
+            image_data: Base64-encoded image.
+            media_type: Image media type (image/jpeg, image/png, ...).
+            model: Model to use (default: default_model).
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+
+        Returns:
+            LLMResponse with the model's answer.
+        """
+        model = self._check_model(model)
+        payload = self._build_image_payload(
+            prompt, image_data, media_type, model, max_tokens, temperature
+        )
+
+        try:
+            response = self._post(
+                self.API_URL, model=model, headers=self._headers(), json=payload
+            )
+        except httpx.TimeoutException:
+            raise RuntimeError("Anthropic API request timed out")
+        except httpx.RequestError as e:
+            raise RuntimeError(f"Anthropic API request failed: {e}")
+
+        return self._handle_response(response)
+
+    async def generate_with_image_async(
+        self,
+        prompt: str,
+        image_data: str,
+        media_type: str = "image/jpeg",
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+    ) -> LLMResponse:
+        """
+        Generate a response about an image asynchronously.
+
+        Args:
+            prompt: Instructions for the model.
+            image_data: Base64-encoded image.
+            media_type: Image media type (image/jpeg, image/png, ...).
+            model: Model to use (default: default_model).
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+
+        Returns:
+            LLMResponse with the model's answer.
+        """
+        model = self._check_model(model)
+        payload = self._build_image_payload(
+            prompt, image_data, media_type, model, max_tokens, temperature
+        )
+
+        try:
+            response = await self._post_async(
+                self.API_URL, model=model, headers=self._headers(), json=payload
+            )
+        except httpx.TimeoutException:
+            raise RuntimeError("Anthropic API request timed out")
+        except httpx.RequestError as e:
+            raise RuntimeError(f"Anthropic API request failed: {e}")
+
+        return self._handle_response(response)
+
+    def _check_model(self, model: str | None) -> str:
+        """Check the provider is configured and resolve the model."""
         if not self.is_configured():
             raise AuthenticationError("Anthropic API key not configured")
 
@@ -158,55 +218,123 @@ class AnthropicProvider(HTTPProvider):
         if not self.validate_model(model):
             raise ModelNotFoundError(f"Model not available: {model}")
 
-        headers = {
+        return model
+
+    def _headers(self) -> dict[str, Any]:
+        """Build the request headers."""
+        return {
             "x-api-key": self._api_key,
             "anthropic-version": self.API_VERSION,
             "Content-Type": "application/json",
         }
 
-        payload = {
+    def _handle_response(self, response: httpx.Response) -> LLMResponse:
+        """Raise for error responses and parse successful ones."""
+        if response.status_code == 401:
+            raise AuthenticationError("Invalid Anthropic API key")
+
+        if response.status_code == 429:
+            raise RateLimitError("Anthropic rate limit exceeded")
+
+        if response.status_code != 200:
+            error_data = response.json().get("error", {})
+            raise RuntimeError(
+                f"Anthropic API error: {error_data.get('message', response.text)}"
+            )
+
+        return self._parse_response(response.json())
+
+    def _build_image_payload(
+        self,
+        prompt: str,
+        image_data: str,
+        media_type: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> dict[str, Any]:
+        """Build the request payload for a prompt about an image."""
+        return {
             "model": model,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "image",
+                            "source": {
+                                "type": "base64",
+                                "media_type": media_type,
+                                "data": image_data,
+                            },
+                        },
+                        {"type": "text", "text": prompt},
+                    ],
+                }
+            ],
             "max_tokens": max_tokens,
             "temperature": temperature,
         }
 
-        try:
-            # Use pooled HTTP client
-            client = await self.get_async_client()
-            response = await client.post(self.API_URL, headers=headers, json=payload)
-
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid Anthropic API key")
-
-            if response.status_code == 429:
-                raise RateLimitError("Anthropic rate limit exceeded")
-
-            if response.status_code != 200:
-                error_data = response.json().get("error", {})
-                raise RuntimeError(
-                    f"Anthropic API error: {error_data.get('message', response.text)}"
-                )
-
-            data = response.json()
-            content_blocks = data.get("content", [])
-            content = ""
-            for block in content_blocks:
-                if block.get("type") == "text":
-                    content += block.get("text", "")
-
-            usage = data.get("usage", {})
-
-            return LLMResponse(
-                content=content,
-                model=data["model"],
-                input_tokens=usage.get("input_tokens", 0),
-                output_tokens=usage.get("output_tokens", 0),
-                finish_reason=data.get("stop_reason", "end_turn"),
-                raw_response=data,
-            )
+    def _build_payload(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the request payload, marking stable content as cacheable."""
+        prefix, remainder = split_prompt_prefix(prompt, kwargs.get("cache_prefix"))
+
+        content: str | list[dict[str, Any]] = prompt
+        if prefix:
+            content = [
+                {"type": "text", "text": prefix, "cache_control": self.CACHE_CONTROL}
+            ]
+            if remainder:
+                content.append({"type": "text", "text": remainder})
+
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": [{"role": "user", "content": content}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
 
-        except httpx.TimeoutException:
-            raise RuntimeError("Anthropic API request timed out")
-        except httpx.RequestError as e:
-            raise RuntimeError(f"Anthropic API request failed: {e}")
+        system_prompt = kwargs.get("system_prompt")
+        if system_prompt:
+            payload["system"] = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": self.CACHE_CONTROL,
+                }
+            ]
+
+        return payload
+
+    @staticmethod
+    def _parse_response(data: dict[str, Any]) -> LLMResponse:
+        """Convert an API response body to an LLMResponse."""
+        content = ""
+        for block in data.get("content", []):
+            if block.get("type") == "text":
+                content += block.get("text", "")
+
+        # Anthropic reports cache reads and writes separately from the
+        # uncached input tokens; input_tokens is normalised to the total
+        usage = data.get("usage", {})
+        cache_read = usage.get("cache_read_input_tokens") or 0
+        cache_write = usage.get("cache_creation_input_tokens") or 0
+
+        return LLMResponse(
+            content=content,
+            model=data["model"],
+            input_tokens=usage.get("input_tokens", 0) + cache_read + cache_write,
+            output_tokens=usage.get("output_tokens", 0),
+            finish_reason=data.get("stop_reason", "end_turn"),
+            raw_response=data,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+        )
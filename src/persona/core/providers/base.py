@@ -22,6 +22,12 @@ class LLMResponse:
         output_tokens: Number of output/completion tokens.
         finish_reason: Why generation stopped (e.g., 'stop', 'length').
         raw_response: The original provider response (for debugging).
+        cached: Whether the response was served from a response cache
+            rather than billed by the provider.
+        cache_read_tokens: Input tokens the provider served from its
+            prompt cache (included in input_tokens).
+        cache_write_tokens: Input tokens the provider wrote to its
+            prompt cache (included in input_tokens).
     """
 
     content: str
@@ -30,6 +36,9 @@ class LLMResponse:
     output_tokens: int = 0
     finish_reason: str = "stop"
     raw_response: dict[str, Any] = field(default_factory=dict)
+    cached: bool = False
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
     @property
     def total_tokens(self) -> int:
@@ -37,6 +46,47 @@ class LLMResponse:
         return self.input_tokens + self.output_tokens
 
 
+# Keyword arguments interpreted by the providers themselves; they must
+# never be forwarded to a vendor API as request parameters
+INTERNAL_KWARGS = frozenset({"cache_prefix"})
+
+
+def vendor_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Remove internal arguments before passing kwargs to a vendor API.
+
+    Args:
+        kwargs: Keyword arguments given to generate().
+
+    Returns:
+        Copy of kwargs without the keys in INTERNAL_KWARGS.
+    """
+    return {k: v for k, v in kwargs.items() if k not in INTERNAL_KWARGS}
+
+
+def split_prompt_prefix(prompt: str, cache_prefix: str | None) -> tuple[str, str]:
+    """
+    Split a prompt into its cacheable prefix and the per-call remainder.
+
+    Callers pass ``cache_prefix`` alongside the full prompt to mark the
+    leading text (typically the source material) that repeats across
+    calls. The prefix is ignored unless the prompt actually starts
+    with it, so providers without prompt caching can keep sending the
+    full prompt unchanged.
+
+    Args:
+        prompt: Full prompt text.
+        cache_prefix: Stable leading portion of the prompt, if any.
+
+    Returns:
+        Tuple of (prefix, remainder); the prefix is empty when the
+        prompt has no usable cache prefix.
+    """
+    if cache_prefix and prompt.startswith(cache_prefix):
+        return cache_prefix, prompt[len(cache_prefix) :]
+    return "", prompt
+
+
 class LLMProvider(ABC):
     """
     Abstract base class for LLM providers.
@@ -80,7 +130,9 @@ class LLMProvider(ABC):
             model: Model to use (defaults to provider's default).
             max_tokens: Maximum tokens to generate.
             temperature: Sampling temperature (0.0 to 1.0).
-            **kwargs: Additional provider-specific parameters.
+            **kwargs: Additional provider-specific parameters. Providers
+                with prompt caching honour ``cache_prefix``, the stable
+                leading portion of the prompt (see split_prompt_prefix).
 
         Returns:
             LLMResponse with the generated content.
@@ -112,8 +164,10 @@ class LLMProvider(ABC):
         """
         Generate a response from the LLM asynchronously.
 
-        Default implementation delegates to synchronous generate() method.
-        Providers should override this for native async support.
+        Default implementation runs the synchronous generate() method on
+        the shared bounded blocking executor (see run_blocking), leaving
+        the event loop's default executor free. Providers should override
+        this for native async support.
 
         Args:
             prompt: The input prompt text.
@@ -129,12 +183,10 @@ class LLMProvider(ABC):
             ValueError: If the model is not available.
             RuntimeError: If the API call fails.
         """
-        import asyncio
+        from persona.core.utils.async_helpers import run_blocking
 
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.generate(prompt, model, max_tokens, temperature, **kwargs),
+        return await run_blocking(
+            self.generate, prompt, model, max_tokens, temperature, **kwargs
         )
 
     def validate_model(self, model: str) -> bool:
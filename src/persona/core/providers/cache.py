@@ -0,0 +1,484 @@
+"""
+Deterministic LLM response cache.
+
+This module provides an opt-in, SQLite-backed cache in front of
+LLMProvider.generate. Responses are keyed on a hash of the provider,
+model, prompt, system prompt and sampling parameters, so re-running an
+experiment, regenerating with a tweaked formatter or resuming a crashed
+batch does not pay for identical prompts again.
+
+Only deterministic (temperature 0) requests are cached unless the cache
+is created with ``cache_sampled=True``; replaying a sampled response
+would otherwise turn every repeated request into a copy of the first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from persona.core.platform import get_cache_dir
+from persona.core.providers.base import LLMProvider, LLMResponse
+
+
+def get_default_response_cache_path() -> Path:
+    """Get default response cache database path."""
+    return get_cache_dir() / "responses.db"
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit/miss statistics for a response cache.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that reached the provider.
+        evictions: Number of entries removed by TTL or size limits.
+        saved_input_tokens: Input tokens not re-sent thanks to cache hits.
+        saved_output_tokens: Output tokens not regenerated thanks to hits.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    saved_input_tokens: int = 0
+    saved_output_tokens: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Return total number of lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Return fraction of lookups served from the cache."""
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+            "saved_input_tokens": self.saved_input_tokens,
+            "saved_output_tokens": self.saved_output_tokens,
+        }
+
+
+class ResponseCache:
+    """
+    SQLite-backed store of LLM responses.
+
+    Entries expire after an optional TTL and the least recently used
+    entries are evicted once the optional entry limit is exceeded.
+    Requests sampled at a temperature above zero bypass the cache unless
+    cache_sampled is set.
+
+    Example:
+        cache = ResponseCache(ttl_seconds=7 * 24 * 3600, max_entries=10_000)
+        key = cache.make_key("anthropic", "claude-sonnet-4", prompt, temperature=0)
+        response = cache.get(key)
+        if response is None:
+            response = provider.generate(prompt)
+            cache.put(key, response)
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        cache_sampled: bool = False,
+    ) -> None:
+        """
+        Initialise the response cache.
+
+        Args:
+            db_path: Path to SQLite database. Defaults to the platform
+                cache directory.
+            ttl_seconds: Optional time-to-live for entries.
+            max_entries: Optional maximum number of stored entries.
+            cache_sampled: Also cache requests with a temperature above
+                zero, replaying the first sampled response.
+        """
+        if db_path is None:
+            db_path = get_default_response_cache_path()
+
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self.cache_sampled = cache_sampled
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response_json TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed "
+            "ON llm_responses(accessed_at)"
+        )
+        self._conn.commit()
+        self.stats = CacheStats()
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """
+        Check whether a request at the given temperature may be cached.
+
+        Args:
+            temperature: Sampling temperature of the request.
+
+        Returns:
+            True for deterministic requests, or any request when
+            cache_sampled is set.
+        """
+        return self.cache_sampled or temperature <= 0.0
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        prompt: str,
+        system_prompt: str = "",
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **extra: Any,
+    ) -> str:
+        """
+        Build a deterministic cache key.
+
+        Args:
+            provider: Provider name.
+            model: Model identifier.
+            prompt: Prompt text.
+            system_prompt: System prompt text.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens to generate.
+            **extra: Additional parameters that affect the response.
+
+        Returns:
+            Hex SHA-256 digest of the request parameters.
+        """
+        payload = {
+            "provider": provider,
+            "model": model,
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "extra": extra,
+        }
+        serialised = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            Cached LLMResponse marked as cached, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json, created_at FROM llm_responses "
+                "WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is not None and self._is_expired(row[1], now):
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE cache_key = ?", (key,)
+                )
+                self._conn.commit()
+                self.stats.evictions += 1
+                row = None
+
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE cache_key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+
+            data = json.loads(row[0])
+            response = LLMResponse(
+                content=data["content"],
+                model=data["model"],
+                input_tokens=data.get("input_tokens", 0),
+                output_tokens=data.get("output_tokens", 0),
+                finish_reason=data.get("finish_reason", "stop"),
+                raw_response=data.get("raw_response", {}),
+                cached=True,
+                cache_read_tokens=data.get("cache_read_tokens", 0),
+                cache_write_tokens=data.get("cache_write_tokens", 0),
+            )
+            self.stats.hits += 1
+            self.stats.saved_input_tokens += response.input_tokens
+            self.stats.saved_output_tokens += response.output_tokens
+            return response
+
+    def put(self, key: str, response: LLMResponse, provider: str = "") -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from make_key().
+            response: Response to store.
+            provider: Provider name, recorded for diagnostics.
+        """
+        data = {
+            "content": response.content,
+            "model": response.model,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "finish_reason": response.finish_reason,
+            "raw_response": response.raw_response,
+            "cache_read_tokens": response.cache_read_tokens,
+            "cache_write_tokens": response.cache_write_tokens,
+        }
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(cache_key, provider, model, response_json, created_at, "
+                "accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    provider,
+                    response.model,
+                    json.dumps(data, default=str),
+                    now,
+                    now,
+                ),
+            )
+            self._conn.commit()
+            self._evict_locked(now)
+
+    def evict(self) -> int:
+        """
+        Remove expired entries and enforce the size limit.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            return self._evict_locked(time.time())
+
+    def clear(self) -> int:
+        """
+        Remove all entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        """Return number of stored entries."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM llm_responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """Check whether an entry created at the given time has expired."""
+        return self._ttl_seconds is not None and now - created_at > self._ttl_seconds
+
+    def _evict_locked(self, now: float) -> int:
+        """Evict entries; caller must hold the lock."""
+        removed = 0
+
+        if self._ttl_seconds is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (now - self._ttl_seconds,),
+            )
+            removed += cursor.rowcount
+
+        if self._max_entries is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_responses WHERE cache_key IN ("
+                "SELECT cache_key FROM llm_responses "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+            removed += cursor.rowcount
+
+        if removed:
+            self._conn.commit()
+            self.stats.evictions += removed
+
+        return removed
+
+
+class CachingProvider(LLMProvider):
+    """
+    Provider wrapper that serves repeated requests from a ResponseCache.
+
+    Responses served from the cache have ``cached=True`` so callers can
+    exclude them from billed token counts. Requests the cache does not
+    accept (see ResponseCache.is_cacheable) go straight to the provider.
+
+    Example:
+        provider = CachingProvider(
+            ProviderFactory.create("anthropic"),
+            ResponseCache(),
+        )
+        response = provider.generate(prompt, temperature=0)  # Calls the API
+        response = provider.generate(prompt, temperature=0)  # From cache
+    """
+
+    def __init__(self, provider: LLMProvider, cache: ResponseCache) -> None:
+        """
+        Initialise the caching wrapper.
+
+        Args:
+            provider: Provider to delegate cache misses to.
+            cache: Response cache to use.
+        """
+        self._provider = provider
+        self._cache = cache
+
+    @property
+    def provider(self) -> LLMProvider:
+        """Return the wrapped provider."""
+        return self._provider
+
+    @property
+    def cache(self) -> ResponseCache:
+        """Return the response cache."""
+        return self._cache
+
+    @property
+    def name(self) -> str:
+        """Return the wrapped provider's name."""
+        return self._provider.name
+
+    @property
+    def default_model(self) -> str:
+        """Return the wrapped provider's default model."""
+        return self._provider.default_model
+
+    @property
+    def available_models(self) -> list[str]:
+        """Return the wrapped provider's available models."""
+        return self._provider.available_models
+
+    def is_configured(self) -> bool:
+        """Check if the wrapped provider is configured."""
+        return self._provider.is_configured()
+
+    def validate_model(self, model: str) -> bool:
+        """Check if a model is available for the wrapped provider."""
+        return self._provider.validate_model(model)
+
+    def generate(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a response, serving repeated requests from the cache."""
+        if not self._cache.is_cacheable(temperature):
+            return self._provider.generate(
+                prompt, model, max_tokens, temperature, **kwargs
+            )
+
+        key = self._make_key(prompt, model, max_tokens, temperature, kwargs)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._provider.generate(
+            prompt, model, max_tokens, temperature, **kwargs
+        )
+        self._store(key, response)
+        return response
+
+    async def generate_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a response asynchronously, using the cache."""
+        if not self._cache.is_cacheable(temperature):
+            return await self._provider.generate_async(
+                prompt, model, max_tokens, temperature, **kwargs
+            )
+
+        key = self._make_key(prompt, model, max_tokens, temperature, kwargs)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self._provider.generate_async(
+            prompt, model, max_tokens, temperature, **kwargs
+        )
+        self._store(key, response)
+        return response
+
+    def _make_key(
+        self,
+        prompt: str,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+        kwargs: dict[str, Any],
+    ) -> str:
+        """Build the cache key for a request."""
+        extra = dict(kwargs)
+        system_prompt = extra.pop("system_prompt", "") or ""
+        # The cache prefix is part of the prompt and doesn't change the output
+        extra.pop("cache_prefix", None)
+        return self._cache.make_key(
+            provider=self._provider.name,
+            model=model or self._provider.default_model,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **extra,
+        )
+
+    def _store(self, key: str, response: LLMResponse) -> None:
+        """Store a response unless it is incomplete."""
+        if response.finish_reason in ("error", "length") or not response.content:
+            return
+        self._cache.put(key, response, provider=self._provider.name)
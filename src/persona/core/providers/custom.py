@@ -16,6 +16,7 @@ from persona.core.providers.base import (
     LLMResponse,
     ModelNotFoundError,
     RateLimitError,
+    vendor_kwargs,
 )
 
 
@@ -120,11 +121,14 @@ class CustomVendorProvider(LLMProvider):
             model: Model identifier.
             max_tokens: Maximum tokens to generate.
             temperature: Sampling temperature.
-            **kwargs: Additional parameters.
+            **kwargs: Additional parameters. Internal arguments such as
+                cache_prefix are not sent to the vendor.
 
         Returns:
             Request payload dictionary.
         """
+        kwargs = vendor_kwargs(kwargs)
+
         if self._config.request_format == "anthropic":
             return {
                 "model": model,
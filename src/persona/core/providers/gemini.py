@@ -60,6 +60,10 @@ class GeminiProvider(HTTPProvider):
     def default_model(self) -> str:
         return "gemini-1.5-pro"
 
+    @property
+    def api_key(self) -> str | None:
+        return self._api_key
+
     @property
     def available_models(self) -> list[str]:
         return list(self.MODELS.keys())
@@ -100,8 +104,7 @@ class GeminiProvider(HTTPProvider):
 
         try:
             # Use pooled HTTP client
-            client = self.get_sync_client()
-            response = client.post(url, headers=headers, json=payload)
+            response = self._post(url, model=model, headers=headers, json=payload)
 
             if response.status_code == 401 or response.status_code == 403:
                 raise AuthenticationError("Invalid Google API key")
@@ -176,8 +179,9 @@ class GeminiProvider(HTTPProvider):
 
         try:
             # Use pooled HTTP client
-            client = await self.get_async_client()
-            response = await client.post(url, headers=headers, json=payload)
+            response = await self._post_async(
+                url, model=model, headers=headers, json=payload
+            )
 
             if response.status_code == 401 or response.status_code == 403:
                 raise AuthenticationError("Invalid Google API key")
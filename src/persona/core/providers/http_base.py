@@ -6,11 +6,186 @@ with connection pooling for improved performance.
 """
 
 import asyncio
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 
 import httpx
 
+from persona.core.logging.tracing import get_tracer
 from persona.core.providers.base import LLMProvider, LLMResponse
+from persona.core.security.adaptive import get_rate_controller
+
+
+class RequestTiming:
+    """
+    Splits an HTTP request's time into pool wait, connect and network time.
+
+    Uses httpx's per-request trace extension, whose events start only
+    once the request has a connection from the pool.
+    """
+
+    def __init__(self) -> None:
+        """Start timing."""
+        self.start_ns = time.perf_counter_ns()
+        self.events: dict[str, int] = {}
+
+    def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Record a transport event (sync clients)."""
+        self.events.setdefault(event_name, time.perf_counter_ns())
+
+    async def trace_async(self, event_name: str, info: dict[str, Any]) -> None:
+        """Record a transport event (async clients)."""
+        self.trace(event_name, info)
+
+    def attributes(self) -> dict[str, float]:
+        """Get timing attributes in milliseconds."""
+        if not self.events:
+            return {}
+
+        times = sorted(self.events.values())
+        sent = next(
+            (t for e, t in self.events.items() if "send_request_headers" in e),
+            times[0],
+        )
+        attributes = {
+            "queue_wait_ms": (times[0] - self.start_ns) / 1_000_000,
+            "network_ms": (times[-1] - sent) / 1_000_000,
+        }
+
+        connect = [t for e, t in self.events.items() if e.startswith("connection.")]
+        if connect:
+            attributes["connect_ms"] = (max(connect) - min(connect)) / 1_000_000
+        return attributes
+
+
+async def _close_at_shutdown(
+    pool: "AsyncClientPool", client: httpx.AsyncClient
+) -> None:
+    """
+    Close a pooled client when its event loop shuts down.
+
+    Runs as a task that waits until it is cancelled, either by
+    AsyncClientPool.aclose() or by asyncio.run(), which cancels the
+    remaining tasks before closing the loop; the client is then closed
+    with aclose() on the still-running loop.
+    """
+    loop_closed = False
+    try:
+        await asyncio.get_running_loop().create_future()
+    except GeneratorExit:
+        # Destroyed after its loop closed without cancelling it; there is
+        # no loop left to close the client on
+        loop_closed = True
+        raise
+    finally:
+        pool._discard(client)
+        if not loop_closed and not client.is_closed:
+            await client.aclose()
+
+
+class AsyncClientPool:
+    """
+    One pooled httpx.AsyncClient per running event loop.
+
+    An AsyncClient's connections belong to the event loop that opened
+    them, so a single process-wide client breaks as soon as a second
+    loop (a later asyncio.run(), a worker thread's loop) uses it. The
+    pool keeps a client per loop and closes it when the loop cancels its
+    remaining tasks (asyncio.run() does this on exit) or when aclose()
+    is called. Clients of loops closed without either are dropped on the
+    next get().
+
+    Example:
+        pool = AsyncClientPool()
+        client = pool.get(lambda: httpx.AsyncClient(timeout=30.0))
+        response = await client.get(url)
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty pool."""
+        self._clients: dict[
+            asyncio.AbstractEventLoop,
+            tuple[httpx.AsyncClient, asyncio.Task[None]],
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(self, factory: Callable[[], httpx.AsyncClient]) -> httpx.AsyncClient:
+        """
+        Get the running loop's client, creating it on first use.
+
+        Args:
+            factory: Creates a new client when the loop has none (or its
+                client has been closed).
+
+        Returns:
+            Client for the running event loop.
+
+        Raises:
+            RuntimeError: If called outside a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(loop)
+            if entry is not None and not entry[0].is_closed:
+                return entry[0]
+
+            self._prune_locked()
+            client = factory()
+            # Started eagerly so cancellation always reaches its finally block
+            watcher = asyncio.Task(
+                _close_at_shutdown(self, client), loop=loop, eager_start=True
+            )
+            self._clients[loop] = (client, watcher)
+        return client
+
+    def current(self) -> httpx.AsyncClient | None:
+        """
+        Get the running loop's client without creating one.
+
+        Returns:
+            The client, or None if this loop has no open client.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        with self._lock:
+            entry = self._clients.get(loop)
+        return entry[0] if entry is not None else None
+
+    async def aclose(self) -> None:
+        """Close the running loop's client."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        with self._lock:
+            entry = self._clients.get(loop)
+        if entry is not None:
+            # Cancelling the watcher runs its finally block, closing the client
+            watcher = entry[1]
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+
+    def _discard(self, client: httpx.AsyncClient) -> None:
+        """Remove a client from the pool."""
+        with self._lock:
+            for loop, entry in list(self._clients.items()):
+                if entry[0] is client:
+                    del self._clients[loop]
+
+    def _prune_locked(self) -> None:
+        """Drop clients of closed loops; caller must hold the lock."""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
+
+    def __len__(self) -> int:
+        """Return number of loops with a client."""
+        with self._lock:
+            self._prune_locked()
+            return len(self._clients)
 
 
 class HTTPProvider(LLMProvider):
@@ -19,7 +194,8 @@ class HTTPProvider(LLMProvider):
 
     Provides a shared httpx client with connection pooling for
     improved performance in batch operations. Both sync and async
-    clients are lazily initialised and reused across requests.
+    clients are lazily initialised and reused across requests; async
+    clients are kept per event loop (see AsyncClientPool).
 
     Configuration options:
         timeout: Request timeout in seconds (default: 120.0)
@@ -47,8 +223,7 @@ class HTTPProvider(LLMProvider):
     # Class-level clients for connection pooling
     # Using class variables ensures all instances share the same pools
     _sync_client: httpx.Client | None = None
-    _async_client: httpx.AsyncClient | None = None
-    _lock: asyncio.Lock | None = None
+    _async_clients = AsyncClientPool()
 
     def __init__(
         self,
@@ -68,6 +243,16 @@ class HTTPProvider(LLMProvider):
         self._max_connections = max_connections or self.DEFAULT_MAX_CONNECTIONS
         self._max_keepalive = max_keepalive_connections or self.DEFAULT_MAX_KEEPALIVE
 
+    @property
+    def api_key(self) -> str | None:
+        """
+        API key sent with requests, if any.
+
+        Used to key the adaptive rate limiter per account. Providers that
+        authenticate with a key override this to return it.
+        """
+        return None
+
     @classmethod
     def _get_timeout(cls, timeout: float | None = None) -> httpx.Timeout:
         """Get timeout configuration."""
@@ -107,27 +292,79 @@ class HTTPProvider(LLMProvider):
         """
         Get or create the asynchronous HTTP client.
 
-        Returns a shared client instance for connection pooling.
-        The client is created on first use and reused for all requests.
-        Uses a lock to ensure thread-safe initialisation.
+        Returns a client shared by all providers on the running event
+        loop. The client is created on the loop's first request and
+        reused for all later requests on that loop.
 
         Returns:
             Shared httpx.AsyncClient instance.
         """
-        # Lazy initialise the lock
-        if HTTPProvider._lock is None:
-            HTTPProvider._lock = asyncio.Lock()
-
-        async with HTTPProvider._lock:
-            if (
-                HTTPProvider._async_client is None
-                or HTTPProvider._async_client.is_closed
-            ):
-                HTTPProvider._async_client = httpx.AsyncClient(
-                    timeout=self._get_timeout(self._timeout),
-                    limits=self._get_limits(self._max_connections, self._max_keepalive),
-                )
-        return HTTPProvider._async_client
+        return HTTPProvider._async_clients.get(
+            lambda: httpx.AsyncClient(
+                timeout=self._get_timeout(self._timeout),
+                limits=self._get_limits(self._max_connections, self._max_keepalive),
+            )
+        )
+
+    def _post(
+        self, url: str, model: str | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        POST using the pooled sync client.
+
+        The request holds a slot from the process-wide adaptive rate
+        controller for its provider, model and API key, and reports its
+        status, rate-limit headers and latency back to it. When tracing
+        is enabled the request is recorded as a "provider.http" span
+        split into pool wait and network time.
+
+        Args:
+            url: Request URL.
+            model: Model the request is for (selects the rate limiter).
+            **kwargs: Arguments passed to httpx.Client.post.
+
+        Returns:
+            The HTTP response.
+        """
+        client = self.get_sync_client()
+        tracer = get_tracer()
+        with get_rate_controller().slot(self.name, model, self.api_key) as slot:
+            if not tracer.enabled:
+                response = client.post(url, **kwargs)
+            else:
+                timing = RequestTiming()
+                with tracer.span("provider.http", provider=self.name) as span:
+                    response = client.post(
+                        url, extensions={"trace": timing.trace}, **kwargs
+                    )
+                    span.set_attributes(timing.attributes())
+                    span.set_attribute("http.status_code", response.status_code)
+            if slot is not None:
+                slot.record(response)
+        return response
+
+    async def _post_async(
+        self, url: str, model: str | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """POST using the pooled async client (see _post)."""
+        client = await self.get_async_client()
+        tracer = get_tracer()
+        async with get_rate_controller().slot_async(
+            self.name, model, self.api_key
+        ) as slot:
+            if not tracer.enabled:
+                response = await client.post(url, **kwargs)
+            else:
+                timing = RequestTiming()
+                with tracer.span("provider.http", provider=self.name) as span:
+                    response = await client.post(
+                        url, extensions={"trace": timing.trace_async}, **kwargs
+                    )
+                    span.set_attributes(timing.attributes())
+                    span.set_attribute("http.status_code", response.status_code)
+            if slot is not None:
+                slot.record(response)
+        return response
 
     @classmethod
     def cleanup_sync(cls) -> None:
@@ -143,13 +380,11 @@ class HTTPProvider(LLMProvider):
     @classmethod
     async def cleanup_async(cls) -> None:
         """
-        Close the asynchronous HTTP client.
+        Close the running event loop's asynchronous HTTP client.
 
         Should be called during application shutdown to release resources.
         """
-        if cls._async_client is not None and not cls._async_client.is_closed:
-            await cls._async_client.aclose()
-            cls._async_client = None
+        await HTTPProvider._async_clients.aclose()
 
     @classmethod
     async def cleanup(cls) -> None:
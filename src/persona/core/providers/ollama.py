@@ -15,7 +15,9 @@ from persona.core.providers.base import (
     LLMProvider,
     LLMResponse,
     ModelNotFoundError,
+    split_prompt_prefix,
 )
+from persona.core.providers.http_base import AsyncClientPool
 
 # Patterns indicating embedding-only models (not for text generation)
 EMBEDDING_PATTERNS = ["embed", "embedding", "nomic-embed", "bge-", "e5-"]
@@ -43,6 +45,9 @@ class OllamaProvider(LLMProvider):
     """
 
     DEFAULT_BASE_URL = "http://localhost:11434"
+
+    # How long Ollama keeps a model loaded after a cache-prefixed request
+    DEFAULT_KEEP_ALIVE = "30m"
     ENV_VAR_BASE_URL = "OLLAMA_BASE_URL"
 
     # Common models - this is a fallback list
@@ -63,6 +68,7 @@ class OllamaProvider(LLMProvider):
         model: str | None = None,
         timeout: float = 300.0,
         api_key: str | None = None,  # Ignored, for compatibility with ProviderFactory
+        keep_alive: str | None = DEFAULT_KEEP_ALIVE,
     ) -> None:
         """
         Initialise the Ollama provider.
@@ -73,6 +79,9 @@ class OllamaProvider(LLMProvider):
             model: Default model to use. If not specified, will be auto-detected.
             timeout: Request timeout in seconds (default: 300s for large models).
             api_key: Ignored parameter for compatibility with ProviderFactory.
+            keep_alive: Ollama keep_alive duration sent with requests that
+                have a cache_prefix, so the loaded model's context cache
+                survives between calls. None leaves Ollama's default.
         """
         self._base_url = (
             base_url or os.getenv(self.ENV_VAR_BASE_URL) or self.DEFAULT_BASE_URL
@@ -82,6 +91,8 @@ class OllamaProvider(LLMProvider):
         self._default_model = model
         self._timeout = timeout
         self._available_models_cache: list[str] | None = None
+        self._keep_alive = keep_alive
+        self._async_clients = AsyncClientPool()
 
     @property
     def name(self) -> str:
@@ -97,9 +108,10 @@ class OllamaProvider(LLMProvider):
         """
         if self._default_model:
             return self._default_model
+        return self._select_default_model(self.available_models)
 
-        # Try to auto-detect from available models
-        available = self.available_models
+    def _select_default_model(self, available: list[str]) -> str:
+        """Pick the preferred model from the available models."""
         if available:
             # Prefer larger, higher-quality models
             preference_order = [
@@ -158,16 +170,42 @@ class OllamaProvider(LLMProvider):
                     f"Ollama API error: {response.status_code} - {response.text}"
                 )
 
-            data = response.json()
-            models = data.get("models", [])
-            model_names = [model["name"] for model in models]
-
-            # Filter out embedding-only models
-            return [
-                name
-                for name in model_names
-                if not any(pattern in name.lower() for pattern in EMBEDDING_PATTERNS)
-            ]
+            return self._parse_tags(response)
+
+        except httpx.ConnectError:
+            raise RuntimeError(
+                f"Cannot connect to Ollama at {self._base_url}. "
+                "Is Ollama running? Start it with 'ollama serve'"
+            )
+        except httpx.TimeoutException:
+            raise RuntimeError(
+                f"Ollama connection timed out at {self._base_url}. "
+                "Check if Ollama is running."
+            )
+        except httpx.RequestError as e:
+            raise RuntimeError(f"Ollama connection failed: {e}")
+
+    async def list_available_models_async(self) -> list[str]:
+        """
+        Query Ollama for available models asynchronously.
+
+        Uses the pooled async client for the running event loop.
+
+        Returns:
+            List of model names that are pulled and ready to use.
+
+        Raises:
+            RuntimeError: If Ollama is not running or not accessible.
+        """
+        try:
+            response = await self._get_async_client().get(
+                f"{self._base_url}/api/tags", timeout=5.0
+            )
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Ollama API error: {response.status_code} - {response.text}"
+                )
+            return self._parse_tags(response)
 
         except httpx.ConnectError:
             raise RuntimeError(
@@ -182,6 +220,20 @@ class OllamaProvider(LLMProvider):
         except httpx.RequestError as e:
             raise RuntimeError(f"Ollama connection failed: {e}")
 
+    @staticmethod
+    def _parse_tags(response: httpx.Response) -> list[str]:
+        """Extract generation model names from an /api/tags response."""
+        data = response.json()
+        models = data.get("models", [])
+        model_names = [model["name"] for model in models]
+
+        # Filter out embedding-only models
+        return [
+            name
+            for name in model_names
+            if not any(pattern in name.lower() for pattern in EMBEDDING_PATTERNS)
+        ]
+
     def is_configured(self) -> bool:
         """
         Check if Ollama is running and accessible.
@@ -196,6 +248,29 @@ class OllamaProvider(LLMProvider):
         except Exception:
             return False
 
+    async def is_configured_async(self) -> bool:
+        """
+        Check asynchronously if Ollama is running and accessible.
+
+        Returns:
+            True if Ollama server is reachable.
+        """
+        try:
+            response = await self._get_async_client().get(
+                f"{self._base_url}/api/tags", timeout=5.0
+            )
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get this provider's pooled client for the running event loop."""
+        return self._async_clients.get(lambda: httpx.AsyncClient(timeout=self._timeout))
+
+    async def aclose(self) -> None:
+        """Close the pooled async client for the running event loop."""
+        await self._async_clients.aclose()
+
     def health_check(self) -> dict[str, Any]:
         """
         Perform a health check on the Ollama connection.
@@ -273,6 +348,12 @@ class OllamaProvider(LLMProvider):
             },
         }
 
+        # Keep the model loaded so its context cache can be reused by
+        # later calls that share the same prompt prefix
+        prefix, _ = split_prompt_prefix(prompt, kwargs.get("cache_prefix"))
+        if prefix and self._keep_alive:
+            payload["keep_alive"] = self._keep_alive
+
         try:
             with httpx.Client(timeout=self._timeout) as client:
                 response = client.post(
@@ -324,17 +405,27 @@ class OllamaProvider(LLMProvider):
         temperature: float = 0.7,
         **kwargs: Any,
     ) -> LLMResponse:
-        """Generate a response using Ollama's API asynchronously."""
-        if not self.is_configured():
-            raise AuthenticationError(
-                f"Ollama is not running or not accessible at {self._base_url}. "
-                "Start Ollama with 'ollama serve'"
-            )
+        """
+        Generate a response using Ollama's API asynchronously.
 
-        model = model or self.default_model
+        Requests go through a pooled client per event loop. Instead of
+        probing the server before every call, the model list is fetched
+        once (which doubles as the reachability check) and a refused
+        connection is reported the same way as an unreachable server.
+        """
+        if self._available_models_cache is None:
+            try:
+                self._available_models_cache = await self.list_available_models_async()
+            except RuntimeError as e:
+                raise AuthenticationError(
+                    f"Ollama is not running or not accessible at {self._base_url}. "
+                    "Start Ollama with 'ollama serve'"
+                ) from e
+
+        available = self._available_models_cache
+        model = model or self._default_model or self._select_default_model(available)
 
         # Validate model is available
-        available = self.available_models
         if model not in available:
             raise ModelNotFoundError(
                 f"Model '{model}' not available. "
@@ -365,11 +456,16 @@ class OllamaProvider(LLMProvider):
             },
         }
 
+        # Keep the model loaded so its context cache can be reused by
+        # later calls that share the same prompt prefix
+        prefix, _ = split_prompt_prefix(prompt, kwargs.get("cache_prefix"))
+        if prefix and self._keep_alive:
+            payload["keep_alive"] = self._keep_alive
+
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    f"{self._base_url}/api/chat", headers=headers, json=payload
-                )
+            response = await self._get_async_client().post(
+                f"{self._base_url}/api/chat", headers=headers, json=payload
+            )
 
             if response.status_code != 200:
                 error_data = response.json() if response.text else {}
@@ -404,5 +500,10 @@ class OllamaProvider(LLMProvider):
                 f"Ollama request timed out after {self._timeout}s. "
                 "Large models may need a longer timeout."
             )
+        except httpx.ConnectError as e:
+            raise AuthenticationError(
+                f"Ollama is not running or not accessible at {self._base_url}. "
+                "Start Ollama with 'ollama serve'"
+            ) from e
         except httpx.RequestError as e:
             raise RuntimeError(f"Ollama API request failed: {e}")
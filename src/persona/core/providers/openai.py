@@ -4,6 +4,7 @@ OpenAI LLM provider implementation.
 This module provides integration with OpenAI's GPT models.
 """
 
+import hashlib
 import os
 from typing import Any
 
@@ -14,6 +15,7 @@ from persona.core.providers.base import (
     LLMResponse,
     ModelNotFoundError,
     RateLimitError,
+    split_prompt_prefix,
 )
 from persona.core.providers.http_base import HTTPProvider
 
@@ -23,7 +25,10 @@ class OpenAIProvider(HTTPProvider):
     OpenAI provider implementation.
 
     Supports GPT-4, GPT-4o, and other OpenAI chat models.
-    Uses HTTP connection pooling for improved performance.
+    Uses HTTP connection pooling for improved performance. OpenAI caches
+    long prompt prefixes automatically; when a ``cache_prefix`` is given
+    its digest is sent as ``prompt_cache_key`` so calls sharing source
+    material are routed to the same cache.
 
     Example:
         provider = OpenAIProvider()
@@ -63,6 +68,10 @@ class OpenAIProvider(HTTPProvider):
     def default_model(self) -> str:
         return "gpt-4o"
 
+    @property
+    def api_key(self) -> str | None:
+        return self._api_key
+
     @property
     def available_models(self) -> list[str]:
         return list(self.MODELS.keys())
@@ -92,21 +101,13 @@ class OpenAIProvider(HTTPProvider):
             "Content-Type": "application/json",
         }
 
-        # Handle o1 models which don't support temperature
-        payload: dict[str, Any] = {
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-        }
-
-        # o1 models don't support temperature parameter
-        if not model.startswith("o1"):
-            payload["temperature"] = temperature
+        payload = self._build_payload(prompt, model, max_tokens, temperature, kwargs)
 
         try:
             # Use pooled HTTP client
-            client = self.get_sync_client()
-            response = client.post(self.API_URL, headers=headers, json=payload)
+            response = self._post(
+                self.API_URL, model=model, headers=headers, json=payload
+            )
 
             if response.status_code == 401:
                 raise AuthenticationError("Invalid OpenAI API key")
@@ -120,18 +121,7 @@ class OpenAIProvider(HTTPProvider):
                     f"OpenAI API error: {error_data.get('message', response.text)}"
                 )
 
-            data = response.json()
-            choice = data["choices"][0]
-            usage = data.get("usage", {})
-
-            return LLMResponse(
-                content=choice["message"]["content"],
-                model=data["model"],
-                input_tokens=usage.get("prompt_tokens", 0),
-                output_tokens=usage.get("completion_tokens", 0),
-                finish_reason=choice.get("finish_reason", "stop"),
-                raw_response=data,
-            )
+            return self._parse_response(response.json())
 
         except httpx.TimeoutException:
             raise RuntimeError("OpenAI API request timed out")
@@ -160,21 +150,13 @@ class OpenAIProvider(HTTPProvider):
             "Content-Type": "application/json",
         }
 
-        # Handle o1 models which don't support temperature
-        payload: dict[str, Any] = {
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-        }
-
-        # o1 models don't support temperature parameter
-        if not model.startswith("o1"):
-            payload["temperature"] = temperature
+        payload = self._build_payload(prompt, model, max_tokens, temperature, kwargs)
 
         try:
             # Use pooled HTTP client
-            client = await self.get_async_client()
-            response = await client.post(self.API_URL, headers=headers, json=payload)
+            response = await self._post_async(
+                self.API_URL, model=model, headers=headers, json=payload
+            )
 
             if response.status_code == 401:
                 raise AuthenticationError("Invalid OpenAI API key")
@@ -188,20 +170,52 @@ class OpenAIProvider(HTTPProvider):
                     f"OpenAI API error: {error_data.get('message', response.text)}"
                 )
 
-            data = response.json()
-            choice = data["choices"][0]
-            usage = data.get("usage", {})
-
-            return LLMResponse(
-                content=choice["message"]["content"],
-                model=data["model"],
-                input_tokens=usage.get("prompt_tokens", 0),
-                output_tokens=usage.get("completion_tokens", 0),
-                finish_reason=choice.get("finish_reason", "stop"),
-                raw_response=data,
-            )
+            return self._parse_response(response.json())
 
         except httpx.TimeoutException:
             raise RuntimeError("OpenAI API request timed out")
         except httpx.RequestError as e:
             raise RuntimeError(f"OpenAI API request failed: {e}")
+
+    def _build_payload(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the request payload."""
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+        }
+
+        # o1 models don't support temperature parameter
+        if not model.startswith("o1"):
+            payload["temperature"] = temperature
+
+        prefix, _ = split_prompt_prefix(prompt, kwargs.get("cache_prefix"))
+        if prefix:
+            digest = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+            payload["prompt_cache_key"] = f"persona-{digest[:32]}"
+
+        return payload
+
+    @staticmethod
+    def _parse_response(data: dict[str, Any]) -> LLMResponse:
+        """Convert an API response body to an LLMResponse."""
+        choice = data["choices"][0]
+        usage = data.get("usage", {})
+        details = usage.get("prompt_tokens_details") or {}
+
+        return LLMResponse(
+            content=choice["message"]["content"],
+            model=data["model"],
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            finish_reason=choice.get("finish_reason", "stop"),
+            raw_response=data,
+            cache_read_tokens=details.get("cached_tokens") or 0,
+        )
@@ -15,6 +15,14 @@ from persona.core.quality.base import (
     get_metric_requirements,
 )
 from persona.core.quality.config import QualityConfig
+from persona.core.quality.context import (
+    AnalysisContext,
+    PersonaText,
+    analysis_context,
+    get_analysis_context,
+    persona_text,
+)
+from persona.core.quality.engine import ExecutionPlan, MetricEngine, MetricResult
 from persona.core.quality.models import (
     BatchQualityResult,
     DimensionScore,
@@ -45,4 +53,14 @@ __all__ = [
     "get_registry",
     "register_metric",
     "get_metric_requirements",
+    # Shared text analysis
+    "AnalysisContext",
+    "PersonaText",
+    "analysis_context",
+    "get_analysis_context",
+    "persona_text",
+    # Concurrent execution
+    "MetricEngine",
+    "MetricResult",
+    "ExecutionPlan",
 ]
@@ -95,6 +95,11 @@ class GevalMetric(QualityMetric):
         """Indicate that this metric does not require evidence report."""
         return False
 
+    @property
+    def requires_llm(self) -> bool:
+        """Indicate that this metric calls a remote model."""
+        return True
+
     def evaluate(
         self,
         persona: Persona,
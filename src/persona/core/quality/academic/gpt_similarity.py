@@ -11,6 +11,7 @@ from persona.core.embedding.factory import EmbeddingFactory
 from persona.core.generation.parser import Persona
 from persona.core.quality.base import QualityMetric
 from persona.core.quality.config import QualityConfig
+from persona.core.quality.context import persona_text
 from persona.core.quality.models import DimensionScore
 
 if TYPE_CHECKING:
@@ -83,6 +84,11 @@ class GptSimilarityMetric(QualityMetric):
         """Indicate that this metric does not require evidence report."""
         return False
 
+    @property
+    def requires_llm(self) -> bool:
+        """Indicate that this metric calls a remote model."""
+        return True
+
     def evaluate(
         self,
         persona: Persona,
@@ -166,44 +172,4 @@ class GptSimilarityMetric(QualityMetric):
         Returns:
             Text representation of the persona.
         """
-        parts = []
-
-        # Add name
-        if persona.name:
-            parts.append(persona.name)
-
-        # Add demographics
-        if persona.demographics:
-            for key, value in persona.demographics.items():
-                if value:
-                    parts.append(f"{key}: {value}")
-
-        # Add goals
-        if persona.goals:
-            parts.extend(persona.goals)
-
-        # Add pain points
-        if persona.pain_points:
-            parts.extend(persona.pain_points)
-
-        # Add behaviours
-        if persona.behaviours:
-            parts.extend(persona.behaviours)
-
-        # Add quotes
-        if persona.quotes:
-            parts.extend(persona.quotes)
-
-        # Add additional fields
-        if persona.additional:
-            for key, value in persona.additional.items():
-                if isinstance(value, list):
-                    parts.extend(str(v) for v in value)
-                elif isinstance(value, dict):
-                    for k, v in value.items():
-                        if v:
-                            parts.append(f"{k}: {v}")
-                else:
-                    parts.append(str(value))
-
-        return " ".join(str(p) for p in parts if p)
+        return persona_text(persona).document
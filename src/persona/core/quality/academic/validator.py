@@ -21,7 +21,26 @@ from persona.core.quality.academic.models import (
     RougeScore,
 )
 from persona.core.quality.academic.rouge import RougeLMetric
+from persona.core.quality.base import QualityMetric
 from persona.core.quality.config import QualityConfig
+from persona.core.quality.context import analysis_context
+from persona.core.quality.engine import MetricEngine
+from persona.core.quality.models import DimensionScore
+
+# Academic metrics, in report order
+ACADEMIC_METRICS = ["rouge_l", "bertscore", "gpt_similarity", "geval"]
+
+# Metrics that compare the persona with source data
+SOURCE_METRICS = {"rouge_l", "bertscore", "gpt_similarity"}
+
+# Errors meaning a metric is unavailable (library not installed, provider
+# not configured); the metric is left out of the report instead
+UNAVAILABLE_ERRORS: dict[str, type[Exception]] = {
+    "rouge_l": ImportError,
+    "bertscore": ImportError,
+    "gpt_similarity": RuntimeError,
+    "geval": RuntimeError,
+}
 
 
 class AcademicValidator:
@@ -98,6 +117,25 @@ class AcademicValidator:
         self.geval_provider = geval_provider
         self.geval_model = geval_model or self.geval_metric.model_name
 
+    def get_metrics(self, metrics: list[str] | None = None) -> dict[str, QualityMetric]:
+        """
+        Get the metric instances for a selection of academic metrics.
+
+        Args:
+            metrics: Metric names (defaults to all academic metrics).
+
+        Returns:
+            Dictionary mapping metric names to instances, in report order.
+        """
+        available: dict[str, QualityMetric] = {
+            "rouge_l": self.rouge_metric,
+            "bertscore": self.bertscore_metric,
+            "gpt_similarity": self.gpt_similarity_metric,
+            "geval": self.geval_metric,
+        }
+        selected = ACADEMIC_METRICS if metrics is None else metrics
+        return {name: available[name] for name in selected if name in available}
+
     def validate(
         self,
         persona: Persona,
@@ -119,44 +157,22 @@ class AcademicValidator:
         Raises:
             ValueError: If required source_data is missing for selected metrics.
         """
-        # Default to all metrics if not specified
-        if metrics is None:
-            metrics = ["rouge_l", "bertscore", "gpt_similarity", "geval"]
+        metrics = self._check_metrics(metrics, source_data)
 
-        # Validate requirements
-        requires_source = {"rouge_l", "bertscore", "gpt_similarity"}
-        selected_requiring_source = requires_source & set(metrics)
-        if selected_requiring_source and not source_data:
-            raise ValueError(f"Metrics {selected_requiring_source} require source_data")
+        scores: dict[str, DimensionScore | None] = {}
 
-        # Compute requested metrics
-        rouge_l = None
-        bertscore = None
-        gpt_similarity = None
-        geval = None
-
-        if "rouge_l" in metrics:
-            rouge_l = self._compute_rouge_l(persona, source_data)
-
-        if "bertscore" in metrics:
-            bertscore = self._compute_bertscore(persona, source_data)
-
-        if "gpt_similarity" in metrics:
-            gpt_similarity = self._compute_gpt_similarity(persona, source_data)
+        # Reference-based metrics share one rendering of the persona
+        with analysis_context():
+            for name, metric in self.get_metrics(metrics).items():
+                if name in SOURCE_METRICS and not source_data:
+                    continue
+                try:
+                    scores[name] = metric.evaluate(persona, source_data=source_data)
+                except UNAVAILABLE_ERRORS[name]:
+                    # Library not installed or provider not configured
+                    scores[name] = None
 
-        if "geval" in metrics:
-            geval = self._compute_geval(persona, source_data)
-
-        # Create report
-        return AcademicValidationReport(
-            persona_id=persona.id,
-            persona_name=persona.name,
-            rouge_l=rouge_l,
-            bertscore=bertscore,
-            gpt_similarity=gpt_similarity,
-            geval=geval,
-            metrics_used=metrics,
-        )
+        return self._build_report(persona, scores, metrics)
 
     def validate_batch(
         self,
@@ -167,6 +183,11 @@ class AcademicValidator:
         """
         Validate multiple personas using academic metrics.
 
+        Metrics run concurrently in a MetricEngine: G-eval and GPT
+        similarity requests are in flight together while ROUGE-L and
+        BERTScore are computed, so a batch takes about as long as its
+        slowest metric rather than the sum of all of them.
+
         Args:
             personas: List of personas to validate.
             source_data: Source data for comparison.
@@ -181,88 +202,98 @@ class AcademicValidator:
         if not personas:
             raise ValueError("At least one persona is required")
 
-        # Validate each persona
-        reports = [self.validate(persona, source_data, metrics) for persona in personas]
+        metrics = self._check_metrics(metrics, source_data)
+
+        engine = MetricEngine(self.get_metrics(metrics))
+        results = engine.run(personas, source_data=source_data)
+
+        scores: list[dict[str, DimensionScore | None]] = [{} for _ in personas]
+        for result in results:
+            if result.skipped:
+                continue
+            exception = result.exception
+            if exception is not None and not isinstance(
+                exception, UNAVAILABLE_ERRORS[result.metric]
+            ):
+                raise exception
+            scores[result.persona_index][result.metric] = result.score
+
+        reports = [
+            self._build_report(persona, persona_scores, metrics)
+            for persona, persona_scores in zip(personas, scores, strict=True)
+        ]
 
         # Create batch report (automatically calculates averages)
         return BatchAcademicValidationReport(reports=reports)
 
-    def _compute_rouge_l(
-        self, persona: Persona, source_data: str | None
-    ) -> RougeScore | None:
-        """Compute ROUGE-L score."""
-        if not source_data:
-            return None
-
-        try:
-            result = self.rouge_metric.evaluate(persona, source_data=source_data)
-            return RougeScore(
-                precision=result.details["precision"],
-                recall=result.details["recall"],
-                fmeasure=result.details["fmeasure"],
+    def _check_metrics(
+        self, metrics: list[str] | None, source_data: str | None
+    ) -> list[str]:
+        """Default the metric selection and check its source requirement."""
+        if metrics is None:
+            metrics = list(ACADEMIC_METRICS)
+
+        selected_requiring_source = SOURCE_METRICS & set(metrics)
+        if selected_requiring_source and not source_data:
+            raise ValueError(f"Metrics {selected_requiring_source} require source_data")
+
+        return metrics
+
+    def _build_report(
+        self,
+        persona: Persona,
+        scores: dict[str, DimensionScore | None],
+        metrics: list[str],
+    ) -> AcademicValidationReport:
+        """Convert metric scores into a persona's validation report."""
+        rouge_l = None
+        bertscore = None
+        gpt_similarity = None
+        geval = None
+
+        if rouge := scores.get("rouge_l"):
+            rouge_l = RougeScore(
+                precision=rouge.details["precision"],
+                recall=rouge.details["recall"],
+                fmeasure=rouge.details["fmeasure"],
             )
-        except ImportError:
-            # Library not installed, skip this metric
-            return None
-
-    def _compute_bertscore(
-        self, persona: Persona, source_data: str | None
-    ) -> BertScore | None:
-        """Compute BERTScore."""
-        if not source_data:
-            return None
-
-        try:
-            result = self.bertscore_metric.evaluate(persona, source_data=source_data)
-            return BertScore(
-                precision=result.details["precision"],
-                recall=result.details["recall"],
-                f1=result.details["f1"],
+
+        if bert := scores.get("bertscore"):
+            bertscore = BertScore(
+                precision=bert.details["precision"],
+                recall=bert.details["recall"],
+                f1=bert.details["f1"],
                 model=self.bertscore_model,
             )
-        except ImportError:
-            # Library not installed, skip this metric
-            return None
-
-    def _compute_gpt_similarity(
-        self, persona: Persona, source_data: str | None
-    ) -> GptSimilarityScore | None:
-        """Compute GPT embedding similarity."""
-        if not source_data:
-            return None
-
-        try:
-            result = self.gpt_similarity_metric.evaluate(
-                persona, source_data=source_data
-            )
-            return GptSimilarityScore(
-                similarity=result.details["similarity"],
-                embedding_model=result.details["embedding_model"],
-                persona_dimensions=result.details["persona_dimensions"],
-                source_dimensions=result.details["source_dimensions"],
+
+        if similarity := scores.get("gpt_similarity"):
+            gpt_similarity = GptSimilarityScore(
+                similarity=similarity.details["similarity"],
+                embedding_model=similarity.details["embedding_model"],
+                persona_dimensions=similarity.details["persona_dimensions"],
+                source_dimensions=similarity.details["source_dimensions"],
             )
-        except RuntimeError:
-            # Provider not configured, skip this metric
-            return None
-
-    def _compute_geval(
-        self, persona: Persona, source_data: str | None
-    ) -> GevalScore | None:
-        """Compute G-eval scores."""
-        try:
-            result = self.geval_metric.evaluate(persona, source_data=source_data)
-            return GevalScore(
-                coherence=result.details["coherence"],
-                relevance=result.details["relevance"],
-                fluency=result.details["fluency"],
-                consistency=result.details["consistency"],
-                overall=result.details["overall"],
-                model=result.details["model"],
-                reasoning=result.details["reasoning"],
+
+        if judged := scores.get("geval"):
+            geval = GevalScore(
+                coherence=judged.details["coherence"],
+                relevance=judged.details["relevance"],
+                fluency=judged.details["fluency"],
+                consistency=judged.details["consistency"],
+                overall=judged.details["overall"],
+                model=judged.details["model"],
+                reasoning=judged.details["reasoning"],
             )
-        except RuntimeError:
-            # LLM evaluation failed, skip this metric
-            return None
+
+        return AcademicValidationReport(
+            persona_id=persona.id,
+            persona_name=persona.name,
+            rouge_l=rouge_l,
+            bertscore=bertscore,
+            gpt_similarity=gpt_similarity,
+            geval=geval,
+            metrics_used=metrics,
+        )
 
 
 def validate_persona(
@@ -5,6 +5,7 @@ This module provides the QualityMetric abstract base class that all
 quality metrics must implement, enabling a pluggable metrics architecture.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -134,6 +135,20 @@ class QualityMetric(ABC):
         """
         ...
 
+    @property
+    def requires_llm(self) -> bool:
+        """
+        Indicate whether this metric calls an LLM or remote model.
+
+        LLM-bound metrics spend their time waiting on the network, so
+        MetricEngine runs them concurrently rather than in worker
+        processes.
+
+        Returns:
+            True if evaluation calls an LLM or embedding service.
+        """
+        return False
+
     @abstractmethod
     def evaluate(
         self,
@@ -156,6 +171,32 @@ class QualityMetric(ABC):
         """
         ...
 
+    async def evaluate_async(
+        self,
+        persona: Persona,
+        source_data: str | None = None,
+        other_personas: list[Persona] | None = None,
+        evidence_report: "EvidenceReport | None" = None,
+    ) -> DimensionScore:
+        """
+        Evaluate the quality of a persona without blocking the event loop.
+
+        The default runs evaluate() in a worker thread; metrics with a
+        native async client can override this.
+
+        Args:
+            persona: The persona to evaluate.
+            source_data: Optional source data text for comparison.
+            other_personas: Optional list of other personas for comparison.
+            evidence_report: Optional evidence linking report.
+
+        Returns:
+            DimensionScore with evaluation results.
+        """
+        return await asyncio.to_thread(
+            self.evaluate, persona, source_data, other_personas, evidence_report
+        )
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<{self.__class__.__name__}(name='{self.name}')>"
@@ -25,6 +25,7 @@ from persona.core.quality.bias.detector import BiasDetector
 from persona.core.quality.bias.embedding import EMBEDDING_AVAILABLE, EmbeddingAnalyser
 from persona.core.quality.bias.judge import BiasJudge
 from persona.core.quality.bias.lexicon import LexiconMatcher
+from persona.core.quality.bias.metric import BiasMetric
 from persona.core.quality.bias.models import (
     BiasCategory,
     BiasConfig,
@@ -39,6 +40,7 @@ __all__ = [
     "BiasDetector",
     "BiasFinding",
     "BiasJudge",
+    "BiasMetric",
     "BiasReport",
     "EmbeddingAnalyser",
     "EMBEDDING_AVAILABLE",
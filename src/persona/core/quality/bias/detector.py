@@ -16,6 +16,7 @@ from persona.core.quality.bias.embedding import (
 from persona.core.quality.bias.judge import BiasJudge
 from persona.core.quality.bias.lexicon import LexiconMatcher
 from persona.core.quality.bias.models import BiasConfig, BiasFinding, BiasReport
+from persona.core.quality.context import analysis_context
 
 if TYPE_CHECKING:
     from persona.core.providers.base import LLMProvider
@@ -168,25 +169,29 @@ class BiasDetector:
         """
         all_findings = []
 
-        # Run lexicon-based detection
-        if self.lexicon:
-            try:
-                lexicon_findings = self.lexicon.analyse(persona, self.config.categories)
-                all_findings.extend(lexicon_findings)
-            except (ValueError, KeyError, AttributeError):
-                # Analysis failure - continue with other methods
-                pass
+        # Lexicon and embedding detection share one extraction of the text
+        with analysis_context():
+            # Run lexicon-based detection
+            if self.lexicon:
+                try:
+                    lexicon_findings = self.lexicon.analyse(
+                        persona, self.config.categories
+                    )
+                    all_findings.extend(lexicon_findings)
+                except (ValueError, KeyError, AttributeError):
+                    # Analysis failure - continue with other methods
+                    pass
 
-        # Run embedding-based detection
-        if self.embedding:
-            try:
-                embedding_findings = self.embedding.analyse(
-                    persona, self.config.categories
-                )
-                all_findings.extend(embedding_findings)
-            except (ValueError, KeyError, AttributeError, RuntimeError):
-                # Analysis failure - continue with other methods
-                pass
+            # Run embedding-based detection
+            if self.embedding:
+                try:
+                    embedding_findings = self.embedding.analyse(
+                        persona, self.config.categories
+                    )
+                    all_findings.extend(embedding_findings)
+                except (ValueError, KeyError, AttributeError, RuntimeError):
+                    # Analysis failure - continue with other methods
+                    pass
 
         # Run LLM judge detection
         if self.judge:
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 from persona.core.generation.parser import Persona
 from persona.core.quality.bias.models import BiasCategory, BiasFinding, Severity
+from persona.core.quality.context import persona_text
 
 if TYPE_CHECKING:
     pass
@@ -281,25 +282,7 @@ class EmbeddingAnalyser:
         Returns:
             List of text segments.
         """
-        texts = []
-
-        # Behaviours
-        if hasattr(persona, "behaviours") and persona.behaviours:
-            texts.extend(persona.behaviours)
-
-        # Goals
-        if hasattr(persona, "goals") and persona.goals:
-            texts.extend(persona.goals)
-
-        # Pain points
-        if hasattr(persona, "pain_points") and persona.pain_points:
-            texts.extend(persona.pain_points)
-
-        # Quote
-        if hasattr(persona, "quote") and persona.quote:
-            texts.append(persona.quote)
-
-        return texts
+        return list(persona_text(persona).segments)
 
     def analyse_gender_bias(
         self, persona: Persona, threshold: float
@@ -11,6 +11,7 @@ from typing import Any
 
 from persona.core.generation.parser import Persona
 from persona.core.quality.bias.models import BiasCategory, BiasFinding, Severity
+from persona.core.quality.context import persona_text
 
 
 class LexiconMatcher:
@@ -60,40 +61,7 @@ class LexiconMatcher:
         Returns:
             Dictionary mapping field names to text content.
         """
-        texts = {}
-
-        # Demographics
-        if hasattr(persona, "demographics") and persona.demographics:
-            for key, value in persona.demographics.items():
-                if isinstance(value, str):
-                    texts[f"demographics.{key}"] = value
-                elif value is not None:
-                    texts[f"demographics.{key}"] = str(value)
-
-        # Behaviours
-        if hasattr(persona, "behaviours") and persona.behaviours:
-            for i, behaviour in enumerate(persona.behaviours):
-                texts[f"behaviours[{i}]"] = behaviour
-
-        # Goals
-        if hasattr(persona, "goals") and persona.goals:
-            for i, goal in enumerate(persona.goals):
-                texts[f"goals[{i}]"] = goal
-
-        # Pain points
-        if hasattr(persona, "pain_points") and persona.pain_points:
-            for i, pain in enumerate(persona.pain_points):
-                texts[f"pain_points[{i}]"] = pain
-
-        # Quote
-        if hasattr(persona, "quote") and persona.quote:
-            texts["quote"] = persona.quote
-
-        # Bio/description if present
-        if hasattr(persona, "bio") and persona.bio:
-            texts["bio"] = persona.bio
-
-        return texts
+        return dict(persona_text(persona).fields)
 
     def _match_patterns(
         self,
@@ -0,0 +1,110 @@
+"""
+Bias detection as a quality metric.
+
+This module provides the BiasMetric class that adapts BiasDetector to
+the QualityMetric interface, so bias detection can run alongside other
+metrics in a MetricEngine.
+"""
+
+from typing import TYPE_CHECKING
+
+from persona.core.generation.parser import Persona
+from persona.core.quality.base import QualityMetric
+from persona.core.quality.bias.detector import BiasDetector
+from persona.core.quality.config import QualityConfig
+from persona.core.quality.models import DimensionScore
+
+if TYPE_CHECKING:
+    from persona.core.evidence.linker import EvidenceReport
+
+
+class BiasMetric(QualityMetric):
+    """
+    Bias and stereotype quality metric.
+
+    Scores personas from 0 (heavily biased) to 100 (no bias detected),
+    the inverse of BiasReport.overall_score, and lists each finding as
+    an issue.
+
+    Example:
+        metric = BiasMetric(detector=BiasDetector(BiasConfig(methods=["lexicon"])))
+        score = metric.evaluate(persona)
+        print(f"Bias-free: {score.score:.0f}/100")
+    """
+
+    def __init__(
+        self,
+        config: QualityConfig | None = None,
+        detector: BiasDetector | None = None,
+    ) -> None:
+        """
+        Initialise the bias metric.
+
+        Args:
+            config: Quality configuration with weights and thresholds.
+            detector: Bias detector to use (default: BiasDetector()).
+        """
+        super().__init__(config)
+        self.detector = detector or BiasDetector()
+
+    @property
+    def name(self) -> str:
+        """Return the unique name of this metric."""
+        return "bias"
+
+    @property
+    def description(self) -> str:
+        """Return a human-readable description."""
+        return "Bias and stereotype detection"
+
+    @property
+    def requires_source_data(self) -> bool:
+        """Indicate that this metric does not require source data."""
+        return False
+
+    @property
+    def requires_other_personas(self) -> bool:
+        """Indicate that this metric does not require other personas."""
+        return False
+
+    @property
+    def requires_evidence_report(self) -> bool:
+        """Indicate that this metric does not require evidence report."""
+        return False
+
+    @property
+    def requires_llm(self) -> bool:
+        """Indicate whether the detector calls an LLM judge."""
+        return self.detector.judge is not None
+
+    def evaluate(
+        self,
+        persona: Persona,
+        source_data: str | None = None,
+        other_personas: list[Persona] | None = None,
+        evidence_report: "EvidenceReport | None" = None,
+    ) -> DimensionScore:
+        """
+        Evaluate persona for bias.
+
+        Args:
+            persona: The persona to evaluate.
+            source_data: Not used by this metric.
+            other_personas: Not used by this metric.
+            evidence_report: Not used by this metric.
+
+        Returns:
+            DimensionScore with the bias report in its details.
+        """
+        report = self.detector.analyse(persona)
+
+        return DimensionScore(
+            dimension=self.name,
+            score=(1.0 - report.overall_score) * 100,
+            weight=self.weight,
+            issues=[
+                f"{finding.category.value}: {finding.description}"
+                for finding in report.findings
+            ],
+            details=report.to_dict(),
+        )
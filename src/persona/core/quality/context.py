@@ -0,0 +1,335 @@
+"""
+Shared per-run text analysis for quality metrics.
+
+Each analyser used to walk the persona and build its own text: the
+diversity tokeniser, the bias lexicon and embedding analysers and the
+academic metrics all re-derived, lower-cased and tokenised the same
+content. An AnalysisContext extracts every text form a metric needs in
+a single pass per persona, keyed by the persona's content hash, and
+hands the same PersonaText to every metric evaluated while the context
+is active. Every form is derived from the persona on first use and
+then cached, so metrics only pay for the forms they read.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+from typing import Any
+
+from persona.core.generation.compact import content_hash
+from persona.core.generation.parser import Persona
+from persona.core.quality.diversity.tokeniser import extract_persona_text, tokenise
+
+# Persona list fields kept item by item
+_LIST_FIELDS = ("goals", "pain_points", "behaviours", "quotes")
+
+_active_context: ContextVar["AnalysisContext | None"] = ContextVar(
+    "persona_analysis_context", default=None
+)
+
+
+def persona_document(persona: Persona) -> str:
+    """
+    Render a persona as labelled prose for reference-based metrics.
+
+    Demographics and nested additional fields are written as
+    "key: value" pairs; list fields contribute one entry per item.
+
+    Args:
+        persona: The persona to render.
+
+    Returns:
+        Text representation of the persona.
+    """
+    parts: list[Any] = []
+
+    if persona.name:
+        parts.append(persona.name)
+
+    if persona.demographics:
+        for key, value in persona.demographics.items():
+            if value:
+                parts.append(f"{key}: {value}")
+
+    parts.extend(persona.goals or [])
+    parts.extend(persona.pain_points or [])
+    parts.extend(persona.behaviours or [])
+    parts.extend(persona.quotes or [])
+
+    if persona.additional:
+        for value in persona.additional.values():
+            if isinstance(value, list):
+                parts.extend(str(v) for v in value)
+            elif isinstance(value, dict):
+                for k, v in value.items():
+                    if v:
+                        parts.append(f"{k}: {v}")
+            else:
+                parts.append(str(value))
+
+    return " ".join(str(p) for p in parts if p)
+
+
+def persona_field_texts(persona: Persona) -> dict[str, str]:
+    """
+    Map field paths to their text for field-level checks.
+
+    Args:
+        persona: The persona to extract text from.
+
+    Returns:
+        Dictionary mapping field paths (e.g. "goals[0]",
+        "demographics.age") to text content.
+    """
+    texts: dict[str, str] = {}
+
+    for key, value in (persona.demographics or {}).items():
+        if value is not None:
+            texts[f"demographics.{key}"] = (
+                value if isinstance(value, str) else str(value)
+            )
+
+    for field_name in ("behaviours", "goals", "pain_points"):
+        for i, item in enumerate(getattr(persona, field_name, None) or []):
+            texts[f"{field_name}[{i}]"] = item
+
+    for field_name in ("quote", "bio"):
+        value = getattr(persona, field_name, None)
+        if value:
+            texts[field_name] = value
+
+    return texts
+
+
+class PersonaText:
+    """
+    Text forms of one persona, each extracted on first use.
+
+    Forms are read from the persona the first time they are accessed
+    and cached, so a persona must not be modified while its text is in
+    use. The content hash is likewise only computed when asked for;
+    outside an analysis context nothing needs it.
+
+    Attributes:
+        content_hash: Content hash of the persona the text came from.
+        text: Plain concatenated content (see extract_persona_text).
+        document: Labelled prose for reference-based metrics.
+        fields: Field path to text mapping for field-level checks.
+        segments: Behaviour, goal and pain point statements.
+        items: List fields (goals, pain_points, behaviours, quotes) as
+            tuples of their original strings.
+    """
+
+    def __init__(self, persona: Persona, digest: str | None = None) -> None:
+        """
+        Initialise persona text.
+
+        Args:
+            persona: The persona to extract text from.
+            digest: Precomputed content hash, if known.
+        """
+        self._persona = persona
+        if digest is not None:
+            self.__dict__["content_hash"] = digest
+
+    @classmethod
+    def from_persona(cls, persona: Persona, digest: str | None = None) -> "PersonaText":
+        """
+        Create text for a persona.
+
+        Args:
+            persona: The persona to extract text from.
+            digest: Precomputed content hash, if known.
+
+        Returns:
+            PersonaText for the persona.
+        """
+        return cls(persona, digest)
+
+    @cached_property
+    def content_hash(self) -> str:
+        """Content hash of the source persona."""
+        return content_hash(self._persona.to_dict())
+
+    @cached_property
+    def text(self) -> str:
+        """Plain concatenated content (see extract_persona_text)."""
+        return extract_persona_text(self._persona)
+
+    @cached_property
+    def document(self) -> str:
+        """Labelled prose for reference-based metrics."""
+        return persona_document(self._persona)
+
+    @cached_property
+    def fields(self) -> dict[str, str]:
+        """Field path to text mapping for field-level checks."""
+        return persona_field_texts(self._persona)
+
+    @cached_property
+    def items(self) -> dict[str, tuple[str, ...]]:
+        """List fields as tuples of their original strings."""
+        return {
+            name: tuple(getattr(self._persona, name, None) or ())
+            for name in _LIST_FIELDS
+        }
+
+    @cached_property
+    def segments(self) -> tuple[str, ...]:
+        """Behaviour, goal and pain point statements."""
+        items = self.items
+        return items["behaviours"] + items["goals"] + items["pain_points"]
+
+    @cached_property
+    def lower(self) -> str:
+        """Lower-cased plain text."""
+        return self.text.lower()
+
+    @cached_property
+    def lower_items(self) -> dict[str, tuple[str, ...]]:
+        """List fields with each item lower-cased and stripped."""
+        return {
+            name: tuple(str(item).lower().strip() for item in values)
+            for name, values in self.items.items()
+        }
+
+    @cached_property
+    def tokens(self) -> tuple[str, ...]:
+        """Normalised word tokens (see tokenise)."""
+        return tuple(tokenise(self.text))
+
+    def __repr__(self) -> str:
+        """Return a short representation."""
+        return f"PersonaText(content_hash={self.content_hash[:12]!r})"
+
+
+class AnalysisContext:
+    """
+    Per-run cache of persona text shared by quality metrics.
+
+    Personas with identical content share one entry, so duplicates in a
+    batch are only processed once. Each persona object is hashed on its
+    first lookup only, so personas must not be modified while the
+    context is active. Safe to use from multiple threads.
+
+    Example:
+        context = AnalysisContext()
+        with context.activate():
+            for metric in registry.get_all_metrics(config).values():
+                metric.evaluate(persona)
+        print(context.hits, context.misses)
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty context."""
+        self._entries: dict[str, PersonaText] = {}
+        # id(persona) -> (persona, text); holding the persona keeps its
+        # id from being reused by another object during the run
+        self._objects: dict[int, tuple[Persona, PersonaText]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, persona: Persona) -> PersonaText:
+        """
+        Get the text for a persona, extracting it on first request.
+
+        Args:
+            persona: The persona to look up.
+
+        Returns:
+            Shared PersonaText for the persona's content.
+        """
+        known = self._objects.get(id(persona))
+        if known is not None and known[0] is persona:
+            self.hits += 1
+            return known[1]
+
+        digest = content_hash(persona.to_dict())
+        entry = self._entries.get(digest)
+        if entry is None:
+            entry = PersonaText.from_persona(persona, digest)
+
+        with self._lock:
+            if digest in self._entries:
+                self.hits += 1
+            else:
+                self.misses += 1
+            entry = self._entries.setdefault(digest, entry)
+            self._objects[id(persona)] = (persona, entry)
+        return entry
+
+    @contextmanager
+    def activate(self) -> Iterator["AnalysisContext"]:
+        """
+        Make this the context used by persona_text() for a block.
+
+        Yields:
+            This context.
+        """
+        token = _active_context.set(self)
+        try:
+            yield self
+        finally:
+            _active_context.reset(token)
+
+    def clear(self) -> None:
+        """Drop all cached text."""
+        with self._lock:
+            self._entries.clear()
+            self._objects.clear()
+
+    def __len__(self) -> int:
+        """Return number of distinct personas cached."""
+        return len(self._entries)
+
+
+def get_analysis_context() -> AnalysisContext | None:
+    """
+    Get the active analysis context.
+
+    Returns:
+        The innermost active AnalysisContext, or None outside a run.
+    """
+    return _active_context.get()
+
+
+@contextmanager
+def analysis_context() -> Iterator[AnalysisContext]:
+    """
+    Run a block inside an analysis context.
+
+    Reuses the active context when one exists, so nested runs (a batch
+    scoring each persona in turn) share a single cache.
+
+    Yields:
+        The active AnalysisContext.
+    """
+    context = _active_context.get()
+    if context is not None:
+        yield context
+        return
+
+    with AnalysisContext().activate() as context:
+        yield context
+
+
+def persona_text(persona: Persona) -> PersonaText:
+    """
+    Get the text for a persona.
+
+    Uses the active analysis context when there is one; otherwise the
+    text is extracted lazily and the persona is never hashed.
+
+    Args:
+        persona: The persona to extract text from.
+
+    Returns:
+        PersonaText for the persona.
+    """
+    context = _active_context.get()
+    if context is None:
+        return PersonaText.from_persona(persona)
+    return context.get(persona)
@@ -5,13 +5,15 @@ This module provides the main analyser class that orchestrates
 text extraction, tokenisation, and metric calculation.
 """
 
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 from persona.core.generation.parser import Persona
 from persona.core.quality.diversity.metrics import (
-    calculate_hapax_ratio,
-    calculate_mattr,
-    calculate_mtld,
+    LexicalMetrics,
+    calculate_all,
     calculate_ttr,
     interpret_mtld,
 )
@@ -21,7 +23,33 @@ from persona.core.quality.diversity.models import (
     DiversityReport,
     InterpretationLevel,
 )
-from persona.core.quality.diversity.tokeniser import extract_persona_text, tokenise
+
+# Minimum batch size spread across worker processes when max_workers > 1
+PARALLEL_MIN_PERSONAS = 32
+
+
+def _analyse_tokens(tokens: list[str], config: DiversityConfig) -> LexicalMetrics:
+    """
+    Calculate metrics for already tokenised text (runs in worker processes).
+
+    Args:
+        tokens: Normalised tokens.
+        config: Diversity configuration.
+
+    Returns:
+        LexicalMetrics; only TTR is calculated below config.min_tokens.
+    """
+    if len(tokens) >= config.min_tokens:
+        return calculate_all(tokens, config.mattr_window_size, config.mtld_threshold)
+
+    # Not enough tokens for reliable analysis
+    frequency = Counter(tokens)
+    return LexicalMetrics(
+        total_tokens=len(tokens),
+        unique_tokens=len(frequency),
+        ttr=calculate_ttr(tokens, frequency),
+        frequency=frequency,
+    )
 
 
 class LexicalDiversityAnalyser:
@@ -63,54 +91,29 @@ class LexicalDiversityAnalyser:
         Returns:
             DiversityReport with comprehensive metrics.
         """
-        # Extract text
-        text = extract_persona_text(persona)
+        # Deferred import: the analysis context imports this package
+        from persona.core.quality.context import persona_text
 
-        # Tokenise
-        tokens = tokenise(text)
-
-        # Calculate metrics
-        total_tokens = len(tokens)
-        unique_tokens = len(set(tokens))
-
-        if total_tokens >= self.config.min_tokens:
-            ttr = calculate_ttr(tokens)
-            mattr = calculate_mattr(tokens, self.config.mattr_window_size)
-            mtld = calculate_mtld(tokens, self.config.mtld_threshold)
-            hapax_ratio = calculate_hapax_ratio(tokens)
-        else:
-            # Not enough tokens for reliable analysis
-            ttr = calculate_ttr(tokens) if tokens else 0.0
-            mattr = 0.0
-            mtld = 0.0
-            hapax_ratio = 0.0
-
-        # Interpret MTLD
-        interpretation_str = interpret_mtld(mtld)
-        interpretation = InterpretationLevel(interpretation_str)
-
-        # Calculate token frequency
-        token_frequency = dict(Counter(tokens))
-
-        return DiversityReport(
-            persona_id=persona.id,
-            persona_name=persona.name,
-            total_tokens=total_tokens,
-            unique_tokens=unique_tokens,
-            ttr=ttr,
-            mattr=mattr,
-            mtld=mtld,
-            hapax_ratio=hapax_ratio,
-            interpretation=interpretation,
-            token_frequency=token_frequency,
-        )
+        metrics = _analyse_tokens(list(persona_text(persona).tokens), self.config)
+        return self._build_report(persona, metrics)
 
-    def analyse_batch(self, personas: list[Persona]) -> BatchDiversityReport:
+    def analyse_batch(
+        self,
+        personas: list[Persona],
+        max_workers: int | None = 1,
+    ) -> BatchDiversityReport:
         """
         Analyse lexical diversity for multiple personas.
 
+        Personas are tokenised once, in-process. Metrics are calculated
+        in-process by default; with max_workers above 1, batches of at
+        least PARALLEL_MIN_PERSONAS send their tokens to a process pool.
+        Reports are returned in input order either way.
+
         Args:
             personas: List of personas to analyse.
+            max_workers: Maximum worker processes (default: 1, in-process;
+                None uses the CPU count).
 
         Returns:
             BatchDiversityReport with individual and aggregate metrics.
@@ -124,8 +127,31 @@ class LexicalDiversityAnalyser:
                 average_hapax_ratio=0.0,
             )
 
+        from persona.core.quality.context import persona_text
+
         # Analyse each persona
-        reports = [self.analyse(persona) for persona in personas]
+        tokens = [list(persona_text(persona).tokens) for persona in personas]
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        workers = max(1, min(len(tokens), max_workers))
+
+        if workers == 1 or len(tokens) < PARALLEL_MIN_PERSONAS:
+            results = [_analyse_tokens(entry, self.config) for entry in tokens]
+        else:
+            chunksize = max(1, len(tokens) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        partial(_analyse_tokens, config=self.config),
+                        tokens,
+                        chunksize=chunksize,
+                    )
+                )
+
+        reports = [
+            self._build_report(persona, metrics)
+            for persona, metrics in zip(personas, results, strict=True)
+        ]
 
         # Calculate averages
         average_ttr = sum(r.ttr for r in reports) / len(reports)
@@ -140,3 +166,22 @@ class LexicalDiversityAnalyser:
             average_mtld=average_mtld,
             average_hapax_ratio=average_hapax_ratio,
         )
+
+    def _build_report(
+        self, persona: Persona, metrics: LexicalMetrics
+    ) -> DiversityReport:
+        """Build a diversity report from calculated metrics."""
+        interpretation = InterpretationLevel(interpret_mtld(metrics.mtld))
+
+        return DiversityReport(
+            persona_id=persona.id,
+            persona_name=persona.name,
+            total_tokens=metrics.total_tokens,
+            unique_tokens=metrics.unique_tokens,
+            ttr=metrics.ttr,
+            mattr=metrics.mattr,
+            mtld=metrics.mtld,
+            hapax_ratio=metrics.hapax_ratio,
+            interpretation=interpretation,
+            token_frequency=dict(metrics.frequency),
+        )
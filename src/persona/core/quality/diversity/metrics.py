@@ -2,20 +2,83 @@
 Lexical diversity metric calculations.
 
 This module implements the core algorithms for calculating various
-lexical diversity measures.
+lexical diversity measures. Every metric runs in time linear in the
+number of tokens, and calculate_all() shares one frequency table
+between the metrics that need it.
 """
 
 from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 
-def calculate_ttr(tokens: list[str]) -> float:
+@dataclass
+class LexicalMetrics:
+    """
+    All lexical diversity metrics for one token sequence.
+
+    Attributes:
+        total_tokens: Number of tokens.
+        unique_tokens: Number of distinct tokens.
+        ttr: Type-Token Ratio (0-1).
+        mattr: Moving-Average Type-Token Ratio (0-1).
+        mtld: Measure of Textual Lexical Diversity.
+        hapax_ratio: Ratio of tokens appearing exactly once (0-1).
+        frequency: Token frequency table.
+    """
+
+    total_tokens: int = 0
+    unique_tokens: int = 0
+    ttr: float = 0.0
+    mattr: float = 0.0
+    mtld: float = 0.0
+    hapax_ratio: float = 0.0
+    frequency: Counter[str] = field(default_factory=Counter)
+
+
+def calculate_all(
+    tokens: Sequence[str],
+    window_size: int = 50,
+    threshold: float = 0.72,
+) -> LexicalMetrics:
+    """
+    Calculate every lexical diversity metric for a token sequence.
+
+    The frequency table is built once and shared by TTR, hapax ratio
+    and the unique token count.
+
+    Args:
+        tokens: Sequence of tokens.
+        window_size: Window size for MATTR.
+        threshold: TTR threshold for MTLD factor completion.
+
+    Returns:
+        LexicalMetrics for the tokens.
+    """
+    frequency = Counter(tokens)
+    return LexicalMetrics(
+        total_tokens=len(tokens),
+        unique_tokens=len(frequency),
+        ttr=calculate_ttr(tokens, frequency),
+        mattr=calculate_mattr(tokens, window_size),
+        mtld=calculate_mtld(tokens, threshold),
+        hapax_ratio=calculate_hapax_ratio(tokens, frequency),
+        frequency=frequency,
+    )
+
+
+def calculate_ttr(
+    tokens: Sequence[str],
+    frequency: Counter[str] | None = None,
+) -> float:
     """
     Calculate Type-Token Ratio.
 
     TTR = unique_tokens / total_tokens
 
     Args:
-        tokens: List of tokens.
+        tokens: Sequence of tokens.
+        frequency: Precomputed frequency table for the tokens, if any.
 
     Returns:
         TTR value (0-1). Returns 0 if no tokens.
@@ -23,21 +86,25 @@ def calculate_ttr(tokens: list[str]) -> float:
     if not tokens:
         return 0.0
 
-    unique = len(set(tokens))
+    unique = len(frequency) if frequency is not None else len(set(tokens))
     total = len(tokens)
 
     return unique / total
 
 
-def calculate_mattr(tokens: list[str], window_size: int = 50) -> float:
+def calculate_mattr(tokens: Sequence[str], window_size: int = 50) -> float:
     """
     Calculate Moving-Average Type-Token Ratio.
 
     Computes TTR for overlapping windows and averages the results.
     This provides a more stable measure than raw TTR for texts of different lengths.
 
+    The window's type count is updated incrementally as it slides (one
+    token enters and one leaves), so the cost is O(n) rather than
+    O(n * window_size).
+
     Args:
-        tokens: List of tokens.
+        tokens: Sequence of tokens.
         window_size: Size of sliding window (default: 50).
 
     Returns:
@@ -50,19 +117,35 @@ def calculate_mattr(tokens: list[str], window_size: int = 50) -> float:
         # Fall back to TTR if not enough tokens
         return calculate_ttr(tokens)
 
-    ttr_values: list[float] = []
+    counts = Counter(tokens[:window_size])
+    types = len(counts)
+    type_total = types
+
+    # Slide window through tokens, tracking the number of types
+    for i in range(window_size, len(tokens)):
+        leaving = tokens[i - window_size]
+        remaining = counts[leaving] - 1
+        if remaining:
+            counts[leaving] = remaining
+        else:
+            del counts[leaving]
+            types -= 1
 
-    # Slide window through tokens
-    for i in range(len(tokens) - window_size + 1):
-        window = tokens[i : i + window_size]
-        window_ttr = calculate_ttr(window)
-        ttr_values.append(window_ttr)
+        entering = tokens[i]
+        if entering in counts:
+            counts[entering] += 1
+        else:
+            counts[entering] = 1
+            types += 1
 
-    # Average all window TTRs
-    return sum(ttr_values) / len(ttr_values) if ttr_values else 0.0
+        type_total += types
 
+    # Average all window TTRs (every window has window_size tokens)
+    windows = len(tokens) - window_size + 1
+    return type_total / (windows * window_size)
 
-def calculate_mtld(tokens: list[str], threshold: float = 0.72) -> float:
+
+def calculate_mtld(tokens: Sequence[str], threshold: float = 0.72) -> float:
     """
     Calculate Measure of Textual Lexical Diversity (MTLD).
 
@@ -72,7 +155,7 @@ def calculate_mtld(tokens: list[str], threshold: float = 0.72) -> float:
     - Average the two directions
 
     Args:
-        tokens: List of tokens.
+        tokens: Sequence of tokens.
         threshold: TTR threshold for factor completion (default: 0.72).
 
     Returns:
@@ -89,20 +172,23 @@ def calculate_mtld(tokens: list[str], threshold: float = 0.72) -> float:
     # Calculate forward MTLD
     forward_mtld = _mtld_directional(tokens, threshold)
 
-    # Calculate reverse MTLD
-    reverse_mtld = _mtld_directional(list(reversed(tokens)), threshold)
+    # Calculate reverse MTLD (without copying the tokens)
+    reverse_mtld = _mtld_directional(tokens, threshold, reverse=True)
 
     # Average both directions
     return (forward_mtld + reverse_mtld) / 2.0
 
 
-def _mtld_directional(tokens: list[str], threshold: float) -> float:
+def _mtld_directional(
+    tokens: Sequence[str], threshold: float, reverse: bool = False
+) -> float:
     """
     Calculate MTLD in one direction.
 
     Args:
-        tokens: List of tokens (in processing order).
+        tokens: Sequence of tokens.
         threshold: TTR threshold for factor completion.
+        reverse: Whether to process the tokens last to first.
 
     Returns:
         MTLD value for this direction.
@@ -114,7 +200,7 @@ def _mtld_directional(tokens: list[str], threshold: float) -> float:
     types: set[str] = set()
     token_count = 0
 
-    for token in tokens:
+    for token in reversed(tokens) if reverse else tokens:
         types.add(token)
         token_count += 1
 
@@ -144,7 +230,10 @@ def _mtld_directional(tokens: list[str], threshold: float) -> float:
         return float(len(tokens))
 
 
-def calculate_hapax_ratio(tokens: list[str]) -> float:
+def calculate_hapax_ratio(
+    tokens: Sequence[str],
+    frequency: Counter[str] | None = None,
+) -> float:
     """
     Calculate hapax legomena ratio.
 
@@ -152,7 +241,8 @@ def calculate_hapax_ratio(tokens: list[str]) -> float:
     Higher ratios indicate greater lexical richness.
 
     Args:
-        tokens: List of tokens.
+        tokens: Sequence of tokens.
+        frequency: Precomputed frequency table for the tokens, if any.
 
     Returns:
         Hapax ratio (0-1). Returns 0 if no tokens.
@@ -161,7 +251,8 @@ def calculate_hapax_ratio(tokens: list[str]) -> float:
         return 0.0
 
     # Count token frequencies
-    frequency = Counter(tokens)
+    if frequency is None:
+        frequency = Counter(tokens)
 
     # Count hapax legomena (frequency = 1)
     hapax_count = sum(1 for count in frequency.values() if count == 1)
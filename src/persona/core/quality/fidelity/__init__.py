@@ -21,9 +21,17 @@ Example:
     >>> print(f"Passed: {report.passed}")
 """
 
-from persona.core.quality.fidelity.constraints import ConstraintValidator
-from persona.core.quality.fidelity.content import ContentChecker
+from persona.core.quality.fidelity.constraints import (
+    ConstraintPlan,
+    ConstraintValidator,
+)
+from persona.core.quality.fidelity.content import (
+    ContentChecker,
+    ContentPlan,
+    KeywordMatcher,
+)
 from persona.core.quality.fidelity.dsl import ConstraintParser
+from persona.core.quality.fidelity.metric import FidelityMetric
 from persona.core.quality.fidelity.models import (
     FidelityConfig,
     FidelityReport,
@@ -31,15 +39,17 @@ from persona.core.quality.fidelity.models import (
     Severity,
     Violation,
 )
-from persona.core.quality.fidelity.schema import SchemaValidator
-from persona.core.quality.fidelity.scorer import FidelityScorer
+from persona.core.quality.fidelity.schema import SchemaPlan, SchemaValidator
+from persona.core.quality.fidelity.scorer import FidelityPlan, FidelityScorer
 from persona.core.quality.fidelity.style import StyleChecker
 
 __all__ = [
     # Core classes
     "FidelityScorer",
+    "FidelityPlan",
     "FidelityReport",
     "FidelityConfig",
+    "FidelityMetric",
     "PromptConstraints",
     "Violation",
     "Severity",
@@ -48,6 +58,11 @@ __all__ = [
     "ContentChecker",
     "ConstraintValidator",
     "StyleChecker",
+    # Compiled plans
+    "SchemaPlan",
+    "ContentPlan",
+    "ConstraintPlan",
+    "KeywordMatcher",
     # DSL parser
     "ConstraintParser",
 ]
@@ -5,63 +5,66 @@ This module validates that personas adhere to numeric constraints
 such as age ranges, item counts, and other quantitative requirements.
 """
 
+import re
 from typing import Any
 
 from persona.core.generation.parser import Persona
 from persona.core.quality.fidelity.models import PromptConstraints, Severity, Violation
 
+# First whole number in an age string such as "42 years old"
+_AGE_PATTERN = re.compile(r"\b(\d+)\b")
 
-class ConstraintValidator:
-    """
-    Validate numeric and range constraints.
 
-    Checks that personas adhere to quantitative requirements like
-    age ranges, minimum/maximum list lengths, etc.
-    """
+def _parse_age(value: Any) -> int | None:
+    """Parse age value to integer."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        match = _AGE_PATTERN.search(value)
+        if match:
+            return int(match.group(1))
+    return None
 
-    def validate(
-        self, persona: Persona, constraints: PromptConstraints
-    ) -> tuple[float, list[Violation]]:
-        """
-        Validate numeric constraints.
 
-        Args:
-            persona: Persona to validate.
-            constraints: Numeric constraints to check.
+def _get_age(persona: Persona) -> int | None:
+    """Extract age from persona, checking multiple possible locations."""
+    # Check demographics.age
+    if persona.demographics and "age" in persona.demographics:
+        return _parse_age(persona.demographics["age"])
 
-        Returns:
-            Tuple of (score 0-1, list of violations).
-        """
-        violations: list[Violation] = []
+    # Check additional.age
+    if "age" in persona.additional:
+        return _parse_age(persona.additional["age"])
 
-        # Check age range
-        if constraints.age_range:
-            age_violations = self._check_age_range(persona, constraints)
-            violations.extend(age_violations)
+    return None
 
-        # Check goal count
-        if constraints.goal_count:
-            goal_violations = self._check_list_count(
-                persona.goals, "goals", constraints.goal_count
-            )
-            violations.extend(goal_violations)
 
-        # Check pain point count
-        if constraints.pain_point_count:
-            pain_violations = self._check_list_count(
-                persona.pain_points, "pain_points", constraints.pain_point_count
-            )
-            violations.extend(pain_violations)
+class ConstraintPlan:
+    """
+    Numeric checks compiled from a set of constraints.
 
-        # Check behaviour count
-        if constraints.behaviour_count:
-            behaviour_violations = self._check_list_count(
-                persona.behaviours, "behaviours", constraints.behaviour_count
-            )
-            violations.extend(behaviour_violations)
+    Only the active range checks are kept, so evaluating a persona
+    does no work for constraints that were not specified.
+    """
+
+    def __init__(self, constraints: PromptConstraints) -> None:
+        """
+        Compile numeric constraints.
 
-        # Calculate score
-        total_checks = sum(
+        Args:
+            constraints: Constraints to compile.
+        """
+        self.age_range = constraints.age_range
+        self.counts = [
+            (field_name, count_range)
+            for field_name, count_range in (
+                ("goals", constraints.goal_count),
+                ("pain_points", constraints.pain_point_count),
+                ("behaviours", constraints.behaviour_count),
+            )
+            if count_range
+        ]
+        self.total_checks = sum(
             1
             for c in [
                 constraints.age_range,
@@ -72,30 +75,41 @@ class ConstraintValidator:
             if c is not None
         )
 
-        if total_checks == 0:
-            return 1.0, violations
-
-        failed_checks = len(violations)
-        score = max(0.0, 1.0 - (failed_checks / total_checks))
+    def evaluate(self, persona: Persona) -> tuple[float, list[Violation]]:
+        """
+        Validate a persona.
 
-        return score, violations
+        Args:
+            persona: Persona to validate.
 
-    def _check_age_range(
-        self, persona: Persona, constraints: PromptConstraints
-    ) -> list[Violation]:
-        """Check that age is within specified range."""
+        Returns:
+            Tuple of (score 0-1, list of violations).
+        """
         violations: list[Violation] = []
 
-        if not constraints.age_range:
-            return violations
+        if self.age_range:
+            violations.extend(self._check_age_range(persona))
+
+        for field_name, count_range in self.counts:
+            violations.extend(
+                self._check_list_count(
+                    getattr(persona, field_name), field_name, count_range
+                )
+            )
+
+        if self.total_checks == 0:
+            return 1.0, violations
 
-        min_age, max_age = constraints.age_range
+        score = max(0.0, 1.0 - (len(violations) / self.total_checks))
+        return score, violations
 
-        # Get age from persona
-        age = self._get_age(persona)
+    def _check_age_range(self, persona: Persona) -> list[Violation]:
+        """Check that age is within specified range."""
+        min_age, max_age = self.age_range
+        age = _get_age(persona)
 
         if age is None:
-            violations.append(
+            return [
                 Violation(
                     dimension="constraint",
                     field="age",
@@ -104,12 +118,10 @@ class ConstraintValidator:
                     expected=f"Age between {min_age} and {max_age}",
                     actual="missing",
                 )
-            )
-            return violations
+            ]
 
-        # Check range
         if age < min_age or age > max_age:
-            violations.append(
+            return [
                 Violation(
                     dimension="constraint",
                     field="age",
@@ -118,21 +130,19 @@ class ConstraintValidator:
                     expected=f"Between {min_age} and {max_age}",
                     actual=str(age),
                 )
-            )
-
-        return violations
+            ]
+        return []
 
+    @staticmethod
     def _check_list_count(
-        self, items: list[Any] | None, field_name: str, count_range: tuple[int, int]
+        items: list[Any] | None, field_name: str, count_range: tuple[int, int]
     ) -> list[Violation]:
         """Check that a list has the required number of items."""
-        violations: list[Violation] = []
-
         min_count, max_count = count_range
         actual_count = len(items) if items else 0
 
         if actual_count < min_count:
-            violations.append(
+            return [
                 Violation(
                     dimension="constraint",
                     field=field_name,
@@ -141,9 +151,9 @@ class ConstraintValidator:
                     expected=f"At least {min_count} items",
                     actual=f"{actual_count} items",
                 )
-            )
-        elif actual_count > max_count:
-            violations.append(
+            ]
+        if actual_count > max_count:
+            return [
                 Violation(
                     dimension="constraint",
                     field=field_name,
@@ -152,33 +162,41 @@ class ConstraintValidator:
                     expected=f"At most {max_count} items",
                     actual=f"{actual_count} items",
                 )
-            )
+            ]
+        return []
+
+
+class ConstraintValidator:
+    """
+    Validate numeric and range constraints.
+
+    Checks that personas adhere to quantitative requirements like
+    age ranges, minimum/maximum list lengths, etc.
+    """
+
+    def compile(self, constraints: PromptConstraints) -> ConstraintPlan:
+        """
+        Compile constraints for repeated evaluation.
+
+        Args:
+            constraints: Numeric constraints to check.
+
+        Returns:
+            ConstraintPlan validating personas against the constraints.
+        """
+        return ConstraintPlan(constraints)
+
+    def validate(
+        self, persona: Persona, constraints: PromptConstraints
+    ) -> tuple[float, list[Violation]]:
+        """
+        Validate numeric constraints.
 
-        return violations
-
-    def _get_age(self, persona: Persona) -> int | None:
-        """Extract age from persona, checking multiple possible locations."""
-        # Check demographics.age
-        if persona.demographics and "age" in persona.demographics:
-            age_value = persona.demographics["age"]
-            return self._parse_age(age_value)
-
-        # Check additional.age
-        if "age" in persona.additional:
-            age_value = persona.additional["age"]
-            return self._parse_age(age_value)
-
-        return None
-
-    def _parse_age(self, value: Any) -> int | None:
-        """Parse age value to integer."""
-        if isinstance(value, int):
-            return value
-        if isinstance(value, str):
-            # Try to extract number from string like "42" or "42 years old"
-            import re
-
-            match = re.search(r"\b(\d+)\b", value)
-            if match:
-                return int(match.group(1))
-        return None
+        Args:
+            persona: Persona to validate.
+            constraints: Numeric constraints to check.
+
+        Returns:
+            Tuple of (score 0-1, list of violations).
+        """
+        return self.compile(constraints).evaluate(persona)
@@ -5,74 +5,153 @@ This module validates that personas contain required keywords, themes,
 and content elements as specified in the prompt.
 """
 
+import re
+from typing import Any
 
 from persona.core.generation.parser import Persona
 from persona.core.quality.fidelity.models import PromptConstraints, Severity, Violation
+from persona.core.quality.fidelity.schema import get_field_value, split_field_path
 
 
-class ContentChecker:
+class KeywordMatcher:
     """
-    Check content requirements and presence of keywords/themes.
+    Case-insensitive substring matcher for a fixed keyword list.
 
-    Uses simple string matching and presence checks to validate
-    that required content elements appear in the persona.
+    All keywords are found in a single scan of the text rather than
+    one scan per keyword. Matching is equivalent to checking
+    keyword.lower() in text.lower() for each keyword.
     """
 
-    def check(
-        self, persona: Persona, constraints: PromptConstraints
-    ) -> tuple[float, list[Violation]]:
+    def __init__(self, keywords: list[str]) -> None:
         """
-        Check content requirements.
+        Compile a keyword list.
 
         Args:
-            persona: Persona to check.
-            constraints: Content constraints.
+            keywords: Keywords to look for, in reporting order.
+        """
+        self.keywords = list(keywords)
+        self._lowered = [keyword.lower() for keyword in self.keywords]
+        distinct = sorted({k for k in self._lowered if k}, key=len, reverse=True)
+        # A lookahead reports a match at every position; the longest
+        # alternative wins at each, and shorter keywords it contains are
+        # implied present
+        self._pattern = (
+            re.compile("(?=(" + "|".join(map(re.escape, distinct)) + "))")
+            if distinct
+            else None
+        )
+
+    def missing(self, text: str) -> list[str]:
+        """
+        Get the keywords that do not occur in a text.
+
+        Args:
+            text: Text to search (any case).
 
         Returns:
-            Tuple of (score 0-1, list of violations).
+            Missing keywords in their original form and order.
         """
-        violations: list[Violation] = []
+        if self._pattern is None:
+            return []
+
+        found = {match.group(1) for match in self._pattern.finditer(text.lower())}
+        return [
+            keyword
+            for keyword, lowered in zip(self.keywords, self._lowered, strict=True)
+            if lowered
+            and lowered not in found
+            and not any(lowered in match for match in found)
+        ]
+
+
+def _field_text(value: Any) -> str | None:
+    """Convert a field value to searchable text."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return " ".join(str(v) for v in value.values())
+    return str(value)
 
-        # Check occupation keywords
-        if constraints.occupation_keywords:
-            occ_violations = self._check_occupation_keywords(persona, constraints)
-            violations.extend(occ_violations)
 
-        # Check goal themes
-        if constraints.goal_themes:
-            goal_violations = self._check_goal_themes(persona, constraints)
-            violations.extend(goal_violations)
+def _get_occupation(persona: Persona) -> str | None:
+    """Extract occupation from persona demographics or additional fields."""
+    # Check demographics first
+    if persona.demographics and "occupation" in persona.demographics:
+        return str(persona.demographics["occupation"])
+
+    # Check additional fields
+    if "occupation" in persona.additional:
+        return str(persona.additional["occupation"])
+
+    return None
+
+
+class ContentPlan:
+    """
+    Content checks compiled from a set of constraints.
+
+    Keyword lists are lowered and compiled into KeywordMatchers and
+    field paths are split once, so each persona field is lowered and
+    scanned a single time.
+    """
 
-        # Check required keywords in specific fields
-        if constraints.required_keywords:
-            keyword_violations = self._check_required_keywords(persona, constraints)
-            violations.extend(keyword_violations)
+    def __init__(self, constraints: PromptConstraints) -> None:
+        """
+        Compile content constraints.
 
-        # Calculate score
-        total_checks = (
+        Args:
+            constraints: Constraints to compile.
+        """
+        self.occupation_keywords = list(constraints.occupation_keywords)
+        self.occupation = KeywordMatcher(constraints.occupation_keywords)
+        self.goal_themes = list(constraints.goal_themes)
+        self.themes = KeywordMatcher(constraints.goal_themes)
+        self.fields = [
+            (name, split_field_path(name), list(keywords), KeywordMatcher(keywords))
+            for name, keywords in constraints.required_keywords.items()
+        ]
+        self.total_checks = (
             len(constraints.occupation_keywords)
             + len(constraints.goal_themes)
             + sum(len(kws) for kws in constraints.required_keywords.values())
         )
 
-        if total_checks == 0:
-            return 1.0, violations
+    def evaluate(self, persona: Persona) -> tuple[float, list[Violation]]:
+        """
+        Check a persona.
 
-        failed_checks = len(violations)
-        score = max(0.0, 1.0 - (failed_checks / total_checks))
+        Args:
+            persona: Persona to check.
+
+        Returns:
+            Tuple of (score 0-1, list of violations).
+        """
+        violations: list[Violation] = []
 
+        if self.occupation_keywords:
+            violations.extend(self._check_occupation(persona))
+        if self.goal_themes:
+            violations.extend(self._check_goal_themes(persona))
+        for field_name, path, keywords, matcher in self.fields:
+            violations.extend(
+                self._check_field(persona, field_name, path, keywords, matcher)
+            )
+
+        if self.total_checks == 0:
+            return 1.0, violations
+
+        score = max(0.0, 1.0 - (len(violations) / self.total_checks))
         return score, violations
 
-    def _check_occupation_keywords(
-        self, persona: Persona, constraints: PromptConstraints
-    ) -> list[Violation]:
+    def _check_occupation(self, persona: Persona) -> list[Violation]:
         """Check that occupation contains required keywords."""
-        violations: list[Violation] = []
-
-        # Get occupation field
-        occupation = self._get_occupation(persona)
+        occupation = _get_occupation(persona)
         if not occupation:
-            violations.append(
+            return [
                 Violation(
                     dimension="content",
                     field="occupation",
@@ -81,149 +160,127 @@ class ContentChecker:
                     expected="occupation with keywords",
                     actual="empty",
                 )
-            )
-            return violations
-
-        # Check keywords
-        occupation_lower = occupation.lower()
-        missing_keywords = []
-
-        for keyword in constraints.occupation_keywords:
-            if keyword.lower() not in occupation_lower:
-                missing_keywords.append(keyword)
+            ]
 
+        missing_keywords = self.occupation.missing(occupation)
         if missing_keywords:
-            violations.append(
+            return [
                 Violation(
                     dimension="content",
                     field="occupation",
-                    description=f"Occupation missing required keywords: {', '.join(missing_keywords)}",
+                    description=(
+                        "Occupation missing required keywords: "
+                        f"{', '.join(missing_keywords)}"
+                    ),
                     severity=Severity.MEDIUM,
-                    expected=f"Contains: {', '.join(constraints.occupation_keywords)}",
+                    expected=f"Contains: {', '.join(self.occupation_keywords)}",
                     actual=occupation,
                 )
-            )
+            ]
+        return []
 
-        return violations
-
-    def _check_goal_themes(
-        self, persona: Persona, constraints: PromptConstraints
-    ) -> list[Violation]:
+    def _check_goal_themes(self, persona: Persona) -> list[Violation]:
         """Check that goals contain required themes."""
-        violations: list[Violation] = []
-
         if not persona.goals:
-            violations.append(
+            return [
                 Violation(
                     dimension="content",
                     field="goals",
                     description="Goals field is empty",
                     severity=Severity.HIGH,
-                    expected=f"Goals containing themes: {', '.join(constraints.goal_themes)}",
+                    expected=f"Goals containing themes: {', '.join(self.goal_themes)}",
                     actual="empty",
                 )
-            )
-            return violations
+            ]
 
         # Combine all goals into searchable text
-        goals_text = " ".join(persona.goals).lower()
-
-        # Check each theme
-        missing_themes = []
-        for theme in constraints.goal_themes:
-            if theme.lower() not in goals_text:
-                missing_themes.append(theme)
-
+        missing_themes = self.themes.missing(" ".join(persona.goals))
         if missing_themes:
-            violations.append(
+            return [
                 Violation(
                     dimension="content",
                     field="goals",
-                    description=f"Goals missing required themes: {', '.join(missing_themes)}",
+                    description=(
+                        f"Goals missing required themes: {', '.join(missing_themes)}"
+                    ),
                     severity=Severity.MEDIUM,
-                    expected=f"Contains themes: {', '.join(constraints.goal_themes)}",
+                    expected=f"Contains themes: {', '.join(self.goal_themes)}",
                     actual=f"Found {len(persona.goals)} goals without all themes",
                 )
-            )
-
-        return violations
-
-    def _check_required_keywords(
-        self, persona: Persona, constraints: PromptConstraints
+            ]
+        return []
+
+    @staticmethod
+    def _check_field(
+        persona: Persona,
+        field_name: str,
+        path: tuple[str, str | None],
+        keywords: list[str],
+        matcher: KeywordMatcher,
     ) -> list[Violation]:
-        """Check that specific fields contain required keywords."""
-        violations: list[Violation] = []
-
-        for field_name, keywords in constraints.required_keywords.items():
-            # Get field value
-            value = self._get_field_text(persona, field_name)
-            if not value:
-                violations.append(
-                    Violation(
-                        dimension="content",
-                        field=field_name,
-                        description=f"Field '{field_name}' is empty",
-                        severity=Severity.HIGH,
-                        expected=f"Contains keywords: {', '.join(keywords)}",
-                        actual="empty",
-                    )
+        """Check that a field contains required keywords."""
+        value = _field_text(get_field_value(persona, path))
+        if not value:
+            return [
+                Violation(
+                    dimension="content",
+                    field=field_name,
+                    description=f"Field '{field_name}' is empty",
+                    severity=Severity.HIGH,
+                    expected=f"Contains keywords: {', '.join(keywords)}",
+                    actual="empty",
                 )
-                continue
-
-            # Check keywords
-            value_lower = value.lower()
-            missing_keywords = []
-
-            for keyword in keywords:
-                if keyword.lower() not in value_lower:
-                    missing_keywords.append(keyword)
-
-            if missing_keywords:
-                violations.append(
-                    Violation(
-                        dimension="content",
-                        field=field_name,
-                        description=f"Field '{field_name}' missing keywords: {', '.join(missing_keywords)}",
-                        severity=Severity.MEDIUM,
-                        expected=f"Contains: {', '.join(keywords)}",
-                        actual=f"Missing: {', '.join(missing_keywords)}",
-                    )
+            ]
+
+        missing_keywords = matcher.missing(value)
+        if missing_keywords:
+            return [
+                Violation(
+                    dimension="content",
+                    field=field_name,
+                    description=(
+                        f"Field '{field_name}' missing keywords: "
+                        f"{', '.join(missing_keywords)}"
+                    ),
+                    severity=Severity.MEDIUM,
+                    expected=f"Contains: {', '.join(keywords)}",
+                    actual=f"Missing: {', '.join(missing_keywords)}",
                 )
+            ]
+        return []
+
+
+class ContentChecker:
+    """
+    Check content requirements and presence of keywords/themes.
 
-        return violations
+    Uses simple string matching and presence checks to validate
+    that required content elements appear in the persona.
+    """
 
-    def _get_occupation(self, persona: Persona) -> str | None:
-        """Extract occupation from persona demographics or additional fields."""
-        # Check demographics first
-        if persona.demographics and "occupation" in persona.demographics:
-            return str(persona.demographics["occupation"])
+    def compile(self, constraints: PromptConstraints) -> ContentPlan:
+        """
+        Compile constraints for repeated evaluation.
 
-        # Check additional fields
-        if "occupation" in persona.additional:
-            return str(persona.additional["occupation"])
+        Args:
+            constraints: Content constraints.
 
-        return None
+        Returns:
+            ContentPlan checking personas against the constraints.
+        """
+        return ContentPlan(constraints)
 
-    def _get_field_text(self, persona: Persona, field_name: str) -> str | None:
-        """Get text content from a field for keyword searching."""
-        # Handle nested fields like "demographics.age"
-        if "." in field_name:
-            parts = field_name.split(".", 1)
-            parent = getattr(persona, parts[0], None)
-            if isinstance(parent, dict):
-                value = parent.get(parts[1])
-            else:
-                return None
-        else:
-            value = getattr(persona, field_name, None)
-
-        # Convert to searchable text
-        if value is None:
-            return None
-        if isinstance(value, str):
-            return value
-        if isinstance(value, list):
-            return " ".join(str(item) for item in value)
-        if isinstance(value, dict):
-            return " ".join(str(v) for v in value.values())
-        return str(value)
+    def check(
+        self, persona: Persona, constraints: PromptConstraints
+    ) -> tuple[float, list[Violation]]:
+        """
+        Check content requirements.
+
+        Args:
+            persona: Persona to check.
+            constraints: Content constraints.
+
+        Returns:
+            Tuple of (score 0-1, list of violations).
+        """
+        return self.compile(constraints).evaluate(persona)
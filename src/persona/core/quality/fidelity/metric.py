@@ -0,0 +1,115 @@
+"""
+Prompt fidelity as a quality metric.
+
+This module provides the FidelityMetric class that adapts a compiled
+FidelityPlan to the QualityMetric interface, so fidelity scoring can run
+alongside other metrics in a MetricEngine.
+"""
+
+from typing import TYPE_CHECKING
+
+from persona.core.generation.parser import Persona
+from persona.core.quality.base import QualityMetric
+from persona.core.quality.config import QualityConfig
+from persona.core.quality.fidelity.models import FidelityConfig, PromptConstraints
+from persona.core.quality.fidelity.scorer import FidelityScorer
+from persona.core.quality.models import DimensionScore
+
+if TYPE_CHECKING:
+    from persona.core.evidence.linker import EvidenceReport
+
+
+class FidelityMetric(QualityMetric):
+    """
+    Prompt fidelity quality metric.
+
+    Compiles the constraints once and scores each persona from 0 to 100
+    (FidelityReport.overall_score scaled), listing each violation as an
+    issue.
+
+    Example:
+        constraints = PromptConstraints(required_fields=["name", "goals"])
+        metric = FidelityMetric(constraints=constraints)
+        score = metric.evaluate(persona)
+    """
+
+    def __init__(
+        self,
+        constraints: PromptConstraints,
+        config: QualityConfig | None = None,
+        fidelity_config: FidelityConfig | None = None,
+    ) -> None:
+        """
+        Initialise the fidelity metric.
+
+        Args:
+            constraints: Constraints to validate personas against.
+            config: Quality configuration with weights and thresholds.
+            fidelity_config: Fidelity configuration (default: FidelityConfig()).
+        """
+        super().__init__(config)
+        self.fidelity_config = fidelity_config or FidelityConfig()
+        self.plan = FidelityScorer(self.fidelity_config).compile(constraints)
+
+    @property
+    def name(self) -> str:
+        """Return the unique name of this metric."""
+        return "fidelity"
+
+    @property
+    def description(self) -> str:
+        """Return a human-readable description."""
+        return "Adherence to prompt constraints and style"
+
+    @property
+    def requires_source_data(self) -> bool:
+        """Indicate that this metric does not require source data."""
+        return False
+
+    @property
+    def requires_other_personas(self) -> bool:
+        """Indicate that this metric does not require other personas."""
+        return False
+
+    @property
+    def requires_evidence_report(self) -> bool:
+        """Indicate that this metric does not require evidence report."""
+        return False
+
+    @property
+    def requires_llm(self) -> bool:
+        """Indicate whether style checks call an LLM judge."""
+        config = self.fidelity_config
+        return config.check_style and config.use_llm_judge
+
+    def evaluate(
+        self,
+        persona: Persona,
+        source_data: str | None = None,
+        other_personas: list[Persona] | None = None,
+        evidence_report: "EvidenceReport | None" = None,
+    ) -> DimensionScore:
+        """
+        Evaluate persona fidelity.
+
+        Args:
+            persona: The persona to evaluate.
+            source_data: Not used by this metric.
+            other_personas: Not used by this metric.
+            evidence_report: Not used by this metric.
+
+        Returns:
+            DimensionScore with the fidelity report in its details.
+        """
+        report = self.plan.score(persona)
+
+        return DimensionScore(
+            dimension=self.name,
+            score=report.overall_score * 100,
+            weight=self.weight,
+            issues=[
+                f"{violation.dimension}: {violation.description}"
+                for violation in report.violations
+            ],
+            details=report.to_dict(),
+        )
@@ -10,57 +10,112 @@ from typing import Any
 from persona.core.generation.parser import Persona
 from persona.core.quality.fidelity.models import PromptConstraints, Severity, Violation
 
-
-class SchemaValidator:
+# Python types accepted for each constraint type name
+TYPE_MAP: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "str": str,
+    "integer": int,
+    "int": int,
+    "float": float,
+    "number": (int, float),
+    "list": list,
+    "array": list,
+    "dict": dict,
+    "object": dict,
+    "boolean": bool,
+    "bool": bool,
+}
+
+
+def split_field_path(field_name: str) -> tuple[str, str | None]:
     """
-    Validate structural schema compliance.
+    Split a field name into an attribute and an optional nested key.
 
-    Checks that personas have required fields populated with correct types.
+    Args:
+        field_name: Field name such as "goals" or "demographics.age".
+
+    Returns:
+        Tuple of (attribute name, nested key or None).
     """
+    if "." in field_name:
+        attribute, key = field_name.split(".", 1)
+        return attribute, key
+    return field_name, None
 
-    def validate(
-        self, persona: Persona, constraints: PromptConstraints
-    ) -> tuple[float, list[Violation]]:
-        """
-        Validate structural constraints.
 
-        Args:
-            persona: Persona to validate.
-            constraints: Structural constraints to check.
+def get_field_value(persona: Persona, path: tuple[str, str | None]) -> Any:
+    """
+    Get a persona field value from a split field path.
 
-        Returns:
-            Tuple of (score 0-1, list of violations).
-        """
-        violations: list[Violation] = []
+    Args:
+        persona: Persona to read.
+        path: Result of split_field_path().
 
-        # Check required fields
-        missing_fields = self._check_required_fields(persona, constraints)
-        violations.extend(missing_fields)
+    Returns:
+        Field value, or None if it is missing.
+    """
+    attribute, key = path
+    value = getattr(persona, attribute, None)
+    if key is None:
+        return value
+    if isinstance(value, dict):
+        return value.get(key)
+    return None
+
+
+def _has_content(value: Any) -> bool:
+    """Check if a value has meaningful content."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return bool(value.strip())
+    if isinstance(value, (list, dict)):
+        return len(value) > 0
+    return True
+
+
+class SchemaPlan:
+    """
+    Structural checks compiled from a set of constraints.
 
-        # Check field types
-        type_violations = self._check_field_types(persona, constraints)
-        violations.extend(type_violations)
+    Field paths are split and type names resolved once, so evaluating
+    many personas only reads fields and runs isinstance checks.
+    """
 
-        # Calculate score
-        if not constraints.required_fields and not constraints.field_types:
-            return 1.0, violations
+    def __init__(self, constraints: PromptConstraints) -> None:
+        """
+        Compile structural constraints.
 
-        total_checks = len(constraints.required_fields) + len(constraints.field_types)
-        failed_checks = len(violations)
-        score = (
-            max(0.0, 1.0 - (failed_checks / total_checks)) if total_checks > 0 else 1.0
+        Args:
+            constraints: Constraints to compile.
+        """
+        self.required = [
+            (name, split_field_path(name)) for name in constraints.required_fields
+        ]
+        # Unknown type names are always valid, so they are dropped here
+        self.types = [
+            (name, split_field_path(name), expected, TYPE_MAP[expected.lower()])
+            for name, expected in constraints.field_types.items()
+            if expected.lower() in TYPE_MAP
+        ]
+        self.total_checks = len(constraints.required_fields) + len(
+            constraints.field_types
         )
 
-        return score, violations
+    def evaluate(self, persona: Persona) -> tuple[float, list[Violation]]:
+        """
+        Validate a persona.
 
-    def _check_required_fields(
-        self, persona: Persona, constraints: PromptConstraints
-    ) -> list[Violation]:
-        """Check that required fields are present and non-empty."""
+        Args:
+            persona: Persona to validate.
+
+        Returns:
+            Tuple of (score 0-1, list of violations).
+        """
         violations: list[Violation] = []
 
-        for field_name in constraints.required_fields:
-            value = self._get_persona_field(persona, field_name)
+        for field_name, path in self.required:
+            value = get_field_value(persona, path)
 
             if value is None:
                 violations.append(
@@ -73,7 +128,7 @@ class SchemaValidator:
                         actual="missing",
                     )
                 )
-            elif not self._has_content(value):
+            elif not _has_content(value):
                 violations.append(
                     Violation(
                         dimension="structure",
@@ -85,23 +140,11 @@ class SchemaValidator:
                     )
                 )
 
-        return violations
-
-    def _check_field_types(
-        self, persona: Persona, constraints: PromptConstraints
-    ) -> list[Violation]:
-        """Check that fields have correct types."""
-        violations: list[Violation] = []
-
-        for field_name, expected_type in constraints.field_types.items():
-            value = self._get_persona_field(persona, field_name)
+        for field_name, path, expected_type, python_type in self.types:
+            value = get_field_value(persona, path)
 
-            if value is None:
-                continue  # Missing fields handled by required_fields check
-
-            # Validate type
-            if not self._check_type(value, expected_type):
-                actual_type = type(value).__name__
+            # Missing fields are handled by the required fields check
+            if value is not None and not isinstance(value, python_type):
                 violations.append(
                     Violation(
                         dimension="structure",
@@ -109,60 +152,47 @@ class SchemaValidator:
                         description=f"Field '{field_name}' has wrong type",
                         severity=Severity.HIGH,
                         expected=expected_type,
-                        actual=actual_type,
+                        actual=type(value).__name__,
                     )
                 )
 
-        return violations
+        if self.total_checks == 0:
+            return 1.0, violations
 
-    def _get_persona_field(self, persona: Persona, field_name: str) -> Any:
+        score = max(0.0, 1.0 - (len(violations) / self.total_checks))
+        return score, violations
+
+
+class SchemaValidator:
+    """
+    Validate structural schema compliance.
+
+    Checks that personas have required fields populated with correct types.
+    """
+
+    def compile(self, constraints: PromptConstraints) -> SchemaPlan:
         """
-        Get a field value from persona, checking both direct attributes and nested paths.
+        Compile constraints for repeated evaluation.
+
+        Args:
+            constraints: Structural constraints to check.
 
-        Supports nested access like "demographics.age".
+        Returns:
+            SchemaPlan evaluating personas against the constraints.
         """
-        if "." in field_name:
-            parts = field_name.split(".", 1)
-            parent = getattr(persona, parts[0], None)
-            if isinstance(parent, dict):
-                return parent.get(parts[1])
-            return None
-        return getattr(persona, field_name, None)
-
-    def _has_content(self, value: Any) -> bool:
-        """Check if a value has meaningful content."""
-        if value is None:
-            return False
-        if isinstance(value, str):
-            return bool(value.strip())
-        if isinstance(value, (list, dict)):
-            return len(value) > 0
-        return True
-
-    def _check_type(self, value: Any, expected_type: str) -> bool:
+        return SchemaPlan(constraints)
+
+    def validate(
+        self, persona: Persona, constraints: PromptConstraints
+    ) -> tuple[float, list[Violation]]:
         """
-        Check if value matches expected type.
+        Validate structural constraints.
+
+        Args:
+            persona: Persona to validate.
+            constraints: Structural constraints to check.
 
-        Supported types: string, integer, float, list, dict, boolean
+        Returns:
+            Tuple of (score 0-1, list of violations).
         """
-        type_map = {
-            "string": str,
-            "str": str,
-            "integer": int,
-            "int": int,
-            "float": float,
-            "number": (int, float),
-            "list": list,
-            "array": list,
-            "dict": dict,
-            "object": dict,
-            "boolean": bool,
-            "bool": bool,
-        }
-
-        expected_python_type = type_map.get(expected_type.lower())
-        if expected_python_type is None:
-            # Unknown type, assume valid
-            return True
-
-        return isinstance(value, expected_python_type)
+        return self.compile(constraints).evaluate(persona)
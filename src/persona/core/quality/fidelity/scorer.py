@@ -5,55 +5,86 @@ This module coordinates all fidelity checks and produces
 comprehensive fidelity reports for personas.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any
 
 from persona.core.generation.parser import Persona
-from persona.core.quality.fidelity.constraints import ConstraintValidator
-from persona.core.quality.fidelity.content import ContentChecker
+from persona.core.quality.fidelity.constraints import (
+    ConstraintPlan,
+    ConstraintValidator,
+)
+from persona.core.quality.fidelity.content import ContentChecker, ContentPlan
 from persona.core.quality.fidelity.models import (
     FidelityConfig,
     FidelityReport,
     PromptConstraints,
     Violation,
 )
-from persona.core.quality.fidelity.schema import SchemaValidator
+from persona.core.quality.fidelity.schema import SchemaPlan, SchemaValidator
 from persona.core.quality.fidelity.style import StyleChecker
 
+# Minimum batch size spread across worker processes when max_workers > 1
+PARALLEL_MIN_PERSONAS = 64
 
-class FidelityScorer:
+# Weight of each dimension in the overall score
+DIMENSION_WEIGHTS = {
+    "structure": 0.35,
+    "content": 0.25,
+    "constraint": 0.25,
+    "style": 0.15,
+}
+
+
+class FidelityPlan:
     """
-    Orchestrate fidelity scoring across all dimensions.
+    Fidelity checks compiled from a configuration and constraints.
 
-    Coordinates structural, content, constraint, and style checks
-    to produce comprehensive fidelity reports.
+    Compiling once and evaluating many personas avoids re-resolving
+    field paths, keyword lists and type names for every persona. Plans
+    are picklable, so batches can be scored in worker processes.
+
+    Example:
+        plan = FidelityScorer(config).compile(constraints)
+        reports = [plan.score(persona) for persona in personas]
     """
 
-    def __init__(self, config: FidelityConfig | None = None):
+    def __init__(
+        self,
+        config: FidelityConfig,
+        constraints: PromptConstraints,
+        style_checker: StyleChecker,
+        schema: SchemaPlan,
+        content: ContentPlan,
+        constraint: ConstraintPlan,
+    ) -> None:
         """
-        Initialise the fidelity scorer.
+        Initialise the plan from compiled dimension checks.
 
         Args:
-            config: Fidelity configuration. Uses defaults if not provided.
+            config: Fidelity configuration.
+            constraints: Constraints the plan was compiled from.
+            style_checker: Style checker (style checks are not compiled).
+            schema: Compiled structural checks.
+            content: Compiled content checks.
+            constraint: Compiled numeric checks.
         """
-        self.config = config or FidelityConfig()
-
-        # Initialise validators
-        self.schema_validator = SchemaValidator()
-        self.content_checker = ContentChecker()
-        self.constraint_validator = ConstraintValidator()
-        self.style_checker = StyleChecker(self.config)
+        self.config = config
+        self.constraints = constraints
+        self.style_checker = style_checker
+        self.schema = schema
+        self.content = content
+        self.constraint = constraint
 
     def score(
-        self,
-        persona: Persona,
-        constraints: PromptConstraints,
-        original_prompt: str | None = None,
+        self, persona: Persona, original_prompt: str | None = None
     ) -> FidelityReport:
         """
-        Score persona fidelity against constraints.
+        Score a persona.
 
         Args:
             persona: Persona to score.
-            constraints: Constraints to validate against.
             original_prompt: Original prompt text for context (optional).
 
         Returns:
@@ -61,58 +92,25 @@ class FidelityScorer:
         """
         all_violations: list[Violation] = []
         scores: dict[str, float] = {}
-        details: dict[str, any] = {}
-
-        # Run structural validation
-        if self.config.check_structure:
-            structure_score, structure_violations = self.schema_validator.validate(
-                persona, constraints
-            )
-            scores["structure"] = structure_score
-            all_violations.extend(structure_violations)
-            details["structure"] = {
-                "violations": len(structure_violations),
-                "checked": True,
-            }
-        else:
-            scores["structure"] = 1.0
-            details["structure"] = {"checked": False}
+        details: dict[str, Any] = {}
 
-        # Run content validation
-        if self.config.check_content:
-            content_score, content_violations = self.content_checker.check(
-                persona, constraints
-            )
-            scores["content"] = content_score
-            all_violations.extend(content_violations)
-            details["content"] = {
-                "violations": len(content_violations),
-                "checked": True,
-            }
-        else:
-            scores["content"] = 1.0
-            details["content"] = {"checked": False}
-
-        # Run constraint validation
-        if self.config.check_constraints:
-            (
-                constraint_score,
-                constraint_violations,
-            ) = self.constraint_validator.validate(persona, constraints)
-            scores["constraint"] = constraint_score
-            all_violations.extend(constraint_violations)
-            details["constraint"] = {
-                "violations": len(constraint_violations),
-                "checked": True,
-            }
-        else:
-            scores["constraint"] = 1.0
-            details["constraint"] = {"checked": False}
+        checks = (
+            ("structure", self.config.check_structure, self.schema.evaluate),
+            ("content", self.config.check_content, self.content.evaluate),
+            ("constraint", self.config.check_constraints, self.constraint.evaluate),
+        )
+        for dimension, enabled, evaluate in checks:
+            if enabled:
+                scores[dimension], violations = evaluate(persona)
+                all_violations.extend(violations)
+                details[dimension] = {"violations": len(violations), "checked": True}
+            else:
+                scores[dimension] = 1.0
+                details[dimension] = {"checked": False}
 
-        # Run style validation
         if self.config.check_style:
             style_score, style_violations = self.style_checker.check(
-                persona, constraints, original_prompt
+                persona, self.constraints, original_prompt
             )
             scores["style"] = style_score
             all_violations.extend(style_violations)
@@ -126,9 +124,8 @@ class FidelityScorer:
             details["style"] = {"checked": False}
 
         # Calculate overall score (weighted average)
-        overall_score = self._calculate_overall_score(scores)
+        overall_score = sum(scores[dim] * DIMENSION_WEIGHTS[dim] for dim in scores)
 
-        # Determine if passed
         # Pass if overall score >= 0.6 and no critical violations
         passed = overall_score >= 0.6 and not any(
             v.severity.value == "critical" for v in all_violations
@@ -147,28 +144,139 @@ class FidelityScorer:
             details=details,
         )
 
-    def _calculate_overall_score(self, scores: dict[str, float]) -> float:
+    def score_batch(
+        self,
+        personas: list[Persona],
+        original_prompt: str | None = None,
+        max_workers: int | None = 1,
+    ) -> list[FidelityReport]:
+        """
+        Score many personas.
+
+        Personas are scored in-process by default; scoring takes well
+        under a millisecond per persona, so starting worker processes
+        rarely pays off. With max_workers above 1, batches of at least
+        PARALLEL_MIN_PERSONAS are scored across a process pool. Reports
+        are returned in input order either way.
+
+        Args:
+            personas: Personas to score.
+            original_prompt: Original prompt text for context (optional).
+            max_workers: Maximum worker processes (default: 1, in-process;
+                None uses the CPU count).
+
+        Returns:
+            FidelityReport for each persona.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        workers = max(1, min(len(personas), max_workers))
+
+        if workers == 1 or len(personas) < PARALLEL_MIN_PERSONAS:
+            return [self.score(persona, original_prompt) for persona in personas]
+
+        chunksize = max(1, len(personas) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    partial(_score_persona, plan=self, original_prompt=original_prompt),
+                    personas,
+                    chunksize=chunksize,
+                )
+            )
+
+
+def _score_persona(
+    persona: Persona, plan: FidelityPlan, original_prompt: str | None
+) -> FidelityReport:
+    """Score one persona with a plan (runs in worker processes)."""
+    return plan.score(persona, original_prompt)
+
+
+class FidelityScorer:
+    """
+    Orchestrate fidelity scoring across all dimensions.
+
+    Coordinates structural, content, constraint, and style checks
+    to produce comprehensive fidelity reports.
+    """
+
+    def __init__(self, config: FidelityConfig | None = None):
+        """
+        Initialise the fidelity scorer.
+
+        Args:
+            config: Fidelity configuration. Uses defaults if not provided.
+        """
+        self.config = config or FidelityConfig()
+
+        # Initialise validators
+        self.schema_validator = SchemaValidator()
+        self.content_checker = ContentChecker()
+        self.constraint_validator = ConstraintValidator()
+        self.style_checker = StyleChecker(self.config)
+
+    def compile(self, constraints: PromptConstraints) -> FidelityPlan:
+        """
+        Compile constraints for scoring many personas.
+
+        Args:
+            constraints: Constraints to validate against.
+
+        Returns:
+            FidelityPlan scoring personas against the constraints.
+        """
+        return FidelityPlan(
+            config=self.config,
+            constraints=constraints,
+            style_checker=self.style_checker,
+            schema=self.schema_validator.compile(constraints),
+            content=self.content_checker.compile(constraints),
+            constraint=self.constraint_validator.compile(constraints),
+        )
+
+    def score(
+        self,
+        persona: Persona,
+        constraints: PromptConstraints,
+        original_prompt: str | None = None,
+    ) -> FidelityReport:
+        """
+        Score persona fidelity against constraints.
+
+        Args:
+            persona: Persona to score.
+            constraints: Constraints to validate against.
+            original_prompt: Original prompt text for context (optional).
+
+        Returns:
+            FidelityReport with comprehensive assessment.
+        """
+        return self.compile(constraints).score(persona, original_prompt)
+
+    def score_batch(
+        self,
+        personas: list[Persona],
+        constraints: PromptConstraints,
+        original_prompt: str | None = None,
+        max_workers: int | None = 1,
+    ) -> list[FidelityReport]:
         """
-        Calculate weighted overall score.
+        Score many personas against the same constraints.
 
-        Weights:
-        - Structure: 35% (most critical)
-        - Content: 25% (important)
-        - Constraint: 25% (important)
-        - Style: 15% (least critical)
+        The constraints are compiled once for the whole batch (see
+        FidelityPlan.score_batch).
 
         Args:
-            scores: Dictionary of dimension scores.
+            personas: Personas to score.
+            constraints: Constraints to validate against.
+            original_prompt: Original prompt text for context (optional).
+            max_workers: Maximum worker processes (default: 1, in-process;
+                None uses the CPU count).
 
         Returns:
-            Weighted overall score (0-1).
+            FidelityReport for each persona, in input order.
         """
-        weights = {
-            "structure": 0.35,
-            "content": 0.25,
-            "constraint": 0.25,
-            "style": 0.15,
-        }
-
-        weighted_sum = sum(scores[dim] * weights[dim] for dim in scores)
-        return weighted_sum
+        return self.compile(constraints).score_batch(
+            personas, original_prompt, max_workers
+        )
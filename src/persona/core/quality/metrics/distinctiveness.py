@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 from persona.core.generation.parser import Persona
 from persona.core.quality.base import QualityMetric
 from persona.core.quality.config import QualityConfig
+from persona.core.quality.context import persona_text
 from persona.core.quality.models import DimensionScore
 
 if TYPE_CHECKING:
@@ -199,18 +200,8 @@ class DistinctivenessMetric(QualityMetric):
     def _estimate_similarity(self, p1: Persona, p2: Persona) -> float:
         """Estimate similarity when comparator is unavailable."""
         # Simple Jaccard similarity on goals and pain points
-        p1_items = set()
-        p2_items = set()
-
-        for goal in p1.goals or []:
-            p1_items.update(goal.lower().split())
-        for pain in p1.pain_points or []:
-            p1_items.update(pain.lower().split())
-
-        for goal in p2.goals or []:
-            p2_items.update(goal.lower().split())
-        for pain in p2.pain_points or []:
-            p2_items.update(pain.lower().split())
+        p1_items = self._goal_and_pain_words(p1)
+        p2_items = self._goal_and_pain_words(p2)
 
         if not p1_items or not p2_items:
             return 0.0
@@ -220,6 +211,15 @@ class DistinctivenessMetric(QualityMetric):
 
         return (intersection / union) * 100 if union > 0 else 0.0
 
+    @staticmethod
+    def _goal_and_pain_words(persona: Persona) -> set[str]:
+        """Get the lower-cased words of a persona's goals and pain points."""
+        items = persona_text(persona).lower_items
+        words: set[str] = set()
+        for item in (*items["goals"], *items["pain_points"]):
+            words.update(item.split())
+        return words
+
     def _similarity_to_score(self, similarity: float) -> float:
         """
         Convert similarity percentage to distinctiveness score.
@@ -241,12 +241,14 @@ class DistinctivenessMetric(QualityMetric):
         other_pains: set[str] = set()
 
         for other in others:
-            other_goals.update(g.lower().strip() for g in (other.goals or []))
-            other_pains.update(p.lower().strip() for p in (other.pain_points or []))
+            other_items = persona_text(other).lower_items
+            other_goals.update(other_items["goals"])
+            other_pains.update(other_items["pain_points"])
 
         # Count unique in this persona
-        persona_goals = set(g.lower().strip() for g in (persona.goals or []))
-        persona_pains = set(p.lower().strip() for p in (persona.pain_points or []))
+        persona_items = persona_text(persona).lower_items
+        persona_goals = set(persona_items["goals"])
+        persona_pains = set(persona_items["pain_points"])
 
         unique_goals = persona_goals - other_goals
         unique_pains = persona_pains - other_pains
@@ -5,12 +5,16 @@ This module provides a plugin architecture for quality metrics,
 enabling registration of custom metrics and discovery via entry points.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any
 
 from persona.core.quality.base import MetricCategory, QualityMetric
 from persona.core.quality.config import QualityConfig
+from persona.core.quality.context import AnalysisContext
+from persona.core.quality.context import analysis_context as _analysis_context
+from persona.core.quality.engine import MetricEngine
 
 
 @dataclass
@@ -74,6 +78,7 @@ class MetricRegistry:
             requires_source_data=False,
             requires_other_personas=False,
             requires_evidence_report=False,
+            is_builtin=True,
         )
         self.register(
             name="consistency",
@@ -83,6 +88,7 @@ class MetricRegistry:
             requires_source_data=False,
             requires_other_personas=False,
             requires_evidence_report=False,
+            is_builtin=True,
         )
         self.register(
             name="evidence_strength",
@@ -92,6 +98,7 @@ class MetricRegistry:
             requires_source_data=False,
             requires_other_personas=False,
             requires_evidence_report=True,
+            is_builtin=True,
         )
         self.register(
             name="distinctiveness",
@@ -101,6 +108,7 @@ class MetricRegistry:
             requires_source_data=False,
             requires_other_personas=True,
             requires_evidence_report=False,
+            is_builtin=True,
         )
         self.register(
             name="realism",
@@ -110,6 +118,7 @@ class MetricRegistry:
             requires_source_data=False,
             requires_other_personas=False,
             requires_evidence_report=False,
+            is_builtin=True,
         )
 
     def register(
@@ -283,6 +292,56 @@ class MetricRegistry:
         """
         return {name: self.get(name, config, **kwargs) for name in self.list_names()}
 
+    @contextmanager
+    def analysis_context(self) -> Iterator[AnalysisContext]:
+        """
+        Share extracted persona text across metrics for one run.
+
+        Every metric evaluated inside the block reads persona text from
+        the same AnalysisContext, so each persona is extracted and
+        tokenised once however many metrics inspect it. An already
+        active context is reused.
+
+        Yields:
+            The active AnalysisContext.
+
+        Example:
+            registry = MetricRegistry()
+            metrics = registry.get_all_metrics(config)
+
+            with registry.analysis_context():
+                for persona in personas:
+                    for metric in metrics.values():
+                        metric.evaluate(persona)
+        """
+        with _analysis_context() as context:
+            yield context
+
+    def get_engine(
+        self,
+        names: list[str] | None = None,
+        config: QualityConfig | None = None,
+        **kwargs: Any,
+    ) -> MetricEngine:
+        """
+        Get an engine that runs registered metrics concurrently.
+
+        Args:
+            names: Metric names to run (defaults to all registered).
+            config: Optional quality configuration for all metrics.
+            **kwargs: Additional MetricEngine arguments (max_workers,
+                max_llm_concurrency, skip_unsatisfied).
+
+        Returns:
+            MetricEngine for the selected metrics.
+
+        Example:
+            engine = registry.get_engine(config=config)
+            for result in engine.run(personas, source_data=text):
+                print(result.metric, result.score)
+        """
+        return MetricEngine.from_registry(self, names, config, **kwargs)
+
     def get_builtin_metrics(
         self,
         config: QualityConfig | None = None,
@@ -299,8 +358,7 @@ class MetricRegistry:
             Dictionary mapping metric names to instances.
         """
         return {
-            name: self.get(name, config, **kwargs)
-            for name in self.get_builtin_names()
+            name: self.get(name, config, **kwargs) for name in self.get_builtin_names()
         }
 
     def get_builtin_names(self) -> list[str]:
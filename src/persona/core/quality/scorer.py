@@ -10,7 +10,9 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from persona.core.generation.parser import Persona
+from persona.core.logging.tracing import traced
 from persona.core.quality.config import QualityConfig
+from persona.core.quality.engine import MetricEngine
 from persona.core.quality.models import (
     BatchQualityResult,
     DimensionScore,
@@ -22,6 +24,15 @@ from persona.core.quality.registry import MetricRegistry, get_registry
 if TYPE_CHECKING:
     from persona.core.evidence.linker import EvidenceReport
 
+# Dimensions evaluated for every persona, in report order
+DIMENSION_NAMES = [
+    "completeness",
+    "consistency",
+    "evidence_strength",
+    "distinctiveness",
+    "realism",
+]
+
 
 class QualityScorer:
     """
@@ -83,6 +94,7 @@ class QualityScorer:
         self._distinctiveness = self._metrics.get("distinctiveness")
         self._realism = self._metrics.get("realism")
 
+    @traced("quality.score")
     def score(
         self,
         persona: Persona,
@@ -115,60 +127,77 @@ class QualityScorer:
         # Evidence Strength
         self._progress("  Evaluating evidence strength...")
         dimensions["evidence_strength"] = self._evidence.evaluate(
-            persona, evidence_report
+            persona, evidence_report=evidence_report
         )
 
         # Distinctiveness
         self._progress("  Evaluating distinctiveness...")
         dimensions["distinctiveness"] = self._distinctiveness.evaluate(
-            persona, other_personas
+            persona, other_personas=other_personas
         )
 
         # Realism
         self._progress("  Evaluating realism...")
         dimensions["realism"] = self._realism.evaluate(persona)
 
-        # Calculate overall score (weighted sum)
-        overall = sum(d.weighted_score for d in dimensions.values())
-
-        # Determine quality level
-        level = self._determine_level(overall)
-
-        return QualityScore(
-            persona_id=persona.id,
-            persona_name=persona.name,
-            overall_score=overall,
-            level=level,
-            dimensions=dimensions,
-            generated_at=datetime.now().isoformat(),
-        )
+        return self._build_score(persona, dimensions)
 
     def score_batch(
         self,
         personas: list[Persona],
         evidence_reports: dict[str, "EvidenceReport"] | None = None,
+        max_workers: int | None = 1,
     ) -> BatchQualityResult:
         """
         Score multiple personas with cross-comparison.
 
+        Dimensions are evaluated concurrently by a MetricEngine, in-process
+        unless max_workers allows large batches to use worker processes.
+
         Args:
             personas: List of personas to evaluate.
             evidence_reports: Optional dict mapping persona_id to evidence report.
+            max_workers: Maximum worker processes (default: 1, in-process;
+                None uses the CPU count).
 
         Returns:
             BatchQualityResult with individual and aggregate scores.
+
+        Raises:
+            Exception: The exception raised by a failing dimension metric.
         """
         self._progress(f"Scoring {len(personas)} personas...")
 
-        evidence_reports = evidence_reports or {}
-        scores: list[QualityScore] = []
-
-        for persona in personas:
-            other_personas = [p for p in personas if p.id != persona.id]
-            evidence = evidence_reports.get(persona.id)
+        # Built-in metrics cope with missing inputs themselves, so none
+        # are skipped
+        engine = MetricEngine(
+            {name: self._metrics[name] for name in DIMENSION_NAMES},
+            max_workers=max_workers,
+            skip_unsatisfied=False,
+        )
+        results = engine.run(
+            personas,
+            evidence_reports=evidence_reports,
+            on_result=lambda r: self._progress(
+                f"  Evaluated {r.metric} for {personas[r.persona_index].name}"
+            ),
+        )
 
-            score = self.score(persona, evidence, other_personas)
-            scores.append(score)
+        dimensions: list[dict[str, DimensionScore]] = [{} for _ in personas]
+        for result in results:
+            if result.exception is not None:
+                raise result.exception
+            if result.score is None:
+                raise RuntimeError(
+                    f"Metric '{result.metric}' failed for persona "
+                    f"'{result.persona_id}': {result.error}"
+                )
+            dimensions[result.persona_index][result.metric] = result.score
+
+        scores = [
+            self._build_score(persona, persona_dimensions)
+            for persona, persona_dimensions in zip(personas, dimensions, strict=True)
+        ]
 
         # Calculate averages
         if scores:
@@ -177,15 +206,8 @@ class QualityScorer:
             average_score = 0.0
 
         # Average by dimension
-        dimension_names = [
-            "completeness",
-            "consistency",
-            "evidence_strength",
-            "distinctiveness",
-            "realism",
-        ]
         average_by_dimension: dict[str, float] = {}
-        for dim in dimension_names:
+        for dim in DIMENSION_NAMES:
             dim_scores = [
                 s.dimensions[dim].score for s in scores if dim in s.dimensions
             ]
@@ -204,6 +226,25 @@ class QualityScorer:
             generated_at=datetime.now().isoformat(),
         )
 
+    def _build_score(
+        self, persona: Persona, dimensions: dict[str, DimensionScore]
+    ) -> QualityScore:
+        """Combine dimension scores into a persona's quality score."""
+        # Calculate overall score (weighted sum)
+        overall = sum(d.weighted_score for d in dimensions.values())
+
+        # Determine quality level
+        level = self._determine_level(overall)
+
+        return QualityScore(
+            persona_id=persona.id,
+            persona_name=persona.name,
+            overall_score=overall,
+            level=level,
+            dimensions=dimensions,
+            generated_at=datetime.now().isoformat(),
+        )
+
     def _determine_level(self, score: float) -> QualityLevel:
         """Determine quality level from score."""
         if score >= self.config.excellent_threshold:
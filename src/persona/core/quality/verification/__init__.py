@@ -46,7 +46,10 @@ Example:
     ... )
 """
 
-from persona.core.quality.verification.consistency import ConsistencyChecker
+from persona.core.quality.verification.consistency import (
+    ConsistencyChecker,
+    PersonaProfile,
+)
 from persona.core.quality.verification.dispatcher import (
     ModelDispatcher,
     ModelGenerationResult,
@@ -87,6 +90,7 @@ __all__ = [
     "AttributeAgreement",
     # Components
     "ConsistencyChecker",
+    "PersonaProfile",
     "ModelDispatcher",
     "ModelGenerationResult",
     "dispatch_multi_model",
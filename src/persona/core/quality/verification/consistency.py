@@ -5,14 +5,56 @@ This module provides functionality to measure consistency across
 persona generation outputs from different models.
 """
 
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
 
 from persona.core.embedding import EmbeddingProvider, get_embedding_provider
 from persona.core.generation.parser import Persona
 from persona.core.quality.verification.models import (
     AttributeAgreement,
     ConsistencyMetrics,
+    attribute_value_key,
 )
 
+# Fields considered when measuring attribute agreement
+SUBSTANTIVE_FIELDS = (
+    "name",
+    "demographics",
+    "goals",
+    "pain_points",
+    "behaviours",
+    "quotes",
+)
+
+
+@dataclass(frozen=True)
+class PersonaProfile:
+    """
+    Pre-computed comparison view of a persona.
+
+    Serialising a persona and hashing its values once lets consistency
+    checks and voting look attributes up directly instead of
+    re-serialising the persona for every comparison.
+
+    Attributes:
+        persona: The source persona.
+        data: Persona serialised with to_dict().
+        value_keys: Hashable key per non-empty attribute value.
+        claims: Normalised factual claims.
+        tokens: Lower-cased words from the name and claims, for alignment.
+    """
+
+    persona: Persona
+    data: dict[str, Any]
+    value_keys: dict[str, str]
+    claims: frozenset[str]
+    tokens: frozenset[str]
+
+
+PersonaInput = Persona | PersonaProfile
+
 
 class ConsistencyChecker:
     """
@@ -53,16 +95,118 @@ class ConsistencyChecker:
         else:
             self.embedding_provider = embedding_provider
 
+    def profile(self, persona: PersonaInput) -> PersonaProfile:
+        """
+        Build the comparison profile for a persona.
+
+        Args:
+            persona: Persona (or an existing profile, returned unchanged).
+
+        Returns:
+            PersonaProfile for the persona.
+        """
+        if isinstance(persona, PersonaProfile):
+            return persona
+
+        data = persona.to_dict()
+        claims = frozenset(self._extract_claims(persona))
+        tokens = set(persona.name.lower().split())
+        for claim in claims:
+            tokens.update(claim.split())
+
+        return PersonaProfile(
+            persona=persona,
+            data=data,
+            value_keys={
+                attr: attribute_value_key(value)
+                for attr, value in data.items()
+                if value
+            },
+            claims=claims,
+            tokens=frozenset(tokens),
+        )
+
+    def profiles(self, personas: Sequence[PersonaInput]) -> list[PersonaProfile]:
+        """Build comparison profiles for several personas."""
+        return [self.profile(p) for p in personas]
+
+    def align_personas(
+        self,
+        persona_sets: Sequence[Sequence[PersonaInput]],
+    ) -> list[dict[int, PersonaProfile]]:
+        """
+        Align personas from several outputs describing the same people.
+
+        The largest output provides the anchors. Every other output's
+        personas are matched one-to-one to anchors by Jaccard similarity
+        of their name and claim words, computed through an inverted word
+        index so only personas sharing words are compared.
+
+        Args:
+            persona_sets: Personas from each model output.
+
+        Returns:
+            One group per anchor persona, mapping output index to the
+            matched persona profile. Groups are ordered as the anchors.
+        """
+        profile_sets = [self.profiles(personas) for personas in persona_sets]
+        if not any(profile_sets):
+            return []
+
+        anchor_index = max(range(len(profile_sets)), key=lambda i: len(profile_sets[i]))
+        anchors = profile_sets[anchor_index]
+        groups: list[dict[int, PersonaProfile]] = [
+            {anchor_index: anchor} for anchor in anchors
+        ]
+
+        # Inverted index from word to the anchors containing it
+        index: dict[str, list[int]] = defaultdict(list)
+        for i, anchor in enumerate(anchors):
+            for token in anchor.tokens:
+                index[token].append(i)
+
+        for set_index, profiles in enumerate(profile_sets):
+            if set_index == anchor_index:
+                continue
+
+            candidates = []
+            for j, profile in enumerate(profiles):
+                shared: Counter[int] = Counter()
+                for token in profile.tokens:
+                    shared.update(index.get(token, ()))
+                for i, overlap in shared.items():
+                    union = len(profile.tokens) + len(anchors[i].tokens) - overlap
+                    candidates.append((overlap / union, j, i))
+
+            # Greedy one-to-one assignment, best matches first
+            candidates.sort(key=lambda c: (-c[0], c[1], c[2]))
+            matched_profiles: set[int] = set()
+            matched_anchors: set[int] = set()
+            for _score, j, i in candidates:
+                if j in matched_profiles or i in matched_anchors:
+                    continue
+                groups[i][set_index] = profiles[j]
+                matched_profiles.add(j)
+                matched_anchors.add(i)
+
+            # Personas sharing no words fall back to positional order
+            free_anchors = (i for i in range(len(anchors)) if i not in matched_anchors)
+            for j, profile in enumerate(profiles):
+                if j not in matched_profiles:
+                    groups[next(free_anchors)][set_index] = profile
+
+        return groups
+
     def calculate_metrics(
         self,
-        personas: list[Persona],
+        personas: Sequence[PersonaInput],
         weights: dict[str, float] | None = None,
     ) -> ConsistencyMetrics:
         """
         Calculate consistency metrics across personas.
 
         Args:
-            personas: List of personas to compare.
+            personas: Personas (or pre-built profiles) to compare.
             weights: Optional custom weights for metrics.
 
         Returns:
@@ -78,9 +222,10 @@ class ConsistencyChecker:
             )
 
         # Calculate individual metrics
-        attr_agreement = self._calculate_attribute_agreement(personas)
-        semantic_consistency = self._calculate_semantic_consistency(personas)
-        factual_convergence = self._calculate_factual_convergence(personas)
+        profiles = self.profiles(personas)
+        attr_agreement = self._calculate_attribute_agreement(profiles)
+        semantic_consistency = self._calculate_semantic_consistency(profiles)
+        factual_convergence = self._calculate_factual_convergence(profiles)
 
         return ConsistencyMetrics(
             attribute_agreement=attr_agreement,
@@ -89,12 +234,12 @@ class ConsistencyChecker:
             weights=weights,
         )
 
-    def _calculate_attribute_agreement(self, personas: list[Persona]) -> float:
+    def _calculate_attribute_agreement(self, personas: Sequence[PersonaInput]) -> float:
         """
         Calculate what percentage of attributes appear in all personas.
 
         Args:
-            personas: List of personas to compare.
+            personas: Personas (or pre-built profiles) to compare.
 
         Returns:
             Agreement score between 0 and 1.
@@ -102,43 +247,26 @@ class ConsistencyChecker:
         if not personas:
             return 0.0
 
-        # Collect all attributes across all personas
-        all_attributes = set()
-        for persona in personas:
-            persona_dict = persona.to_dict()
-            # Focus on substantive fields
-            substantive_fields = [
-                "name",
-                "demographics",
-                "goals",
-                "pain_points",
-                "behaviours",
-                "quotes",
-            ]
-            for field in substantive_fields:
-                if field in persona_dict and persona_dict[field]:
-                    all_attributes.add(field)
-
-        if not all_attributes:
-            return 0.0
+        # Count how many personas have each substantive attribute
+        presence: Counter[str] = Counter()
+        for profile in self.profiles(personas):
+            presence.update(f for f in SUBSTANTIVE_FIELDS if f in profile.value_keys)
 
-        # Count how many personas have each attribute
-        agreements = []
-        for attr in all_attributes:
-            count = sum(
-                1 for p in personas if attr in p.to_dict() and p.to_dict()[attr]
-            )
-            agreements.append(count / len(personas))
+        if not presence:
+            return 0.0
 
         # Return average agreement across all attributes
-        return sum(agreements) / len(agreements) if agreements else 0.0
+        agreements = [count / len(personas) for count in presence.values()]
+        return sum(agreements) / len(agreements)
 
-    def _calculate_semantic_consistency(self, personas: list[Persona]) -> float:
+    def _calculate_semantic_consistency(
+        self, personas: Sequence[PersonaInput]
+    ) -> float:
         """
         Calculate semantic similarity using embeddings.
 
         Args:
-            personas: List of personas to compare.
+            personas: Personas (or pre-built profiles) to compare.
 
         Returns:
             Semantic consistency score between 0 and 1.
@@ -147,7 +275,7 @@ class ConsistencyChecker:
             return 1.0
 
         # Convert personas to text representations
-        texts = [self._persona_to_text(p) for p in personas]
+        texts = [self._persona_to_text(p.persona) for p in self.profiles(personas)]
 
         # Get embeddings
         try:
@@ -173,12 +301,12 @@ class ConsistencyChecker:
             # Fall back to simple comparison on error
             return self._simple_text_similarity(texts)
 
-    def _calculate_factual_convergence(self, personas: list[Persona]) -> float:
+    def _calculate_factual_convergence(self, personas: Sequence[PersonaInput]) -> float:
         """
         Calculate what percentage of factual claims appear in majority of outputs.
 
         Args:
-            personas: List of personas to compare.
+            personas: Personas (or pre-built profiles) to compare.
 
         Returns:
             Convergence score between 0 and 1.
@@ -186,43 +314,31 @@ class ConsistencyChecker:
         if len(personas) < 2:
             return 1.0
 
-        # Extract factual claims from each persona
-        all_claims = []
-        for persona in personas:
-            claims = self._extract_claims(persona)
-            all_claims.append(claims)
+        # Count how many personas contain each claim in a single pass
+        claim_counts: Counter[str] = Counter()
+        for profile in self.profiles(personas):
+            claim_counts.update(profile.claims)
 
-        if not any(all_claims):
+        if not claim_counts:
             return 0.0
 
-        # Find unique claims
-        unique_claims = set()
-        for claims in all_claims:
-            unique_claims.update(claims)
-
-        # Count how many personas contain each claim
-        claim_counts = {}
-        for claim in unique_claims:
-            count = sum(1 for claims in all_claims if claim in claims)
-            claim_counts[claim] = count
-
         # Calculate percentage of claims in majority
         majority_threshold = len(personas) / 2
         majority_claims = sum(
             1 for count in claim_counts.values() if count > majority_threshold
         )
 
-        return majority_claims / len(unique_claims) if unique_claims else 0.0
+        return majority_claims / len(claim_counts)
 
     def get_attribute_details(
         self,
-        personas: list[Persona],
+        personas: Sequence[PersonaInput],
     ) -> dict[str, AttributeAgreement]:
         """
         Get detailed agreement information for each attribute.
 
         Args:
-            personas: List of personas to analyse.
+            personas: Personas (or pre-built profiles) to analyse.
 
         Returns:
             Dictionary mapping attribute names to agreement details.
@@ -230,33 +346,32 @@ class ConsistencyChecker:
         if not personas:
             return {}
 
-        # Collect all attributes
-        all_attributes = set()
-        for persona in personas:
-            all_attributes.update(persona.to_dict().keys())
-
-        # Calculate agreement for each attribute
-        details = {}
-        total_count = len(personas)
+        profiles = self.profiles(personas)
 
-        for attr in all_attributes:
-            values = []
-            present_count = 0
-
-            for persona in personas:
-                persona_dict = persona.to_dict()
-                if attr in persona_dict and persona_dict[attr]:
-                    values.append(persona_dict[attr])
-                    present_count += 1
-
-            details[attr] = AttributeAgreement(
+        # Collect all attributes
+        all_attributes: set[str] = set()
+        for profile in profiles:
+            all_attributes.update(profile.data.keys())
+
+        # Gather present values and their pre-computed keys per attribute
+        values: dict[str, list[Any]] = {attr: [] for attr in all_attributes}
+        keys: dict[str, list[str]] = {attr: [] for attr in all_attributes}
+        for profile in profiles:
+            for attr, key in profile.value_keys.items():
+                values[attr].append(profile.data[attr])
+                keys[attr].append(key)
+
+        total_count = len(profiles)
+        return {
+            attr: AttributeAgreement(
                 attribute=attr,
-                present_count=present_count,
+                present_count=len(values[attr]),
                 total_count=total_count,
-                values=values,
+                values=values[attr],
+                value_keys=keys[attr],
             )
-
-        return details
+            for attr in all_attributes
+        }
 
     def _persona_to_text(self, persona: Persona) -> str:
         """
@@ -6,11 +6,28 @@ metrics, and results when comparing persona generation across
 multiple LLM models.
 """
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
+def attribute_value_key(value: Any) -> str:
+    """
+    Build a hashable key for an attribute value.
+
+    Equal values (including nested lists and dicts) produce equal keys,
+    so voting can count values without re-hashing nested structures.
+
+    Args:
+        value: Attribute value.
+
+    Returns:
+        Canonical string key for the value.
+    """
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+
 @dataclass
 class VerificationConfig:
     """
@@ -142,6 +159,7 @@ class AttributeAgreement:
         total_count: Total number of models.
         values: List of values from different models.
         agreement_score: Percentage of models agreeing (0-1).
+        value_keys: Keys from attribute_value_key(), parallel to values.
     """
 
     attribute: str
@@ -149,11 +167,14 @@ class AttributeAgreement:
     total_count: int
     values: list[Any] = field(default_factory=list)
     agreement_score: float = 0.0
+    value_keys: list[str] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        """Calculate agreement score."""
+        """Calculate agreement score and value keys."""
         if self.total_count > 0:
             self.agreement_score = self.present_count / self.total_count
+        if len(self.value_keys) != len(self.values):
+            self.value_keys = [attribute_value_key(v) for v in self.values]
 
     @property
     def is_agreed(self) -> bool:
@@ -182,7 +203,8 @@ class VerificationReport:
         consistency_score: Overall consistency score (0-1).
         agreed_attributes: Attributes agreed upon by voting strategy.
         disputed_attributes: Attributes with disagreement.
-        model_outputs: Optional raw outputs from each model.
+        model_outputs: Optional raw outputs from each model, as a list of
+            persona dictionaries per model.
         metrics: Detailed consistency metrics.
         consensus_persona: Persona built from agreed attributes.
         timestamp: When verification was performed.
@@ -224,20 +246,27 @@ class VerificationReport:
         if not self.model_outputs:
             return {}
 
+        # Each model maps to a list of persona dictionaries
+        outputs = [
+            persona
+            for output in self.model_outputs.values()
+            for persona in (output if isinstance(output, list) else [output])
+            if isinstance(persona, dict)
+        ]
+
         all_attributes = set()
-        for output in self.model_outputs.values():
-            if isinstance(output, dict):
-                all_attributes.update(output.keys())
+        for output in outputs:
+            all_attributes.update(output.keys())
 
         details = {}
-        total_count = len(self.model_outputs)
+        total_count = len(outputs)
 
         for attr in all_attributes:
             values = []
             present_count = 0
 
-            for output in self.model_outputs.values():
-                if isinstance(output, dict) and attr in output:
+            for output in outputs:
+                if attr in output:
                     values.append(output[attr])
                     present_count += 1
 
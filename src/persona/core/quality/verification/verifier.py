@@ -6,13 +6,22 @@ verification across multiple LLM models.
 """
 
 import asyncio
+import os
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from persona.core.multimodel.generator import ModelSpec
-from persona.core.quality.verification.consistency import ConsistencyChecker
+from persona.core.quality.verification.consistency import (
+    ConsistencyChecker,
+    PersonaInput,
+    PersonaProfile,
+)
 from persona.core.quality.verification.dispatcher import (
     ModelDispatcher,
+    ModelGenerationResult,
 )
 from persona.core.quality.verification.models import (
     VerificationConfig,
@@ -20,6 +29,9 @@ from persona.core.quality.verification.models import (
 )
 from persona.core.quality.verification.voting import get_voting_strategy
 
+# Upper bound on threads waiting on embedding requests in verify_batch
+MAX_EMBEDDING_THREADS = 8
+
 
 class MultiModelVerifier:
     """
@@ -80,21 +92,7 @@ class MultiModelVerifier:
         Returns:
             VerificationReport with results.
         """
-        # Parse model specs
-        model_specs = [ModelSpec.parse(m) for m in self.config.models]
-
-        # Generate personas from each model
-        if self.config.parallel:
-            results = await self.dispatcher.dispatch_parallel(
-                data, model_specs, count, prompt_template
-            )
-        else:
-            results = await self.dispatcher.dispatch_sequential(
-                data, model_specs, count, prompt_template
-            )
-
-        # Extract successful results
-        successful_results = [r for r in results if r.success]
+        successful_results = await self._dispatch(data, count, prompt_template)
 
         if not successful_results:
             # All models failed
@@ -114,38 +112,10 @@ class MultiModelVerifier:
             model_key = f"{result.model.provider}:{result.model.model}"
             model_outputs[model_key] = [p.to_dict() for p in result.personas]
 
-        # Calculate consistency metrics
-        metrics = self.checker.calculate_metrics(all_personas)
-
-        # Get attribute details
-        attribute_details = self.checker.get_attribute_details(all_personas)
-
-        # Apply voting strategy
-        voting_strategy = get_voting_strategy(self.config.voting_strategy)
-
-        agreed_attributes = voting_strategy.get_agreed_attributes(attribute_details)
-        disputed_attributes = voting_strategy.get_disputed_attributes(attribute_details)
-        consensus_persona = voting_strategy.extract_consensus(
-            all_personas, attribute_details
-        )
-
-        # Use confidence score as consistency score
-        consistency_score = metrics.confidence_score
-
-        # Create report
-        report = VerificationReport(
-            persona_id=persona_id or "verification",
-            config=self.config,
-            consistency_score=consistency_score,
-            agreed_attributes=agreed_attributes,
-            disputed_attributes=disputed_attributes,
-            model_outputs=model_outputs,
-            metrics=metrics,
-            consensus_persona=consensus_persona,
+        return self._build_report(
+            all_personas, model_outputs, persona_id or "verification"
         )
 
-        return report
-
     async def verify_self_consistency(
         self,
         data: str | Path,
@@ -197,61 +167,185 @@ class MultiModelVerifier:
             model_key = f"{result.model.provider}:{result.model.model}-sample{i+1}"
             model_outputs[model_key] = [p.to_dict() for p in result.personas]
 
-        # Calculate consistency metrics
-        metrics = self.checker.calculate_metrics(all_personas)
-
-        # Get attribute details
-        attribute_details = self.checker.get_attribute_details(all_personas)
-
-        # Apply voting strategy
-        voting_strategy = get_voting_strategy(self.config.voting_strategy)
-
-        agreed_attributes = voting_strategy.get_agreed_attributes(attribute_details)
-        disputed_attributes = voting_strategy.get_disputed_attributes(attribute_details)
-        consensus_persona = voting_strategy.extract_consensus(
-            all_personas, attribute_details
-        )
-
-        consistency_score = metrics.confidence_score
-
-        # Create report
-        report = VerificationReport(
-            persona_id=persona_id or f"self-consistency-{model}",
-            config=self.config,
-            consistency_score=consistency_score,
-            agreed_attributes=agreed_attributes,
-            disputed_attributes=disputed_attributes,
-            model_outputs=model_outputs,
-            metrics=metrics,
-            consensus_persona=consensus_persona,
+        return self._build_report(
+            all_personas,
+            model_outputs,
+            persona_id or f"self-consistency-{model}",
         )
 
-        return report
-
     async def verify_batch(
         self,
         data: str | Path,
         count: int = 3,
         prompt_template: str | None = None,
+        max_workers: int | None = 1,
     ) -> list[VerificationReport]:
         """
         Verify a batch of personas.
 
+        Generates once with every model, aligns the personas that
+        describe the same person across model outputs, and verifies
+        each aligned group independently.
+
+        Reports are built off the event loop. Groups wait on embedding
+        requests when the checker has an embedding provider, so they
+        are verified concurrently on a thread pool; otherwise scoring is
+        CPU-bound and runs in a single worker thread, or across a
+        process pool when max_workers is above 1.
+
         Args:
             data: Source data for persona generation.
             count: Number of personas to generate and verify.
             prompt_template: Optional custom prompt template.
+            max_workers: Maximum worker processes for CPU-bound scoring
+                (default: 1, no process pool; None uses the CPU count).
 
         Returns:
             List of verification reports (one per persona).
         """
-        # Generate once with all models
-        report = await self.verify(data, count, prompt_template)
+        successful_results = await self._dispatch(data, count, prompt_template)
+
+        if not successful_results:
+            return [
+                VerificationReport(
+                    persona_id="verification-failed",
+                    config=self.config,
+                    consistency_score=0.0,
+                    passed=False,
+                )
+            ]
+
+        model_keys = self._model_keys(successful_results)
+        groups = self.checker.align_personas(
+            [result.personas for result in successful_results]
+        )
+
+        jobs = []
+        for index, group in enumerate(groups):
+            members = [group[i] for i in sorted(group)]
+            model_outputs = {
+                model_keys[i]: [profile.data] for i, profile in sorted(group.items())
+            }
+            persona_id = members[0].persona.id or f"persona-{index + 1}"
+            jobs.append((members, model_outputs, persona_id))
+
+        return await self._build_reports(jobs, max_workers)
+
+    async def _build_reports(
+        self,
+        jobs: list[tuple[list[PersonaProfile], dict[str, Any], str]],
+        max_workers: int | None,
+    ) -> list[VerificationReport]:
+        """Build one report per job on an executor suited to the work."""
+        build = partial(_build_report, self.checker, self.config)
+        executor: Executor
+
+        if self._uses_embeddings():
+            executor = ThreadPoolExecutor(
+                max_workers=min(len(jobs), MAX_EMBEDDING_THREADS)
+            )
+        else:
+            workers = max(1, min(len(jobs), max_workers or os.cpu_count() or 1))
+            if workers == 1:
+                return await asyncio.to_thread(
+                    lambda: [build(*job) for job in jobs]
+                )
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+        loop = asyncio.get_running_loop()
+        with executor:
+            return list(
+                await asyncio.gather(
+                    *(loop.run_in_executor(executor, build, *job) for job in jobs)
+                )
+            )
+
+    def _uses_embeddings(self) -> bool:
+        """Check whether consistency scoring calls an embedding API."""
+        provider = self.checker.embedding_provider
+        return provider is not None and provider.is_configured()
 
-        # For batch mode, we return one report per persona
-        # In this implementation, we return a single report
-        # In production, you might split by persona
-        return [report]
+    async def _dispatch(
+        self,
+        data: str | Path,
+        count: int,
+        prompt_template: str | None,
+    ) -> list[ModelGenerationResult]:
+        """Generate with every configured model and keep the successes."""
+        # Parse model specs
+        model_specs = [ModelSpec.parse(m) for m in self.config.models]
+
+        # Generate personas from each model
+        if self.config.parallel:
+            results = await self.dispatcher.dispatch_parallel(
+                data, model_specs, count, prompt_template
+            )
+        else:
+            results = await self.dispatcher.dispatch_sequential(
+                data, model_specs, count, prompt_template
+            )
+
+        return [r for r in results if r.success]
+
+    @staticmethod
+    def _model_keys(results: list[ModelGenerationResult]) -> list[str]:
+        """Build a unique output key for each model result."""
+        keys = []
+        seen: dict[str, int] = {}
+        for result in results:
+            key = f"{result.model.provider}:{result.model.model}"
+            seen[key] = seen.get(key, 0) + 1
+            keys.append(key if seen[key] == 1 else f"{key}-{seen[key]}")
+        return keys
+
+    def _build_report(
+        self,
+        personas: Sequence[PersonaInput],
+        model_outputs: dict[str, Any],
+        persona_id: str,
+    ) -> VerificationReport:
+        """Score personas and apply the voting strategy."""
+        return _build_report(
+            self.checker, self.config, personas, model_outputs, persona_id
+        )
+
+
+def _build_report(
+    checker: ConsistencyChecker,
+    config: VerificationConfig,
+    personas: Sequence[PersonaInput],
+    model_outputs: dict[str, Any],
+    persona_id: str,
+) -> VerificationReport:
+    """Score personas and apply the voting strategy (runs in workers)."""
+    profiles = checker.profiles(personas)
+
+    # Calculate consistency metrics
+    metrics = checker.calculate_metrics(profiles)
+
+    # Get attribute details
+    attribute_details = checker.get_attribute_details(profiles)
+
+    # Apply voting strategy
+    voting_strategy = get_voting_strategy(config.voting_strategy)
+
+    agreed_attributes = voting_strategy.get_agreed_attributes(attribute_details)
+    disputed_attributes = voting_strategy.get_disputed_attributes(attribute_details)
+    consensus_persona = voting_strategy.extract_consensus(
+        [p.persona for p in profiles], attribute_details
+    )
+
+    # Use confidence score as consistency score
+    return VerificationReport(
+        persona_id=persona_id,
+        config=config,
+        consistency_score=metrics.confidence_score,
+        agreed_attributes=agreed_attributes,
+        disputed_attributes=disputed_attributes,
+        model_outputs=model_outputs,
+        metrics=metrics,
+        consensus_persona=consensus_persona,
+    )
 
 
 async def verify_multi_model(
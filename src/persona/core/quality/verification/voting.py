@@ -10,7 +10,10 @@ from collections import Counter
 from typing import Any
 
 from persona.core.generation.parser import Persona
-from persona.core.quality.verification.models import AttributeAgreement
+from persona.core.quality.verification.models import (
+    AttributeAgreement,
+    attribute_value_key,
+)
 
 
 class VotingStrategy(ABC):
@@ -91,7 +94,9 @@ class MajorityVotingStrategy(VotingStrategy):
         for attr, details in attribute_details.items():
             if details.agreement_score > 0.5:
                 # Attribute is in majority, pick most common value
-                consensus[attr] = self._select_majority_value(details.values)
+                consensus[attr] = self._select_majority_value(
+                    details.values, details.value_keys
+                )
 
         return consensus
 
@@ -117,12 +122,17 @@ class MajorityVotingStrategy(VotingStrategy):
             if details.agreement_score <= 0.5
         ]
 
-    def _select_majority_value(self, values: list[Any]) -> Any:
+    def _select_majority_value(
+        self,
+        values: list[Any],
+        value_keys: list[str] | None = None,
+    ) -> Any:
         """
         Select the most common value from a list.
 
         Args:
             values: List of values to vote on.
+            value_keys: Optional pre-computed keys parallel to values.
 
         Returns:
             Most common value.
@@ -130,28 +140,12 @@ class MajorityVotingStrategy(VotingStrategy):
         if not values:
             return None
 
-        # For lists, convert to tuples for hashing
-        hashable_values = []
-        for v in values:
-            if isinstance(v, list):
-                hashable_values.append(tuple(v))
-            elif isinstance(v, dict):
-                hashable_values.append(tuple(sorted(v.items())))
-            else:
-                hashable_values.append(v)
-
-        # Count occurrences
-        counter = Counter(hashable_values)
-        most_common = counter.most_common(1)[0][0]
-
-        # Convert back to original type
-        if isinstance(most_common, tuple):
-            # Try to determine if it was a list or dict
-            if values and isinstance(values[0], list):
-                return list(most_common)
-            elif values and isinstance(values[0], dict):
-                return dict(most_common)
-        return most_common
+        if value_keys is None or len(value_keys) != len(values):
+            value_keys = [attribute_value_key(v) for v in values]
+
+        # Count occurrences and return the first value with the top key
+        most_common = Counter(value_keys).most_common(1)[0][0]
+        return values[value_keys.index(most_common)]
 
 
 class UnanimousVotingStrategy(VotingStrategy):
@@ -173,7 +167,9 @@ class UnanimousVotingStrategy(VotingStrategy):
         for attr, details in attribute_details.items():
             if details.agreement_score == 1.0:
                 # Attribute is in all outputs
-                consensus[attr] = self._select_common_value(details.values)
+                consensus[attr] = self._select_common_value(
+                    details.values, details.value_keys
+                )
 
         return consensus
 
@@ -199,7 +195,11 @@ class UnanimousVotingStrategy(VotingStrategy):
             if details.agreement_score < 1.0
         ]
 
-    def _select_common_value(self, values: list[Any]) -> Any:
+    def _select_common_value(
+        self,
+        values: list[Any],
+        value_keys: list[str] | None = None,
+    ) -> Any:
         """
         Select value from unanimous list.
 
@@ -207,6 +207,7 @@ class UnanimousVotingStrategy(VotingStrategy):
 
         Args:
             values: List of values (should all be present).
+            value_keys: Optional pre-computed keys parallel to values.
 
         Returns:
             Common or combined value.
@@ -214,9 +215,12 @@ class UnanimousVotingStrategy(VotingStrategy):
         if not values:
             return None
 
+        if value_keys is None or len(value_keys) != len(values):
+            value_keys = [attribute_value_key(v) for v in values]
+
         # Check if all values are identical
         first = values[0]
-        if all(v == first for v in values):
+        if len(set(value_keys)) == 1:
             return first
 
         # If lists, combine and deduplicate
@@ -225,9 +229,7 @@ class UnanimousVotingStrategy(VotingStrategy):
             seen = set()
             for value_list in values:
                 for item in value_list:
-                    item_key = (
-                        tuple(sorted(item.items())) if isinstance(item, dict) else item
-                    )
+                    item_key = attribute_value_key(item)
                     if item_key not in seen:
                         combined.append(item)
                         seen.add(item_key)
@@ -272,17 +274,31 @@ class WeightedVotingStrategy(VotingStrategy):
         """Extract consensus using weighted voting."""
         consensus = {}
 
-        # Calculate weighted agreement threshold
-        total_weight = self._calculate_total_weight(personas)
-        threshold = total_weight * 0.5  # Weighted majority
+        # Serialise each persona and look up its weight once
+        persona_dicts = [persona.to_dict() for persona in personas]
+        weights = [self._persona_weight(persona) for persona in personas]
 
-        for attr, details in attribute_details.items():
-            # Calculate weighted presence
-            weighted_presence = self._calculate_weighted_presence(attr, personas)
-
-            if weighted_presence > threshold:
+        # Calculate weighted agreement threshold
+        threshold = sum(weights) * 0.5  # Weighted majority
+
+        # Accumulate weighted presence and weighted value votes per attribute
+        presence: dict[str, float] = {}
+        votes: dict[str, dict[str, float]] = {}
+        first_values: dict[str, dict[str, Any]] = {}
+        for persona_dict, weight in zip(persona_dicts, weights):
+            for attr, value in persona_dict.items():
+                if value:
+                    presence[attr] = presence.get(attr, 0.0) + weight
+                key = attribute_value_key(value)
+                attr_votes = votes.setdefault(attr, {})
+                attr_votes[key] = attr_votes.get(key, 0.0) + weight
+                first_values.setdefault(attr, {}).setdefault(key, value)
+
+        for attr in attribute_details:
+            if presence.get(attr, 0.0) > threshold:
                 # Select value weighted by model capabilities
-                consensus[attr] = self._select_weighted_value(attr, personas)
+                best_key = max(votes[attr].items(), key=lambda x: x[1])[0]
+                consensus[attr] = first_values[attr][best_key]
 
         return consensus
 
@@ -310,14 +326,14 @@ class WeightedVotingStrategy(VotingStrategy):
             if details.agreement_score <= 0.5
         ]
 
+    def _persona_weight(self, persona: Persona) -> float:
+        """Get the weight of the model that produced a persona."""
+        model = self._extract_model_name(persona)
+        return self.model_weights.get(model, self.default_weight)
+
     def _calculate_total_weight(self, personas: list[Persona]) -> float:
         """Calculate total weight across all models."""
-        total = 0.0
-        for persona in personas:
-            model = self._extract_model_name(persona)
-            weight = self.model_weights.get(model, self.default_weight)
-            total += weight
-        return total
+        return sum(self._persona_weight(persona) for persona in personas)
 
     def _calculate_weighted_presence(
         self,
@@ -325,45 +341,11 @@ class WeightedVotingStrategy(VotingStrategy):
         personas: list[Persona],
     ) -> float:
         """Calculate weighted presence of an attribute."""
-        presence = 0.0
-        for persona in personas:
-            persona_dict = persona.to_dict()
-            if attribute in persona_dict and persona_dict[attribute]:
-                model = self._extract_model_name(persona)
-                weight = self.model_weights.get(model, self.default_weight)
-                presence += weight
-        return presence
-
-    def _select_weighted_value(
-        self,
-        attribute: str,
-        personas: list[Persona],
-    ) -> Any:
-        """Select value weighted by model capabilities."""
-        # Collect values with their weights
-        weighted_values: dict[Any, float] = {}
-
-        for persona in personas:
-            persona_dict = persona.to_dict()
-            if attribute in persona_dict:
-                value = persona_dict[attribute]
-                model = self._extract_model_name(persona)
-                weight = self.model_weights.get(model, self.default_weight)
-
-                # Make value hashable
-                hashable_value = self._make_hashable(value)
-
-                if hashable_value in weighted_values:
-                    weighted_values[hashable_value] += weight
-                else:
-                    weighted_values[hashable_value] = weight
-
-        if not weighted_values:
-            return None
-
-        # Select value with highest total weight
-        best_value = max(weighted_values.items(), key=lambda x: x[1])[0]
-        return self._restore_value(best_value)
+        return sum(
+            self._persona_weight(persona)
+            for persona in personas
+            if persona.to_dict().get(attribute)
+        )
 
     def _extract_model_name(self, persona: Persona) -> str:
         """Extract model name from persona."""
@@ -377,25 +359,6 @@ class WeightedVotingStrategy(VotingStrategy):
                 return parts[-1]
         return "unknown"
 
-    def _make_hashable(self, value: Any) -> Any:
-        """Convert value to hashable type."""
-        if isinstance(value, list):
-            return tuple(value)
-        elif isinstance(value, dict):
-            return tuple(sorted(value.items()))
-        return value
-
-    def _restore_value(self, hashable_value: Any) -> Any:
-        """Restore original value type."""
-        if isinstance(hashable_value, tuple):
-            # Try to determine original type
-            if hashable_value and isinstance(hashable_value[0], tuple):
-                # Was a dict
-                return dict(hashable_value)
-            # Was a list
-            return list(hashable_value)
-        return hashable_value
-
 
 def get_voting_strategy(
     strategy_name: str,
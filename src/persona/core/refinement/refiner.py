@@ -6,12 +6,42 @@ refining personas through natural language instructions.
 """
 
 import copy
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from persona.core.generation.parser import Persona
 
+# Versions between full snapshots in a refinement history
+DEFAULT_CHECKPOINT_INTERVAL = 16
+
+
+def _field_delta(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Compute the top-level fields changed between two persona dicts."""
+    return {
+        "set": {
+            k: copy.deepcopy(v)
+            for k, v in after.items()
+            if k not in before or before[k] != v
+        },
+        "unset": [k for k in before if k not in after],
+    }
+
+
+def _apply_delta(data: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Apply a field delta, sharing unchanged field values."""
+    result = dict(data)
+    result.update(delta["set"])
+    for key in delta["unset"]:
+        result.pop(key, None)
+    return result
+
 
 @dataclass
 class RefinementInstruction:
@@ -77,27 +107,68 @@ class RefinementResult:
         }
 
 
-@dataclass
+@dataclass(init=False)
 class RefinementHistory:
     """
     History of refinements for a persona.
 
+    Versions are stored as a base snapshot plus field-level deltas,
+    with a full checkpoint every checkpoint_interval versions, so
+    memory grows with the edits made rather than with versions times
+    persona size. Versions are reconstructed on demand.
+
     Attributes:
         persona_id: ID of the persona.
-        versions: List of persona versions (snapshots).
+        versions: Every version, rebuilt from the deltas on read
+            (initial versions may be passed to the constructor).
         instructions: List of refinement instructions.
         current_version: Current version index.
+        checkpoint_interval: Versions between full snapshots.
     """
 
     persona_id: str
-    versions: list[Persona] = field(default_factory=list)
-    instructions: list[RefinementInstruction] = field(default_factory=list)
-    current_version: int = 0
+    instructions: list[RefinementInstruction]
+    current_version: int
+    checkpoint_interval: int
+    _base: dict[str, Any] | None = field(repr=False)
+    _deltas: list[dict[str, Any]] = field(repr=False)
+    _checkpoints: dict[int, dict[str, Any]] = field(repr=False)
+    _head: dict[str, Any] | None = field(repr=False)
+
+    def __init__(
+        self,
+        persona_id: str,
+        versions: list[Persona] | None = None,
+        instructions: list[RefinementInstruction] | None = None,
+        current_version: int = 0,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        """Record initial versions as a base snapshot plus deltas."""
+        self.persona_id = persona_id
+        self.instructions = instructions if instructions is not None else []
+        self.current_version = current_version
+        self.checkpoint_interval = checkpoint_interval
+        self._base = None
+        self._deltas = []
+        self._checkpoints = {}
+        self._head = None
+        for persona in versions or []:
+            self.append(persona)
+
+    @property
+    def versions(self) -> list[Persona]:
+        """Reconstruct every version, oldest first (prefer get() for one)."""
+        return [
+            Persona.from_dict(copy.deepcopy(self._snapshot(version)))
+            for version in range(self.version_count)
+        ]
 
     @property
     def version_count(self) -> int:
         """Number of versions."""
-        return len(self.versions)
+        if self._base is None:
+            return 0
+        return len(self._deltas) + 1
 
     @property
     def can_undo(self) -> bool:
@@ -107,14 +178,78 @@ class RefinementHistory:
     @property
     def can_redo(self) -> bool:
         """Check if redo is available."""
-        return self.current_version < len(self.versions) - 1
+        return self.current_version < self.version_count - 1
 
     @property
     def current(self) -> Persona | None:
         """Get current persona version."""
-        if 0 <= self.current_version < len(self.versions):
-            return self.versions[self.current_version]
-        return None
+        return self.get(self.current_version)
+
+    def append(self, persona: Persona) -> int:
+        """
+        Record a new latest version.
+
+        Args:
+            persona: Persona to record.
+
+        Returns:
+            Version number of the recorded persona.
+        """
+        if self._base is None:
+            snapshot = copy.deepcopy(persona.to_dict())
+            self._base = snapshot
+            self._checkpoints = {0: snapshot}
+        else:
+            delta = _field_delta(self._head, persona.to_dict())
+            snapshot = _apply_delta(self._head, delta)
+            self._deltas.append(delta)
+            version = len(self._deltas)
+            if version % self.checkpoint_interval == 0:
+                self._checkpoints[version] = snapshot
+
+        self._head = snapshot
+        return self.version_count - 1
+
+    def truncate(self, version: int) -> None:
+        """
+        Discard all versions after a version.
+
+        Args:
+            version: Last version to keep.
+        """
+        if version >= self.version_count - 1:
+            return
+
+        self._head = self._snapshot(version)
+        del self._deltas[version:]
+        del self.instructions[version:]
+        self._checkpoints = {v: c for v, c in self._checkpoints.items() if v <= version}
+
+    def get(self, version: int) -> Persona | None:
+        """
+        Reconstruct a version.
+
+        Args:
+            version: Version number.
+
+        Returns:
+            Independent copy of the persona at that version, or None if
+            the version does not exist.
+        """
+        if not 0 <= version < self.version_count:
+            return None
+        return Persona.from_dict(copy.deepcopy(self._snapshot(version)))
+
+    def _snapshot(self, version: int) -> dict[str, Any]:
+        """Build the stored dictionary for a version from a checkpoint."""
+        if version == self.version_count - 1:
+            return self._head
+
+        start = max(v for v in self._checkpoints if v <= version)
+        data = self._checkpoints[start]
+        for delta in self._deltas[start:version]:
+            data = _apply_delta(data, delta)
+        return data
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -125,8 +260,39 @@ class RefinementHistory:
             "can_undo": self.can_undo,
             "can_redo": self.can_redo,
             "instructions": [i.to_dict() for i in self.instructions],
+            "checkpoint_interval": self.checkpoint_interval,
+            "base": self._base,
+            "deltas": self._deltas,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RefinementHistory":
+        """Create from dictionary."""
+        history = cls(
+            persona_id=data["persona_id"],
+            instructions=[
+                RefinementInstruction.from_dict(i) for i in data.get("instructions", [])
+            ],
+            current_version=data.get("current_version", 0),
+            checkpoint_interval=data.get(
+                "checkpoint_interval", DEFAULT_CHECKPOINT_INTERVAL
+            ),
+        )
+
+        if data.get("base") is not None:
+            # Replay deltas to rebuild checkpoints and the latest version
+            history._base = data["base"]
+            history._checkpoints = {0: history._base}
+            head = history._base
+            for version, delta in enumerate(data.get("deltas", []), start=1):
+                head = _apply_delta(head, delta)
+                history._deltas.append(delta)
+                if version % history.checkpoint_interval == 0:
+                    history._checkpoints[version] = head
+            history._head = head
+
+        return history
+
 
 @dataclass
 class RefinementSession:
@@ -147,13 +313,9 @@ class RefinementSession:
     def __post_init__(self):
         """Initialise history if needed."""
         if self.history is None:
-            self.history = RefinementHistory(
-                persona_id=self.persona.id,
-                versions=[copy.deepcopy(self.persona)],
-                current_version=0,
-            )
-        elif not self.history.versions:
-            self.history.versions = [copy.deepcopy(self.persona)]
+            self.history = RefinementHistory(persona_id=self.persona.id)
+        if self.history.version_count == 0:
+            self.history.append(self.persona)
             self.history.current_version = 0
 
     @property
@@ -174,18 +336,11 @@ class RefinementSession:
             instruction: The instruction that created it.
         """
         # Truncate any redo history
-        if self.history.current_version < len(self.history.versions) - 1:
-            self.history.versions = self.history.versions[
-                : self.history.current_version + 1
-            ]
-            self.history.instructions = self.history.instructions[
-                : self.history.current_version
-            ]
+        self.history.truncate(self.history.current_version)
 
         # Add new version
-        self.history.versions.append(copy.deepcopy(persona))
+        self.history.current_version = self.history.append(persona)
         self.history.instructions.append(instruction)
-        self.history.current_version = len(self.history.versions) - 1
         self.persona = persona
 
     def undo(self) -> Persona | None:
@@ -199,7 +354,7 @@ class RefinementSession:
             return None
 
         self.history.current_version -= 1
-        self.persona = copy.deepcopy(self.history.current)
+        self.persona = self.history.current
         return self.persona
 
     def redo(self) -> Persona | None:
@@ -213,7 +368,7 @@ class RefinementSession:
             return None
 
         self.history.current_version += 1
-        self.persona = copy.deepcopy(self.history.current)
+        self.persona = self.history.current
         return self.persona
 
     def get_version(self, version: int) -> Persona | None:
@@ -226,9 +381,7 @@ class RefinementSession:
         Returns:
             Persona at that version, or None if invalid.
         """
-        if 0 <= version < len(self.history.versions):
-            return self.history.versions[version]
-        return None
+        return self.history.get(version)
 
     def get_diff(self, version_a: int, version_b: int) -> dict[str, Any]:
         """
@@ -282,13 +435,66 @@ class RefinementSession:
 
         return changes
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "persona": self.persona.to_dict(),
+            "history": self.history.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RefinementSession":
+        """Create from dictionary."""
+        return cls(
+            persona=Persona.from_dict(dict(data["persona"])),
+            history=RefinementHistory.from_dict(data["history"]),
+        )
+
+    def save(self, path: Path | str) -> Path:
+        """
+        Write the session to a JSON file atomically.
+
+        Args:
+            path: File to write.
+
+        Returns:
+            Path to the written file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    @classmethod
+    def load(cls, path: Path | str) -> "RefinementSession":
+        """
+        Read a session written by save().
+
+        Args:
+            path: File to read.
+
+        Returns:
+            Restored session.
+        """
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
 
 class PersonaRefiner:
     """
     Refines personas through natural language instructions.
 
     Provides iterative refinement with history tracking,
-    undo/redo support, and change summaries.
+    undo/redo support, and change summaries. With a session directory,
+    sessions can be evicted from memory to disk and are reloaded
+    transparently by get_session().
 
     Example:
         refiner = PersonaRefiner()
@@ -317,9 +523,24 @@ class PersonaRefiner:
         },
     }
 
-    def __init__(self) -> None:
-        """Initialise the refiner."""
-        self._sessions: dict[str, RefinementSession] = {}
+    def __init__(
+        self,
+        session_dir: Path | str | None = None,
+        max_sessions: int | None = None,
+    ) -> None:
+        """
+        Initialise the refiner.
+
+        Args:
+            session_dir: Directory evicted sessions are persisted to, or
+                None to keep sessions in memory only.
+            max_sessions: Maximum sessions held in memory; the least
+                recently used are evicted to session_dir. Ignored without
+                a session directory.
+        """
+        self._sessions: OrderedDict[str, RefinementSession] = OrderedDict()
+        self.session_dir = Path(session_dir) if session_dir else None
+        self.max_sessions = max_sessions
 
     def create_session(self, persona: Persona) -> RefinementSession:
         """
@@ -333,11 +554,13 @@ class PersonaRefiner:
         """
         session = RefinementSession(persona=copy.deepcopy(persona))
         self._sessions[persona.id] = session
+        self._sessions.move_to_end(persona.id)
+        self._evict_excess()
         return session
 
     def get_session(self, persona_id: str) -> RefinementSession | None:
         """
-        Get an existing session.
+        Get an existing session, reloading it if it was evicted.
 
         Args:
             persona_id: Persona ID.
@@ -345,7 +568,66 @@ class PersonaRefiner:
         Returns:
             Session if exists, None otherwise.
         """
-        return self._sessions.get(persona_id)
+        session = self._sessions.get(persona_id)
+        if session is not None:
+            self._sessions.move_to_end(persona_id)
+            return session
+
+        path = self._session_path(persona_id)
+        if path is None or not path.exists():
+            return None
+
+        session = RefinementSession.load(path)
+        self._sessions[persona_id] = session
+        self._evict_excess()
+        return session
+
+    def save_session(self, persona_id: str) -> Path | None:
+        """
+        Persist a session to the session directory.
+
+        Args:
+            persona_id: Persona ID.
+
+        Returns:
+            Path to the session file, or None if the session is not in
+            memory or there is no session directory.
+        """
+        session = self._sessions.get(persona_id)
+        path = self._session_path(persona_id)
+        if session is None or path is None:
+            return None
+        return session.save(path)
+
+    def evict_session(self, persona_id: str) -> bool:
+        """
+        Persist a session and drop it from memory.
+
+        Args:
+            persona_id: Persona ID.
+
+        Returns:
+            True if the session was evicted, False if it is not in memory
+            or there is no session directory to persist it to.
+        """
+        if self.save_session(persona_id) is None:
+            return False
+        del self._sessions[persona_id]
+        return True
+
+    def _evict_excess(self) -> None:
+        """Evict least recently used sessions beyond max_sessions."""
+        if self.session_dir is None or self.max_sessions is None:
+            return
+        while len(self._sessions) > self.max_sessions:
+            self.evict_session(next(iter(self._sessions)))
+
+    def _session_path(self, persona_id: str) -> Path | None:
+        """Get the file a session is persisted to."""
+        if self.session_dir is None:
+            return None
+        digest = hashlib.sha256(persona_id.encode("utf-8")).hexdigest()[:16]
+        return self.session_dir / f"{digest}.json"
 
     def refine(
         self,
@@ -471,7 +753,7 @@ class PersonaRefiner:
             instruction=f"Revert to version {version}",
         )
 
-        session.add_version(copy.deepcopy(persona), instr)
+        session.add_version(persona, instr)
 
         return RefinementResult(
             success=True,
@@ -609,6 +891,12 @@ class PersonaRefiner:
         Returns:
             True if session was closed, False if not found.
         """
+        path = self._session_path(persona_id)
+        if path is not None and path.exists():
+            path.unlink()
+            self._sessions.pop(persona_id, None)
+            return True
+
         if persona_id in self._sessions:
             del self._sessions[persona_id]
             return True
@@ -4,6 +4,15 @@ Security module for Persona.
 Provides API key protection, rotation, rate limiting, and error handling.
 """
 
+from persona.core.security.adaptive import (
+    AdaptiveConfig,
+    AdaptiveLimiter,
+    AdaptiveRateController,
+    RateLimitHeaders,
+    get_rate_controller,
+    parse_rate_limit_headers,
+    set_rate_controller,
+)
 from persona.core.security.keys import (
     KeyMaskingFilter,
     SecureString,
@@ -54,6 +63,14 @@ __all__ = [
     "RateLimiter",
     "RateLimitConfig",
     "RateLimitExceeded",
+    # Adaptive rate control
+    "AdaptiveConfig",
+    "AdaptiveLimiter",
+    "AdaptiveRateController",
+    "RateLimitHeaders",
+    "get_rate_controller",
+    "set_rate_controller",
+    "parse_rate_limit_headers",
     # Retry (F-058)
     "RetryStrategy",
     "CircuitBreaker",
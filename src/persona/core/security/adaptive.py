@@ -0,0 +1,840 @@
+"""
+Adaptive concurrency and rate control for provider requests.
+
+RateLimiter enforces static per-provider budgets and only reacts once a
+429 has arrived. AdaptiveRateController instead tunes how many requests
+may be in flight for each provider, model and API key. It uses what the
+provider reports: rate-limit headers (how many requests and tokens are
+left and when they reset), Retry-After, latency and error rates.
+
+The limit follows AIMD (additive increase, multiplicative decrease).
+While responses are healthy it grows by about one request per round
+trip. It is cut multiplicatively as soon as the provider signals
+pressure: a 429/503/529, little remaining headroom, latency climbing
+well above its usual level, or a rising error rate. Callers therefore
+run close to the provider's real ceiling without tripping 429 storms.
+
+HTTP providers report every request to the process-wide controller
+(see get_rate_controller). Batch processing, hybrid and multi-model
+generation and the API therefore share the same limits.
+"""
+
+import asyncio
+import email.utils
+import hashlib
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
+
+from persona.core.security.rate_limiter import (
+    DEFAULT_RATE_LIMITS,
+    RateLimitConfig,
+    RateLimitExceeded,
+)
+
+# Status codes providers use to ask clients to slow down
+RATE_LIMIT_STATUS = frozenset({429, 503, 529})
+
+# Latency samples needed before latency can trigger a decrease
+MIN_LATENCY_SAMPLES = 10
+
+# Weight of each new sample in the long-run latency average
+SLOW_SMOOTHING = 0.02
+
+# Header names, OpenAI style first, then Anthropic style
+_HEADER_NAMES = {
+    "limit_requests": (
+        "x-ratelimit-limit-requests",
+        "anthropic-ratelimit-requests-limit",
+    ),
+    "remaining_requests": (
+        "x-ratelimit-remaining-requests",
+        "anthropic-ratelimit-requests-remaining",
+    ),
+    "reset_requests": (
+        "x-ratelimit-reset-requests",
+        "anthropic-ratelimit-requests-reset",
+    ),
+    "limit_tokens": (
+        "x-ratelimit-limit-tokens",
+        "anthropic-ratelimit-tokens-limit",
+        "anthropic-ratelimit-input-tokens-limit",
+    ),
+    "remaining_tokens": (
+        "x-ratelimit-remaining-tokens",
+        "anthropic-ratelimit-tokens-remaining",
+        "anthropic-ratelimit-input-tokens-remaining",
+    ),
+    "reset_tokens": (
+        "x-ratelimit-reset-tokens",
+        "anthropic-ratelimit-tokens-reset",
+        "anthropic-ratelimit-input-tokens-reset",
+    ),
+}
+
+# Go-style durations used by OpenAI, e.g. "1s", "6m0s", "20ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value: str, now: datetime | None = None) -> float | None:
+    """
+    Parse a reset time or Retry-After value into seconds from now.
+
+    Accepts plain seconds ("12", "0.5"), Go-style durations ("6m0s",
+    "20ms"), RFC 3339 timestamps ("2025-01-01T00:00:30Z") and HTTP dates.
+
+    Args:
+        value: Header value.
+        now: Current time for timestamp values (defaults to now, UTC).
+
+    Returns:
+        Seconds until the reset (never negative), or None if the value
+        cannot be parsed.
+    """
+    value = value.strip()
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            moment = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    now = now or datetime.now(UTC)
+    return max(0.0, (moment - now).total_seconds())
+
+
+@dataclass
+class RateLimitHeaders:
+    """
+    Rate-limit information reported with a provider response.
+
+    Attributes:
+        limit_requests: Requests allowed per window.
+        remaining_requests: Requests left in the current window.
+        reset_requests: Seconds until the request budget resets.
+        limit_tokens: Tokens allowed per window.
+        remaining_tokens: Tokens left in the current window.
+        reset_tokens: Seconds until the token budget resets.
+        retry_after: Seconds the provider asked clients to wait.
+    """
+
+    limit_requests: int | None = None
+    remaining_requests: int | None = None
+    reset_requests: float | None = None
+    limit_tokens: int | None = None
+    remaining_tokens: int | None = None
+    reset_tokens: float | None = None
+    retry_after: float | None = None
+
+    @property
+    def headroom(self) -> float | None:
+        """Smallest remaining fraction of the request and token budgets."""
+        fractions = [
+            remaining / limit
+            for remaining, limit in (
+                (self.remaining_requests, self.limit_requests),
+                (self.remaining_tokens, self.limit_tokens),
+            )
+            if remaining is not None and limit
+        ]
+        return min(fractions) if fractions else None
+
+    @property
+    def pause(self) -> float | None:
+        """
+        Seconds to hold new requests back, if the provider asked for it.
+
+        Either the provider's Retry-After, or the time until an exhausted
+        request or token budget resets.
+        """
+        waits = [self.retry_after or 0.0]
+        if self.remaining_requests == 0 and self.reset_requests is not None:
+            waits.append(self.reset_requests)
+        if self.remaining_tokens == 0 and self.reset_tokens is not None:
+            waits.append(self.reset_tokens)
+        longest = max(waits)
+        return longest or None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, omitting unreported values."""
+        return {k: v for k, v in self.__dict__.items() if v is not None}
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str] | None) -> RateLimitHeaders:
+    """
+    Read rate-limit information from response headers.
+
+    Understands OpenAI's x-ratelimit-* headers, Anthropic's
+    anthropic-ratelimit-* headers, Retry-After and retry-after-ms.
+
+    Args:
+        headers: Response headers (any mapping; names are matched
+            case-insensitively).
+
+    Returns:
+        RateLimitHeaders with every field the headers reported.
+    """
+    result = RateLimitHeaders()
+    if not isinstance(headers, Mapping):
+        return result
+
+    lowered = {
+        str(k).lower(): v for k, v in headers.items() if isinstance(v, str) and v
+    }
+
+    def first(names: tuple[str, ...]) -> str | None:
+        return next((lowered[n] for n in names if n in lowered), None)
+
+    for name, candidates in _HEADER_NAMES.items():
+        value = first(candidates)
+        if value is None:
+            continue
+        if name.startswith("reset"):
+            setattr(result, name, parse_duration(value))
+        else:
+            try:
+                setattr(result, name, int(float(value)))
+            except ValueError:
+                pass
+
+    if "retry-after-ms" in lowered:
+        ms = parse_duration(lowered["retry-after-ms"])
+        result.retry_after = ms / 1000 if ms is not None else None
+    elif "retry-after" in lowered:
+        result.retry_after = parse_duration(lowered["retry-after"])
+
+    return result
+
+
+def key_fingerprint(api_key: str | None) -> str:
+    """
+    Identify an API key without keeping the key itself.
+
+    Args:
+        api_key: API key, or None.
+
+    Returns:
+        Short SHA-256 prefix of the key, or "" when there is no key.
+    """
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class LimiterKey(NamedTuple):
+    """Provider, model and key fingerprint a limiter applies to."""
+
+    provider: str
+    model: str
+    key: str
+
+
+@dataclass
+class AdaptiveConfig:
+    """
+    Tuning for adaptive concurrency limits.
+
+    Attributes:
+        initial_limit: Starting in-flight limit. None uses the provider's
+            RateLimitConfig.concurrent_requests.
+        min_limit: Lowest in-flight limit.
+        max_limit: Highest in-flight limit.
+        increase: Requests added to the limit per round trip of healthy,
+            saturated traffic.
+        decrease: Factor applied to the limit when the provider signals
+            rate limiting or errors climb.
+        latency_decrease: Gentler factor applied when latency climbs.
+        latency_tolerance: Ratio of recent to long-run latency treated as
+            queueing at the provider.
+        error_threshold: Recent error rate (0-1) that triggers a decrease.
+        low_headroom: Remaining fraction of the request or token budget
+            below which the limit is reduced before a 429 arrives.
+        smoothing: Weight of each new sample in recent averages.
+    """
+
+    initial_limit: int | None = None
+    min_limit: int = 1
+    max_limit: int = 64
+    increase: float = 1.0
+    decrease: float = 0.5
+    latency_decrease: float = 0.9
+    latency_tolerance: float = 2.0
+    error_threshold: float = 0.25
+    low_headroom: float = 0.1
+    smoothing: float = 0.2
+
+
+class AdaptiveLimiter:
+    """
+    AIMD in-flight limit for one provider, model and API key.
+
+    Safe to share between threads and event loops: sync callers block
+    on a condition variable, and async waiters are woken on their own
+    loop when a slot frees up.
+
+    Example:
+        limiter = controller.limiter("openai", "gpt-4o", api_key)
+        await limiter.acquire_async()
+        started = time.monotonic()
+        response = await client.post(url, json=payload)
+        limiter.complete(
+            time.monotonic() - started,
+            status=response.status_code,
+            headers=response.headers,
+        )
+    """
+
+    def __init__(
+        self,
+        key: LimiterKey,
+        config: AdaptiveConfig,
+        rate_limit: RateLimitConfig,
+    ) -> None:
+        """
+        Initialise the limiter.
+
+        Args:
+            key: What the limiter applies to.
+            config: AIMD tuning.
+            rate_limit: Static provider configuration, used for the
+                starting limit.
+        """
+        self.key = key
+        self.config = config
+        initial = config.initial_limit or rate_limit.concurrent_requests
+        self._limit = float(min(max(initial, config.min_limit), config.max_limit))
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.latency: float | None = None
+        self.baseline_latency: float | None = None
+        self.error_rate = 0.0
+        self.last_headers = RateLimitHeaders()
+        self.requests = 0
+        self.successes = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self._latency_samples = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit."""
+        return max(self.config.min_limit, int(self._limit))
+
+    def _wait_locked(self, now: float) -> float | None:
+        """Seconds until a slot may free up; 0 if one is free, None if unknown."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.in_flight >= self.limit:
+            return None
+        return 0.0
+
+    def _timeout_error(self, wait: float | None) -> RateLimitExceeded:
+        """Build the error raised when acquiring times out."""
+        return RateLimitExceeded(
+            f"Timeout waiting for request slot for {self.key.provider}",
+            provider=self.key.provider,
+            retry_after=wait,
+        )
+
+    def try_acquire(self) -> bool:
+        """
+        Take a slot if one is free now.
+
+        Returns:
+            True if a slot was taken.
+        """
+        with self._lock:
+            if self._wait_locked(time.monotonic()) != 0.0:
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self, timeout: float | None = None) -> float:
+        """
+        Take a slot, blocking until one is free.
+
+        Args:
+            timeout: Maximum time to wait (None for no limit).
+
+        Returns:
+            Time waited in seconds.
+
+        Raises:
+            RateLimitExceeded: If no slot was free within the timeout.
+        """
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                wait = self._wait_locked(now)
+                if wait == 0.0:
+                    self.in_flight += 1
+                    return now - start
+
+                remaining = None if timeout is None else timeout - (now - start)
+                if remaining is not None and remaining <= 0:
+                    raise self._timeout_error(wait)
+                delays = [d for d in (wait, remaining) if d is not None]
+                self._condition.wait(min(delays) if delays else None)
+
+    async def acquire_async(self, timeout: float | None = None) -> float:
+        """
+        Take a slot without blocking the event loop.
+
+        Args:
+            timeout: Maximum time to wait (None for no limit).
+
+        Returns:
+            Time waited in seconds.
+
+        Raises:
+            RateLimitExceeded: If no slot was free within the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._wait_locked(now)
+                if wait == 0.0:
+                    self.in_flight += 1
+                    return now - start
+
+                remaining = None if timeout is None else timeout - (now - start)
+                if remaining is not None and remaining <= 0:
+                    raise self._timeout_error(wait)
+                waiter = (loop, loop.create_future())
+                self._waiters.append(waiter)
+
+            delays = [d for d in (wait, remaining) if d is not None]
+            try:
+                await asyncio.wait({waiter[1]}, timeout=min(delays) if delays else None)
+            finally:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+
+    def release(self) -> None:
+        """Give a slot back without reporting an outcome (e.g. cancellation)."""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._notify_locked()
+
+    def complete(
+        self,
+        latency: float,
+        status: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        error: bool = False,
+    ) -> None:
+        """
+        Give a slot back and adjust the limit from the request's outcome.
+
+        Args:
+            latency: Request duration in seconds.
+            status: HTTP status code, if a response arrived.
+            headers: Response headers, if a response arrived.
+            error: Whether the request failed without a usable response
+                (timeout, connection error).
+        """
+        info = parse_rate_limit_headers(headers)
+        with self._lock:
+            now = time.monotonic()
+            saturated = self.in_flight >= self.limit
+            self.in_flight = max(0, self.in_flight - 1)
+            self.requests += 1
+            self._adjust_locked(now, latency, status, info, error, saturated)
+            self._notify_locked()
+
+    def _adjust_locked(
+        self,
+        now: float,
+        latency: float,
+        status: int | None,
+        info: RateLimitHeaders,
+        error: bool,
+        saturated: bool,
+    ) -> None:
+        """Apply one request's signals to the limit."""
+        config = self.config
+        if info.to_dict():
+            self.last_headers = info
+
+        pause = info.pause
+        if pause:
+            self.blocked_until = max(self.blocked_until, now + pause)
+
+        if status in RATE_LIMIT_STATUS:
+            self.rate_limited += 1
+            self._decrease_locked(now, config.decrease)
+            return
+
+        failed = error or (status is not None and status >= 500)
+        self.error_rate += config.smoothing * (float(failed) - self.error_rate)
+        if failed:
+            self.errors += 1
+            if self.error_rate > config.error_threshold:
+                self._decrease_locked(now, config.decrease)
+            return
+
+        self.successes += 1
+        self._record_latency_locked(latency)
+
+        # Never allow more in flight than requests left in the window
+        if info.remaining_requests is not None:
+            self._limit = min(
+                self._limit, float(max(config.min_limit, info.remaining_requests))
+            )
+
+        headroom = info.headroom
+        if headroom is not None and headroom < config.low_headroom:
+            self._decrease_locked(now, config.decrease)
+        elif self._latency_climbing():
+            self._decrease_locked(now, config.latency_decrease)
+        elif saturated:
+            # Roughly +increase per round trip: each of `limit` responses
+            # adds increase / limit
+            self._limit = min(
+                float(config.max_limit), self._limit + config.increase / self._limit
+            )
+
+    def _record_latency_locked(self, latency: float) -> None:
+        """Update the recent and long-run latency averages."""
+        self._latency_samples += 1
+        if self.latency is None or self.baseline_latency is None:
+            self.latency = self.baseline_latency = latency
+            return
+        self.latency += self.config.smoothing * (latency - self.latency)
+        self.baseline_latency += SLOW_SMOOTHING * (latency - self.baseline_latency)
+
+    def _latency_climbing(self) -> bool:
+        """Whether recent latency is well above its long-run level."""
+        return (
+            self._latency_samples >= MIN_LATENCY_SAMPLES
+            and self.latency is not None
+            and self.baseline_latency is not None
+            and self.latency > self.config.latency_tolerance * self.baseline_latency
+        )
+
+    def _decrease_locked(self, now: float, factor: float) -> None:
+        """Cut the limit, at most once per round trip."""
+        round_trip = self.latency or 0.0
+        if now - self._last_decrease < round_trip:
+            return
+        self._limit = max(float(self.config.min_limit), self._limit * factor)
+        self._last_decrease = now
+
+    def _notify_locked(self) -> None:
+        """Wake sync and async waiters so they re-check for a free slot."""
+        self._condition.notify_all()
+        for loop, future in self._waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                pass  # Loop already closed
+        self._waiters.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the limiter's state."""
+        with self._lock:
+            blocked_for = max(0.0, self.blocked_until - time.monotonic())
+            return {
+                "provider": self.key.provider,
+                "model": self.key.model,
+                "key": self.key.key,
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "blocked_for": blocked_for,
+                "latency": self.latency,
+                "baseline_latency": self.baseline_latency,
+                "error_rate": self.error_rate,
+                "requests": self.requests,
+                "successes": self.successes,
+                "errors": self.errors,
+                "rate_limited": self.rate_limited,
+                "headers": self.last_headers.to_dict(),
+            }
+
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve a waiter's future if nobody else has."""
+    if not future.done():
+        future.set_result(None)
+
+
+class RequestSlot:
+    """
+    One request's slot, reporting its outcome when the block exits.
+
+    Call record() with the response; if the block raises before a
+    response is recorded, the request counts as an error (or is simply
+    released on cancellation).
+    """
+
+    def __init__(self, limiter: AdaptiveLimiter) -> None:
+        """
+        Initialise the slot.
+
+        Args:
+            limiter: Limiter the slot was taken from.
+        """
+        self.limiter = limiter
+        self.started = time.monotonic()
+        self.status: int | None = None
+        self.headers: Mapping[str, str] | None = None
+
+    def record(self, response: Any) -> None:
+        """
+        Record the response (anything with status_code and headers).
+
+        Args:
+            response: HTTP response.
+        """
+        status = getattr(response, "status_code", None)
+        self.status = status if isinstance(status, int) else None
+        self.headers = getattr(response, "headers", None)
+
+    def _finish(self, error: BaseException | None) -> None:
+        """Report the outcome to the limiter."""
+        if isinstance(error, asyncio.CancelledError):
+            self.limiter.release()
+            return
+        self.limiter.complete(
+            time.monotonic() - self.started,
+            status=self.status,
+            headers=self.headers,
+            error=error is not None and self.status is None,
+        )
+
+
+class AdaptiveRateController:
+    """
+    Adaptive in-flight limits per provider, model and API key.
+
+    Example:
+        controller = get_rate_controller()
+        async with controller.slot_async("anthropic", model, api_key) as slot:
+            response = await client.post(url, json=payload)
+            slot.record(response)
+        print(controller.get_status())
+    """
+
+    def __init__(
+        self,
+        config: AdaptiveConfig | None = None,
+        rate_limits: dict[str, RateLimitConfig] | None = None,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Initialise the controller.
+
+        Args:
+            config: AIMD tuning shared by all limiters.
+            rate_limits: Static provider configurations for starting
+                limits (defaults to DEFAULT_RATE_LIMITS).
+            enabled: Whether slots are limited at all; when False,
+                slot() and slot_async() never wait or record.
+        """
+        self.config = config or AdaptiveConfig()
+        self.enabled = enabled
+        self._rate_limits = rate_limits or DEFAULT_RATE_LIMITS.copy()
+        self._limiters: dict[LimiterKey, AdaptiveLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(
+        self,
+        provider: str,
+        model: str | None = None,
+        api_key: str | None = None,
+    ) -> AdaptiveLimiter:
+        """
+        Get the limiter for a provider, model and key, creating it on first use.
+
+        Args:
+            provider: Provider name.
+            model: Model identifier.
+            api_key: API key; only a fingerprint of it is kept.
+
+        Returns:
+            Shared AdaptiveLimiter.
+        """
+        key = LimiterKey(provider, model or "", key_fingerprint(api_key))
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(key)
+                if limiter is None:
+                    limiter = AdaptiveLimiter(
+                        key,
+                        self.config,
+                        self._rate_limits.get(provider, RateLimitConfig()),
+                    )
+                    self._limiters[key] = limiter
+        return limiter
+
+    @contextmanager
+    def slot(
+        self,
+        provider: str,
+        model: str | None = None,
+        api_key: str | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[RequestSlot | None]:
+        """
+        Hold a request slot for a block (blocking).
+
+        Args:
+            provider: Provider name.
+            model: Model identifier.
+            api_key: API key.
+            timeout: Maximum time to wait for a slot.
+
+        Yields:
+            RequestSlot to record the response on, or None when the
+            controller is disabled.
+
+        Raises:
+            RateLimitExceeded: If no slot was free within the timeout.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        limiter = self.limiter(provider, model, api_key)
+        limiter.acquire(timeout)
+        request = RequestSlot(limiter)
+        try:
+            yield request
+        except BaseException as e:
+            request._finish(e)
+            raise
+        request._finish(None)
+
+    @asynccontextmanager
+    async def slot_async(
+        self,
+        provider: str,
+        model: str | None = None,
+        api_key: str | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[RequestSlot | None]:
+        """
+        Hold a request slot for a block without blocking the event loop.
+
+        Args:
+            provider: Provider name.
+            model: Model identifier.
+            api_key: API key.
+            timeout: Maximum time to wait for a slot.
+
+        Yields:
+            RequestSlot to record the response on, or None when the
+            controller is disabled.
+
+        Raises:
+            RateLimitExceeded: If no slot was free within the timeout.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        limiter = self.limiter(provider, model, api_key)
+        await limiter.acquire_async(timeout)
+        request = RequestSlot(limiter)
+        try:
+            yield request
+        except BaseException as e:
+            request._finish(e)
+            raise
+        request._finish(None)
+
+    def get_status(self) -> list[dict[str, Any]]:
+        """
+        Get the state of every limiter.
+
+        Returns:
+            One dictionary per provider, model and key.
+        """
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return [limiter.to_dict() for limiter in limiters]
+
+    def to_prometheus(self, prefix: str = "persona") -> str:
+        """Render current limits in Prometheus text exposition format."""
+        gauges = {
+            "provider_concurrency_limit": ("limit", "Adaptive in-flight limit."),
+            "provider_in_flight": ("in_flight", "Requests currently in flight."),
+            "provider_rate_limited_total": (
+                "rate_limited",
+                "Responses that signalled rate limiting.",
+            ),
+        }
+        status = self.get_status()
+        lines: list[str] = []
+        for metric, (field, description) in gauges.items():
+            kind = "counter" if metric.endswith("_total") else "gauge"
+            lines.append(f"# HELP {prefix}_{metric} {description}")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for entry in status:
+                label = (
+                    f'{{provider="{entry["provider"]}",model="{entry["model"]}",'
+                    f'key="{entry["key"]}"}}'
+                )
+                lines.append(f"{prefix}_{metric}{label} {entry[field]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Forget all learned limits."""
+        with self._lock:
+            self._limiters.clear()
+
+
+_controller = AdaptiveRateController()
+
+
+def get_rate_controller() -> AdaptiveRateController:
+    """Get the process-wide adaptive rate controller."""
+    return _controller
+
+
+def set_rate_controller(
+    controller: AdaptiveRateController | None,
+) -> AdaptiveRateController:
+    """
+    Replace the process-wide adaptive rate controller.
+
+    Args:
+        controller: Controller to use, or None for a disabled one.
+
+    Returns:
+        The previous controller.
+    """
+    global _controller
+    previous = _controller
+    _controller = controller or AdaptiveRateController(enabled=False)
+    return previous
@@ -7,6 +7,7 @@ and request queueing.
 
 import asyncio
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -300,6 +301,33 @@ class RateLimiter:
                 config.max_delay,
             )
 
+    def record_response_headers(
+        self,
+        provider: str,
+        headers: Mapping[str, str],
+    ) -> None:
+        """
+        Align the bucket with the provider's reported rate-limit headers.
+
+        The bucket never holds more requests than the provider says are
+        left, and an exhausted budget or Retry-After sets the backoff
+        delay, so the limiter slows down before a 429 rather than after.
+
+        Args:
+            provider: Provider name.
+            headers: Response headers (see parse_rate_limit_headers).
+        """
+        from persona.core.security.adaptive import parse_rate_limit_headers
+
+        info = parse_rate_limit_headers(headers)
+        self._refill_tokens(provider)
+        state = self._get_state(provider)
+
+        if info.remaining_requests is not None:
+            state.tokens = min(state.tokens, float(info.remaining_requests))
+        if info.pause:
+            state.backoff_delay = max(state.backoff_delay, info.pause)
+
     def get_status(self, provider: str) -> dict[str, Any]:
         """
         Get current rate limit status for a provider.
@@ -8,11 +8,22 @@ synthetic data generation.
 
 import csv
 import json
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from persona.core.synthetic.columnar import (
+    CATEGORICAL_LIMIT,
+    ColumnAccumulator,
+    accumulate,
+    is_null,
+    numeric_summary,
+    reservoir_sample,
+)
 from persona.core.synthetic.models import (
     ColumnType,
     DataSchema,
@@ -28,15 +39,31 @@ class DataAnalyser:
     (categorical frequencies, numeric ranges), and relationships to
     inform synthetic data generation.
 
+    CSV files are streamed row by row and every column is summarised in
+    a single pass, so memory use does not grow with the number of rows.
+    For very large inputs, sample_size limits analysis to a uniform
+    random sample of rows.
+
     Example:
         analyser = DataAnalyser()
         schema = analyser.analyse_file("interviews.csv")
         print(f"Schema: {schema.column_names()}")
+
+        # Million-row source: analyse a 50k-row sample
+        schema = DataAnalyser(sample_size=50_000).analyse_file("survey.csv")
     """
 
-    def __init__(self) -> None:
-        """Initialise the data analyser."""
-        pass
+    def __init__(self, sample_size: int | None = None, seed: int = 0) -> None:
+        """
+        Initialise the data analyser.
+
+        Args:
+            sample_size: Maximum rows to analyse; larger inputs are
+                reservoir-sampled. None analyses every row.
+            seed: Random seed for reproducible samples.
+        """
+        self.sample_size = sample_size
+        self.seed = seed
 
     def analyse_file(self, file_path: Path | str) -> DataSchema:
         """
@@ -61,7 +88,7 @@ class DataAnalyser:
         suffix = file_path.suffix.lower()
 
         if suffix == ".csv":
-            data = self._load_csv(file_path)
+            data = self._iter_csv(file_path)
             format_type = "csv"
         elif suffix == ".json":
             data = self._load_json(file_path)
@@ -95,12 +122,12 @@ class DataAnalyser:
 
     def _load_csv(self, file_path: Path) -> list[dict[str, Any]]:
         """Load CSV file into list of dictionaries."""
-        data = []
+        return list(self._iter_csv(file_path))
+
+    def _iter_csv(self, file_path: Path) -> Iterator[dict[str, Any]]:
+        """Stream rows from a CSV file."""
         with open(file_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                data.append(row)
-        return data
+            yield from csv.DictReader(f)
 
     def _load_json(self, file_path: Path) -> list[dict[str, Any]]:
         """Load JSON file into list of dictionaries."""
@@ -138,34 +165,35 @@ class DataAnalyser:
         else:
             raise ValueError("YAML must be a list or dictionary")
 
-    def _analyse_data(self, data: list[dict[str, Any]], format_type: str) -> DataSchema:
-        """Analyse structured data and build schema."""
-        if not data:
+    def _analyse_data(
+        self, data: Iterable[dict[str, Any]], format_type: str
+    ) -> DataSchema:
+        """Analyse structured data in a single pass and build schema."""
+        source_row_count = None
+        if self.sample_size is not None:
+            data, total = reservoir_sample(data, self.sample_size, self.seed)
+            if total > len(data):
+                source_row_count = total
+
+        accumulators, row_count = accumulate(data)
+        if row_count == 0:
             raise ValueError("No data to analyse")
 
-        row_count = len(data)
-
-        # Extract all column names
-        all_keys = set()
-        for row in data:
-            all_keys.update(row.keys())
-
-        column_names = sorted(all_keys)
-
         # Analyse each column
-        columns = []
-        for col_name in column_names:
-            dist = self._analyse_column(col_name, data)
-            columns.append(dist)
+        columns = [
+            self._build_column_stats(accumulators[name], row_count)
+            for name in sorted(accumulators)
+        ]
 
         # Detect relationships (simplified - just note which columns might be related)
-        relationships = self._detect_relationships(columns, data)
+        relationships = self._detect_relationships(columns, [])
 
         return DataSchema(
             columns=columns,
             row_count=row_count,
             format=format_type,
             relationships=relationships,
+            source_row_count=source_row_count,
         )
 
     def _analyse_column(
@@ -174,55 +202,55 @@ class DataAnalyser:
         data: list[dict[str, Any]],
     ) -> DistributionStats:
         """Analyse a single column to determine type and distribution."""
-        values = []
-        null_count = 0
-
-        # Extract values
+        acc = ColumnAccumulator(col_name)
         for row in data:
             value = row.get(col_name)
-            if (
-                value is None
-                or value == ""
-                or (isinstance(value, str) and value.strip() == "")
-            ):
-                null_count += 1
-            else:
-                values.append(value)
+            if not is_null(value):
+                acc.add(value)
+        return self._build_column_stats(acc, len(data))
 
-        unique_count = len(set(str(v) for v in values))
+    def _build_column_stats(
+        self,
+        acc: ColumnAccumulator,
+        row_count: int,
+    ) -> DistributionStats:
+        """Build distribution stats from a column accumulator."""
+        unique_count = acc.unique_count
 
         # Infer column type
-        col_type = self._infer_type(values)
-
-        # Sample values (up to 5)
-        sample_values = list(set(values))[:5]
+        col_type = self._infer_type(acc.type_sample)
 
         # Build distribution based on type
         categorical_dist = None
         numeric_stats = None
+        histogram_counts = None
+        histogram_edges = None
 
         if col_type == ColumnType.CATEGORICAL or col_type == ColumnType.TEXT:
             # For categorical, count frequencies
-            if unique_count <= 50:  # Reasonable categorical limit
-                categorical_dist = self._calculate_categorical_distribution(values)
+            if unique_count <= CATEGORICAL_LIMIT:
+                categorical_dist = acc.frequencies
             else:
                 # Too many unique values, treat as text
                 col_type = ColumnType.TEXT
 
         elif col_type == ColumnType.NUMERIC:
-            numeric_stats = self._calculate_numeric_stats(values)
+            numeric_stats = acc.numeric_summary()
+            histogram_counts, histogram_edges = acc.histogram()
 
         elif col_type == ColumnType.BOOLEAN:
-            categorical_dist = self._calculate_categorical_distribution(values)
+            categorical_dist = acc.frequencies
 
         return DistributionStats(
-            column_name=col_name,
+            column_name=acc.name,
             column_type=col_type,
             unique_count=unique_count,
-            null_count=null_count,
-            sample_values=sample_values,
+            null_count=row_count - acc.count,
+            sample_values=acc.sample_values,
             categorical_distribution=categorical_dist,
             numeric_stats=numeric_stats,
+            histogram_counts=histogram_counts,
+            histogram_edges=histogram_edges,
         )
 
     def _infer_type(self, values: list[Any]) -> ColumnType:
@@ -274,42 +302,20 @@ class DataAnalyser:
         values: list[Any],
     ) -> dict[str, int]:
         """Calculate frequency distribution for categorical data."""
-        distribution = {}
-        for value in values:
-            key = str(value)
-            distribution[key] = distribution.get(key, 0) + 1
-        return distribution
+        return dict(Counter(str(value) for value in values))
 
     def _calculate_numeric_stats(
         self,
         values: list[Any],
     ) -> dict[str, float]:
         """Calculate statistics for numeric data."""
-        numeric_values = []
+        numbers = array("d")
         for val in values:
             try:
-                numeric_values.append(float(val))
+                numbers.append(float(val))
             except (ValueError, TypeError):
                 pass
-
-        if not numeric_values:
-            return {
-                "min": 0.0,
-                "max": 0.0,
-                "mean": 0.0,
-                "std": 0.0,
-            }
-
-        mean = sum(numeric_values) / len(numeric_values)
-        variance = sum((x - mean) ** 2 for x in numeric_values) / len(numeric_values)
-        std = variance**0.5
-
-        return {
-            "min": min(numeric_values),
-            "max": max(numeric_values),
-            "mean": mean,
-            "std": std,
-        }
+        return numeric_summary(numbers)
 
     def _detect_relationships(
         self,
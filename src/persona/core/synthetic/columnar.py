@@ -0,0 +1,267 @@
+"""
+Columnar statistics for synthetic data analysis.
+
+This module provides single-pass column accumulators used by
+DataAnalyser. Numeric values are packed into typed arrays and
+summarised in bulk (with NumPy when it is installed), and categorical
+values are tallied in frequency tables, so analysing a file never needs
+a per-column pass over a list of row dictionaries.
+"""
+
+import math
+import random
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Values sampled to infer a column's type
+TYPE_SAMPLE_SIZE = 100
+
+# Columns with more distinct values than this are treated as free text
+CATEGORICAL_LIMIT = 50
+
+# Distinct example values kept per column
+SAMPLE_VALUE_COUNT = 5
+
+# Quantiles reported for numeric columns
+QUANTILES = {"p05": 0.05, "p25": 0.25, "p50": 0.5, "p75": 0.75, "p95": 0.95}
+
+# Number of equal-width histogram bins for numeric columns
+HISTOGRAM_BINS = 10
+
+
+def is_null(value: Any) -> bool:
+    """Check whether a value counts as missing."""
+    return value is None or (isinstance(value, str) and value.strip() == "")
+
+
+class ColumnAccumulator:
+    """
+    Single-pass statistics for one column.
+
+    Frequency counts are kept until the column exceeds CATEGORICAL_LIMIT
+    distinct values, after which only value hashes are kept for the
+    distinct count. Numeric parsing stops as soon as the type sample
+    shows the column is not numeric.
+
+    Example:
+        acc = ColumnAccumulator("age")
+        for row in rows:
+            acc.add(row.get("age"))
+        stats = acc.numeric_summary()
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialise the accumulator.
+
+        Args:
+            name: Column name.
+        """
+        self.name = name
+        self.count = 0
+        self.type_sample: list[Any] = []
+        self.sample_values: list[Any] = []
+        self.numbers = array("d")
+        self._numeric = True
+        self._counts: Counter[str] | None = Counter()
+        self._hashes: set[int] | None = None
+
+    def add(self, value: Any) -> None:
+        """Add a non-null value to the column."""
+        self.count += 1
+        key = str(value)
+
+        if len(self.type_sample) < TYPE_SAMPLE_SIZE:
+            self.type_sample.append(value)
+
+        if self._counts is not None:
+            if key not in self._counts and len(self.sample_values) < SAMPLE_VALUE_COUNT:
+                self.sample_values.append(value)
+            self._counts[key] += 1
+            if len(self._counts) > CATEGORICAL_LIMIT:
+                self._hashes = {hash(k) for k in self._counts}
+                self._counts = None
+        else:
+            self._hashes.add(hash(key))
+
+        if self._numeric:
+            try:
+                self.numbers.append(float(value))
+            except (ValueError, TypeError):
+                if self.count <= TYPE_SAMPLE_SIZE:
+                    # Not numeric: stop parsing the rest of the column
+                    self._numeric = False
+                    self.numbers = array("d")
+
+    @property
+    def unique_count(self) -> int:
+        """Number of distinct values (compared as strings)."""
+        if self._counts is not None:
+            return len(self._counts)
+        return len(self._hashes)
+
+    @property
+    def frequencies(self) -> dict[str, int] | None:
+        """Frequency table, or None if the column exceeded CATEGORICAL_LIMIT."""
+        if self._counts is None:
+            return None
+        return dict(self._counts)
+
+    def numeric_summary(self) -> dict[str, float]:
+        """Summary statistics for the parsed numeric values."""
+        return numeric_summary(self.numbers)
+
+    def histogram(self) -> tuple[list[int], list[float]]:
+        """Histogram counts and bin edges for the parsed numeric values."""
+        return histogram(self.numbers)
+
+
+def numeric_summary(values: array) -> dict[str, float]:
+    """
+    Compute min, max, mean, population std and quantiles.
+
+    Args:
+        values: Array of floats.
+
+    Returns:
+        Dictionary of statistics (all zero for an empty array).
+    """
+    if len(values) == 0:
+        return {"min": 0.0, "max": 0.0, "mean": 0.0, "std": 0.0}
+
+    if NUMPY_AVAILABLE:
+        data = np.frombuffer(values, dtype=np.float64)
+        stats = {
+            "min": float(data.min()),
+            "max": float(data.max()),
+            "mean": float(data.mean()),
+            "std": float(data.std()),
+        }
+        quantiles = np.quantile(data, list(QUANTILES.values()))
+        stats.update(
+            {name: float(q) for name, q in zip(QUANTILES, quantiles, strict=True)}
+        )
+        return stats
+
+    ordered = sorted(values)
+    n = len(ordered)
+    mean = math.fsum(ordered) / n
+    variance = math.fsum((x - mean) ** 2 for x in ordered) / n
+
+    stats = {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": mean,
+        "std": variance**0.5,
+    }
+    for name, q in QUANTILES.items():
+        stats[name] = _quantile(ordered, q)
+    return stats
+
+
+def histogram(
+    values: array, bins: int = HISTOGRAM_BINS
+) -> tuple[list[int], list[float]]:
+    """
+    Compute an equal-width histogram (same binning as numpy.histogram).
+
+    Args:
+        values: Array of floats.
+        bins: Number of bins.
+
+    Returns:
+        Tuple of (counts, edges); both empty for an empty array.
+    """
+    if len(values) == 0:
+        return [], []
+
+    if NUMPY_AVAILABLE:
+        counts, edges = np.histogram(np.frombuffer(values, dtype=np.float64), bins)
+        return [int(c) for c in counts], [float(e) for e in edges]
+
+    low, high = min(values), max(values)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+
+    width = (high - low) / bins
+    counts = [0] * bins
+    for x in values:
+        counts[min(int((x - low) / width), bins - 1)] += 1
+
+    edges = [low + i * width for i in range(bins)] + [high]
+    return counts, edges
+
+
+def reservoir_sample(
+    rows: Iterable[dict[str, Any]], size: int, seed: int = 0
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Draw a uniform random sample of rows in a single pass.
+
+    Args:
+        rows: Rows to sample from.
+        size: Maximum sample size.
+        seed: Random seed, for reproducible samples.
+
+    Returns:
+        Tuple of (sampled rows in source order, total rows seen).
+    """
+    rng = random.Random(seed)
+    reservoir: list[tuple[int, dict[str, Any]]] = []
+    total = 0
+
+    for total, row in enumerate(rows, 1):
+        if len(reservoir) < size:
+            reservoir.append((total, row))
+        else:
+            slot = rng.randrange(total)
+            if slot < size:
+                reservoir[slot] = (total, row)
+
+    reservoir.sort(key=lambda item: item[0])
+    return [row for _, row in reservoir], total
+
+
+def accumulate(
+    rows: Iterable[dict[str, Any]],
+) -> tuple[dict[str, ColumnAccumulator], int]:
+    """
+    Accumulate column statistics over rows in a single pass.
+
+    Args:
+        rows: Rows as dictionaries.
+
+    Returns:
+        Tuple of (accumulators keyed by column name, row count).
+    """
+    columns: dict[str, ColumnAccumulator] = {}
+    row_count = 0
+
+    for row in rows:
+        row_count += 1
+        for name, value in row.items():
+            acc = columns.get(name)
+            if acc is None:
+                acc = columns[name] = ColumnAccumulator(name)
+            if not is_null(value):
+                acc.add(value)
+
+    return columns, row_count
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    """Linear-interpolated quantile of sorted values (NumPy's default)."""
+    position = q * (len(ordered) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
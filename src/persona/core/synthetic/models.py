@@ -35,7 +35,10 @@ class DistributionStats(BaseModel):
         null_count: Number of null/empty values.
         sample_values: Sample of actual values (up to 5).
         categorical_distribution: Frequency map for categorical data.
-        numeric_stats: Statistics for numeric data (min, max, mean, std).
+        numeric_stats: Statistics for numeric data (min, max, mean, std
+            and p05-p95 quantiles).
+        histogram_counts: Equal-width histogram counts for numeric data.
+        histogram_edges: Histogram bin edges (one more than the counts).
     """
 
     column_name: str
@@ -45,6 +48,8 @@ class DistributionStats(BaseModel):
     sample_values: list[Any] = Field(default_factory=list)
     categorical_distribution: dict[str, int] | None = None
     numeric_stats: dict[str, float] | None = None
+    histogram_counts: list[int] | None = None
+    histogram_edges: list[float] | None = None
 
     model_config = ConfigDict(use_enum_values=True)
 
@@ -58,12 +63,15 @@ class DataSchema(BaseModel):
         row_count: Total number of rows in source data.
         format: Original data format (csv, json, yaml).
         relationships: Detected relationships between columns.
+        source_row_count: Total rows in the source when the schema was
+            built from a sample (row_count is then the sample size).
     """
 
     columns: list[DistributionStats]
     row_count: int
     format: str = "csv"
     relationships: dict[str, list[str]] = Field(default_factory=dict)
+    source_row_count: int | None = None
 
     def get_column(self, name: str) -> DistributionStats | None:
         """Get distribution stats for a specific column."""
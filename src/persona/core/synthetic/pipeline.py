@@ -7,8 +7,11 @@ using local LLMs.
 """
 
 import csv
+import hashlib
 import json
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
@@ -34,19 +37,31 @@ class SyntheticPipeline:
     confusion with the existing SyntheticDataGenerator class that creates
     demo/test data.
 
+    Batches are requested concurrently and appended to a progress file
+    (``<output>.partial.jsonl``) as they arrive, so an interrupted run
+    can be resumed without regenerating the records already written.
+
     Example:
         pipeline = SyntheticPipeline(provider="ollama", model="qwen2.5:72b")
         result = pipeline.synthesise(
             input_path="interviews.csv",
             output_path="synthetic.csv",
-            count=100
+            count=100,
+            max_concurrency=8,
         )
     """
 
+    # Default number of batches requested at once
+    DEFAULT_MAX_CONCURRENCY = 4
+
+    # Suffix of the progress file written alongside the output
+    PROGRESS_SUFFIX = ".partial.jsonl"
+
     def __init__(
         self,
         provider: str = "ollama",
         model: str | None = None,
+        sample_size: int | None = None,
     ) -> None:
         """
         Initialise the synthetic data pipeline.
@@ -54,11 +69,13 @@ class SyntheticPipeline:
         Args:
             provider: LLM provider to use (ollama, anthropic, openai, gemini).
             model: Specific model to use (if None, uses provider default).
+            sample_size: Maximum rows analysed per file when building the
+                schema and validating; larger inputs are reservoir-sampled.
         """
         self.provider_name = provider
         self.model_name = model
-        self.analyser = DataAnalyser()
-        self.validator = SyntheticValidator()
+        self.analyser = DataAnalyser(sample_size=sample_size)
+        self.validator = SyntheticValidator(sample_size=sample_size)
 
         # Initialise provider
         self._provider = ProviderFactory.create(provider)
@@ -79,6 +96,9 @@ class SyntheticPipeline:
         batch_size: int = 10,
         temperature: float = 0.7,
         validate: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        resume: bool = False,
+        deduplicate: bool = True,
     ) -> SyntheticResult:
         """
         Generate synthetic data from sensitive source.
@@ -92,13 +112,19 @@ class SyntheticPipeline:
             batch_size: Number of records to generate per API call.
             temperature: Temperature for LLM generation (0.0-1.0).
             validate: Whether to validate output quality.
+            max_concurrency: Maximum number of batches requested at once.
+            resume: Whether to continue from the progress file left by an
+                interrupted run instead of starting again.
+            deduplicate: Whether to drop records identical to ones already
+                generated.
 
         Returns:
             SyntheticResult with generation details and validation.
 
         Raises:
             FileNotFoundError: If input file doesn't exist.
-            ValueError: If input format is unsupported or data is invalid.
+            ValueError: If input format is unsupported, data is invalid or
+                max_concurrency is below 1.
         """
         input_path = Path(input_path)
         output_path = Path(output_path)
@@ -108,17 +134,24 @@ class SyntheticPipeline:
         # Step 1: Analyse original data
         schema = self.analyser.analyse_file(input_path)
 
-        # Step 2: Generate synthetic data
-        synthetic_data = self._generate_records(
+        # Step 2: Generate synthetic data, appending batches to the
+        # progress file as they arrive
+        progress_path = self._progress_path(output_path)
+        stats = self._generate_records(
             schema=schema,
             count=count,
             preserve_distribution=preserve_distribution,
             batch_size=batch_size,
             temperature=temperature,
+            progress_path=progress_path,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            deduplicate=deduplicate,
         )
 
         # Step 3: Save synthetic data
-        self._save_data(synthetic_data, output_path, schema.format)
+        self._save_data(self._read_progress(progress_path), output_path, schema.format)
+        progress_path.unlink(missing_ok=True)
 
         generation_time = time.time() - start_time
 
@@ -134,7 +167,7 @@ class SyntheticPipeline:
             input_path=input_path,
             output_path=output_path,
             data_schema=schema,
-            row_count=len(synthetic_data),
+            row_count=stats["records"],
             model=self.model_name,
             provider=self.provider_name,
             generation_time=generation_time,
@@ -144,6 +177,8 @@ class SyntheticPipeline:
                 "preserve_distribution": preserve_distribution,
                 "batch_size": batch_size,
                 "temperature": temperature,
+                "max_concurrency": max_concurrency,
+                **stats,
             },
         )
 
@@ -154,42 +189,171 @@ class SyntheticPipeline:
         preserve_distribution: bool,
         batch_size: int,
         temperature: float,
-    ) -> list[dict[str, Any]]:
-        """Generate synthetic records using LLM."""
-        all_records = []
-        batches = (count + batch_size - 1) // batch_size  # Ceiling division
-
-        for batch_idx in range(batches):
-            # Determine how many records for this batch
-            remaining = count - len(all_records)
-            batch_count = min(batch_size, remaining)
-
-            # Build generation prompt
-            prompt = self._build_generation_prompt(
-                schema=schema,
-                count=batch_count,
-                preserve_distribution=preserve_distribution,
-            )
+        progress_path: Path,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        resume: bool = False,
+        deduplicate: bool = True,
+    ) -> dict[str, int]:
+        """
+        Generate synthetic records using LLM, appending them to a progress file.
+
+        Up to max_concurrency batches are in flight at once. Each batch is
+        deduplicated against the records already written before it is
+        appended, and extra batches top up any shortfall (at most as many
+        again as originally planned). A resumed progress file holding more
+        than count records is cut back to its first count records.
 
-            # Generate with LLM
-            response = self._provider.generate(
-                prompt=prompt,
-                model=self.model_name,
-                temperature=temperature,
-                max_tokens=4096,
+        Returns:
+            Counts of records written, resumed, duplicates dropped and
+            batches requested.
+
+        Raises:
+            ValueError: If max_concurrency is below 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
             )
 
-            # Parse response
-            batch_records = self._parse_llm_response(response.content, schema)
+        seen: set[str] = set()
+        written = 0
+        resumed = 0
+
+        progress_path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and progress_path.exists():
+            overflow = False
+            for record in self._read_progress(progress_path):
+                if written >= count:
+                    overflow = True
+                    break
+                seen.add(self._record_key(record))
+                written += 1
+            resumed = written
+            if overflow:
+                self._truncate_progress(progress_path, count)
+            else:
+                # Terminate a line left partial by an interrupted write
+                with open(progress_path, "rb+") as f:
+                    size = f.seek(0, 2)
+                    if size:
+                        f.seek(size - 1)
+                        if f.read(1) != b"\n":
+                            f.write(b"\n")
+        else:
+            progress_path.unlink(missing_ok=True)
 
-            all_records.extend(batch_records)
+        planned = (count - written + batch_size - 1) // batch_size
+        max_batches = planned * 2
+        requested = 0
+        duplicates = 0
 
-            # Stop if we've generated enough
-            if len(all_records) >= count:
-                break
+        prompts: dict[int, str] = {}
 
-        # Trim to exact count
-        return all_records[:count]
+        def prompt_for(batch_count: int) -> str:
+            if batch_count not in prompts:
+                prompts[batch_count] = self._build_generation_prompt(
+                    schema=schema,
+                    count=batch_count,
+                    preserve_distribution=preserve_distribution,
+                )
+            return prompts[batch_count]
+
+        with (
+            ThreadPoolExecutor(max_workers=max_concurrency) as executor,
+            open(progress_path, "a", encoding="utf-8") as progress,
+        ):
+            in_flight: dict[Future, int] = {}
+
+            while written < count:
+                # Keep enough batches in flight to cover the remaining records
+                expected = sum(in_flight.values())
+                while (
+                    len(in_flight) < max_concurrency
+                    and written + expected < count
+                    and requested < max_batches
+                ):
+                    batch_count = min(batch_size, count - written - expected)
+                    future = executor.submit(
+                        self._provider.generate,
+                        prompt=prompt_for(batch_count),
+                        model=self.model_name,
+                        temperature=temperature,
+                        max_tokens=4096,
+                    )
+                    in_flight[future] = batch_count
+                    expected += batch_count
+                    requested += 1
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.pop(future)
+                    batch_records = self._parse_llm_response(
+                        future.result().content, schema
+                    )
+
+                    for record in batch_records:
+                        if written >= count:
+                            break
+                        if deduplicate:
+                            key = self._record_key(record)
+                            if key in seen:
+                                duplicates += 1
+                                continue
+                            seen.add(key)
+                        progress.write(json.dumps(record, default=str) + "\n")
+                        written += 1
+
+                    progress.flush()
+
+            # Target reached: drop batches that have not started yet
+            for future in in_flight:
+                future.cancel()
+
+        return {
+            "records": written,
+            "resumed_records": resumed,
+            "duplicates_dropped": duplicates,
+            "batches": requested,
+        }
+
+    def _progress_path(self, output_path: Path) -> Path:
+        """Get the progress file used while generating output_path."""
+        return output_path.with_name(output_path.name + self.PROGRESS_SUFFIX)
+
+    @staticmethod
+    def _read_progress(progress_path: Path) -> Iterator[dict[str, Any]]:
+        """Stream records from a progress file."""
+        if not progress_path.exists():
+            return
+
+        with open(progress_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Partial line from an interrupted write
+                    continue
+
+    def _truncate_progress(self, progress_path: Path, count: int) -> None:
+        """Rewrite a progress file keeping only its first count records."""
+        temp_path = progress_path.with_name(progress_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for i, record in enumerate(self._read_progress(progress_path)):
+                if i >= count:
+                    break
+                f.write(json.dumps(record, default=str) + "\n")
+        temp_path.replace(progress_path)
+
+    @staticmethod
+    def _record_key(record: Any) -> str:
+        """Get a digest identifying a record's content."""
+        serialised = json.dumps(record, sort_keys=True, default=str)
+        return hashlib.sha256(serialised.encode("utf-8")).hexdigest()[:32]
 
     def _build_generation_prompt(
         self,
@@ -332,11 +496,11 @@ class SyntheticPipeline:
 
     def _save_data(
         self,
-        data: list[dict[str, Any]],
+        data: Iterable[dict[str, Any]],
         output_path: Path,
         format_type: str,
     ) -> None:
-        """Save synthetic data to file."""
+        """Save synthetic data to file, streaming records as they are read."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         if format_type == "csv":
@@ -349,22 +513,35 @@ class SyntheticPipeline:
             # Default to CSV
             self._save_csv(data, output_path)
 
-    def _save_csv(self, data: list[dict[str, Any]], output_path: Path) -> None:
+    def _save_csv(self, data: Iterable[dict[str, Any]], output_path: Path) -> None:
         """Save data as CSV."""
-        if not data:
+        records = iter(data)
+        first = next(records, None)
+        if first is None:
             return
 
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
+            writer = csv.DictWriter(f, fieldnames=first.keys())
             writer.writeheader()
-            writer.writerows(data)
+            writer.writerow(first)
+            writer.writerows(records)
 
-    def _save_json(self, data: list[dict[str, Any]], output_path: Path) -> None:
-        """Save data as JSON."""
+    def _save_json(self, data: Iterable[dict[str, Any]], output_path: Path) -> None:
+        """Save data as JSON (same layout as json.dump with indent=2)."""
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-
-    def _save_yaml(self, data: list[dict[str, Any]], output_path: Path) -> None:
+            empty = True
+            for record in data:
+                f.write("[\n  " if empty else ",\n  ")
+                f.write(json.dumps(record, indent=2).replace("\n", "\n  "))
+                empty = False
+            f.write("[]" if empty else "\n]")
+
+    def _save_yaml(self, data: Iterable[dict[str, Any]], output_path: Path) -> None:
         """Save data as YAML."""
         with open(output_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            empty = True
+            for record in data:
+                yaml.dump([record], f, default_flow_style=False, allow_unicode=True)
+                empty = False
+            if empty:
+                yaml.dump([], f, default_flow_style=False, allow_unicode=True)
@@ -6,11 +6,20 @@ synthetic data quality by checking schema match, distribution
 similarity, PII presence, and semantic similarity.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from persona.core.synthetic.analyser import DataAnalyser
+from persona.core.synthetic.columnar import QUANTILES
 from persona.core.synthetic.models import ValidationResult
 
+if TYPE_CHECKING:
+    from persona.core.data import DataLoader
+
+# Characters of synthetic data passed to the PII detector at a time
+PII_CHUNK_CHARS = 100_000
+
 
 class SyntheticValidator:
     """
@@ -36,9 +45,15 @@ class SyntheticValidator:
     MIN_DISTRIBUTION_SIMILARITY = 0.85
     MIN_DIVERSITY = 0.70
 
-    def __init__(self) -> None:
-        """Initialise the validator."""
-        self.analyser = DataAnalyser()
+    def __init__(self, sample_size: int | None = None) -> None:
+        """
+        Initialise the validator.
+
+        Args:
+            sample_size: Maximum rows analysed per file; larger files are
+                reservoir-sampled. None analyses every row.
+        """
+        self.analyser = DataAnalyser(sample_size=sample_size)
 
     def validate(
         self,
@@ -159,7 +174,7 @@ class SyntheticValidator:
         Calculate distribution similarity between datasets.
 
         For categorical columns: compares frequency distributions
-        For numeric columns: compares mean/std deviation
+        For numeric columns: compares mean/std deviation and quantiles
         """
         similarities = []
 
@@ -262,8 +277,38 @@ class SyntheticValidator:
         # Weight mean more heavily (60/40)
         similarity = mean_sim * 0.6 + std_sim * 0.4
 
+        # Blend in quantile agreement when both summaries include quantiles
+        quantile_sim = self._quantile_similarity(orig_stats, synth_stats)
+        if quantile_sim is not None:
+            similarity = (similarity + quantile_sim) / 2
+
         return max(0.0, min(1.0, similarity))
 
+    def _quantile_similarity(
+        self,
+        orig_stats: dict[str, float],
+        synth_stats: dict[str, float],
+    ) -> float | None:
+        """
+        Compare quantiles relative to the original value range.
+
+        Returns:
+            Similarity between 0 and 1, or None if either summary has
+            no quantiles.
+        """
+        if not all(q in orig_stats and q in synth_stats for q in QUANTILES):
+            return None
+
+        value_range = orig_stats.get("max", 0.0) - orig_stats.get("min", 0.0)
+        if value_range <= 0:
+            value_range = abs(orig_stats["p50"]) or 1.0
+
+        total_diff = sum(
+            min(abs(orig_stats[q] - synth_stats[q]) / value_range, 1.0)
+            for q in QUANTILES
+        )
+        return 1.0 - total_diff / len(QUANTILES)
+
     def _check_pii(self, synthetic_path: Path) -> tuple[bool, int, list[str]]:
         """
         Check for PII in synthetic data.
@@ -283,16 +328,18 @@ class SyntheticValidator:
                 # TODO: Add warning
                 return False, 0, []
 
-            # Load synthetic data
-            loader = DataLoader()
-            content, _ = loader.load_path(synthetic_path)
-
-            # Detect PII
-            entities = detector.detect(content)
-
-            if entities:
-                entity_types = list(set(e.type for e in entities))
-                return True, len(entities), entity_types
+            # Stream synthetic records and detect PII a chunk at a time,
+            # so large outputs never sit in memory (or in the NLP model)
+            # as a single string
+            entity_count = 0
+            entity_types: set[str] = set()
+            for chunk in self._iter_pii_chunks(DataLoader(), synthetic_path):
+                entities = detector.detect(chunk)
+                entity_count += len(entities)
+                entity_types.update(e.type for e in entities)
+
+            if entity_count:
+                return True, entity_count, list(entity_types)
             else:
                 return False, 0, []
 
@@ -305,6 +352,21 @@ class SyntheticValidator:
             # TODO: Add proper logging
             return False, 0, []
 
+    @staticmethod
+    def _iter_pii_chunks(loader: "DataLoader", path: Path) -> Iterator[str]:
+        """Group streamed records into chunks of about PII_CHUNK_CHARS."""
+        parts: list[str] = []
+        size = 0
+        for record in loader.iter_records(path, count_tokens=False):
+            if parts and size + len(record.text) > PII_CHUNK_CHARS:
+                yield "".join(parts)
+                parts = []
+                size = 0
+            parts.append(record.text if parts else record.content)
+            size += len(record.text)
+        if parts:
+            yield "".join(parts)
+
     def _calculate_diversity(self, schema) -> float | None:
         """
         Calculate diversity of generated records.
@@ -4,12 +4,22 @@ Core utility modules.
 This package contains shared utilities used across the Persona codebase.
 """
 
-from persona.core.utils.async_helpers import is_async_context, run_sync, to_thread
+from persona.core.utils.async_helpers import (
+    get_blocking_executor,
+    is_async_context,
+    run_blocking,
+    run_sync,
+    to_thread,
+)
 from persona.core.utils.json_extractor import JSONExtractor
+from persona.core.utils.json_stream import StreamingJSONParser
 
 __all__ = [
     "JSONExtractor",
+    "StreamingJSONParser",
     "run_sync",
     "is_async_context",
     "to_thread",
+    "run_blocking",
+    "get_blocking_executor",
 ]
@@ -12,11 +12,22 @@ Example:
 """
 
 import asyncio
+import atexit
+import contextvars
+import functools
+import threading
 from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypeVar
 
 T = TypeVar("T")
 
+# Worker threads in the shared blocking-call executor
+BLOCKING_EXECUTOR_WORKERS = 32
+
+_blocking_executor: ThreadPoolExecutor | None = None
+_blocking_executor_lock = threading.Lock()
+
 
 def run_sync(
     coro_func: Callable[..., Awaitable[T]],
@@ -111,3 +122,73 @@ async def to_thread(func: Callable[..., T], *args, **kwargs) -> T:
         None,
         lambda: func(*args, **kwargs),
     )
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared executor for blocking calls made from async code.
+
+    The executor is separate from the event loop's default executor and
+    has a fixed number of workers, so sync fallbacks (providers without
+    native async, large parses) queue here instead of exhausting the
+    default pool used by asyncio.to_thread and DNS resolution.
+
+    Returns:
+        Process-wide ThreadPoolExecutor, created on first use.
+    """
+    global _blocking_executor
+    if _blocking_executor is None:
+        with _blocking_executor_lock:
+            if _blocking_executor is None:
+                _blocking_executor = ThreadPoolExecutor(
+                    max_workers=BLOCKING_EXECUTOR_WORKERS,
+                    thread_name_prefix="persona-blocking",
+                )
+    return _blocking_executor
+
+
+def shutdown_blocking_executor(wait: bool = True) -> None:
+    """
+    Shut down the shared blocking-call executor.
+
+    A new executor is created on the next call to get_blocking_executor().
+
+    Args:
+        wait: Whether to wait for running calls to finish.
+    """
+    global _blocking_executor
+    with _blocking_executor_lock:
+        executor, _blocking_executor = _blocking_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+atexit.register(shutdown_blocking_executor, wait=False)
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking function on the shared bounded executor.
+
+    The function runs in a copy of the caller's context, so context
+    variables (trace spans, request IDs) are visible in the worker
+    thread, as with asyncio.to_thread.
+
+    Args:
+        func: Blocking function to run.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        The result of the function.
+
+    Example:
+        async def main():
+            response = await run_blocking(provider.generate, prompt)
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_blocking_executor(),
+        functools.partial(context.run, func, *args, **kwargs),
+    )
@@ -0,0 +1,255 @@
+"""
+Incremental JSON record scanner for LLM responses.
+
+JSONExtractor needs the complete response and may call json.loads
+several times over sliced copies of it. StreamingJSONParser instead
+scans text once as it arrives, tracking only bracket depth and string
+state, and decodes each record (an object inside the top-level array,
+or inside a top-level "personas" array) as soon as its closing brace
+is seen. Records completed before a truncated tail are kept.
+"""
+
+import json
+import re
+from typing import Any
+
+# Next character that can change the scanner's state outside strings
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+
+# Next character that can end a string or start an escape
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+# Start of the JSON payload, or a reasoning block to skip over
+_SEEK = re.compile(r"[{\[]|<reasoning\b", re.IGNORECASE)
+
+_REASONING_END = re.compile(r"</reasoning\s*>", re.IGNORECASE)
+
+# Key introducing a nested array of records in a top-level object
+_RECORDS_KEY = re.compile(r'"personas"\s*:\s*$')
+
+# Characters looked back over to find the key before an array
+_KEY_LOOKBACK = 64
+
+# Consumed text is dropped from the buffer once it exceeds this size
+_TRIM_THRESHOLD = 8192
+
+
+class StreamingJSONParser:
+    """
+    Single-pass scanner yielding JSON records as they complete.
+
+    Text before the payload (prose, markdown fences, a <reasoning>
+    block) is skipped. Recognised layouts are a top-level array of
+    objects, an object with a "personas" array, or a single object;
+    a single object is only returned by close(), once it is known
+    not to contain a records array.
+
+    Example:
+        parser = StreamingJSONParser()
+        for chunk in stream:
+            for record in parser.feed(chunk):
+                handle(record)
+        remaining = parser.close()
+        if parser.truncated:
+            print("Response was cut off; kept completed records only")
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty scanner."""
+        self._buffer = ""
+        self._pos = 0
+        self._root_start: int | None = None
+        self._root_char = ""
+        self._stack: list[str] = []
+        self._in_string = False
+        self._record_start: int | None = None
+        self._record_depth = 0
+        self._in_records_array = False
+        self._records_found = 0
+        self._done = False
+        self._closed = False
+
+    @property
+    def started(self) -> bool:
+        """Whether the start of the JSON payload has been seen."""
+        return self._root_start is not None
+
+    @property
+    def complete(self) -> bool:
+        """Whether the top-level JSON value has been closed."""
+        return self._done
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the payload started but its top-level value never closed."""
+        return self.started and not self._done
+
+    @property
+    def records_found(self) -> int:
+        """Number of records returned so far."""
+        return self._records_found
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """
+        Scan more text.
+
+        Args:
+            chunk: Next piece of the response.
+
+        Returns:
+            Records completed by this chunk, in order.
+        """
+        if self._done or not chunk:
+            return []
+
+        self._buffer += chunk
+        records: list[dict[str, Any]] = []
+
+        if self._root_start is None and not self._seek():
+            self._trim()
+            return records
+
+        buffer = self._buffer
+        end = len(buffer)
+        pos = self._pos
+
+        while pos < end and not self._done:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    pos = end
+                    break
+                if match.group() == "\\":
+                    if match.end() >= end:
+                        # Escape split across chunks: resume at the backslash
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = end
+                break
+
+            char = match.group()
+            pos = match.end()
+
+            if char == '"':
+                self._in_string = True
+            elif char == "[":
+                if self._stack == ["{"]:
+                    lookback = buffer[
+                        max(0, match.start() - _KEY_LOOKBACK) : match.start()
+                    ]
+                    self._in_records_array = bool(_RECORDS_KEY.search(lookback))
+                self._stack.append(char)
+            elif char == "{":
+                if self._record_start is None and self._is_record():
+                    self._record_start = match.start()
+                    self._record_depth = len(self._stack)
+                self._stack.append(char)
+            else:
+                if not self._stack:
+                    continue
+                self._stack.pop()
+                if (
+                    self._record_start is not None
+                    and len(self._stack) == self._record_depth
+                ):
+                    record = self._decode(buffer[self._record_start : pos])
+                    self._record_start = None
+                    if record:
+                        records.append(record)
+                if not self._stack:
+                    self._done = True
+
+        self._pos = pos
+        self._records_found += len(records)
+        self._trim()
+        return records
+
+    def close(self) -> list[dict[str, Any]]:
+        """
+        Finish scanning.
+
+        Returns:
+            The top-level object if it was a single record (an object
+            with no records array); otherwise an empty list, since
+            completed records were already returned by feed().
+        """
+        if self._closed:
+            return []
+        self._closed = True
+
+        if not self._done or self._records_found or self._root_start is None:
+            return []
+        if self._root_char != "{":
+            return []
+
+        root = self._decode(self._buffer[self._root_start : self._pos])
+        if root and "personas" not in root:
+            self._records_found += 1
+            return [root]
+        return []
+
+    def _seek(self) -> bool:
+        """Find the start of the payload, skipping reasoning blocks."""
+        while True:
+            match = _SEEK.search(self._buffer, self._pos)
+            if match is None:
+                # Keep a tail in case a tag is split across chunks
+                self._pos = max(self._pos, len(self._buffer) - len("<reasoning"))
+                return False
+
+            if match.group() in "{[":
+                self._root_start = match.start()
+                self._root_char = match.group()
+                self._pos = match.start()
+                return True
+
+            end = _REASONING_END.search(self._buffer, match.end())
+            if end is None:
+                self._pos = match.start()
+                return False
+            self._pos = end.end()
+
+    def _trim(self) -> None:
+        """Drop consumed text so appending chunks stays cheap."""
+        if self._root_start is None:
+            cut = self._pos
+        elif self._root_char == "{" and not (
+            self._in_records_array or self._records_found
+        ):
+            # A single top-level object is decoded whole by close()
+            return
+        else:
+            start = self._record_start if self._record_start is not None else self._pos
+            cut = max(0, start - _KEY_LOOKBACK)
+
+        if cut < _TRIM_THRESHOLD or cut * 2 < len(self._buffer):
+            return
+
+        self._buffer = self._buffer[cut:]
+        self._pos -= cut
+        if self._record_start is not None:
+            self._record_start -= cut
+        if self._root_start is not None:
+            self._root_start = max(0, self._root_start - cut)
+
+    def _is_record(self) -> bool:
+        """Check whether an object opening at the current depth is a record."""
+        if self._stack == ["["]:
+            return True
+        return self._stack == ["{", "["] and self._in_records_array
+
+    def _decode(self, text: str) -> dict[str, Any] | None:
+        """Decode a complete object, ignoring malformed ones."""
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return value if isinstance(value, dict) else None
@@ -8,6 +8,7 @@ against quality criteria and data consistency checks.
 from persona.core.validation.validator import (
     PersonaValidator,
     ValidationLevel,
+    ValidationPlan,
     ValidationResult,
     ValidationRule,
 )
@@ -15,6 +16,7 @@ from persona.core.validation.validator import (
 __all__ = [
     "PersonaValidator",
     "ValidationLevel",
+    "ValidationPlan",
     "ValidationResult",
     "ValidationRule",
 ]
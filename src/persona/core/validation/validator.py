@@ -5,13 +5,39 @@ This module provides the PersonaValidator class for checking
 persona quality and consistency.
 """
 
+import os
+import pickle
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 from persona.core.generation.parser import Persona
 
+# Names treated as generic placeholders (compared lower-cased)
+GENERIC_NAMES = frozenset(
+    {
+        "user",
+        "persona",
+        "customer",
+        "person",
+        "user 1",
+        "persona 1",
+        "test",
+        "example",
+        "john doe",
+        "jane doe",
+        "placeholder",
+    }
+)
+
+# Minimum batch size spread across worker processes when max_workers > 1.
+# The built-in checks take microseconds per persona, less than sending the
+# persona to a worker, so fan-out only pays off for expensive custom rules.
+PARALLEL_MIN_PERSONAS = 64
+
 
 class ValidationLevel(Enum):
     """Severity level for validation issues."""
@@ -110,6 +136,130 @@ class ValidationRule:
     enabled: bool = True
 
 
+def _calculate_score(issues: list[ValidationIssue]) -> int:
+    """Calculate quality score based on issues."""
+    score = 100
+
+    for issue in issues:
+        if issue.level == ValidationLevel.ERROR:
+            score -= 25
+        elif issue.level == ValidationLevel.WARNING:
+            score -= 10
+        elif issue.level == ValidationLevel.INFO:
+            score -= 2
+
+    return max(0, score)
+
+
+class ValidationPlan:
+    """
+    The active rule set of a validator, compiled for batch evaluation.
+
+    Disabled rules are dropped when the plan is compiled, so evaluating
+    a persona only calls the checks that apply. Plans whose checks can
+    be pickled (all built-in rules can) can optionally be evaluated
+    across a process pool for large batches.
+
+    Example:
+        plan = PersonaValidator().compile()
+        results = plan.evaluate_batch(personas)
+    """
+
+    def __init__(self, rules: list[ValidationRule], strict: bool = False) -> None:
+        """
+        Compile a rule set.
+
+        Args:
+            rules: Rules to evaluate, in order; disabled rules are skipped.
+            strict: If True, treat warnings as errors.
+        """
+        self.checks = [(rule.name, rule.check) for rule in rules if rule.enabled]
+        self.strict = strict
+
+    @cached_property
+    def parallelisable(self) -> bool:
+        """Whether the checks can be sent to worker processes."""
+        try:
+            pickle.dumps(self.checks)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Lambdas and closures cannot be sent to worker processes
+            return False
+        return True
+
+    def evaluate(self, persona: Persona) -> ValidationResult:
+        """
+        Validate a single persona.
+
+        Args:
+            persona: The persona to validate.
+
+        Returns:
+            ValidationResult with all issues found.
+        """
+        issues: list[ValidationIssue] = []
+
+        for name, check in self.checks:
+            try:
+                issues.extend(check(persona))
+            except Exception as e:
+                issues.append(
+                    ValidationIssue(
+                        rule=name,
+                        message=f"Rule check failed: {e}",
+                        level=ValidationLevel.ERROR,
+                    )
+                )
+
+        # Calculate validity
+        if self.strict:
+            is_valid = len(issues) == 0
+        else:
+            is_valid = not any(i.level == ValidationLevel.ERROR for i in issues)
+
+        return ValidationResult(
+            persona_id=persona.id,
+            is_valid=is_valid,
+            issues=issues,
+            score=_calculate_score(issues),
+        )
+
+    def evaluate_batch(
+        self,
+        personas: list[Persona],
+        max_workers: int | None = 1,
+    ) -> list[ValidationResult]:
+        """
+        Validate multiple personas.
+
+        Personas are validated in-process by default. With max_workers
+        above 1, batches of at least PARALLEL_MIN_PERSONAS are validated
+        across a process pool when the plan is parallelisable. Results
+        are returned in input order either way.
+
+        Args:
+            personas: List of personas to validate.
+            max_workers: Maximum worker processes (default: 1, in-process;
+                None uses the CPU count).
+
+        Returns:
+            List of ValidationResult for each persona.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        workers = max(1, min(len(personas), max_workers))
+
+        if (
+            workers == 1
+            or len(personas) < PARALLEL_MIN_PERSONAS
+            or not self.parallelisable
+        ):
+            return [self.evaluate(persona) for persona in personas]
+
+        chunksize = max(1, len(personas) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.evaluate, personas, chunksize=chunksize))
+
+
 class PersonaValidator:
     """
     Validates personas against quality and consistency rules.
@@ -133,6 +283,8 @@ class PersonaValidator:
         """
         self._strict = strict
         self._rules: list[ValidationRule] = []
+        self._plan: ValidationPlan | None = None
+        self._plan_key: tuple[Any, ...] = ()
         self._register_builtin_rules()
 
     def _register_builtin_rules(self) -> None:
@@ -142,7 +294,7 @@ class PersonaValidator:
             ValidationRule(
                 name="required_id",
                 description="Persona must have an ID",
-                check=self._check_required_id,
+                check=_check_required_id,
                 level=ValidationLevel.ERROR,
             )
         )
@@ -151,7 +303,7 @@ class PersonaValidator:
             ValidationRule(
                 name="required_name",
                 description="Persona must have a name",
-                check=self._check_required_name,
+                check=_check_required_name,
                 level=ValidationLevel.ERROR,
             )
         )
@@ -161,7 +313,7 @@ class PersonaValidator:
             ValidationRule(
                 name="has_goals",
                 description="Persona should have at least one goal",
-                check=self._check_has_goals,
+                check=_check_has_goals,
                 level=ValidationLevel.WARNING,
             )
         )
@@ -170,7 +322,7 @@ class PersonaValidator:
             ValidationRule(
                 name="has_pain_points",
                 description="Persona should have at least one pain point",
-                check=self._check_has_pain_points,
+                check=_check_has_pain_points,
                 level=ValidationLevel.WARNING,
             )
         )
@@ -179,7 +331,7 @@ class PersonaValidator:
             ValidationRule(
                 name="has_demographics",
                 description="Persona should have demographics",
-                check=self._check_has_demographics,
+                check=_check_has_demographics,
                 level=ValidationLevel.WARNING,
             )
         )
@@ -189,7 +341,7 @@ class PersonaValidator:
             ValidationRule(
                 name="name_not_generic",
                 description="Persona name should not be generic placeholder",
-                check=self._check_name_not_generic,
+                check=_check_name_not_generic,
                 level=ValidationLevel.WARNING,
             )
         )
@@ -198,7 +350,7 @@ class PersonaValidator:
             ValidationRule(
                 name="goals_not_empty",
                 description="Goals should not be empty strings",
-                check=self._check_goals_not_empty,
+                check=_check_goals_not_empty,
                 level=ValidationLevel.ERROR,
             )
         )
@@ -207,7 +359,7 @@ class PersonaValidator:
             ValidationRule(
                 name="unique_goals",
                 description="Goals should be unique",
-                check=self._check_unique_goals,
+                check=_check_unique_goals,
                 level=ValidationLevel.WARNING,
             )
         )
@@ -216,7 +368,7 @@ class PersonaValidator:
             ValidationRule(
                 name="minimum_detail",
                 description="Persona should have minimum level of detail",
-                check=self._check_minimum_detail,
+                check=_check_minimum_detail,
                 level=ValidationLevel.INFO,
             )
         )
@@ -249,6 +401,21 @@ class PersonaValidator:
                 return True
         return False
 
+    def compile(self) -> ValidationPlan:
+        """
+        Compile the currently enabled rules.
+
+        The plan is cached and only rebuilt after the rule set changes.
+
+        Returns:
+            ValidationPlan evaluating personas against those rules.
+        """
+        key = tuple((r.name, r.check, r.enabled) for r in self._rules)
+        if self._plan is None or key != self._plan_key:
+            self._plan = ValidationPlan(self._rules, strict=self._strict)
+            self._plan_key = key
+        return self._plan
+
     def validate(self, persona: Persona) -> ValidationResult:
         """
         Validate a single persona.
@@ -259,226 +426,190 @@ class PersonaValidator:
         Returns:
             ValidationResult with all issues found.
         """
-        issues: list[ValidationIssue] = []
+        return self.compile().evaluate(persona)
 
-        for rule in self._rules:
-            if not rule.enabled:
-                continue
-
-            try:
-                rule_issues = rule.check(persona)
-                issues.extend(rule_issues)
-            except Exception as e:
-                issues.append(
-                    ValidationIssue(
-                        rule=rule.name,
-                        message=f"Rule check failed: {e}",
-                        level=ValidationLevel.ERROR,
-                    )
-                )
-
-        # Calculate validity
-        if self._strict:
-            is_valid = len(issues) == 0
-        else:
-            is_valid = not any(i.level == ValidationLevel.ERROR for i in issues)
-
-        # Calculate score
-        score = self._calculate_score(issues)
-
-        return ValidationResult(
-            persona_id=persona.id,
-            is_valid=is_valid,
-            issues=issues,
-            score=score,
-        )
-
-    def validate_batch(self, personas: list[Persona]) -> list[ValidationResult]:
+    def validate_batch(
+        self,
+        personas: list[Persona],
+        max_workers: int | None = 1,
+    ) -> list[ValidationResult]:
         """
         Validate multiple personas.
 
+        The rules are compiled once for the whole batch (see
+        ValidationPlan.evaluate_batch).
+
         Args:
             personas: List of personas to validate.
+            max_workers: Maximum worker processes (default: 1, in-process;
+                None uses the CPU count).
 
         Returns:
             List of ValidationResult for each persona.
         """
-        return [self.validate(p) for p in personas]
-
-    def _calculate_score(self, issues: list[ValidationIssue]) -> int:
-        """Calculate quality score based on issues."""
-        score = 100
+        return self.compile().evaluate_batch(personas, max_workers)
 
-        for issue in issues:
-            if issue.level == ValidationLevel.ERROR:
-                score -= 25
-            elif issue.level == ValidationLevel.WARNING:
-                score -= 10
-            elif issue.level == ValidationLevel.INFO:
-                score -= 2
 
-        return max(0, score)
+# Built-in rule implementations
 
-    # Built-in rule implementations
 
-    def _check_required_id(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that persona has an ID."""
-        if not persona.id or not persona.id.strip():
-            return [
-                ValidationIssue(
-                    rule="required_id",
-                    message="Persona is missing required ID",
-                    level=ValidationLevel.ERROR,
-                    field="id",
-                )
-            ]
-        return []
-
-    def _check_required_name(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that persona has a name."""
-        if not persona.name or not persona.name.strip():
-            return [
-                ValidationIssue(
-                    rule="required_name",
-                    message="Persona is missing required name",
-                    level=ValidationLevel.ERROR,
-                    field="name",
-                )
-            ]
-        return []
+def _check_required_id(persona: Persona) -> list[ValidationIssue]:
+    """Check that persona has an ID."""
+    if not persona.id or not persona.id.strip():
+        return [
+            ValidationIssue(
+                rule="required_id",
+                message="Persona is missing required ID",
+                level=ValidationLevel.ERROR,
+                field="id",
+            )
+        ]
+    return []
 
-    def _check_has_goals(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that persona has goals."""
-        if not persona.goals:
-            return [
-                ValidationIssue(
-                    rule="has_goals",
-                    message="Persona has no goals defined",
-                    level=ValidationLevel.WARNING,
-                    field="goals",
-                )
-            ]
-        return []
 
-    def _check_has_pain_points(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that persona has pain points."""
-        if not persona.pain_points:
-            return [
-                ValidationIssue(
-                    rule="has_pain_points",
-                    message="Persona has no pain points defined",
-                    level=ValidationLevel.WARNING,
-                    field="pain_points",
-                )
-            ]
-        return []
+def _check_required_name(persona: Persona) -> list[ValidationIssue]:
+    """Check that persona has a name."""
+    if not persona.name or not persona.name.strip():
+        return [
+            ValidationIssue(
+                rule="required_name",
+                message="Persona is missing required name",
+                level=ValidationLevel.ERROR,
+                field="name",
+            )
+        ]
+    return []
 
-    def _check_has_demographics(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that persona has demographics."""
-        if not persona.demographics:
-            return [
-                ValidationIssue(
-                    rule="has_demographics",
-                    message="Persona has no demographics defined",
-                    level=ValidationLevel.WARNING,
-                    field="demographics",
-                )
-            ]
-        return []
 
-    def _check_name_not_generic(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that name is not a generic placeholder."""
-        generic_names = {
-            "user",
-            "persona",
-            "customer",
-            "person",
-            "user 1",
-            "persona 1",
-            "test",
-            "example",
-            "john doe",
-            "jane doe",
-            "placeholder",
-        }
+def _check_has_goals(persona: Persona) -> list[ValidationIssue]:
+    """Check that persona has goals."""
+    if not persona.goals:
+        return [
+            ValidationIssue(
+                rule="has_goals",
+                message="Persona has no goals defined",
+                level=ValidationLevel.WARNING,
+                field="goals",
+            )
+        ]
+    return []
 
-        if persona.name and persona.name.lower().strip() in generic_names:
-            return [
-                ValidationIssue(
-                    rule="name_not_generic",
-                    message=f"Persona name '{persona.name}' appears to be a generic placeholder",
-                    level=ValidationLevel.WARNING,
-                    field="name",
-                    value=persona.name,
-                )
-            ]
-        return []
 
-    def _check_goals_not_empty(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that goals are not empty strings."""
-        issues = []
-        for i, goal in enumerate(persona.goals or []):
-            if not goal or not goal.strip():
-                issues.append(
-                    ValidationIssue(
-                        rule="goals_not_empty",
-                        message=f"Goal at index {i} is empty",
-                        level=ValidationLevel.ERROR,
-                        field=f"goals[{i}]",
-                    )
-                )
-        return issues
+def _check_has_pain_points(persona: Persona) -> list[ValidationIssue]:
+    """Check that persona has pain points."""
+    if not persona.pain_points:
+        return [
+            ValidationIssue(
+                rule="has_pain_points",
+                message="Persona has no pain points defined",
+                level=ValidationLevel.WARNING,
+                field="pain_points",
+            )
+        ]
+    return []
 
-    def _check_unique_goals(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that goals are unique."""
-        if not persona.goals:
-            return []
 
-        seen = set()
-        duplicates = []
+def _check_has_demographics(persona: Persona) -> list[ValidationIssue]:
+    """Check that persona has demographics."""
+    if not persona.demographics:
+        return [
+            ValidationIssue(
+                rule="has_demographics",
+                message="Persona has no demographics defined",
+                level=ValidationLevel.WARNING,
+                field="demographics",
+            )
+        ]
+    return []
+
+
+def _check_name_not_generic(persona: Persona) -> list[ValidationIssue]:
+    """Check that name is not a generic placeholder."""
+    if persona.name and persona.name.lower().strip() in GENERIC_NAMES:
+        return [
+            ValidationIssue(
+                rule="name_not_generic",
+                message=(
+                    f"Persona name '{persona.name}' appears to be a "
+                    "generic placeholder"
+                ),
+                level=ValidationLevel.WARNING,
+                field="name",
+                value=persona.name,
+            )
+        ]
+    return []
 
-        for goal in persona.goals:
-            normalised = goal.lower().strip()
-            if normalised in seen:
-                duplicates.append(goal)
-            seen.add(normalised)
 
-        if duplicates:
-            return [
+def _check_goals_not_empty(persona: Persona) -> list[ValidationIssue]:
+    """Check that goals are not empty strings."""
+    issues = []
+    for i, goal in enumerate(persona.goals or []):
+        if not goal or not goal.strip():
+            issues.append(
                 ValidationIssue(
-                    rule="unique_goals",
-                    message=f"Found {len(duplicates)} duplicate goal(s)",
-                    level=ValidationLevel.WARNING,
-                    field="goals",
-                    value=duplicates,
+                    rule="goals_not_empty",
+                    message=f"Goal at index {i} is empty",
+                    level=ValidationLevel.ERROR,
+                    field=f"goals[{i}]",
                 )
-            ]
-        return []
+            )
+    return issues
 
-    def _check_minimum_detail(self, persona: Persona) -> list[ValidationIssue]:
-        """Check that persona has minimum level of detail."""
-        detail_score = 0
-
-        if persona.name:
-            detail_score += 1
-        if persona.demographics:
-            detail_score += len(persona.demographics)
-        if persona.goals:
-            detail_score += len(persona.goals)
-        if persona.pain_points:
-            detail_score += len(persona.pain_points)
-        if persona.behaviours:
-            detail_score += len(persona.behaviours)
-        if persona.quotes:
-            detail_score += len(persona.quotes)
-
-        if detail_score < 5:
-            return [
-                ValidationIssue(
-                    rule="minimum_detail",
-                    message=f"Persona has low detail level (score: {detail_score}/5 minimum)",
-                    level=ValidationLevel.INFO,
-                    value=detail_score,
-                )
-            ]
+
+def _check_unique_goals(persona: Persona) -> list[ValidationIssue]:
+    """Check that goals are unique."""
+    if not persona.goals:
         return []
+
+    seen = set()
+    duplicates = []
+
+    for goal in persona.goals:
+        normalised = goal.lower().strip()
+        if normalised in seen:
+            duplicates.append(goal)
+        seen.add(normalised)
+
+    if duplicates:
+        return [
+            ValidationIssue(
+                rule="unique_goals",
+                message=f"Found {len(duplicates)} duplicate goal(s)",
+                level=ValidationLevel.WARNING,
+                field="goals",
+                value=duplicates,
+            )
+        ]
+    return []
+
+
+def _check_minimum_detail(persona: Persona) -> list[ValidationIssue]:
+    """Check that persona has minimum level of detail."""
+    detail_score = 0
+
+    if persona.name:
+        detail_score += 1
+    if persona.demographics:
+        detail_score += len(persona.demographics)
+    if persona.goals:
+        detail_score += len(persona.goals)
+    if persona.pain_points:
+        detail_score += len(persona.pain_points)
+    if persona.behaviours:
+        detail_score += len(persona.behaviours)
+    if persona.quotes:
+        detail_score += len(persona.quotes)
+
+    if detail_score < 5:
+        return [
+            ValidationIssue(
+                rule="minimum_detail",
+                message=(
+                    f"Persona has low detail level (score: {detail_score}/5 minimum)"
+                ),
+                level=ValidationLevel.INFO,
+                value=detail_score,
+            )
+        ]
+    return []
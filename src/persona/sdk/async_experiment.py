@@ -5,10 +5,10 @@ This module provides async versions of experiment management
 for integration with async applications.
 """
 
-import asyncio
 from pathlib import Path
 from typing import Any
 
+from persona.core.utils.async_helpers import run_blocking
 from persona.sdk.async_generator import AsyncPersonaGenerator
 from persona.sdk.exceptions import (
     DataError,
@@ -75,11 +75,7 @@ class AsyncExperimentSDK:
         Raises:
             ConfigurationError: If experiment already exists.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_sdk.create(config),
-        )
+        return await run_blocking(self._sync_sdk.create, config)
 
     async def aload(self, name: str) -> ExperimentModel:
         """
@@ -94,11 +90,7 @@ class AsyncExperimentSDK:
         Raises:
             ConfigurationError: If experiment doesn't exist.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_sdk.load(name),
-        )
+        return await run_blocking(self._sync_sdk.load, name)
 
     async def alist_experiments(self) -> list[ExperimentModel]:
         """
@@ -107,11 +99,7 @@ class AsyncExperimentSDK:
         Returns:
             List of ExperimentModel instances.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self._sync_sdk.list_experiments,
-        )
+        return await run_blocking(self._sync_sdk.list_experiments)
 
     async def adelete(self, name: str, confirm: bool = False) -> bool:
         """
@@ -124,11 +112,7 @@ class AsyncExperimentSDK:
         Returns:
             True if deleted.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_sdk.delete(name, confirm=confirm),
-        )
+        return await run_blocking(self._sync_sdk.delete, name, confirm=confirm)
 
     async def aexists(self, name: str) -> bool:
         """
@@ -140,11 +124,7 @@ class AsyncExperimentSDK:
         Returns:
             True if experiment exists.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_sdk.exists(name),
-        )
+        return await run_blocking(self._sync_sdk.exists, name)
 
     async def aadd_data(
         self,
@@ -163,10 +143,8 @@ class AsyncExperimentSDK:
         Returns:
             Path to the data file in experiment.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_sdk.add_data(experiment_name, data_path, copy=copy),
+        return await run_blocking(
+            self._sync_sdk.add_data, experiment_name, data_path, copy=copy
         )
 
     async def alist_data(self, experiment_name: str) -> list[Path]:
@@ -179,11 +157,7 @@ class AsyncExperimentSDK:
         Returns:
             List of data file paths.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_sdk.list_data(experiment_name),
-        )
+        return await run_blocking(self._sync_sdk.list_data, experiment_name)
 
     async def agenerate(
         self,
@@ -237,11 +211,7 @@ class AsyncExperimentSDK:
         Returns:
             List of output directory paths.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_sdk.get_outputs(experiment_name),
-        )
+        return await run_blocking(self._sync_sdk.get_outputs, experiment_name)
 
     async def aget_statistics(self, experiment_name: str) -> dict[str, Any]:
         """
@@ -253,11 +223,7 @@ class AsyncExperimentSDK:
         Returns:
             Dictionary with experiment statistics.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_sdk.get_statistics(experiment_name),
-        )
+        return await run_blocking(self._sync_sdk.get_statistics, experiment_name)
 
     # Sync methods for convenience (no IO)
     def exists(self, name: str) -> bool:
@@ -10,11 +10,8 @@ from collections.abc import Callable, Coroutine
 from pathlib import Path
 from typing import Any
 
-from persona.sdk.exceptions import (
-    DataError,
-    GenerationError,
-    ProviderError,
-)
+from persona.core.utils.async_helpers import run_blocking
+from persona.sdk.exceptions import DataError
 from persona.sdk.generator import PersonaGenerator
 from persona.sdk.models import (
     GenerationResultModel,
@@ -75,9 +72,9 @@ class AsyncPersonaGenerator:
         self._provider = provider
         self._model = model
         self._api_key = api_key
-        self._progress_callback: Callable[
-            [str, int, int], Coroutine[Any, Any, None]
-        ] | None = None
+        self._progress_callback: (
+            Callable[[str, int, int], Coroutine[Any, Any, None]] | None
+        ) = None
 
     @property
     def provider(self) -> str:
@@ -118,9 +115,12 @@ class AsyncPersonaGenerator:
         """
         Asynchronously generate personas from input data.
 
-        This method runs the generation in a thread pool to avoid
-        blocking the event loop, since the underlying LLM calls
-        are currently synchronous.
+        Runs the core pipeline's native async path on the calling event
+        loop: the provider request uses its pooled async client, and only
+        blocking work (file loading, large parses, providers without
+        async support) is handed to the shared bounded executor, so
+        hundreds of concurrent calls do not exhaust the loop's default
+        thread pool.
 
         Args:
             data_path: Path to input data file or directory.
@@ -150,38 +150,34 @@ class AsyncPersonaGenerator:
                 path=str(data_path),
             )
 
-        # Run sync generation in thread pool
-        loop = asyncio.get_event_loop()
+        # Import core modules (lazy import to avoid circular deps)
+        from persona.core.generation import GenerationPipeline
+
+        core_config = self._sync_generator._core_config(data_path, config)
+        pipeline = GenerationPipeline()
 
-        # Set up sync progress callback that calls async one
+        # Progress callbacks run as tasks on this loop and are awaited
+        # before returning, so none outlive the call
+        progress_tasks: list[asyncio.Task[None]] = []
         if self._progress_callback:
+            callback = self._progress_callback
 
-            def sync_callback(message: str, step: int, total: int) -> None:
-                # Schedule async callback
-                asyncio.run_coroutine_threadsafe(
-                    self._progress_callback(message, step, total),  # type: ignore
-                    loop,
+            def schedule(message: str, step: int, total: int) -> None:
+                progress_tasks.append(
+                    asyncio.ensure_future(callback(message, step, total))
                 )
 
-            self._sync_generator.set_progress_callback(sync_callback)
+            pipeline.set_progress_callback(PersonaGenerator._progress_wrapper(schedule))
 
         try:
-            result = await loop.run_in_executor(
-                None,
-                lambda: self._sync_generator.generate(data_path, config),
-            )
-            return result
-        except DataError:
-            raise
-        except ProviderError:
-            raise
-        except GenerationError:
-            raise
+            core_result = await pipeline.generate_async(core_config)
         except Exception as e:
-            raise GenerationError(
-                f"Async generation failed: {e}",
-                stage="async_wrapper",
-            ) from e
+            raise self._sync_generator._translate_error(e, data_path) from e
+        finally:
+            if progress_tasks:
+                await asyncio.gather(*progress_tasks, return_exceptions=True)
+
+        return GenerationResultModel.from_core_result(core_result)
 
     async def agenerate_batch(
         self,
@@ -246,12 +242,8 @@ class AsyncPersonaGenerator:
                 path=str(data_path),
             )
 
-        # Run sync estimation in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_generator.estimate_cost(data_path, config),
-        )
+        # Run sync estimation on the shared blocking executor
+        return await run_blocking(self._sync_generator.estimate_cost, data_path, config)
 
     def validate_config(self, config: PersonaConfig) -> list[str]:
         """
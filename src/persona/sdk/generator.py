@@ -20,6 +20,16 @@ from persona.sdk.models import (
     PersonaConfig,
 )
 
+# Progress steps reported by the generation pipeline
+GENERATION_STEPS = (
+    "Loading data",
+    "Loading workflow",
+    "Rendering prompt",
+    "Generating",
+    "Parsing response",
+    "Complete",
+)
+
 
 class PersonaGenerator:
     """
@@ -151,10 +161,42 @@ class PersonaGenerator:
             )
 
         # Import core modules (lazy import to avoid circular deps)
-        from persona.core.generation import GenerationConfig, GenerationPipeline
+        from persona.core.generation import GenerationPipeline
+
+        core_config = self._core_config(data_path, config)
+
+        # Create pipeline
+        pipeline = GenerationPipeline()
+
+        # Set progress callback wrapper
+        if self._progress_callback:
+            pipeline.set_progress_callback(
+                self._progress_wrapper(self._progress_callback)
+            )
 
-        # Create core config
-        core_config = GenerationConfig(
+        # Generate
+        try:
+            core_result = pipeline.generate(core_config)
+        except Exception as e:
+            raise self._translate_error(e, data_path) from e
+
+        # Convert to SDK model
+        return GenerationResultModel.from_core_result(core_result)
+
+    def _core_config(self, data_path: Path, config: PersonaConfig) -> Any:
+        """
+        Build the core pipeline configuration for a generation run.
+
+        Args:
+            data_path: Path to input data file or directory.
+            config: SDK generation configuration.
+
+        Returns:
+            persona.core.generation.GenerationConfig for the run.
+        """
+        from persona.core.generation import GenerationConfig
+
+        return GenerationConfig(
             data_path=data_path,
             count=config.count,
             provider=self._provider,
@@ -167,52 +209,54 @@ class PersonaGenerator:
             max_tokens=config.max_tokens,
         )
 
-        # Create pipeline
-        pipeline = GenerationPipeline()
+    @staticmethod
+    def _progress_wrapper(
+        callback: Callable[[str, int, int], Any],
+    ) -> Callable[[str], None]:
+        """
+        Adapt a (message, step, total) callback to the pipeline's callback.
 
-        # Set progress callback wrapper
-        if self._progress_callback:
-            steps = [
-                "Loading data",
-                "Loading workflow",
-                "Rendering prompt",
-                "Generating",
-                "Parsing response",
-                "Complete",
-            ]
-            step_index = [0]
-
-            def progress_wrapper(message: str) -> None:
-                step_index[0] += 1
-                if self._progress_callback:
-                    self._progress_callback(message, step_index[0], len(steps))
-
-            pipeline.set_progress_callback(progress_wrapper)
+        Each call gets its own step counter, so concurrent runs sharing
+        a callback report their own progress.
 
-        # Generate
-        try:
-            core_result = pipeline.generate(core_config)
-        except FileNotFoundError as e:
-            raise DataError(str(e), path=str(data_path)) from e
-        except ValueError as e:
-            raise DataError(str(e), path=str(data_path)) from e
-        except RuntimeError as e:
-            error_msg = str(e).lower()
+        Args:
+            callback: SDK progress callback.
+
+        Returns:
+            Pipeline progress callback taking only the message.
+        """
+        step_index = [0]
+
+        def progress_wrapper(message: str) -> None:
+            step_index[0] += 1
+            callback(message, step_index[0], len(GENERATION_STEPS))
+
+        return progress_wrapper
+
+    def _translate_error(self, error: Exception, data_path: Path) -> Exception:
+        """
+        Map a pipeline exception to the SDK exception to raise.
+
+        Args:
+            error: Exception raised by the core pipeline.
+            data_path: Path to the input data.
+
+        Returns:
+            SDK exception (DataError, RateLimitError, ProviderError or
+            GenerationError).
+        """
+        if isinstance(error, FileNotFoundError | ValueError):
+            return DataError(str(error), path=str(data_path))
+        if isinstance(error, RuntimeError):
+            error_msg = str(error).lower()
             if "rate limit" in error_msg:
                 from persona.sdk.exceptions import RateLimitError
 
-                raise RateLimitError(str(e), provider=self._provider) from e
+                return RateLimitError(str(error), provider=self._provider)
             if "api" in error_msg or "auth" in error_msg:
-                raise ProviderError(str(e), provider=self._provider) from e
-            raise GenerationError(str(e), stage="generation") from e
-        except Exception as e:
-            raise GenerationError(
-                f"Generation failed: {e}",
-                stage="unknown",
-            ) from e
-
-        # Convert to SDK model
-        return GenerationResultModel.from_core_result(core_result)
+                return ProviderError(str(error), provider=self._provider)
+            return GenerationError(str(error), stage="generation")
+        return GenerationError(f"Generation failed: {error}", stage="unknown")
 
     def estimate_cost(
         self,
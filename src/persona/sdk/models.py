@@ -11,6 +11,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from persona.core.generation.compact import CompactPersona
+
 
 class ComplexityLevel(str, Enum):
     """Persona generation complexity levels."""
@@ -162,6 +164,56 @@ class PersonaModel(BaseModel):
             additional=persona.additional or {},
         )
 
+    @classmethod
+    def from_compact(cls, persona: CompactPersona) -> "PersonaModel":
+        """
+        Create PersonaModel from a CompactPersona.
+
+        Fields are validated and copied exactly as in from_core_persona,
+        so a title stored as an additional field stays there.
+
+        Args:
+            persona: Compact persona.
+
+        Returns:
+            PersonaModel instance.
+        """
+        return cls.model_validate(
+            {
+                "id": persona.id,
+                "name": persona.name,
+                "title": getattr(persona, "title", ""),
+                "goals": persona.goals,
+                "pain_points": persona.pain_points,
+                "behaviours": persona.behaviours,
+                "quotes": persona.quotes,
+                "demographics": dict(persona.demographics),
+                "additional": dict(persona.additional),
+            }
+        )
+
+    def to_compact(self) -> CompactPersona:
+        """
+        Convert to a CompactPersona.
+
+        Returns:
+            CompactPersona sharing this model's values; a non-empty
+            title is kept as an additional field, as for core personas.
+        """
+        additional = self.additional
+        if self.title:
+            additional = {**additional, "title": self.title}
+        return CompactPersona(
+            id=self.id,
+            name=self.name,
+            demographics=self.demographics,
+            goals=self.goals,
+            pain_points=self.pain_points,
+            behaviours=self.behaviours,
+            quotes=self.quotes,
+            additional=additional,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return self.model_dump()
@@ -218,6 +270,11 @@ class GenerationResultModel(BaseModel):
         default_factory=datetime.now,
         description="Generation timestamp",
     )
+    truncated: bool = Field(
+        default=False,
+        description="Whether the response was cut off before all personas "
+        "were complete",
+    )
 
     @classmethod
     def from_core_result(cls, result: Any) -> "GenerationResultModel":
@@ -240,6 +297,7 @@ class GenerationResultModel(BaseModel):
             model=result.model,
             provider=result.provider,
             source_files=[str(f) for f in result.source_files],
+            truncated=result.truncated,
         )
 
     def to_json(self, output_dir: str | Path) -> Path:
@@ -50,6 +50,7 @@ from persona.ui.commands import (
     help_app,
     lineage_app,
     model_app,
+    output_app,
     plugin_app,
     preview_app,
     privacy_app,
@@ -130,6 +131,7 @@ app.add_typer(vendor_app, name="vendor", hidden=True)
 app.add_typer(model_app, name="model", hidden=True)
 app.add_typer(template_app, name="template", hidden=True)
 app.add_typer(workflow_app, name="workflow", hidden=True)
+app.add_typer(output_app, name="output", hidden=True)
 
 # CLI context management (replaces global state)
 from persona.ui.context import (
@@ -183,6 +185,23 @@ def interactive_callback(value: bool) -> None:
     set_interactive(bool(value))
 
 
+def _enable_profiling(ctx: typer.Context, output: Path | None) -> None:
+    """Record timing spans and print a summary when the command finishes."""
+    from persona.core.logging.tracing import configure_tracing, set_tracer
+
+    tracer = configure_tracing(jsonl_path=output)
+
+    def report() -> None:
+        set_tracer(None)
+        tracer.shutdown()
+        console = get_console()
+        console.print(tracer.summary.format_table(), markup=False, highlight=False)
+        if output is not None:
+            console.print(f"[dim]Spans written to {output}[/dim]")
+
+    ctx.call_on_close(report)
+
+
 def _reset_globals() -> None:
     """Reset context state (for testing)."""
     reset_cli_context()
@@ -245,9 +264,26 @@ def main(
             help="Run in interactive mode with guided prompts.",
         ),
     ] = None,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Print a timing breakdown by stage on exit.",
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-output",
+            help="Append timing spans to a JSONL file (implies --profile).",
+        ),
+    ] = None,
     ctx: typer.Context = None,
 ) -> None:
     """Generate realistic user personas from your data using AI."""
+    if ctx and (profile or profile_output):
+        _enable_profiling(ctx, profile_output)
+
     # If a subcommand was invoked, let it handle things
     if ctx and ctx.invoked_subcommand is not None:
         return
@@ -21,6 +21,7 @@ from persona.ui.commands.generate import generate_app
 from persona.ui.commands.help import help_app
 from persona.ui.commands.lineage import lineage_app
 from persona.ui.commands.model import model_app
+from persona.ui.commands.output import output_app
 from persona.ui.commands.plugin import plugin_app
 from persona.ui.commands.preview import preview_app
 from persona.ui.commands.privacy import privacy_app
@@ -70,4 +71,5 @@ __all__ = [
     "project_app",
     "variant_app",
     "lineage_app",
+    "output_app",
 ]
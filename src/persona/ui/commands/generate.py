@@ -2,17 +2,24 @@
 Generate command for creating personas from data.
 """
 
+from dataclasses import replace
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Any, Optional
 
 import typer
 from rich.table import Table
 
-from persona.core.data import DataLoader
+from persona.core.data import DataLoader, LoadResult
 from persona.core.experiments import RunHistoryManager
 from persona.core.generation import GenerationConfig, GenerationPipeline
+from persona.core.multimodel import ModelSpec, MultiModelGenerator
 from persona.core.output import OutputManager
-from persona.core.providers import ProviderFactory
+from persona.core.providers import (
+    CachingProvider,
+    LLMProvider,
+    ProviderFactory,
+    ResponseCache,
+)
 from persona.ui.completers import complete_model, complete_provider, complete_workflow
 from persona.ui.console import get_console
 from persona.ui.interactive import GenerateWizard, is_interactive_supported
@@ -205,6 +212,16 @@ def generate(
             help="Use all available models (local and cloud).",
         ),
     ] = False,
+    models: Annotated[
+        str | None,
+        typer.Option(
+            "--models",
+            help=(
+                "Comma-separated models to run concurrently "
+                "(e.g. anthropic:claude-sonnet-4,openai:gpt-4o)."
+            ),
+        ),
+    ] = None,
     accept_terms: Annotated[
         bool,
         typer.Option(
@@ -219,6 +236,37 @@ def generate(
             help="Bypass cache and fetch fresh data from URL sources.",
         ),
     ] = False,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help="Reuse cached LLM responses for identical deterministic requests.",
+        ),
+    ] = False,
+    cache_sampled: Annotated[
+        bool,
+        typer.Option(
+            "--cache-sampled",
+            help="With --cache, also replay responses sampled above temperature 0.",
+        ),
+    ] = False,
+    temperature: Annotated[
+        float,
+        typer.Option(
+            "--temperature",
+            help="Sampling temperature (0 gives deterministic, cacheable output).",
+        ),
+    ] = 0.7,
+    dedupe: Annotated[
+        bool,
+        typer.Option(
+            "--dedupe",
+            help=(
+                "Store prompts and responses once in a shared blob store "
+                "under the output directory."
+            ),
+        ),
+    ] = False,
 ) -> None:
     """
     Generate personas from data files.
@@ -231,6 +279,7 @@ def generate(
         # Provider selection shortcuts
         persona generate --from data.csv --local  # Use all local Ollama models
         persona generate --from data.csv --cloud  # Use cloud providers (default)
+        persona generate --from data.csv --models claude-sonnet-4,gpt-4o
         persona generate --from data.csv --all    # Use all available models
 
         # Specific model selection
@@ -242,6 +291,11 @@ def generate(
         persona generate --from https://github.com/user/repo/blob/main/data.csv --accept-terms
         persona generate --from URL --accept-terms --no-cache  # Force fresh fetch
 
+        # Reuse LLM responses when re-running identical prompts
+        persona generate --from data.csv --cache --temperature 0
+        persona generate --from data.csv --cache --cache-sampled
+        persona generate --from data.csv --dedupe  # Share identical prompts
+
         # Hybrid mode examples
         persona generate --from data.csv --hybrid --count 10
         persona generate --from data.csv --hybrid --no-frontier  # Local-only
@@ -299,6 +353,40 @@ def generate(
 
     console = get_console()
 
+    response_cache = _make_response_cache(console, cache, cache_sampled, temperature)
+    if response_cache is not None:
+        ctx.call_on_close(response_cache.close)
+
+    # Handle explicit model list (--models a,b,c)
+    if models:
+        try:
+            model_specs = [
+                ModelSpec.parse(m.strip()) for m in models.split(",") if m.strip()
+            ]
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] Invalid --models value: {e}")
+            raise typer.Exit(1)
+
+        return _handle_multi_model_generation(
+            console=console,
+            data_path=data_path,
+            output=output,
+            count=count,
+            workflow=workflow,
+            experiment=experiment,
+            dry_run=dry_run,
+            no_progress=no_progress,
+            anonymise=anonymise,
+            anonymise_strategy=anonymise_strategy,
+            verify=verify,
+            verify_models=verify_models,
+            verify_threshold=verify_threshold,
+            model_specs=model_specs,
+            temperature=temperature,
+            response_cache=response_cache,
+            dedupe=dedupe,
+        )
+
     # Handle shortcut flags (--local, --cloud, --all)
     if local or all_providers:
         # --local or --all: use all local models
@@ -317,6 +405,9 @@ def generate(
             verify_models=verify_models,
             verify_threshold=verify_threshold,
             include_cloud=all_providers,
+            temperature=temperature,
+            response_cache=response_cache,
+            dedupe=dedupe,
         )
 
     # Handle Ollama model selection when provider is ollama but no model specified
@@ -344,6 +435,9 @@ def generate(
                 verify_models=verify_models,
                 verify_threshold=verify_threshold,
                 include_cloud=False,
+                temperature=temperature,
+                response_cache=response_cache,
+                dedupe=dedupe,
             )
 
     from persona import __version__
@@ -364,6 +458,7 @@ def generate(
                 accept_terms=accept_terms,
                 no_cache=no_cache,
             )
+            loaded = LoadResult(content=data, files=list(url_sources))
             # Show URL source info
             for source in url_sources:
                 if hasattr(source, 'resolved_url') and source.resolved_url != path_str:
@@ -386,13 +481,24 @@ def generate(
         console.print(f"[bold]Loading data from:[/bold] {data_path}")
 
         try:
-            data, _files = loader.load_path(data_path)
+            loaded = loader.load_path_parallel(data_path)
+            data = loaded.content
+            token_count = loaded.total_tokens
         except Exception as e:
             console.print(f"[red]Error loading data:[/red] {e}")
             raise typer.Exit(1)
 
+        if len(loaded.file_tokens) > 1:
+            console.print(
+                f"[dim]Loaded {len(loaded.file_tokens)} files in "
+                f"{loaded.elapsed_seconds:.2f}s "
+                f"({loaded.megabytes_per_second:.1f} MB/s, "
+                f"{loaded.workers} workers)[/dim]"
+            )
+
     # Show data summary
-    token_count = loader.count_tokens(data)
+    if loader.is_url(path_str):
+        token_count = loader.count_tokens(data)
     console.print(
         f"[green]✓[/green] Loaded {len(data)} characters ({token_count:,} tokens)"
     )
@@ -475,6 +581,8 @@ def generate(
             output=output,
             experiment=experiment,
             dry_run=dry_run,
+            response_cache=response_cache,
+            dedupe=dedupe,
         )
 
     # Configure generation (before provider check for dry_run)
@@ -484,6 +592,7 @@ def generate(
         model=model,
         count=count,
         workflow=workflow,
+        temperature=temperature,
     )
 
     # Show configuration
@@ -511,6 +620,7 @@ def generate(
         model=model or llm_provider.default_model,
         count=count,
         workflow=workflow,
+        temperature=temperature,
     )
 
     # Generate personas with streaming output
@@ -526,9 +636,10 @@ def generate(
     )
 
     try:
-        pipeline = GenerationPipeline()
+        pipeline = GenerationPipeline(response_cache=response_cache)
         pipeline.set_progress_callback(progress_callback)
-        result = pipeline.generate(config)
+        # Generate from the data loaded (and anonymised) above
+        result = pipeline.generate(config, loaded=replace(loaded, content=data))
 
         # Add URL sources if present (from URL data loading)
         if url_sources:
@@ -545,7 +656,7 @@ def generate(
 
     # Save output (respect experiment directory structure)
     output_dir, save_name = _resolve_output_path(output, experiment)
-    manager = OutputManager(base_dir=output_dir)
+    manager = _make_output_manager(output_dir, dedupe)
 
     output_path = manager.save(result, name=save_name)
     console.print(f"[green]✓[/green] Saved to: {output_path}")
@@ -589,6 +700,8 @@ def _handle_hybrid_generation(
     output: Optional[Path],
     experiment: Optional[str],
     dry_run: bool,
+    response_cache: ResponseCache | None = None,
+    dedupe: bool = False,
 ) -> None:
     """Handle hybrid pipeline generation."""
     import asyncio
@@ -618,7 +731,7 @@ def _handle_hybrid_generation(
         return
 
     # Create pipeline
-    pipeline = HybridPipeline(config)
+    pipeline = HybridPipeline(config, response_cache=response_cache)
 
     # Generate personas
     console.print("\n[dim]Starting hybrid generation...[/dim]")
@@ -637,9 +750,7 @@ def _handle_hybrid_generation(
 
     # Save output (respect experiment directory structure)
     output_dir, save_name = _resolve_output_path(output, experiment)
-    from persona.core.output import OutputManager
-
-    manager = OutputManager(base_dir=output_dir)
+    manager = _make_output_manager(output_dir, dedupe)
 
     # Convert hybrid result to format compatible with OutputManager
     # We need to adapt the personas to the expected format
@@ -700,6 +811,31 @@ def _handle_hybrid_generation(
                 pass  # Don't fail generation if history recording fails
 
 
+def _make_output_manager(output_dir: Path, dedupe: bool = False) -> OutputManager:
+    """Create the output manager, sharing artefacts through blobs if asked."""
+    if dedupe:
+        return OutputManager.with_blob_store(output_dir)
+    return OutputManager(base_dir=output_dir)
+
+
+def _make_response_cache(
+    console,
+    cache: bool,
+    cache_sampled: bool = False,
+    temperature: float = 0.0,
+) -> ResponseCache | None:
+    """Create the LLM response cache requested on the command line."""
+    if not cache:
+        return None
+    if temperature > 0 and not cache_sampled:
+        console.print(
+            f"[yellow]Warning:[/yellow] --cache only replays deterministic "
+            f"requests, but --temperature is {temperature}. Nothing will be "
+            "cached; pass --temperature 0 or add --cache-sampled."
+        )
+    return ResponseCache(cache_sampled=cache_sampled)
+
+
 def _show_hybrid_config(console, config: "HybridConfig", count: int) -> None:
     """Display hybrid configuration."""
     from rich.table import Table
@@ -755,6 +891,14 @@ def _show_hybrid_result(console, result: "HybridResult") -> None:
     console.print(f"  Frontier: ${costs['frontier']['cost']:.4f}")
     console.print(f"  [bold]Total: ${costs['total']['cost']:.4f}[/bold]")
 
+    cache_costs = costs.get("cache", {})
+    if cache_costs.get("hits"):
+        cached_tokens = cache_costs["input_tokens"] + cache_costs["output_tokens"]
+        console.print(
+            f"  Cache hits: {cache_costs['hits']} "
+            f"({cached_tokens:,} tokens not billed)"
+        )
+
     if costs["budget"]["max"]:
         remaining = costs["budget"]["remaining"]
         console.print(f"  Budget remaining: ${remaining:.4f}")
@@ -777,51 +921,63 @@ def _handle_multi_model_generation(
     verify_models: Optional[str],
     verify_threshold: float,
     include_cloud: bool = False,
+    model_specs: list[ModelSpec] | None = None,
+    temperature: float = 0.7,
+    response_cache: ResponseCache | None = None,
+    dedupe: bool = False,
 ) -> None:
     """Generate personas using multiple models.
 
-    This runs generation for each model and saves results separately.
+    The data is loaded once and all models run concurrently through
+    MultiModelGenerator; results are saved separately, so the run takes
+    roughly as long as the slowest model.
 
     Args:
         include_cloud: If True, also include cloud providers (anthropic, openai, gemini).
+        model_specs: Explicit ModelSpec list; skips model discovery when given.
+        temperature: Sampling temperature for every model.
+        response_cache: Optional cache shared by every model's pipeline.
+        dedupe: Store artefacts in the output directory's blob store.
     """
     from rich.table import Table
 
     from persona import __version__
-    from persona.core.data import DataLoader
-    from persona.core.generation import GenerationConfig, GenerationPipeline
-    from persona.core.output import OutputManager
-    from persona.core.providers import ProviderFactory
+    from persona.core.generation import GenerationResult, Persona
 
     console.print(f"[dim]Persona {__version__}[/dim]\n")
 
     # Build list of models to use
     models_to_use = []  # List of (provider, model) tuples
 
-    # Get local Ollama models
-    try:
-        ollama_provider = ProviderFactory.create("ollama")
-        if ollama_provider.is_configured():
-            local_models = ollama_provider.list_available_models()
-            for m in local_models:
-                models_to_use.append(("ollama", m))
-    except Exception as e:
-        console.print(f"[yellow]Warning:[/yellow] Could not get Ollama models: {e}")
-
-    # Add cloud providers if requested
-    if include_cloud:
-        cloud_configs = [
-            ("anthropic", "claude-sonnet-4-20250514"),
-            ("openai", "gpt-4o"),
-            ("gemini", "gemini-2.5-flash"),
-        ]
-        for provider_name, model_name in cloud_configs:
-            try:
-                p = ProviderFactory.create(provider_name)
-                if p.is_configured():
-                    models_to_use.append((provider_name, model_name))
-            except Exception:
-                pass  # Skip unconfigured providers
+    if model_specs:
+        models_to_use = [(spec.provider, spec.model) for spec in model_specs]
+    else:
+        # Get local Ollama models
+        try:
+            ollama_provider = ProviderFactory.create("ollama")
+            if ollama_provider.is_configured():
+                local_models = ollama_provider.list_available_models()
+                for m in local_models:
+                    models_to_use.append(("ollama", m))
+        except Exception as e:
+            console.print(
+                f"[yellow]Warning:[/yellow] Could not get Ollama models: {e}"
+            )
+
+        # Add cloud providers if requested
+        if include_cloud:
+            cloud_configs = [
+                ("anthropic", "claude-sonnet-4-20250514"),
+                ("openai", "gpt-4o"),
+                ("gemini", "gemini-2.5-flash"),
+            ]
+            for provider_name, model_name in cloud_configs:
+                try:
+                    p = ProviderFactory.create(provider_name)
+                    if p.is_configured():
+                        models_to_use.append((provider_name, model_name))
+                except Exception:
+                    pass  # Skip unconfigured providers
 
     if not models_to_use:
         console.print("[red]Error:[/red] No models available.")
@@ -830,7 +986,10 @@ def _handle_multi_model_generation(
             console.print("Or configure a cloud provider API key.")
         raise typer.Exit(1)
 
-    mode_name = "All Providers" if include_cloud else "Local Models"
+    if model_specs:
+        mode_name = "Multi-Model"
+    else:
+        mode_name = "All Providers" if include_cloud else "Local Models"
     console.print(f"[bold cyan]{mode_name} Generation Mode[/bold cyan]")
     model_display = [f"{p}:{m}" for p, m in models_to_use]
     console.print(
@@ -852,7 +1011,7 @@ def _handle_multi_model_generation(
     loader = DataLoader()
 
     try:
-        data, _files = loader.load_path(data_path)
+        data, source_files = loader.load_path(data_path)
     except Exception as e:
         console.print(f"[red]Error loading data:[/red] {e}")
         raise typer.Exit(1)
@@ -878,10 +1037,11 @@ def _handle_multi_model_generation(
             if detector.is_available() and anonymiser.is_available():
                 entities = detector.detect(data)
                 if entities:
-                    result = anonymiser.anonymise(data, entities, anon_strategy)
-                    data = result.text
+                    anonymised = anonymiser.anonymise(data, entities, anon_strategy)
+                    data = anonymised.text
                     console.print(
-                        f"[green]✓[/green] Anonymised {result.entity_count} PII entities"
+                        f"[green]✓[/green] Anonymised {anonymised.entity_count} "
+                        "PII entities"
                     )
         except Exception as e:
             console.print(f"[yellow]Warning:[/yellow] Could not anonymise: {e}")
@@ -892,35 +1052,54 @@ def _handle_multi_model_generation(
         return
 
     # Generate with each model (respect experiment directory structure)
-    results_summary = []
+    results_summary: list[dict[str, Any]] = []
     output_dir, _ = _resolve_output_path(output, experiment)
-    manager = OutputManager(base_dir=output_dir)
+    manager = _make_output_manager(output_dir, dedupe)
+
+    specs = [ModelSpec(provider=p, model=m) for p, m in models_to_use]
+
+    def create_provider(name: str) -> LLMProvider:
+        provider = ProviderFactory.create(name)
+        if response_cache is not None:
+            return CachingProvider(provider, response_cache)
+        return provider
+
+    generator = MultiModelGenerator(
+        default_temperature=temperature,
+        provider_factory=create_provider,
+        workflow=workflow or "default",
+    )
+
+    if not no_progress:
+        with console.status(
+            f"[cyan]Generating with {len(specs)} models concurrently...",
+            spinner="dots",
+        ):
+            multi_result = generator.generate(data, specs, count=count or 3)
+    else:
+        multi_result = generator.generate(data, specs, count=count or 3)
 
-    for i, (provider_name, model_name) in enumerate(models_to_use, 1):
+    for i, ((provider_name, model_name), model_output) in enumerate(
+        zip(models_to_use, multi_result.model_outputs), 1
+    ):
         model_display_name = f"{provider_name}:{model_name}"
         console.print(
             f"\n[bold]Model {i}/{len(models_to_use)}: {model_display_name}[/bold]"
         )
 
-        config = GenerationConfig(
-            data_path=data_path,
-            provider=provider_name,
-            model=model_name,
-            count=count or 3,
-            workflow=workflow or "default",
-        )
-
         try:
-            pipeline = GenerationPipeline()
-
-            # Simple progress for multi-model mode
-            if not no_progress:
-                with console.status(
-                    f"[cyan]Generating with {model_display_name}...", spinner="dots"
-                ):
-                    result = pipeline.generate(config)
-            else:
-                result = pipeline.generate(config)
+            if model_output.error is not None:
+                raise RuntimeError(model_output.error)
+            result = GenerationResult(
+                personas=[Persona.from_dict(p) for p in model_output.personas],
+                input_tokens=model_output.tokens_input,
+                output_tokens=model_output.tokens_output,
+                model=model_name,
+                provider=provider_name,
+                source_files=[f for f in source_files if isinstance(f, Path)],
+                prompt=model_output.prompt or "",
+                raw_response=model_output.raw_response or "",
+            )
 
             # Save output with model name in experiment
             safe_name = model_name.replace(":", "-").replace("/", "-")
@@ -1271,6 +1450,15 @@ def _show_result_summary(console, result) -> None:
         f"(in: {result.input_tokens:,}, out: {result.output_tokens:,})[/dim]"
     )
 
+    if result.cached:
+        console.print("[dim]Response served from cache (no tokens billed)[/dim]")
+
+    if result.truncated:
+        console.print(
+            "[yellow]Warning:[/yellow] The response was cut off; only personas "
+            "completed before the cut were kept. Try a smaller --count."
+        )
+
 
 def _run_verification(
     console,
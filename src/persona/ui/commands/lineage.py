@@ -413,6 +413,13 @@ def verify_lineage(
             help="Output as JSON.",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Rehash every file, ignoring hashes from earlier runs.",
+        ),
+    ] = False,
 ) -> None:
     """
     Verify entity integrity.
@@ -424,14 +431,23 @@ def verify_lineage(
         persona lineage verify ent-abc123
         persona lineage verify ent-abc123 --chain
     """
+    from persona.core.lineage import (
+        HashCache,
+        IntegrityVerifier,
+        get_default_hash_cache_path,
+    )
+
     console = get_console()
     store = _get_store()
+    cache = HashCache(None if no_cache else get_default_hash_cache_path())
+    verifier = IntegrityVerifier(cache=cache)
 
     try:
         if chain:
-            result = store.verify_chain(entity_id)
+            result = store.verify_chain(entity_id, verifier=verifier)
         else:
-            result = store.verify_entity(entity_id)
+            result = store.verify_entity(entity_id, verifier=verifier)
+        cache.save()
 
         if json_output:
             print(json.dumps(result, indent=2))
@@ -0,0 +1,114 @@
+"""
+Output maintenance CLI commands.
+
+Provides commands for moving generation artefacts into the shared blob
+store and removing blobs that no output references any more.
+"""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from persona.core.output import BlobStore, OutputManager
+from persona.core.output.manager import BLOB_DIR_NAME
+from persona.ui.commands.preview import _format_size
+from persona.ui.console import get_console
+
+output_app = typer.Typer(
+    name="output",
+    help="Maintain generation output directories.",
+)
+
+
+@output_app.command("migrate")
+def migrate(
+    output_dir: Annotated[
+        Path,
+        typer.Option(
+            "--dir",
+            "-d",
+            help="Output base directory to migrate.",
+        ),
+    ] = Path("./outputs"),
+    compression: Annotated[
+        str,
+        typer.Option(
+            "--compression",
+            "-c",
+            help="Compression for new blobs (none, gzip, zstd).",
+        ),
+    ] = "gzip",
+) -> None:
+    """
+    Move inline prompts and responses into the shared blob store.
+
+    Identical artefacts across outputs are stored once. Outputs saved
+    with --dedupe are already migrated and are left untouched.
+
+    Example:
+        persona output migrate
+        persona output migrate --dir ./experiments/demo/outputs -c zstd
+    """
+    console = get_console()
+
+    try:
+        store = BlobStore(output_dir / BLOB_DIR_NAME, compression=compression)
+    except (ValueError, ImportError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    manager = OutputManager(output_dir, blob_store=store)
+
+    result = manager.migrate_all()
+
+    if result.files_migrated == 0:
+        console.print("[yellow]No inline artefacts to migrate.[/yellow]")
+        return
+
+    console.print(
+        f"[green]✓[/green] Migrated {result.files_migrated} files from "
+        f"{result.outputs_migrated} outputs "
+        f"({_format_size(result.bytes_migrated)} before deduplication)"
+    )
+    console.print(
+        f"[dim]Blob store size: "
+        f"{_format_size(store.get_total_size())}[/dim]"
+    )
+
+
+@output_app.command("gc")
+def collect_garbage(
+    output_dir: Annotated[
+        Path,
+        typer.Option(
+            "--dir",
+            "-d",
+            help="Output base directory whose blob store to clean.",
+        ),
+    ] = Path("./outputs"),
+) -> None:
+    """
+    Delete blobs that no output references any more.
+
+    Run this after deleting output folders. Blobs written while the
+    collection runs are kept, so it is safe alongside generation.
+
+    Example:
+        persona output gc
+        persona output gc --dir ./experiments/demo/outputs
+    """
+    console = get_console()
+    manager = OutputManager.with_blob_store(output_dir)
+
+    result = manager.collect_garbage()
+
+    console.print(
+        f"[green]✓[/green] Removed {len(result.removed)} unreferenced blobs "
+        f"({_format_size(result.bytes_freed)} freed), kept {result.kept}"
+    )
+    if result.recent:
+        console.print(
+            f"[dim]{result.recent} recently written blobs kept for "
+            "in-progress saves[/dim]"
+        )
@@ -13,7 +13,14 @@ from rich.panel import Panel
 from rich.table import Table
 
 from persona.core.generation.parser import Persona
-from persona.core.quality import QualityConfig, QualityLevel, QualityScorer
+from persona.core.quality import (
+    MetricEngine,
+    MetricResult,
+    QualityConfig,
+    QualityLevel,
+    QualityMetric,
+    QualityScorer,
+)
 from persona.ui.console import get_console
 
 quality_app = typer.Typer(
@@ -68,6 +75,37 @@ def score(
             help="Use lenient thresholds (lower quality requirements).",
         ),
     ] = False,
+    all_metrics: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            help="Also run academic, bias, fidelity and G-eval metrics.",
+        ),
+    ] = False,
+    source_path: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--source",
+            "-s",
+            help="Source data for academic metrics (with --all).",
+            exists=True,
+        ),
+    ] = None,
+    constraints_path: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--constraints",
+            help="Constraints YAML for the fidelity metric (with --all).",
+            exists=True,
+        ),
+    ] = None,
+    geval_provider: Annotated[
+        str,
+        typer.Option(
+            "--geval-provider",
+            help="LLM provider for G-eval (with --all).",
+        ),
+    ] = "ollama",
 ) -> None:
     """
     Calculate quality scores for personas.
@@ -79,10 +117,16 @@ def score(
     - Distinctiveness: Uniqueness vs other personas
     - Realism: Plausibility as a real person
 
+    With --all, the academic (ROUGE-L, BERTScore, GPT similarity),
+    bias, fidelity and G-eval metrics run concurrently as well. Metrics
+    that need --source are skipped without it, and fidelity runs only
+    with --constraints.
+
     Example:
         persona score ./outputs/20250101_120000/
         persona score ./personas.json --min-score 70
         persona score ./outputs/ --output json --save report.json
+        persona score ./outputs/ --all --source ./data.txt
     """
     if ctx.invoked_subcommand is not None:
         return
@@ -125,13 +169,28 @@ def score(
     scorer = QualityScorer(config=config)
     result = scorer.score_batch(personas)
 
+    additional: list[MetricResult] = []
+    if all_metrics:
+        source_data = None
+        try:
+            if source_path:
+                source_data = source_path.read_text(encoding="utf-8")
+            metrics = _additional_metrics(config, constraints_path, geval_provider)
+        except Exception as e:
+            console.print(f"[red]Error preparing metrics:[/red] {e}")
+            raise typer.Exit(1)
+        additional = MetricEngine(metrics).run(personas, source_data=source_data)
+
     # Output results
     if output_format == "json":
+        data = result.to_dict()
+        if all_metrics:
+            data["additional_metrics"] = _summarise_metrics(additional)
         output = {
             "command": "score",
             "version": __version__,
             "success": True,
-            "data": result.to_dict(),
+            "data": data,
         }
         output_text = json.dumps(output, indent=2)
         print(output_text)
@@ -139,6 +198,8 @@ def score(
             save_to.write_text(output_text)
     elif output_format == "markdown":
         report = _generate_markdown_report(result, personas)
+        if all_metrics:
+            report += _markdown_metrics_section(additional)
         print(report)
         if save_to:
             save_to.write_text(report)
@@ -146,9 +207,14 @@ def score(
         if not console._quiet:
             console.print(f"[dim]Persona {__version__}[/dim]\n")
         _display_rich_output(console, result, personas)
+        if all_metrics:
+            _display_metrics(console, additional)
         if save_to:
             # Save JSON for rich output
-            save_to.write_text(json.dumps(result.to_dict(), indent=2))
+            data = result.to_dict()
+            if all_metrics:
+                data["additional_metrics"] = _summarise_metrics(additional)
+            save_to.write_text(json.dumps(data, indent=2))
 
     # Check minimum score threshold
     if minimum_score is not None:
@@ -162,6 +228,99 @@ def score(
             raise typer.Exit(1)
 
 
+def _additional_metrics(
+    config: QualityConfig,
+    constraints_path: Path | None,
+    geval_provider: str,
+) -> dict[str, QualityMetric]:
+    """Create the metrics run alongside the quality dimensions by --all."""
+    from persona.core.quality.academic import AcademicValidator
+    from persona.core.quality.bias import BiasMetric
+
+    validator = AcademicValidator(config=config, geval_provider=geval_provider)
+    metrics = validator.get_metrics()
+    metrics["bias"] = BiasMetric(config=config)
+
+    if constraints_path:
+        from persona.core.quality.fidelity import ConstraintParser, FidelityMetric
+
+        constraints = ConstraintParser().parse_file(constraints_path)
+        metrics["fidelity"] = FidelityMetric(constraints, config=config)
+
+    return metrics
+
+
+def _summarise_metrics(results: list[MetricResult]) -> list[dict]:
+    """Summarise additional metric results by metric."""
+    by_metric: dict[str, list[MetricResult]] = {}
+    for result in results:
+        by_metric.setdefault(result.metric, []).append(result)
+
+    summary = []
+    for name, metric_results in by_metric.items():
+        scores = [r.score.score for r in metric_results if r.score is not None]
+        summary.append(
+            {
+                "metric": name,
+                "average_score": (
+                    round(sum(scores) / len(scores), 2) if scores else None
+                ),
+                "evaluated": len(scores),
+                "errors": sorted({r.error for r in metric_results if r.error}),
+                "skipped": next((r.skipped for r in metric_results if r.skipped), None),
+                "results": [r.to_dict() for r in metric_results],
+            }
+        )
+    return summary
+
+
+def _display_metrics(console, results: list[MetricResult]) -> None:
+    """Display additional metric results with Rich formatting."""
+    table = Table(title="Additional Metrics")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Average", justify="right")
+    table.add_column("Status")
+
+    for entry in _summarise_metrics(results):
+        if entry["skipped"]:
+            status = f"[dim]Skipped: {entry['skipped']}[/dim]"
+        elif entry["errors"]:
+            status = f"[red]{entry['errors'][0]}[/red]"
+        else:
+            status = f"[green]{entry['evaluated']} evaluated[/green]"
+        average = entry["average_score"]
+        table.add_row(
+            entry["metric"],
+            f"{average:.1f}" if average is not None else "-",
+            status,
+        )
+
+    console.print()
+    console.print(table)
+
+
+def _markdown_metrics_section(results: list[MetricResult]) -> str:
+    """Generate the Markdown section for additional metrics."""
+    lines = [
+        "",
+        "## Additional Metrics",
+        "",
+        "| Metric | Average | Status |",
+        "|--------|---------|--------|",
+    ]
+    for entry in _summarise_metrics(results):
+        average = entry["average_score"]
+        if entry["skipped"]:
+            status = f"Skipped: {entry['skipped']}"
+        elif entry["errors"]:
+            status = entry["errors"][0]
+        else:
+            status = f"{entry['evaluated']} evaluated"
+        average_text = f"{average:.1f}" if average is not None else "-"
+        lines.append(f"| {entry['metric']} | {average_text} | {status} |")
+    return "\n".join(lines) + "\n"
+
+
 def _display_rich_output(console, result, personas) -> None:
     """Display results with Rich formatting."""
     console.print(
@@ -10,7 +10,7 @@ import typer
 from rich.panel import Panel
 from rich.table import Table
 
-from persona.core.refinement import PersonaRefiner
+from persona.core.refinement import PersonaRefiner, RefinementSession
 from persona.ui.console import get_console
 
 refine_app = typer.Typer(
@@ -52,16 +52,26 @@ def refine(
             help="Output results as JSON.",
         ),
     ] = False,
+    session_dir: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--session-dir",
+            help="Directory refinement sessions are kept in between runs.",
+        ),
+    ] = None,
 ) -> None:
     """
     Refine personas with natural language instructions.
 
     Apply modifications like "add a goal about efficiency" or
-    "make more technical" to iteratively improve personas.
+    "make more technical" to iteratively improve personas. With
+    --session-dir, each run continues the persona's saved session so
+    versions accumulate and can be compared with `refine diff`.
 
     Example:
         persona refine ./persona.json --instruction "Add goal: improve efficiency"
         persona refine ./persona.json -i "Make more technical" -o ./refined.json
+        persona refine --session-dir ./.sessions ./persona.json -i "Make concise"
     """
     if ctx.invoked_subcommand is not None:
         return
@@ -140,9 +150,10 @@ def refine(
         return
 
     # Apply refinement
-    refiner = PersonaRefiner()
-    session = refiner.create_session(persona)
+    refiner = PersonaRefiner(session_dir=session_dir)
+    session = _open_session(refiner, persona)
     result = refiner.refine(session, instruction)
+    refiner.save_session(persona.id)
 
     if not result.success:
         if json_output:
@@ -281,12 +292,21 @@ def show_diff(
             help="Second version to compare (default: current).",
         ),
     ] = None,
+    session_dir: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--session-dir",
+            help="Directory refinement sessions are kept in between runs.",
+        ),
+    ] = None,
 ) -> None:
     """
     Show differences between persona versions.
 
+    Versions come from the persona's saved session in --session-dir.
+
     Example:
-        persona refine diff ./persona.json --from 0 --to 2
+        persona refine diff --session-dir ./.sessions ./persona.json --from 0 --to 2
     """
     console = get_console()
 
@@ -301,8 +321,8 @@ def show_diff(
         console.print(f"[red]Error loading persona:[/red] {e}")
         raise typer.Exit(1)
 
-    refiner = PersonaRefiner()
-    session = refiner.create_session(persona)
+    refiner = PersonaRefiner(session_dir=session_dir)
+    session = _open_session(refiner, persona)
 
     # Get diff
     diff = refiner.get_diff(session, version_a, version_b)
@@ -375,6 +395,15 @@ def _show_instruction_examples(console) -> None:
         console.print(f"  [dim]--instruction[/dim] [cyan]{example}[/cyan]")
 
 
+def _open_session(refiner: PersonaRefiner, persona) -> RefinementSession:
+    """Resume the persona's saved session, or start a new one."""
+    session = refiner.get_session(persona.id)
+    if session is not None and session.persona.to_dict() == persona.to_dict():
+        return session
+    # No saved session, or the file was edited since: start afresh
+    return refiner.create_session(persona)
+
+
 def _load_persona(path: Path):
     """Load a single persona from a file."""
     from persona.core.generation.parser import Persona
@@ -76,6 +76,27 @@ def synthesise(
             help="Records per API call.",
         ),
     ] = 10,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Maximum number of batches requested at once.",
+        ),
+    ] = 4,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help="Continue an interrupted run from its progress file.",
+        ),
+    ] = False,
+    sample_size: Annotated[
+        int | None,
+        typer.Option(
+            "--sample-size",
+            help="Analyse at most this many rows per file (random sample).",
+        ),
+    ] = None,
     no_validate: Annotated[
         bool,
         typer.Option(
@@ -100,6 +121,8 @@ def synthesise(
     Example:
         persona synthesise --input interviews.csv --output synthetic.csv
         persona synthesise -i data.json -n 100 --model qwen2.5:72b
+        persona synthesise -i data.csv -n 10000 --concurrency 8 --resume
+        persona synthesise -i survey.csv --sample-size 50000
     """
     # If subcommand invoked, don't run main logic
     if ctx.invoked_subcommand is not None:
@@ -138,7 +161,11 @@ def synthesise(
 
     # Create pipeline
     try:
-        pipeline = SyntheticPipeline(provider=provider, model=model)
+        pipeline = SyntheticPipeline(
+            provider=provider,
+            model=model,
+            sample_size=sample_size,
+        )
     except Exception as e:
         console.print(f"[red]Error creating pipeline:[/red] {e}")
         raise typer.Exit(1)
@@ -154,6 +181,8 @@ def synthesise(
             batch_size=batch_size,
             temperature=temperature,
             validate=not no_validate,
+            max_concurrency=concurrency,
+            resume=resume,
         )
     except Exception as e:
         console.print(f"[red]Error generating synthetic data:[/red] {e}")
@@ -273,6 +302,13 @@ def validate(
             exists=True,
         ),
     ],
+    sample_size: Annotated[
+        int | None,
+        typer.Option(
+            "--sample-size",
+            help="Analyse at most this many rows per file (random sample).",
+        ),
+    ] = None,
     json_output: Annotated[
         bool,
         typer.Option(
@@ -304,7 +340,7 @@ def validate(
 
     # Validate
     try:
-        validator = SyntheticValidator()
+        validator = SyntheticValidator(sample_size=sample_size)
         result = validator.validate(
             original_path=original_path,
             synthetic_path=synthetic_path,
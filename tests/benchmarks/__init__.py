@@ -0,0 +1 @@
+"""Performance benchmarks for Persona core hot paths."""
@@ -0,0 +1,25 @@
+"""
+Benchmarks for persona clustering and comparison.
+"""
+
+from persona.core.clustering import PersonaClusterer
+from persona.core.comparison import PersonaComparator
+from persona.core.generation.parser import Persona
+
+
+def test_cluster_similarity(benchmark, personas: list[Persona]):
+    """Cluster sixty personas by similarity."""
+    clusterer = PersonaClusterer()
+
+    result = benchmark(clusterer.cluster, personas)
+
+    assert result.clusters
+
+
+def test_find_duplicates(benchmark, personas: list[Persona]):
+    """Compare every pair of sixty personas."""
+    comparator = PersonaComparator()
+
+    duplicates = benchmark(comparator.find_duplicates, personas)
+
+    assert isinstance(duplicates, list)
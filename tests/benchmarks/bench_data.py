@@ -0,0 +1,17 @@
+"""
+Benchmarks for data loading.
+"""
+
+from pathlib import Path
+
+from persona.core.data import DataLoader
+
+
+def test_load_path_directory(benchmark, transcript_dir: Path):
+    """Load and combine a directory of large transcripts."""
+    loader = DataLoader()
+
+    content, files = benchmark(loader.load_path, transcript_dir)
+
+    assert len(files) == 40
+    assert content
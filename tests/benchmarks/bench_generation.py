@@ -0,0 +1,88 @@
+"""
+Benchmarks for persona generation, parsing and batch processing.
+"""
+
+import asyncio
+import json
+import random
+from pathlib import Path
+
+from persona.core.batch import BatchConfig, BatchProcessor
+from persona.core.generation.parser import PersonaParser
+from persona.core.hybrid import HybridConfig, HybridPipeline
+from persona.core.providers import ProviderFactory
+from tests.benchmarks.synthetic import (
+    persona_response,
+    synthetic_persona_dict,
+    synthetic_transcript,
+)
+
+JUDGE_RESPONSE = json.dumps(
+    {
+        criterion: {"score": 0.9, "reasoning": "Consistent and grounded."}
+        for criterion in ("coherence", "realism", "usefulness")
+    }
+)
+
+
+def test_parser_parse(benchmark):
+    """Parse a response containing fifty personas."""
+    parser = PersonaParser()
+    response = persona_response(50)
+
+    result = benchmark(parser.parse, response)
+
+    assert len(result.personas) == 50
+
+
+def test_batch_processor(benchmark, fake_provider, tmp_path: Path):
+    """Process ten files through the generation pipeline."""
+    rng = random.Random(3)
+    files = []
+    for i in range(10):
+        path = tmp_path / f"interview_{i}.txt"
+        path.write_text(synthetic_transcript(rng, sentences=100))
+        files.append(path)
+    processor = BatchProcessor(fake_provider(), BatchConfig(provider="fake"))
+
+    result = benchmark(processor.process_files, files)
+
+    assert result.total_personas == 30
+
+
+def test_hybrid_pipeline_local_only(benchmark, fake_provider, monkeypatch):
+    """Draft twenty personas in local-only mode."""
+    rng = random.Random(5)
+    drafts = json.dumps([synthetic_persona_dict(i, rng) for i in range(5)])
+    provider = fake_provider(lambda prompt: drafts)
+    monkeypatch.setattr(ProviderFactory, "create", lambda *args, **kwargs: provider)
+    pipeline = HybridPipeline(HybridConfig(frontier_provider=None, batch_size=5))
+    data = synthetic_transcript(rng)
+
+    result = benchmark(lambda: asyncio.run(pipeline.generate(data, count=20)))
+
+    assert result.persona_count == 20
+
+
+def test_hybrid_pipeline_with_judge(benchmark, fake_provider, monkeypatch):
+    """Draft and judge twenty personas in hybrid mode."""
+    rng = random.Random(5)
+    drafts = json.dumps([synthetic_persona_dict(i, rng) for i in range(5)])
+
+    def respond(prompt: str) -> str:
+        return JUDGE_RESPONSE if "coherence" in prompt.lower() else drafts
+
+    provider = fake_provider(respond)
+    monkeypatch.setattr(ProviderFactory, "create", lambda *args, **kwargs: provider)
+    config = HybridConfig(
+        frontier_provider="anthropic",
+        frontier_model="claude-3-5-sonnet-20241022",
+        quality_threshold=0.5,
+        batch_size=5,
+    )
+    pipeline = HybridPipeline(config)
+    data = synthetic_transcript(rng)
+
+    result = benchmark(lambda: asyncio.run(pipeline.generate(data, count=20)))
+
+    assert result.passing_count == 20
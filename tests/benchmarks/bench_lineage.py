@@ -0,0 +1,83 @@
+"""
+Benchmarks for lineage graph traversal and bulk recording.
+"""
+
+from pathlib import Path
+
+import pytest
+from persona.core.lineage import SQLiteLineageStore
+from persona.core.lineage.hashing import hash_content
+
+CHAIN_LENGTH = 200
+
+BATCH_PERSONAS = 500
+
+
+@pytest.fixture
+def lineage_chain(tmp_path: Path) -> tuple[SQLiteLineageStore, str, str]:
+    """Store holding a derivation chain of CHAIN_LENGTH entities."""
+    store = SQLiteLineageStore(tmp_path / "lineage.db")
+    agent = store.get_or_create_agent("cli_tool", "persona", version="bench")
+
+    root = previous = store.create_entity(
+        "input_file", "interviews.csv", hash_content("root")
+    )
+    for i in range(CHAIN_LENGTH):
+        activity = store.create_activity(
+            "persona_refine",
+            f"refine {i}",
+            agent,
+            used_entities=[previous],
+        )
+        entity = store.create_entity(
+            "persona",
+            f"step {i}",
+            hash_content(str(i)),
+            generated_by=activity,
+        )
+        store.complete_activity(activity, generated_entities=[entity])
+        previous = entity
+
+    yield store, root, previous
+    store.close()
+
+
+def test_get_ancestors(benchmark, lineage_chain):
+    """Walk from the newest entity back to the input file."""
+    store, root, leaf = lineage_chain
+
+    graph = benchmark(store.get_ancestors, leaf)
+
+    assert root in {entity.entity_id for entity in graph.entities}
+
+
+def test_get_descendants(benchmark, lineage_chain):
+    """Walk from the input file to every derived entity."""
+    store, root, leaf = lineage_chain
+
+    graph = benchmark(store.get_descendants, root)
+
+    assert leaf in {entity.entity_id for entity in graph.entities}
+
+
+def test_record_batch(benchmark, tmp_path: Path):
+    """Record provenance for a BATCH_PERSONAS-persona run in one batch."""
+    store = SQLiteLineageStore(tmp_path / "lineage.db")
+    agent = store.get_or_create_agent("cli_tool", "persona", version="bench")
+    source = store.create_entity("input_file", "interviews.csv", hash_content("in"))
+
+    def record() -> None:
+        with store.batch() as batch:
+            activity = batch.create_activity(
+                "llm_generation", "generate", agent, used_entities=[source]
+            )
+            outputs = [
+                batch.create_entity("persona", f"persona {i}", hash_content(str(i)))
+                for i in range(BATCH_PERSONAS)
+            ]
+            batch.complete_activity(activity, generated_entities=outputs)
+
+    benchmark(record)
+
+    assert len(store.list_entities(entity_type="persona")) >= BATCH_PERSONAS
+    store.close()
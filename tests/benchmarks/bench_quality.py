@@ -0,0 +1,45 @@
+"""
+Benchmarks for quality scoring and lexical diversity.
+"""
+
+from persona.core.generation.parser import Persona
+from persona.core.quality import QualityScorer
+from persona.core.quality.diversity.analyser import LexicalDiversityAnalyser
+from persona.core.quality.diversity.metrics import calculate_mattr, calculate_mtld
+from persona.core.quality.diversity.tokeniser import extract_persona_text, tokenise
+
+
+def test_quality_score_batch(benchmark, personas: list[Persona]):
+    """Score thirty personas with cross-comparison."""
+    scorer = QualityScorer()
+
+    result = benchmark(scorer.score_batch, personas[:30])
+
+    assert len(result.scores) == 30
+
+
+def test_diversity_analyse_batch(benchmark, personas: list[Persona]):
+    """Analyse lexical diversity of sixty personas."""
+    analyser = LexicalDiversityAnalyser()
+
+    report = benchmark(analyser.analyse_batch, personas)
+
+    assert len(report.reports) == 60
+
+
+def test_mattr_long_text(benchmark, personas: list[Persona]):
+    """Compute MATTR over the combined text of all personas."""
+    tokens = tokenise(" ".join(extract_persona_text(p) for p in personas))
+
+    value = benchmark(calculate_mattr, tokens)
+
+    assert 0.0 < value <= 1.0
+
+
+def test_mtld_long_text(benchmark, personas: list[Persona]):
+    """Compute MTLD over the combined text of all personas."""
+    tokens = tokenise(" ".join(extract_persona_text(p) for p in personas))
+
+    value = benchmark(calculate_mtld, tokens)
+
+    assert value > 0.0
@@ -0,0 +1,60 @@
+"""
+Shared fixtures for performance benchmarks.
+
+Benchmarks use pytest-benchmark and live in bench_*.py files, so the
+normal test run does not collect them. Run them with `make bench`.
+"""
+
+import json
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from persona.core.generation.parser import Persona
+from tests.benchmarks.synthetic import (
+    FakeProvider,
+    persona_response,
+    synthetic_persona_dict,
+    synthetic_transcript,
+)
+
+
+@pytest.fixture(scope="session")
+def personas() -> list[Persona]:
+    """Sixty synthetic personas."""
+    rng = random.Random(42)
+    return [Persona.from_dict(synthetic_persona_dict(i, rng)) for i in range(60)]
+
+
+@pytest.fixture(scope="session")
+def transcript_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory of forty large transcripts in mixed formats."""
+    directory = tmp_path_factory.mktemp("transcripts")
+    rng = random.Random(7)
+    for i in range(40):
+        text = synthetic_transcript(rng)
+        if i % 4 == 0:
+            rows = [{"participant": f"P{i}", "line": line} for line in text.split("\n")]
+            (directory / f"interview_{i:02d}.json").write_text(json.dumps(rows))
+        elif i % 4 == 1:
+            (directory / f"interview_{i:02d}.md").write_text(
+                f"# Interview {i}\n\n{text}"
+            )
+        else:
+            (directory / f"interview_{i:02d}.txt").write_text(text)
+    return directory
+
+
+@pytest.fixture
+def fake_provider() -> Callable[..., FakeProvider]:
+    """Factory for fake providers with configurable latency."""
+
+    def create(
+        respond: Callable[[str], str] | None = None,
+        latency: float = 0.0,
+    ) -> FakeProvider:
+        content = persona_response(3)
+        return FakeProvider(respond or (lambda prompt: content), latency)
+
+    return create
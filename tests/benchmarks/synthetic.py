@@ -0,0 +1,150 @@
+"""
+Synthetic inputs and a fake LLM provider for benchmarks.
+
+All inputs are generated deterministically, and LLM calls go to an
+in-process fake provider with configurable latency, so results measure
+Persona's own overhead rather than network or model time.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from persona.core.providers.base import LLMProvider, LLMResponse
+
+# Word pools for synthetic text
+_WORDS = (
+    "workflow dashboard export report meeting deadline budget feedback "
+    "onboarding search filter mobile desktop offline sync notification "
+    "integration spreadsheet approval review template archive calendar "
+    "customer ticket priority handover audit compliance training shortcut "
+    "frustrating slow reliable confusing simple quick manual automatic "
+    "collaborate share track compare migrate schedule prioritise document"
+).split()
+
+_OCCUPATIONS = [
+    "Software Developer",
+    "UX Designer",
+    "Product Manager",
+    "Data Analyst",
+    "Support Lead",
+    "Marketing Manager",
+]
+
+
+def synthetic_sentence(rng: random.Random, length: int = 12) -> str:
+    """Generate a sentence of random pool words."""
+    words = [rng.choice(_WORDS) for _ in range(length)]
+    return " ".join(words).capitalize() + "."
+
+
+def synthetic_persona_dict(index: int, rng: random.Random) -> dict[str, Any]:
+    """Generate a persona dictionary as an LLM would return it."""
+    return {
+        "id": f"persona-{index:04d}",
+        "name": f"Participant {index}",
+        "demographics": {
+            "age_range": rng.choice(["18-24", "25-34", "35-44", "45-54"]),
+            "occupation": rng.choice(_OCCUPATIONS),
+            "location": rng.choice(["Urban", "Suburban", "Rural"]),
+        },
+        "goals": [synthetic_sentence(rng) for _ in range(4)],
+        "pain_points": [synthetic_sentence(rng) for _ in range(4)],
+        "behaviours": [synthetic_sentence(rng) for _ in range(4)],
+        "quotes": [synthetic_sentence(rng, 20) for _ in range(2)],
+    }
+
+
+def synthetic_transcript(rng: random.Random, sentences: int = 200) -> str:
+    """Generate an interview transcript."""
+    lines = []
+    for i in range(sentences):
+        speaker = "Interviewer" if i % 4 == 0 else "Participant"
+        lines.append(f"{speaker}: {synthetic_sentence(rng, rng.randint(8, 20))}")
+    return "\n".join(lines)
+
+
+def persona_response(count: int, seed: int = 0) -> str:
+    """Build a generation response in the format PersonaParser expects."""
+    rng = random.Random(seed)
+    personas = [synthetic_persona_dict(i, rng) for i in range(count)]
+    return "\n".join(
+        [
+            "<reasoning>\nGrouped participants by workflow.\n</reasoning>",
+            "<output>",
+            json.dumps({"personas": personas}, indent=2),
+            "</output>",
+        ]
+    )
+
+
+class FakeProvider(LLMProvider):
+    """
+    In-process provider returning canned responses.
+
+    Attributes:
+        respond: Function mapping a prompt to response content.
+        latency: Seconds each call takes, simulating network and model time.
+        calls: Number of generate calls made.
+    """
+
+    def __init__(
+        self,
+        respond: Callable[[str], str],
+        latency: float = 0.0,
+    ) -> None:
+        self.respond = respond
+        self.latency = latency
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    @property
+    def default_model(self) -> str:
+        return "fake-model"
+
+    @property
+    def available_models(self) -> list[str]:
+        return ["fake-model"]
+
+    def is_configured(self) -> bool:
+        return True
+
+    def generate(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._response(prompt, model)
+
+    async def generate_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._response(prompt, model)
+
+    def _response(self, prompt: str, model: str | None) -> LLMResponse:
+        self.calls += 1
+        content = self.respond(prompt)
+        return LLMResponse(
+            content=content,
+            model=model or self.default_model,
+            input_tokens=len(prompt) // 4,
+            output_tokens=len(content) // 4,
+        )
@@ -217,3 +217,19 @@ def test_openapi_json(client):
     assert "openapi" in data
     assert "info" in data
     assert "paths" in data
+
+
+def test_metrics_endpoint(client):
+    """Test metrics are served in Prometheus and JSON formats."""
+    from persona.core.logging.tracing import get_tracer
+
+    get_tracer().record("generation.render", 2.0)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'span="generation.render"' in response.text
+
+    data = client.get("/metrics", params={"format": "json"}).json()
+    assert data["generation.render"]["count"] >= 1
+    assert isinstance(data["rate_limits"], list)
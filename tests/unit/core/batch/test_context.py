@@ -1,5 +1,6 @@
 """Tests for context window awareness (F-062)."""
 
+from pathlib import Path
 
 from persona.core.batch.context import (
     MODEL_CONTEXT_WINDOWS,
@@ -9,6 +10,7 @@ from persona.core.batch.context import (
     WarningLevel,
     check_context_usage,
 )
+from persona.core.data import LoadResult
 
 
 class TestContextBudget:
@@ -222,6 +224,23 @@ class TestContextManager:
         assert suggested > 0
         assert suggested < 100000
 
+    def test_calculate_load_budget(self):
+        """Uses token counts from loading without re-encoding."""
+        manager = ContextManager()
+        load_result = LoadResult(
+            content="ignored",
+            files=[],
+            file_tokens={Path("a.txt"): 40000, Path("b.txt"): 20000},
+            separator_tokens=5,
+        )
+
+        budget = manager.calculate_load_budget(
+            "gpt-4o", load_result, system_tokens=1000
+        )
+
+        assert budget.input_data_tokens == 60005
+        assert budget.system_prompt_tokens == 1000
+
 
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
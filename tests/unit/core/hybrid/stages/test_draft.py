@@ -15,6 +15,7 @@ from persona.core.hybrid.stages.draft import (
     draft_personas,
 )
 from persona.core.providers.base import LLMResponse
+from persona.core.providers.cache import ResponseCache
 
 
 class TestBuildDraftPrompt:
@@ -234,6 +235,44 @@ class TestDraftPersonas:
         # Should have made multiple calls for batches
         assert mock_provider.generate_async.call_count >= 2
 
+    @pytest.mark.asyncio
+    async def test_cached_batches_are_distinct_requests(
+        self, config, cost_tracker, tmp_path
+    ):
+        """Test later batches are not served as cached copies of the first."""
+        config.batch_size = 2
+
+        mock_provider = MagicMock()
+        mock_provider.name = "ollama"
+        mock_provider.is_configured.return_value = True
+        mock_provider.generate_async = AsyncMock(
+            return_value=LLMResponse(
+                content='[{"id": "p1", "name": "User 1"}, {"id": "p2"}]',
+                model="test-model",
+                input_tokens=100,
+                output_tokens=100,
+            )
+        )
+        cache = ResponseCache(tmp_path / "cache.db", cache_sampled=True)
+
+        with patch(
+            "persona.core.hybrid.stages.draft.ProviderFactory"
+        ) as mock_factory:
+            mock_factory.create.return_value = mock_provider
+
+            await draft_personas(
+                input_data="Test data",
+                config=config,
+                count=6,
+                cost_tracker=cost_tracker,
+                response_cache=cache,
+            )
+
+        prompts = [call.args[0] for call in mock_provider.generate_async.call_args_list]
+        assert len(prompts) == 3
+        assert len(set(prompts)) == 3
+        assert cache.stats.hits == 0
+
     @pytest.mark.asyncio
     async def test_tracks_token_usage(self, config, cost_tracker):
         """Test that token usage is tracked."""
@@ -286,6 +286,7 @@ class TestFilterPersonas:
         mock_result = MagicMock()
         mock_result.overall_score = 0.8
         mock_result.raw_response = True
+        mock_result.cached = False
         mock_result.to_dict.return_value = {"overall_score": 0.8}
 
         mock_judge = MagicMock()
@@ -305,3 +306,28 @@ class TestFilterPersonas:
 
         # Check that judge tokens were tracked
         assert cost_tracker.judge_input_tokens > 0 or cost_tracker.judge_output_tokens > 0
+
+    @pytest.mark.asyncio
+    async def test_cached_results_not_billed(self, config, cost_tracker):
+        """Test judge results served from the cache are tracked as cached."""
+        mock_result = MagicMock()
+        mock_result.overall_score = 0.8
+        mock_result.raw_response = True
+        mock_result.cached = True
+        mock_result.to_dict.return_value = {"overall_score": 0.8}
+
+        mock_judge = MagicMock()
+        mock_judge.evaluate.return_value = mock_result
+
+        with patch(
+            "persona.core.hybrid.stages.filter.PersonaJudge",
+            return_value=mock_judge,
+        ):
+            await filter_personas(
+                personas=[{"id": "p1", "name": "Alice"}],
+                config=config,
+                cost_tracker=cost_tracker,
+            )
+
+        assert cost_tracker.judge_input_tokens == 0
+        assert cost_tracker.to_dict()["cache"]["hits"] == 1
@@ -0,0 +1,95 @@
+"""Shared fixtures for multi-model tests."""
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from persona.core.providers.base import LLMProvider, LLMResponse
+
+
+class StubProvider(LLMProvider):
+    """Provider stub returning canned personas after an optional delay."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False) -> None:
+        self._name = name
+        self.delay = delay
+        self.fail = fail
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def default_model(self) -> str:
+        return "stub-model"
+
+    @property
+    def available_models(self) -> list[str]:
+        return ["stub-model"]
+
+    def is_configured(self) -> bool:
+        return True
+
+    def generate(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        raise NotImplementedError("StubProvider is async-only")
+
+    async def generate_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if self.fail:
+            raise RuntimeError(f"{self._name} unavailable")
+
+        personas = [
+            {
+                "id": f"persona-{i + 1}",
+                "name": f"Persona {i + 1} ({model})",
+                "demographics": {"role": "User"},
+                "goals": ["Goal 1", "Goal 2"],
+                "pain_points": ["Frustration 1"],
+            }
+            for i in range(3)
+        ]
+        return LLMResponse(
+            content=json.dumps({"personas": personas}),
+            model=model or self.default_model,
+            input_tokens=1000,
+            output_tokens=500,
+        )
+
+
+@pytest.fixture
+def stub_providers() -> dict[str, StubProvider]:
+    """Stub providers keyed by provider name."""
+    return {
+        name: StubProvider(name) for name in ("anthropic", "openai", "gemini", "ollama")
+    }
+
+
+@pytest.fixture
+def provider_factory(stub_providers: dict[str, StubProvider]):
+    """Provider factory returning stub providers."""
+    return stub_providers.__getitem__
@@ -184,9 +184,9 @@ class TestMultiModelResult:
 class TestMultiModelGenerator:
     """Tests for MultiModelGenerator."""
 
-    def test_generate_parallel(self):
+    def test_generate_parallel(self, provider_factory):
         """Generates with parallel mode."""
-        generator = MultiModelGenerator()
+        generator = MultiModelGenerator(provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -202,9 +202,9 @@ class TestMultiModelGenerator:
         assert result.execution_mode == "parallel"
         assert len(result.model_outputs) == 2
 
-    def test_generate_sequential(self):
+    def test_generate_sequential(self, provider_factory):
         """Generates with sequential mode."""
-        generator = MultiModelGenerator()
+        generator = MultiModelGenerator(provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -219,9 +219,9 @@ class TestMultiModelGenerator:
 
         assert result.execution_mode == "sequential"
 
-    def test_generate_consensus(self):
+    def test_generate_consensus(self, provider_factory):
         """Generates with consensus mode."""
-        generator = MultiModelGenerator()
+        generator = MultiModelGenerator(provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -238,24 +238,24 @@ class TestMultiModelGenerator:
         # Consensus mode should produce consolidated personas
         assert len(result.consolidated_personas) >= 0
 
-    def test_generate_empty_models_raises(self):
+    def test_generate_empty_models_raises(self, provider_factory):
         """Raises for empty models list."""
-        generator = MultiModelGenerator()
+        generator = MultiModelGenerator(provider_factory=provider_factory)
 
         with pytest.raises(ValueError, match="At least one model"):
             generator.generate(data="Test", models=[], count=3)
 
-    def test_generate_invalid_mode_raises(self):
+    def test_generate_invalid_mode_raises(self, provider_factory):
         """Raises for invalid mode."""
-        generator = MultiModelGenerator()
+        generator = MultiModelGenerator(provider_factory=provider_factory)
         models = [ModelSpec("anthropic", "claude")]
 
         with pytest.raises(ValueError, match="Invalid mode"):
             generator.generate(data="Test", models=models, mode="invalid")
 
-    def test_generate_single(self):
+    def test_generate_single(self, provider_factory):
         """Generates with single model."""
-        generator = MultiModelGenerator()
+        generator = MultiModelGenerator(provider_factory=provider_factory)
         model = ModelSpec("anthropic", "claude-sonnet-4")
 
         output = generator.generate_single(
@@ -266,14 +266,34 @@ class TestMultiModelGenerator:
 
         assert output.success
         assert len(output.personas) == 3
+        assert output.raw_response
+
+    @pytest.mark.asyncio
+    async def test_generate_async(self, provider_factory):
+        """Generates from within an event loop."""
+        generator = MultiModelGenerator(provider_factory=provider_factory)
+        models = [
+            ModelSpec("anthropic", "claude-sonnet-4"),
+            ModelSpec("ollama", "qwen2.5:7b"),
+        ]
+
+        result = await generator.generate_async(
+            data="Test data",
+            models=models,
+            count=3,
+        )
+
+        assert len(result.successful_models) == 2
+        assert result.model_outputs[1].cost == 0.0
 
 
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
-    def test_generate_multi_model_strings(self):
+    def test_generate_multi_model_strings(self, provider_factory):
         """Generates with string model specs."""
         result = generate_multi_model(
+            provider_factory=provider_factory,
             data="Test data",
             models=["anthropic:claude-sonnet-4", "openai:gpt-4o"],
             count=2,
@@ -282,9 +302,10 @@ class TestConvenienceFunctions:
 
         assert len(result.model_outputs) == 2
 
-    def test_generate_multi_model_mixed(self):
+    def test_generate_multi_model_mixed(self, provider_factory):
         """Generates with mixed model specs."""
         result = generate_multi_model(
+            provider_factory=provider_factory,
             data="Test data",
             models=[
                 "anthropic:claude-sonnet-4",
@@ -1,6 +1,8 @@
 """Tests for execution strategies (F-067)."""
 
+import time
 
+import pytest
 from persona.core.multimodel.generator import ModelSpec
 from persona.core.multimodel.strategies import (
     ConsensusStrategy,
@@ -43,9 +45,9 @@ class TestStrategyConfig:
 class TestParallelStrategy:
     """Tests for ParallelStrategy."""
 
-    def test_execute_basic(self):
+    def test_execute_basic(self, provider_factory):
         """Executes parallel generation."""
-        strategy = ParallelStrategy()
+        strategy = ParallelStrategy(provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -62,9 +64,9 @@ class TestParallelStrategy:
         assert result.execution_mode == "parallel"
         assert len(result.model_outputs) == 2
 
-    def test_execute_tracks_totals(self):
+    def test_execute_tracks_totals(self, provider_factory):
         """Tracks total tokens and cost."""
-        strategy = ParallelStrategy()
+        strategy = ParallelStrategy(provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
         ]
@@ -81,9 +83,9 @@ class TestParallelStrategy:
         assert result.total_tokens_output > 0
         assert result.total_cost > 0
 
-    def test_execute_multiple_models(self):
+    def test_execute_multiple_models(self, provider_factory):
         """Handles multiple models."""
-        strategy = ParallelStrategy(max_workers=2)
+        strategy = ParallelStrategy(max_workers=2, provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -100,13 +102,151 @@ class TestParallelStrategy:
 
         assert len(result.model_outputs) == 3
 
+    def test_execute_runs_models_concurrently(self, provider_factory, stub_providers):
+        """Total latency is close to the slowest model, not the sum."""
+        for provider in stub_providers.values():
+            provider.delay = 0.2
+        strategy = ParallelStrategy(provider_factory=provider_factory)
+        models = [
+            ModelSpec("anthropic", "claude-sonnet-4"),
+            ModelSpec("openai", "gpt-4o"),
+            ModelSpec("gemini", "gemini-1.5-pro"),
+        ]
+
+        start = time.monotonic()
+        result = strategy.execute(
+            data="Test data",
+            models=models,
+            count=3,
+            temperature=0.7,
+            max_tokens=4096,
+        )
+        elapsed = time.monotonic() - start
+
+        assert all(o.success for o in result.model_outputs)
+        assert elapsed < 0.5
+
+    def test_execute_uses_response_usage(self, provider_factory):
+        """Tokens and personas come from the provider response."""
+        strategy = ParallelStrategy(provider_factory=provider_factory)
+
+        result = strategy.execute(
+            data="Test data",
+            models=[ModelSpec("anthropic", "claude-sonnet-4-20250514")],
+            count=3,
+            temperature=0.7,
+            max_tokens=4096,
+        )
+
+        output = result.model_outputs[0]
+        assert output.tokens_input == 1000
+        assert output.tokens_output == 500
+        assert output.cost == pytest.approx(0.0105)
+        assert output.personas[0]["model_source"] == (
+            "anthropic:claude-sonnet-4-20250514"
+        )
+
+    def test_execute_timeout_returns_partial_results(
+        self, provider_factory, stub_providers
+    ):
+        """A model exceeding the timeout does not discard the others."""
+        stub_providers["openai"].delay = 5.0
+        strategy = ParallelStrategy(
+            timeout_seconds=0.2, provider_factory=provider_factory
+        )
+
+        result = strategy.execute(
+            data="Test data",
+            models=[
+                ModelSpec("anthropic", "claude-sonnet-4"),
+                ModelSpec("openai", "gpt-4o"),
+            ],
+            count=3,
+            temperature=0.7,
+            max_tokens=4096,
+        )
+
+        assert len(result.successful_models) == 1
+        assert "Timed out" in result.failed_models[0].error
+
+    def test_execute_captures_provider_errors(self, provider_factory, stub_providers):
+        """Provider errors are reported per model."""
+        stub_providers["gemini"].fail = True
+        strategy = ParallelStrategy(provider_factory=provider_factory)
+
+        result = strategy.execute(
+            data="Test data",
+            models=[
+                ModelSpec("anthropic", "claude-sonnet-4"),
+                ModelSpec("gemini", "gemini-1.5-pro"),
+            ],
+            count=3,
+            temperature=0.7,
+            max_tokens=4096,
+        )
+
+        assert len(result.successful_models) == 1
+        assert result.failed_models[0].error == "gemini unavailable"
+
+    def test_execute_renders_workflow_file(
+        self, provider_factory, stub_providers, tmp_path
+    ):
+        """Prompts are rendered from the configured workflow."""
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text(
+            'name: custom\ntemplate: "Make {{ count }} personas from {{ data }}"\n'
+        )
+        strategy = ParallelStrategy(
+            provider_factory=provider_factory, workflow=str(workflow_file)
+        )
+
+        result = strategy.execute(
+            data="Test data",
+            models=[ModelSpec("openai", "gpt-4o")],
+            count=2,
+            temperature=0.7,
+            max_tokens=4096,
+        )
+
+        assert stub_providers["openai"].prompts == ["Make 2 personas from Test data"]
+        assert result.model_outputs[0].prompt == "Make 2 personas from Test data"
+
+    @pytest.mark.asyncio
+    async def test_execute_async(self, provider_factory):
+        """Runs inside an existing event loop."""
+        strategy = ParallelStrategy(provider_factory=provider_factory)
+
+        result = await strategy.execute_async(
+            data="Test data",
+            models=[ModelSpec("anthropic", "claude-sonnet-4")],
+            count=3,
+            temperature=0.7,
+            max_tokens=4096,
+        )
+
+        assert result.model_outputs[0].success
+
+    @pytest.mark.asyncio
+    async def test_execute_sync_in_event_loop_raises(self, provider_factory):
+        """Synchronous execution inside an event loop is rejected."""
+        strategy = ParallelStrategy(provider_factory=provider_factory)
+
+        with pytest.raises(RuntimeError, match="async context"):
+            strategy.execute(
+                data="Test data",
+                models=[ModelSpec("anthropic", "claude-sonnet-4")],
+                count=3,
+                temperature=0.7,
+                max_tokens=4096,
+            )
+
 
 class TestSequentialStrategy:
     """Tests for SequentialStrategy."""
 
-    def test_execute_basic(self):
+    def test_execute_basic(self, provider_factory):
         """Executes sequential generation."""
-        strategy = SequentialStrategy()
+        strategy = SequentialStrategy(provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -123,9 +263,11 @@ class TestSequentialStrategy:
         assert result.execution_mode == "sequential"
         assert len(result.model_outputs) == 2
 
-    def test_execute_passes_context(self):
+    def test_execute_passes_context(self, provider_factory, stub_providers):
         """Passes context between models when enabled."""
-        strategy = SequentialStrategy(pass_context=True)
+        strategy = SequentialStrategy(
+            pass_context=True, provider_factory=provider_factory
+        )
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -140,13 +282,16 @@ class TestSequentialStrategy:
         )
 
         # Second model should have context from first
-        # (In mock, this shows as "with context" in name)
         second_output = result.model_outputs[1]
         assert second_output.success
+        assert "Previous model generated" in stub_providers["openai"].prompts[0]
+        assert "Previous model generated" not in stub_providers["anthropic"].prompts[0]
 
-    def test_execute_no_context(self):
+    def test_execute_no_context(self, provider_factory):
         """Does not pass context when disabled."""
-        strategy = SequentialStrategy(pass_context=False)
+        strategy = SequentialStrategy(
+            pass_context=False, provider_factory=provider_factory
+        )
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -166,9 +311,9 @@ class TestSequentialStrategy:
 class TestConsensusStrategy:
     """Tests for ConsensusStrategy."""
 
-    def test_execute_basic(self):
+    def test_execute_basic(self, provider_factory):
         """Executes consensus generation."""
-        strategy = ConsensusStrategy()
+        strategy = ConsensusStrategy(provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -185,9 +330,9 @@ class TestConsensusStrategy:
         assert result.execution_mode == "consensus"
         assert len(result.model_outputs) == 2
 
-    def test_execute_produces_consolidated(self):
+    def test_execute_produces_consolidated(self, provider_factory):
         """Produces consolidated personas."""
-        strategy = ConsensusStrategy()
+        strategy = ConsensusStrategy(provider_factory=provider_factory)
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
@@ -204,9 +349,11 @@ class TestConsensusStrategy:
         # Should have consolidated personas
         assert len(result.consolidated_personas) >= 0
 
-    def test_execute_custom_threshold(self):
+    def test_execute_custom_threshold(self, provider_factory):
         """Uses custom consensus threshold."""
-        strategy = ConsensusStrategy(consensus_threshold=0.9)
+        strategy = ConsensusStrategy(
+            consensus_threshold=0.9, provider_factory=provider_factory
+        )
         models = [
             ModelSpec("anthropic", "claude-sonnet-4"),
             ModelSpec("openai", "gpt-4o"),
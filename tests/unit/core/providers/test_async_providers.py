@@ -151,6 +151,35 @@ class TestAnthropicProviderAsync:
             with pytest.raises(AuthenticationError):
                 await provider.generate_async("Test prompt")
 
+    async def test_generate_with_image_async(self):
+        """Test async vision requests send the image before the prompt."""
+        provider = AnthropicProvider(api_key="test-key")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "model": "claude-sonnet-4-5-20250929",
+            "content": [{"type": "text", "text": "{}"}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 1500, "output_tokens": 2},
+        }
+
+        with patch.object(
+            provider, "_post_async", AsyncMock(return_value=mock_response)
+        ) as post:
+            response = await provider.generate_with_image_async(
+                "Read the notes", "aGVsbG8=", media_type="image/png"
+            )
+
+        content = post.call_args.kwargs["json"]["messages"][0]["content"]
+        assert content[0]["source"] == {
+            "type": "base64",
+            "media_type": "image/png",
+            "data": "aGVsbG8=",
+        }
+        assert content[1] == {"type": "text", "text": "Read the notes"}
+        assert response.content == "{}"
+
 
 @pytest.mark.asyncio
 class TestGeminiProviderAsync:
@@ -380,3 +409,25 @@ class TestOllamaProviderAsync:
                 payload = call_args[1]["json"]
                 assert payload["options"]["temperature"] == 0.9
                 assert payload["options"]["num_predict"] == 2048
+
+    async def test_generate_async_reuses_pooled_client(self):
+        """Test calls share one client and fetch the model list once."""
+        provider = OllamaProvider(model="llama3:8b")
+
+        tags = MagicMock(status_code=200)
+        tags.json.return_value = {"models": [{"name": "llama3:8b"}]}
+        chat = MagicMock(status_code=200)
+        chat.json.return_value = {"message": {"content": "Hi"}, "done": True}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = MagicMock(is_closed=False)
+            mock_instance.get = AsyncMock(return_value=tags)
+            mock_instance.post = AsyncMock(return_value=chat)
+            mock_client.return_value = mock_instance
+
+            await provider.generate_async("First")
+            await provider.generate_async("Second")
+
+            assert mock_client.call_count == 1
+            assert mock_instance.get.await_count == 1
+            assert mock_instance.post.await_count == 2
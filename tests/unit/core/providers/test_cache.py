@@ -0,0 +1,288 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from persona.core.generation.pipeline import GenerationConfig, GenerationPipeline
+from persona.core.hybrid.cost import CostTracker
+from persona.core.providers.base import LLMProvider, LLMResponse
+from persona.core.providers.cache import CachingProvider, ResponseCache
+
+
+class CountingProvider(LLMProvider):
+    """Provider stub that counts calls."""
+
+    def __init__(self, content: str = '{"personas": []}') -> None:
+        self.calls = 0
+        self.content = content
+
+    @property
+    def name(self) -> str:
+        return "stub"
+
+    @property
+    def default_model(self) -> str:
+        return "stub-model"
+
+    @property
+    def available_models(self) -> list[str]:
+        return ["stub-model"]
+
+    def is_configured(self) -> bool:
+        return True
+
+    def generate(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            content=self.content,
+            model=model or self.default_model,
+            input_tokens=100,
+            output_tokens=50,
+        )
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_miss_then_hit(self, tmp_path: Path):
+        """Test storing and retrieving a response."""
+        cache = ResponseCache(tmp_path / "cache.db")
+        key = cache.make_key("stub", "m", "prompt")
+
+        assert cache.get(key) is None
+        cache.put(key, LLMResponse(content="hi", model="m", input_tokens=3))
+        response = cache.get(key)
+
+        assert response is not None
+        assert response.content == "hi"
+        assert response.cached is True
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.saved_input_tokens == 3
+
+    def test_hit_keeps_prompt_cache_usage(self, tmp_path: Path):
+        """Test provider prompt-cache token counts survive a round trip."""
+        cache = ResponseCache(tmp_path / "cache.db")
+        key = cache.make_key("stub", "m", "prompt")
+        cache.put(
+            key,
+            LLMResponse(
+                content="hi",
+                model="m",
+                input_tokens=300,
+                cache_read_tokens=200,
+                cache_write_tokens=50,
+            ),
+        )
+
+        response = cache.get(key)
+
+        assert response is not None
+        assert response.cache_read_tokens == 200
+        assert response.cache_write_tokens == 50
+
+    def test_key_depends_on_parameters(self):
+        """Test sampling parameters change the key."""
+        base = ResponseCache.make_key("p", "m", "prompt")
+
+        assert base == ResponseCache.make_key("p", "m", "prompt")
+        assert base != ResponseCache.make_key("p", "m", "prompt", temperature=0.2)
+        assert base != ResponseCache.make_key("p", "m", "prompt", max_tokens=10)
+        assert base != ResponseCache.make_key("p", "m", "prompt", system_prompt="s")
+        assert base != ResponseCache.make_key("p", "other", "prompt")
+        assert base != ResponseCache.make_key("q", "m", "prompt")
+
+    def test_ttl_expiry(self, tmp_path: Path):
+        """Test expired entries are not served."""
+        cache = ResponseCache(tmp_path / "cache.db", ttl_seconds=0.01)
+        key = cache.make_key("p", "m", "prompt")
+        cache.put(key, LLMResponse(content="hi", model="m"))
+
+        time.sleep(0.05)
+
+        assert cache.get(key) is None
+        assert cache.stats.evictions == 1
+
+    def test_max_entries_evicts_least_recently_used(self, tmp_path: Path):
+        """Test size limit keeps recently used entries."""
+        cache = ResponseCache(tmp_path / "cache.db", max_entries=2)
+        keys = [cache.make_key("p", "m", f"prompt {i}") for i in range(3)]
+
+        cache.put(keys[0], LLMResponse(content="0", model="m"))
+        time.sleep(0.01)
+        cache.put(keys[1], LLMResponse(content="1", model="m"))
+        time.sleep(0.01)
+        cache.get(keys[0])
+        time.sleep(0.01)
+        cache.put(keys[2], LLMResponse(content="2", model="m"))
+
+        assert len(cache) == 2
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        """Test entries survive reopening the database."""
+        db_path = tmp_path / "cache.db"
+        key = ResponseCache.make_key("p", "m", "prompt")
+        ResponseCache(db_path).put(key, LLMResponse(content="hi", model="m"))
+
+        assert ResponseCache(db_path).get(key) is not None
+
+    def test_clear(self, tmp_path: Path):
+        """Test clearing the cache."""
+        cache = ResponseCache(tmp_path / "cache.db")
+        cache.put(cache.make_key("p", "m", "a"), LLMResponse(content="a", model="m"))
+
+        assert cache.clear() == 1
+        assert len(cache) == 0
+
+
+class TestCachingProvider:
+    """Tests for CachingProvider."""
+
+    def test_repeated_prompt_served_from_cache(self, tmp_path: Path):
+        """Test identical requests only reach the provider once."""
+        inner = CountingProvider()
+        provider = CachingProvider(inner, ResponseCache(tmp_path / "cache.db"))
+
+        first = provider.generate("prompt", temperature=0.0)
+        second = provider.generate("prompt", temperature=0.0)
+
+        assert inner.calls == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.content == first.content
+
+    def test_different_system_prompt_misses(self, tmp_path: Path):
+        """Test system prompt is part of the key."""
+        inner = CountingProvider()
+        provider = CachingProvider(inner, ResponseCache(tmp_path / "cache.db"))
+
+        provider.generate("prompt", temperature=0.0, system_prompt="a")
+        provider.generate("prompt", temperature=0.0, system_prompt="b")
+
+        assert inner.calls == 2
+
+    def test_truncated_responses_not_cached(self, tmp_path: Path):
+        """Test responses cut off by max_tokens are not stored."""
+
+        class TruncatingProvider(CountingProvider):
+            def generate(self, *args: Any, **kwargs: Any) -> LLMResponse:
+                response = super().generate(*args, **kwargs)
+                response.finish_reason = "length"
+                return response
+
+        inner = TruncatingProvider()
+        provider = CachingProvider(inner, ResponseCache(tmp_path / "cache.db"))
+
+        provider.generate("prompt", temperature=0.0)
+        provider.generate("prompt", temperature=0.0)
+
+        assert inner.calls == 2
+
+    def test_sampled_requests_bypass_cache(self, tmp_path: Path):
+        """Test requests above temperature zero are not cached by default."""
+        inner = CountingProvider()
+        cache = ResponseCache(tmp_path / "cache.db")
+        provider = CachingProvider(inner, cache)
+
+        provider.generate("prompt", temperature=0.7)
+        response = provider.generate("prompt", temperature=0.7)
+
+        assert inner.calls == 2
+        assert response.cached is False
+        assert len(cache) == 0
+        assert cache.stats.lookups == 0
+
+    def test_cache_sampled_opt_in(self, tmp_path: Path):
+        """Test sampled requests are cached when cache_sampled is set."""
+        inner = CountingProvider()
+        provider = CachingProvider(
+            inner, ResponseCache(tmp_path / "cache.db", cache_sampled=True)
+        )
+
+        provider.generate("prompt", temperature=0.7)
+        response = provider.generate("prompt", temperature=0.7)
+
+        assert inner.calls == 1
+        assert response.cached is True
+
+    @pytest.mark.asyncio
+    async def test_generate_async(self, tmp_path: Path):
+        """Test async generation uses the cache."""
+        inner = CountingProvider()
+        provider = CachingProvider(inner, ResponseCache(tmp_path / "cache.db"))
+
+        await provider.generate_async("prompt", temperature=0.0)
+        response = await provider.generate_async("prompt", temperature=0.0)
+
+        assert inner.calls == 1
+        assert response.cached is True
+
+    def test_delegates_metadata(self, tmp_path: Path):
+        """Test provider properties are delegated."""
+        inner = CountingProvider()
+        provider = CachingProvider(inner, ResponseCache(tmp_path / "cache.db"))
+
+        assert provider.name == "stub"
+        assert provider.default_model == "stub-model"
+        assert provider.is_configured()
+
+
+class TestGenerationPipelineCache:
+    """Tests for response caching in GenerationPipeline."""
+
+    def test_result_reports_cache_hit(self, tmp_path: Path, monkeypatch):
+        """Test cache hits are surfaced in GenerationResult."""
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("Interview notes")
+        inner = CountingProvider()
+        monkeypatch.setattr(
+            "persona.core.generation.pipeline.ProviderFactory.create",
+            lambda name: inner,
+        )
+
+        pipeline = GenerationPipeline(
+            response_cache=ResponseCache(tmp_path / "cache.db")
+        )
+        config = GenerationConfig(
+            data_path=data_file, provider="stub", temperature=0.0
+        )
+
+        first = pipeline.generate(config)
+        second = pipeline.generate(config)
+
+        assert inner.calls == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.cache_stats["hits"] == 1
+
+
+class TestCostTrackerCache:
+    """Tests for cache accounting in CostTracker."""
+
+    def test_cached_usage_not_billed(self):
+        """Test cached usage is tracked separately from billed usage."""
+        tracker = CostTracker(
+            frontier_provider="anthropic",
+            frontier_model="claude-3-5-sonnet-20241022",
+        )
+        tracker.add_cached_usage(1_000_000, 1_000_000)
+
+        assert tracker.total_cost == 0.0
+        assert tracker.to_dict()["cache"] == {
+            "hits": 1,
+            "input_tokens": 1_000_000,
+            "output_tokens": 1_000_000,
+        }
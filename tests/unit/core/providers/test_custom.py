@@ -264,6 +264,29 @@ class TestCustomVendorProviderRequest:
 
         assert "temperature" not in payload
 
+    @pytest.mark.parametrize("request_format", ["openai", "anthropic"])
+    def test_build_request_drops_internal_kwargs(self, request_format):
+        """Test cache_prefix is not sent as a request parameter."""
+        config = VendorConfig(
+            id="test",
+            name="Test",
+            api_base="https://api.example.com",
+            request_format=request_format,
+        )
+        provider = CustomVendorProvider(config)
+
+        payload = provider._build_request_payload(
+            prompt="DATA Hello",
+            model="gpt-4",
+            max_tokens=100,
+            temperature=0.7,
+            cache_prefix="DATA ",
+            top_p=0.9,
+        )
+
+        assert "cache_prefix" not in payload
+        assert payload["top_p"] == 0.9
+
 
 class TestCustomVendorProviderResponse:
     """Tests for CustomVendorProvider response parsing."""
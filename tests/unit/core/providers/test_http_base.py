@@ -2,6 +2,8 @@
 Tests for HTTP base provider with connection pooling (F-129).
 """
 
+import asyncio
+
 import pytest
 
 from persona.core.providers.http_base import HTTPProvider
@@ -62,6 +64,10 @@ class TestHTTPProviderInit:
         provider = ConcreteHTTPProvider(max_keepalive_connections=10)
         assert provider._max_keepalive == 10
 
+    def test_api_key_defaults_to_none(self):
+        """Test providers without a key report none."""
+        assert ConcreteHTTPProvider().api_key is None
+
 
 class TestHTTPProviderSyncClient:
     """Tests for synchronous client management."""
@@ -108,7 +114,6 @@ class TestHTTPProviderAsyncClient:
 
     def setup_method(self):
         """Reset class-level clients before each test."""
-        HTTPProvider._async_client = None
         HTTPProvider._lock = None
 
     @pytest.mark.asyncio
@@ -143,7 +148,42 @@ class TestHTTPProviderAsyncClient:
 
         await HTTPProvider.cleanup_async()
 
-        assert HTTPProvider._async_client is None
+        assert HTTPProvider._async_clients.current() is None
+
+    def test_async_client_per_event_loop(self):
+        """Test each event loop gets its own open client."""
+        provider = ConcreteHTTPProvider()
+
+        async def get_client():
+            client = await provider.get_async_client()
+            assert await provider.get_async_client() is client
+            return client
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+    def test_async_client_closed_with_its_loop(self):
+        """Test a loop's client is closed and dropped when the loop ends."""
+        provider = ConcreteHTTPProvider()
+
+        async def get_client():
+            return await provider.get_async_client()
+
+        clients = [asyncio.run(get_client()) for _ in range(3)]
+
+        assert all(client.is_closed for client in clients)
+        assert len(HTTPProvider._async_clients) == 0
+
+    def test_closed_loop_client_pruned(self):
+        """Test clients of loops closed without shutdown are dropped."""
+        provider = ConcreteHTTPProvider()
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(provider.get_async_client())
+        loop.close()
+
+        assert len(HTTPProvider._async_clients) == 0
 
 
 class TestHTTPProviderTimeout:
@@ -187,7 +227,6 @@ class TestHTTPProviderCleanup:
     def setup_method(self):
         """Reset clients before each test."""
         HTTPProvider._sync_client = None
-        HTTPProvider._async_client = None
         HTTPProvider._lock = None
 
     @pytest.mark.asyncio
@@ -203,4 +242,4 @@ class TestHTTPProviderCleanup:
         await HTTPProvider.cleanup()
 
         assert HTTPProvider._sync_client is None
-        assert HTTPProvider._async_client is None
+        assert HTTPProvider._async_clients.current() is None
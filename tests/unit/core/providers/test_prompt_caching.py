@@ -0,0 +1,296 @@
+"""
+Tests for provider prompt-prefix caching.
+"""
+
+import json
+from typing import Any
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from persona.core.evaluation import EvaluationCriteria, PersonaJudge
+from persona.core.evaluation.prompts import (
+    build_batch_evaluation_prompt,
+    build_evaluation_prefix,
+)
+from persona.core.generation.pipeline import GenerationPipeline
+from persona.core.hybrid.cost import CostTracker, estimate_cost
+from persona.core.hybrid.stages.draft import _build_draft_prefix, _build_draft_prompt
+from persona.core.hybrid.stages.refine import (
+    _build_refinement_prefix,
+    _build_refinement_prompt,
+)
+from persona.core.providers.anthropic import AnthropicProvider
+from persona.core.providers.base import LLMResponse, split_prompt_prefix
+from persona.core.providers.http_base import HTTPProvider
+from persona.core.providers.ollama import OllamaProvider
+from persona.core.providers.openai import OpenAIProvider
+
+# Captured before tests patch httpx.Client
+HTTPX_CLIENT = httpx.Client
+
+
+class StubServer:
+    """In-process HTTP stub recording request bodies."""
+
+    def __init__(self, body: dict[str, Any]) -> None:
+        self.body = body
+        self.requests: list[dict[str, Any]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json={"models": [{"name": "llama3:8b"}]})
+        self.requests.append(json.loads(request.content))
+        return httpx.Response(200, json=self.body)
+
+    def client(self, **kwargs: Any) -> httpx.Client:
+        return HTTPX_CLIENT(transport=httpx.MockTransport(self.handler))
+
+
+@pytest.fixture
+def pooled_stub(monkeypatch):
+    """Route pooled HTTP provider requests to a stub server."""
+
+    def install(body: dict[str, Any]) -> StubServer:
+        server = StubServer(body)
+        monkeypatch.setattr(HTTPProvider, "_sync_client", server.client())
+        return server
+
+    yield install
+    HTTPProvider.cleanup_sync()
+
+
+class TestSplitPromptPrefix:
+    """Tests for split_prompt_prefix."""
+
+    def test_splits_matching_prefix(self):
+        """Test a matching prefix is split from the remainder."""
+        assert split_prompt_prefix("DATA then ask", "DATA") == ("DATA", " then ask")
+
+    def test_ignores_non_matching_prefix(self):
+        """Test a prefix that does not start the prompt is ignored."""
+        assert split_prompt_prefix("ask then DATA", "DATA") == ("", "ask then DATA")
+        assert split_prompt_prefix("prompt", None) == ("", "prompt")
+
+
+class TestAnthropicPromptCaching:
+    """Tests for Anthropic cache_control support."""
+
+    BODY = {
+        "model": "claude-sonnet-4-5-20250929",
+        "content": [{"type": "text", "text": "ok"}],
+        "stop_reason": "end_turn",
+        "usage": {
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "cache_read_input_tokens": 2000,
+            "cache_creation_input_tokens": 0,
+        },
+    }
+
+    def test_prefix_marked_cacheable(self, pooled_stub):
+        """Test the prefix and system prompt carry cache_control."""
+        server = pooled_stub(self.BODY)
+        provider = AnthropicProvider(api_key="test")
+
+        provider.generate(
+            "DATA\nInstructions",
+            cache_prefix="DATA\n",
+            system_prompt="You are a researcher",
+        )
+
+        payload = server.requests[0]
+        content = payload["messages"][0]["content"]
+        assert content[0] == {
+            "type": "text",
+            "text": "DATA\n",
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert content[1] == {"type": "text", "text": "Instructions"}
+        assert payload["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_plain_prompt_unchanged(self, pooled_stub):
+        """Test prompts without a prefix are sent as plain text."""
+        server = pooled_stub(self.BODY)
+
+        AnthropicProvider(api_key="test").generate("Hello")
+
+        assert server.requests[0]["messages"][0]["content"] == "Hello"
+        assert "system" not in server.requests[0]
+
+    def test_cached_tokens_reported(self, pooled_stub):
+        """Test cache reads are reported and included in input tokens."""
+        pooled_stub(self.BODY)
+
+        response = AnthropicProvider(api_key="test").generate("Hello")
+
+        assert response.input_tokens == 2010
+        assert response.cache_read_tokens == 2000
+        assert response.cache_write_tokens == 0
+
+
+class TestOpenAIPromptCaching:
+    """Tests for OpenAI cached prefix support."""
+
+    BODY = {
+        "model": "gpt-4o",
+        "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": 3000,
+            "completion_tokens": 10,
+            "prompt_tokens_details": {"cached_tokens": 2048},
+        },
+    }
+
+    def test_prompt_cache_key_stable(self, pooled_stub):
+        """Test calls sharing a prefix send the same prompt_cache_key."""
+        server = pooled_stub(self.BODY)
+        provider = OpenAIProvider(api_key="test")
+
+        provider.generate("DATA one", cache_prefix="DATA")
+        provider.generate("DATA two", cache_prefix="DATA")
+        provider.generate("no prefix")
+
+        keys = [request.get("prompt_cache_key") for request in server.requests]
+        assert keys[0] is not None
+        assert keys[0] == keys[1]
+        assert keys[2] is None
+        assert server.requests[0]["messages"][0]["content"] == "DATA one"
+
+    def test_cached_tokens_reported(self, pooled_stub):
+        """Test cached prompt tokens are reported."""
+        pooled_stub(self.BODY)
+
+        response = OpenAIProvider(api_key="test").generate("Hello")
+
+        assert response.input_tokens == 3000
+        assert response.cache_read_tokens == 2048
+
+
+class TestOllamaPromptCaching:
+    """Tests for Ollama keep_alive support."""
+
+    BODY = {
+        "model": "llama3:8b",
+        "message": {"content": "ok"},
+        "done": True,
+        "prompt_eval_count": 5,
+        "eval_count": 5,
+    }
+
+    def test_keep_alive_sent_with_prefix(self, monkeypatch):
+        """Test keep_alive is only sent for cache-prefixed requests."""
+        server = StubServer(self.BODY)
+        monkeypatch.setattr("persona.core.providers.ollama.httpx.Client", server.client)
+        provider = OllamaProvider(keep_alive="1h")
+
+        provider.generate("DATA ask", model="llama3:8b", cache_prefix="DATA")
+        provider.generate("ask", model="llama3:8b")
+
+        assert server.requests[0]["keep_alive"] == "1h"
+        assert "keep_alive" not in server.requests[1]
+
+
+class TestPromptLayout:
+    """Tests for stable prompt prefixes."""
+
+    def test_generation_prefix_ends_with_data(self):
+        """Test the pipeline prefix covers everything up to the data."""
+        prompt = "Intro\nDATA\nGenerate 3 personas"
+
+        assert GenerationPipeline._cache_prefix(prompt, "DATA") == "Intro\nDATA"
+        assert GenerationPipeline._cache_prefix(prompt, "missing") == ""
+
+    def test_default_template_prefix_independent_of_count(self):
+        """Test the default workflow's prefix does not vary with count."""
+        from persona.core.prompts import WorkflowLoader
+
+        workflow = WorkflowLoader().load_builtin("default")
+        prefixes = {
+            GenerationPipeline._cache_prefix(
+                workflow.render_prompt(count=count, data="DATA"), "DATA"
+            )
+            for count in (3, 5)
+        }
+
+        assert len(prefixes) == 1
+
+    def test_draft_prompt_starts_with_prefix(self):
+        """Test draft prompts share the research data prefix."""
+        prefix = _build_draft_prefix("DATA")
+
+        assert _build_draft_prompt("DATA", 3).startswith(prefix)
+        assert _build_draft_prompt("DATA", 5).startswith(prefix)
+
+    def test_evaluation_prompts_start_with_rubric(self):
+        """Test judge prompts share the rubric prefix across personas."""
+        criteria = [EvaluationCriteria.COHERENCE, EvaluationCriteria.REALISM]
+        prefix = build_evaluation_prefix(criteria)
+        prompts = build_batch_evaluation_prompt(
+            [{"id": "p1"}, {"id": "p2"}], criteria
+        )
+
+        assert all(prompt.startswith(prefix) for prompt in prompts)
+        assert "p1" not in prefix
+
+    def test_batch_evaluation_prefix_independent_of_count(self):
+        """Test the batch rubric does not vary with the number of personas."""
+        criteria = [EvaluationCriteria.COHERENCE, EvaluationCriteria.DISTINCTIVENESS]
+        prefix = build_evaluation_prefix(criteria, batch=True)
+
+        for count in (2, 5):
+            personas = [{"id": f"p{i}"} for i in range(count)]
+            [prompt] = build_batch_evaluation_prompt(personas, criteria)
+            assert prompt.startswith(prefix)
+
+    def test_refinement_prompt_starts_with_instructions(self):
+        """Test refinement prompts put the fixed instructions first."""
+        prefix = _build_refinement_prefix()
+        prompt = _build_refinement_prompt({"id": "p1"}, {"realism": "Vague"})
+
+        assert prompt.startswith(prefix)
+        assert prompt.index('"id": "p1"') < prompt.index("Vague")
+
+    def test_judge_sends_cache_prefix(self):
+        """Test the judge marks the rubric as the cacheable prefix."""
+        provider = MagicMock()
+        provider.generate.return_value = LLMResponse(
+            content='{"coherence": {"score": 0.8, "reasoning": "ok"}}',
+            model="test",
+        )
+        judge = PersonaJudge(provider="ollama", model="test")
+        judge.provider = provider
+        criteria = [EvaluationCriteria.COHERENCE]
+
+        judge.evaluate({"id": "p1"}, criteria=criteria)
+
+        kwargs = provider.generate.call_args.kwargs
+        assert kwargs["cache_prefix"] == build_evaluation_prefix(criteria)
+        assert kwargs["prompt"].startswith(kwargs["cache_prefix"])
+
+
+class TestPromptCacheCost:
+    """Tests for prompt cache pricing."""
+
+    def test_cache_reads_discounted(self):
+        """Test cached input tokens are billed at the cache read rate."""
+        model = "claude-3-5-sonnet-20241022"
+        full = estimate_cost("anthropic", model, input_tokens=1_000_000)
+        cached = estimate_cost(
+            "anthropic", model, input_tokens=1_000_000, cache_read_tokens=1_000_000
+        )
+
+        assert full == pytest.approx(3.0)
+        assert cached == pytest.approx(0.3)
+
+    def test_tracker_reports_cache_tokens(self):
+        """Test CostTracker records prompt cache usage."""
+        tracker = CostTracker(
+            frontier_provider="anthropic",
+            frontier_model="claude-3-5-sonnet-20241022",
+        )
+        tracker.add_frontier_usage(1_000_000, 0, cache_read_tokens=1_000_000)
+
+        assert tracker.frontier_cost == pytest.approx(0.3)
+        assert tracker.to_dict()["frontier"]["cache_read_tokens"] == 1_000_000
@@ -2,11 +2,14 @@
 
 import pytest
 from persona.core.generation.parser import Persona
+from persona.core.quality.academic.geval import GevalMetric
+from persona.core.quality.academic.rouge import RougeLMetric
 from persona.core.quality.academic.validator import (
     AcademicValidator,
     validate_persona,
     validate_personas,
 )
+from persona.core.quality.models import DimensionScore
 
 
 class TestAcademicValidator:
@@ -113,6 +116,72 @@ class TestAcademicValidator:
         assert "rouge_l" in result
 
 
+class StubGevalMetric(GevalMetric):
+    """G-eval metric that answers without calling an LLM."""
+
+    def evaluate(
+        self, persona, source_data=None, other_personas=None, evidence_report=None
+    ):
+        if persona.name == "broken":
+            raise KeyError("no judgement")
+        return DimensionScore(
+            dimension=self.name,
+            score=80.0,
+            weight=0.0,
+            details={
+                "coherence": 0.8,
+                "relevance": 0.8,
+                "fluency": 0.8,
+                "consistency": 0.8,
+                "overall": 80.0,
+                "model": "stub",
+                "reasoning": "",
+            },
+        )
+
+
+class UnavailableRougeMetric(RougeLMetric):
+    """ROUGE-L metric whose library is missing."""
+
+    def evaluate(
+        self, persona, source_data=None, other_personas=None, evidence_report=None
+    ):
+        raise ImportError("rouge-score library is required")
+
+
+class TestValidateBatchEngine:
+    """Tests for batch validation on the metric engine."""
+
+    @pytest.fixture
+    def validator(self):
+        """Create a validator with stubbed metrics."""
+        validator = AcademicValidator()
+        validator.geval_metric = StubGevalMetric()
+        validator.rouge_metric = UnavailableRougeMetric()
+        return validator
+
+    def test_batch_builds_reports_from_engine(self, validator):
+        """Test engine results become per-persona reports in order."""
+        personas = [Persona(id=f"p{i}", name=f"P{i}") for i in range(3)]
+
+        batch = validator.validate_batch(
+            personas, source_data="text", metrics=["rouge_l", "geval"]
+        )
+
+        assert [r.persona_id for r in batch.reports] == ["p0", "p1", "p2"]
+        assert all(r.geval is not None for r in batch.reports)
+        assert all(r.geval.model == "stub" for r in batch.reports)
+        # Unavailable metrics are left out rather than failing the batch
+        assert all(r.rouge_l is None for r in batch.reports)
+
+    def test_batch_reraises_unexpected_errors(self, validator):
+        """Test errors other than unavailability propagate unchanged."""
+        personas = [Persona(id="p0", name="broken")]
+
+        with pytest.raises(KeyError, match="no judgement"):
+            validator.validate_batch(personas, metrics=["geval"])
+
+
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
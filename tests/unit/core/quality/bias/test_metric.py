@@ -0,0 +1,27 @@
+"""Tests for the bias quality metric."""
+
+from persona.core.generation.parser import Persona
+from persona.core.quality.bias import BiasConfig, BiasDetector, BiasMetric
+
+
+class TestBiasMetric:
+    """Tests for BiasMetric."""
+
+    def test_scores_inverse_of_bias(self):
+        """Test the score is 100 minus the scaled bias score."""
+        detector = BiasDetector(BiasConfig(methods=["lexicon"]))
+        metric = BiasMetric(detector=detector)
+        persona = Persona(id="p1", name="Alex", goals=["Ship reliable software"])
+
+        score = metric.evaluate(persona)
+        report = detector.analyse(persona)
+
+        assert score.dimension == "bias"
+        assert score.score == (1.0 - report.overall_score) * 100
+        assert len(score.issues) == len(report.findings)
+
+    def test_llm_bound_only_with_judge(self):
+        """Test the metric is LLM-bound only when the detector has a judge."""
+        detector = BiasDetector(BiasConfig(methods=["lexicon"]))
+
+        assert not BiasMetric(detector=detector).requires_llm
@@ -300,3 +300,76 @@ class TestLexicalDiversityAnalyser:
         # MATTR might differ due to different window sizes
         # TTR should be the same
         assert report1.ttr == report2.ttr
+
+    def test_analyse_batch_parallel_matches_serial(self):
+        """Test process-pool batch analysis matches in-process results."""
+        from persona.core.quality.diversity.analyser import PARALLEL_MIN_PERSONAS
+
+        personas = [
+            Persona(
+                id=f"p{i}",
+                name=f"Persona {i}",
+                goals=[
+                    f"Goal {j} about topic {i * j % 17} and more" for j in range(20)
+                ],
+            )
+            for i in range(PARALLEL_MIN_PERSONAS)
+        ]
+        analyser = LexicalDiversityAnalyser()
+
+        serial = analyser.analyse_batch(personas, max_workers=1)
+        parallel = analyser.analyse_batch(personas, max_workers=2)
+
+        assert [r.persona_id for r in parallel.reports] == [p.id for p in personas]
+        assert [r.mattr for r in parallel.reports] == [r.mattr for r in serial.reports]
+        assert parallel.average_mtld == serial.average_mtld
+
+    def test_analyse_batch_in_process_by_default(self, monkeypatch):
+        """Test the process pool is only used when max_workers opts in."""
+        from persona.core.quality.diversity import analyser as analyser_module
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started without opt-in")
+
+        monkeypatch.setattr(analyser_module, "ProcessPoolExecutor", no_pool)
+        personas = [
+            Persona(id=f"p{i}", name=f"Persona {i}", goals=["Save time"])
+            for i in range(analyser_module.PARALLEL_MIN_PERSONAS)
+        ]
+
+        report = LexicalDiversityAnalyser().analyse_batch(personas)
+
+        assert len(report.reports) == len(personas)
+
+    def test_analyse_batch_sends_tokens_to_workers(self, monkeypatch):
+        """Test workers receive tokens rather than re-tokenising text."""
+        from persona.core.quality.diversity import analyser as analyser_module
+
+        mapped: list = []
+
+        class InlineExecutor:
+            def __init__(self, max_workers: int):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, fn, items, chunksize=1):
+                items = list(items)
+                mapped.extend(items)
+                return [fn(item) for item in items]
+
+        monkeypatch.setattr(analyser_module, "ProcessPoolExecutor", InlineExecutor)
+        personas = [
+            Persona(id=f"p{i}", name=f"Persona {i}", goals=["Save time daily"])
+            for i in range(analyser_module.PARALLEL_MIN_PERSONAS)
+        ]
+
+        LexicalDiversityAnalyser().analyse_batch(personas, max_workers=2)
+
+        assert len(mapped) == len(personas)
+        assert all(isinstance(item, list) for item in mapped)
+        assert "daily" in mapped[0]
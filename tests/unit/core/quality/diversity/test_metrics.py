@@ -1,7 +1,11 @@
 """Unit tests for metrics module."""
 
+import random
+from collections import Counter
+
 import pytest
 from persona.core.quality.diversity.metrics import (
+    calculate_all,
     calculate_hapax_ratio,
     calculate_mattr,
     calculate_mtld,
@@ -187,6 +191,49 @@ class TestCalculateHapaxRatio:
         assert ratio == pytest.approx(1 / 81)
 
 
+class TestLinearMetrics:
+    """Tests for the incremental and shared-table metric paths."""
+
+    @staticmethod
+    def _naive_mattr(tokens, window_size):
+        windows = [
+            len(set(tokens[i : i + window_size])) / window_size
+            for i in range(len(tokens) - window_size + 1)
+        ]
+        return sum(windows) / len(windows)
+
+    def test_mattr_matches_naive_windows(self):
+        """Test the sliding counter matches recomputing each window."""
+        rng = random.Random(7)
+        tokens = [f"w{rng.randint(0, 40)}" for _ in range(500)]
+
+        for window_size in (1, 10, 50, 500):
+            assert calculate_mattr(tokens, window_size) == pytest.approx(
+                self._naive_mattr(tokens, window_size)
+            )
+
+    def test_calculate_all_matches_individual_metrics(self):
+        """Test calculate_all agrees with the individual functions."""
+        rng = random.Random(3)
+        tokens = [f"w{rng.randint(0, 80)}" for _ in range(300)]
+
+        metrics = calculate_all(tokens, window_size=25, threshold=0.72)
+
+        assert metrics.total_tokens == 300
+        assert metrics.unique_tokens == len(set(tokens))
+        assert metrics.frequency == Counter(tokens)
+        assert metrics.ttr == calculate_ttr(tokens)
+        assert metrics.mattr == calculate_mattr(tokens, 25)
+        assert metrics.mtld == calculate_mtld(tokens, 0.72)
+        assert metrics.hapax_ratio == calculate_hapax_ratio(tokens)
+
+    def test_mtld_accepts_tuples(self):
+        """Test MTLD works on any sequence without copying to a list."""
+        tokens = [f"w{i % 12}" for i in range(120)]
+
+        assert calculate_mtld(tuple(tokens)) == calculate_mtld(tokens)
+
+
 class TestInterpretMTLD:
     """Tests for interpret_mtld function."""
 
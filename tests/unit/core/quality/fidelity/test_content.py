@@ -6,7 +6,7 @@ Tests ContentChecker for content requirement validation.
 
 
 from persona.core.generation.parser import Persona
-from persona.core.quality.fidelity.content import ContentChecker
+from persona.core.quality.fidelity.content import ContentChecker, KeywordMatcher
 from persona.core.quality.fidelity.models import PromptConstraints
 
 
@@ -172,3 +172,21 @@ class TestContentChecker:
 
         assert score == 1.0
         assert len(violations) == 0
+
+
+class TestKeywordMatcher:
+    """Test KeywordMatcher."""
+
+    def test_matches_substring_semantics(self):
+        """Test results equal a per-keyword case-insensitive substring check."""
+        keywords = ["Data", "data scientist", "scien", "ML", "", "engineer", "a"]
+        texts = ["Senior DATA Scientist", "ml engineer", "", "nothing here"]
+        matcher = KeywordMatcher(keywords)
+
+        for text in texts:
+            expected = [k for k in keywords if k.lower() not in text.lower()]
+            assert matcher.missing(text) == expected
+
+    def test_empty_keyword_list(self):
+        """Test an empty list never reports missing keywords."""
+        assert KeywordMatcher([]).missing("anything") == []
@@ -0,0 +1,39 @@
+"""
+Tests for the fidelity quality metric.
+"""
+
+from persona.core.generation.parser import Persona
+from persona.core.quality.fidelity import (
+    FidelityConfig,
+    FidelityMetric,
+    FidelityScorer,
+    PromptConstraints,
+)
+
+
+class TestFidelityMetric:
+    """Test FidelityMetric."""
+
+    def test_matches_fidelity_report(self):
+        """Test the score and issues come from the fidelity report."""
+        persona = Persona(id="p1", name="Test User", goals=["One goal"])
+        constraints = PromptConstraints(
+            required_fields=["name", "goals"], goal_count=(3, 5)
+        )
+        config = FidelityConfig(use_llm_judge=False)
+
+        score = FidelityMetric(constraints, fidelity_config=config).evaluate(persona)
+        report = FidelityScorer(config).score(persona, constraints)
+
+        assert score.dimension == "fidelity"
+        assert score.score == report.overall_score * 100
+        assert len(score.issues) == report.violation_count > 0
+
+    def test_llm_bound_with_llm_judge(self):
+        """Test the metric is LLM-bound when style uses the LLM judge."""
+        constraints = PromptConstraints()
+
+        assert FidelityMetric(constraints).requires_llm
+        assert not FidelityMetric(
+            constraints, fidelity_config=FidelityConfig(use_llm_judge=False)
+        ).requires_llm
@@ -199,3 +199,37 @@ class TestFidelityScorer:
         assert "content" in report.details
         assert "constraint" in report.details
         assert "style" in report.details
+
+    def test_score_batch_matches_score(self):
+        """Test batch scoring (serial and pooled) matches scoring one by one."""
+        personas = [
+            Persona(
+                id=f"p{i}",
+                name=f"User {i}",
+                demographics={
+                    "age": f"{20 + i % 30} years",
+                    "occupation": "Data Analyst",
+                },
+                goals=[f"Goal {j}" for j in range(i % 5)],
+            )
+            for i in range(70)
+        ]
+        constraints = PromptConstraints(
+            required_fields=["name", "goals", "demographics.age"],
+            field_types={"name": "string", "goals": "list"},
+            age_range=(25, 45),
+            goal_count=(2, 4),
+            occupation_keywords=["data", "analyst", "engineer"],
+        )
+        scorer = FidelityScorer(FidelityConfig(use_llm_judge=False))
+
+        def strip(report):
+            data = report.to_dict()
+            del data["generated_at"]
+            return data
+
+        expected = [strip(scorer.score(p, constraints)) for p in personas]
+
+        assert [strip(r) for r in scorer.score_batch(personas, constraints)] == expected
+        pooled = scorer.score_batch(personas, constraints, max_workers=2)
+        assert [strip(r) for r in pooled] == expected
@@ -0,0 +1,124 @@
+"""Tests for the shared quality analysis context."""
+
+import pytest
+from persona.core.generation.parser import Persona
+from persona.core.quality import (
+    AnalysisContext,
+    MetricRegistry,
+    QualityScorer,
+    analysis_context,
+    get_analysis_context,
+    persona_text,
+)
+from persona.core.quality import context as context_module
+from persona.core.quality.academic.rouge import RougeLMetric
+from persona.core.quality.bias.lexicon import LexiconMatcher
+from persona.core.quality.context import PersonaText
+from persona.core.quality.diversity.tokeniser import extract_persona_text, tokenise
+
+
+@pytest.fixture
+def persona() -> Persona:
+    """Create a test persona."""
+    return Persona(
+        id="p001",
+        name="Sarah Mitchell",
+        demographics={"age": 32, "occupation": "Product Manager"},
+        goals=["  Planning Sprints  ", "Reduce meetings"],
+        pain_points=["Scattered tools"],
+        behaviours=["Checks Slack daily"],
+        quotes=["I'm always switching apps."],
+        additional={"skills": ["Roadmaps", "Analytics"]},
+    )
+
+
+class TestPersonaText:
+    """Tests for PersonaText extraction."""
+
+    def test_matches_existing_extractors(self, persona):
+        """Test cached forms match the analysers' own extraction."""
+        text = PersonaText.from_persona(persona)
+
+        assert text.text == extract_persona_text(persona)
+        assert text.tokens == tuple(tokenise(text.text))
+        assert text.document.startswith("Sarah Mitchell age: 32")
+        assert text.fields["demographics.age"] == "32"
+        assert text.fields["goals[1]"] == "Reduce meetings"
+        assert text.segments == (
+            "Checks Slack daily",
+            "  Planning Sprints  ",
+            "Reduce meetings",
+            "Scattered tools",
+        )
+        assert text.lower_items["goals"] == ("planning sprints", "reduce meetings")
+
+    def test_extracts_lazily_without_hashing(self, persona, monkeypatch):
+        """Test text outside a context skips the hash and unread forms."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("extracted eagerly")
+
+        monkeypatch.setattr(context_module, "content_hash", fail)
+        monkeypatch.setattr(context_module, "persona_document", fail)
+
+        text = persona_text(persona)
+
+        assert text.tokens == tuple(tokenise(extract_persona_text(persona)))
+        assert text.fields["goals[1]"] == "Reduce meetings"
+
+
+class TestAnalysisContext:
+    """Tests for AnalysisContext caching."""
+
+    def test_extracts_once_per_content(self, persona):
+        """Test repeated and duplicate personas share one entry."""
+        context = AnalysisContext()
+        duplicate = Persona.from_dict(persona.to_dict())
+
+        first = context.get(persona)
+        assert context.get(persona) is first
+        assert context.get(duplicate) is first
+        assert len(context) == 1
+        assert context.misses == 1
+        assert context.hits == 2
+
+    def test_inactive_outside_block(self, persona):
+        """Test persona_text only caches inside an active context."""
+        assert get_analysis_context() is None
+        assert persona_text(persona) is not persona_text(persona)
+
+        with analysis_context() as context:
+            assert get_analysis_context() is context
+            assert persona_text(persona) is persona_text(persona)
+
+        assert get_analysis_context() is None
+
+    def test_nested_blocks_share_context(self):
+        """Test nested analysis_context blocks reuse the outer context."""
+        with analysis_context() as outer, analysis_context() as inner:
+            assert inner is outer
+
+    def test_metrics_share_extraction(self, persona):
+        """Test different analysers read the same cached entry."""
+        with MetricRegistry(register_builtins=False).analysis_context() as context:
+            RougeLMetric()._persona_to_text(persona)
+            LexiconMatcher()._extract_persona_text(persona)
+
+        assert context.misses == 1
+        assert context.hits == 1
+
+    def test_score_batch_extracts_each_persona_once(self, persona, monkeypatch):
+        """Test batch scoring extracts each persona's text once."""
+        other = Persona(id="p002", name="Tom Baker", goals=["Ship faster"])
+        calls: list[str] = []
+        original = PersonaText.from_persona.__func__
+
+        def counting(cls, p, digest=None):
+            calls.append(p.id)
+            return original(cls, p, digest)
+
+        monkeypatch.setattr(PersonaText, "from_persona", classmethod(counting))
+
+        QualityScorer().score_batch([persona, other])
+
+        assert sorted(calls) == ["p001", "p002"]
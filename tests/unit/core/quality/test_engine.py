@@ -0,0 +1,221 @@
+"""Tests for the concurrent quality metric engine."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persona.core.generation.parser import Persona
+from persona.core.quality import (
+    MetricEngine,
+    MetricRegistry,
+    QualityMetric,
+    QualityScorer,
+)
+from persona.core.quality.models import DimensionScore
+
+if TYPE_CHECKING:
+    from persona.core.evidence.linker import EvidenceReport
+
+
+class SlowLLMMetric(QualityMetric):
+    """LLM-bound metric that waits without blocking the event loop."""
+
+    delay = 0.2
+
+    @property
+    def name(self) -> str:
+        return "slow_llm"
+
+    @property
+    def requires_source_data(self) -> bool:
+        return False
+
+    @property
+    def requires_other_personas(self) -> bool:
+        return False
+
+    @property
+    def requires_evidence_report(self) -> bool:
+        return False
+
+    @property
+    def requires_llm(self) -> bool:
+        return True
+
+    def evaluate(
+        self, persona, source_data=None, other_personas=None, evidence_report=None
+    ):
+        raise AssertionError("evaluate_async should be used")
+
+    async def evaluate_async(
+        self,
+        persona: Persona,
+        source_data: str | None = None,
+        other_personas: list[Persona] | None = None,
+        evidence_report: "EvidenceReport | None" = None,
+    ) -> DimensionScore:
+        await asyncio.sleep(self.delay)
+        return DimensionScore(dimension=self.name, score=50.0, weight=0.0)
+
+
+class SourceMetric(QualityMetric):
+    """CPU-bound metric requiring source data."""
+
+    @property
+    def name(self) -> str:
+        return "source"
+
+    @property
+    def requires_source_data(self) -> bool:
+        return True
+
+    @property
+    def requires_other_personas(self) -> bool:
+        return False
+
+    @property
+    def requires_evidence_report(self) -> bool:
+        return False
+
+    def evaluate(
+        self, persona, source_data=None, other_personas=None, evidence_report=None
+    ):
+        if persona.name == "broken":
+            raise ValueError("cannot score")
+        return DimensionScore(dimension=self.name, score=len(source_data), weight=0.0)
+
+
+@pytest.fixture
+def personas() -> list[Persona]:
+    """Create test personas."""
+    return [
+        Persona(id=f"p{i:03d}", name=f"Person {i}", goals=[f"Goal {i}"])
+        for i in range(3)
+    ]
+
+
+class TestMetricEngine:
+    """Tests for MetricEngine."""
+
+    def test_plan_groups_and_skips(self, personas):
+        """Test metrics are grouped by kind and skipped without inputs."""
+        registry = MetricRegistry()
+        registry.register("slow_llm", SlowLLMMetric, "Slow LLM metric")
+        registry.register(
+            "source", SourceMetric, "Source metric", requires_source_data=True
+        )
+        engine = registry.get_engine()
+
+        plan = engine.plan(personas)
+
+        assert "slow_llm" in plan.llm
+        assert "completeness" in plan.cpu
+        assert plan.dependencies["source"] == {"source_data"}
+        assert "source" in plan.skipped
+        assert "evidence_strength" in plan.skipped
+        assert "source" in engine.plan(personas, source_data="text").cpu
+
+    def test_llm_metrics_run_concurrently(self, personas):
+        """Test LLM-bound evaluations overlap rather than queue."""
+        engine = MetricEngine({"slow_llm": SlowLLMMetric()}, max_llm_concurrency=8)
+
+        started = time.perf_counter()
+        results = engine.run(personas)
+        elapsed = time.perf_counter() - started
+
+        assert [r.score.score for r in results] == [50.0, 50.0, 50.0]
+        assert elapsed < SlowLLMMetric.delay * len(personas)
+
+    def test_stream_yields_results_as_completed(self, personas):
+        """Test fast CPU results stream before slow LLM results."""
+        engine = MetricEngine({"slow_llm": SlowLLMMetric(), "source": SourceMetric()})
+
+        async def collect() -> list[str]:
+            return [r.metric async for r in engine.stream(personas, source_data="abc")]
+
+        order = asyncio.run(collect())
+
+        assert order[:3] == ["source"] * 3
+        assert order[3:] == ["slow_llm"] * 3
+
+    def test_run_orders_results_and_captures_errors(self, personas):
+        """Test results are ordered by persona and failures are reported."""
+        personas[1].name = "broken"
+        engine = MetricEngine({"source": SourceMetric()})
+        seen = []
+
+        results = engine.run(personas, source_data="abcd", on_result=seen.append)
+
+        assert [r.persona_id for r in results] == ["p000", "p001", "p002"]
+        assert results[0].score.score == 4
+        assert results[1].score is None
+        assert results[1].error == "ValueError: cannot score"
+        assert isinstance(results[1].exception, ValueError)
+        assert len(seen) == 3
+
+    def test_run_inside_event_loop(self, personas):
+        """Test run() works when called from async code."""
+        engine = MetricEngine({"source": SourceMetric()})
+
+        async def main():
+            return engine.run(personas, source_data="ab")
+
+        assert all(r.ok for r in asyncio.run(main()))
+
+    def test_in_process_by_default(self, personas):
+        """Test large runs stay in-process unless workers are requested."""
+        jobs = [("source", i) for i in range(1000)]
+
+        default = MetricEngine({"source": SourceMetric()})
+        executor = default._cpu_executor(None, ["source"], len(jobs))
+        executor.shutdown()
+
+        assert isinstance(executor, ThreadPoolExecutor)
+
+    def test_process_pool_matches_in_process(self, monkeypatch):
+        """Test pooled evaluation gives the same scores."""
+        monkeypatch.setattr("persona.core.quality.engine.PARALLEL_MIN_EVALUATIONS", 1)
+        personas = [
+            Persona(id=f"p{i:03d}", name=f"Person {i}", goals=[f"Goal {i % 5}"])
+            for i in range(16)
+        ]
+        metrics = MetricRegistry().get_builtin_metrics()
+
+        def strip(results):
+            return [(r.metric, r.persona_id, r.score.score) for r in results]
+
+        serial = MetricEngine(metrics, max_workers=1, skip_unsatisfied=False)
+        pooled = MetricEngine(metrics, max_workers=2, skip_unsatisfied=False)
+
+        assert strip(pooled.run(personas)) == strip(serial.run(personas))
+
+
+class TestScoreBatchEngine:
+    """Tests for QualityScorer.score_batch on the engine."""
+
+    def test_batch_matches_individual_scores(self, personas):
+        """Test batch scores equal per-persona scoring."""
+        scorer = QualityScorer()
+
+        batch = scorer.score_batch(personas)
+
+        for persona, score in zip(personas, batch.scores, strict=True):
+            others = [p for p in personas if p.id != persona.id]
+            expected = scorer.score(persona, other_personas=others)
+            assert score.overall_score == pytest.approx(expected.overall_score)
+            assert list(score.dimensions) == list(expected.dimensions)
+
+    def test_batch_reraises_metric_exception(self, personas, monkeypatch):
+        """Test a failing dimension raises its own exception."""
+        scorer = QualityScorer()
+
+        def fail(*args, **kwargs):
+            raise KeyError("missing field")
+
+        monkeypatch.setattr(scorer._metrics["realism"], "evaluate", fail)
+
+        with pytest.raises(KeyError, match="missing field"):
+            scorer.score_batch(personas)
@@ -309,3 +309,76 @@ class TestConsistencyChecker:
             + metrics.factual_convergence * 0.2
         )
         assert abs(metrics.confidence_score - expected) < 0.001
+
+    def test_profile_precomputes_value_keys(self):
+        """Test profiles hash non-empty attribute values once."""
+        checker = ConsistencyChecker(
+            embedding_provider=MockEmbeddingProvider(configured=False)
+        )
+
+        profile = checker.profile(Persona(id="p1", name="Alice", goals=["Ship"]))
+
+        assert set(profile.value_keys) == {"id", "name", "goals"}
+        assert "ship" in profile.claims
+        assert checker.profile(profile) is profile
+
+
+class TestAlignPersonas:
+    """Tests for ConsistencyChecker.align_personas."""
+
+    def test_aligns_reordered_outputs(self):
+        """Test personas are matched by content, not position."""
+        checker = ConsistencyChecker(
+            embedding_provider=MockEmbeddingProvider(configured=False)
+        )
+        model_a = [
+            Persona(id="a1", name="Alice", goals=["Automate reporting"]),
+            Persona(id="a2", name="Bob", goals=["Reduce travel costs"]),
+        ]
+        model_b = [
+            Persona(id="b1", name="Robert", goals=["Reduce travel costs"]),
+            Persona(id="b2", name="Alice", goals=["Automate reporting"]),
+        ]
+
+        groups = checker.align_personas([model_a, model_b])
+
+        assert [g[0].persona.id for g in groups] == ["a1", "a2"]
+        assert [g[1].persona.id for g in groups] == ["b2", "b1"]
+
+    def test_uneven_outputs_use_largest_as_anchor(self):
+        """Test groups follow the largest output and keep every persona."""
+        checker = ConsistencyChecker(
+            embedding_provider=MockEmbeddingProvider(configured=False)
+        )
+        model_a = [Persona(id="a1", name="Alice")]
+        model_b = [
+            Persona(id="b1", name="Bob"),
+            Persona(id="b2", name="Alice"),
+            Persona(id="b3", name="Carol"),
+        ]
+
+        groups = checker.align_personas([model_a, model_b])
+
+        assert len(groups) == 3
+        assert groups[1][0].persona.id == "a1"
+        assert 0 not in groups[0] and 0 not in groups[2]
+
+    def test_unrelated_personas_fall_back_to_position(self):
+        """Test personas sharing no words are still paired."""
+        checker = ConsistencyChecker(
+            embedding_provider=MockEmbeddingProvider(configured=False)
+        )
+
+        groups = checker.align_personas(
+            [[Persona(id="a1", name="Alice")], [Persona(id="b1", name="Zed")]]
+        )
+
+        assert groups[0][1].persona.id == "b1"
+
+    def test_empty(self):
+        """Test empty outputs produce no groups."""
+        checker = ConsistencyChecker(
+            embedding_provider=MockEmbeddingProvider(configured=False)
+        )
+
+        assert checker.align_personas([[], []]) == []
@@ -1,12 +1,12 @@
 """Tests for verification data models."""
 
-
 import pytest
 from persona.core.quality.verification.models import (
     AttributeAgreement,
     ConsistencyMetrics,
     VerificationConfig,
     VerificationReport,
+    attribute_value_key,
 )
 
 
@@ -178,6 +178,21 @@ class TestAttributeAgreement:
         assert data["agreement_score"] == 0.75
         assert data["is_agreed"] is True
 
+    def test_value_keys_computed(self):
+        """Test values are pre-hashed independent of dict ordering."""
+        agreement = AttributeAgreement(
+            attribute="demographics",
+            present_count=2,
+            total_count=2,
+            values=[{"age": 30, "role": "Dev"}, {"role": "Dev", "age": 30}],
+        )
+
+        assert len(agreement.value_keys) == 2
+        assert agreement.value_keys[0] == agreement.value_keys[1]
+        assert agreement.value_keys[0] == attribute_value_key(
+            {"role": "Dev", "age": 30}
+        )
+
 
 class TestVerificationReport:
     """Tests for VerificationReport."""
@@ -7,6 +7,8 @@ from persona.core.quality.verification import (
     verify_multi_model,
     verify_self_consistency,
 )
+from persona.core.embedding.base import EmbeddingResponse
+from persona.core.quality.verification.consistency import ConsistencyChecker
 
 # Test model names with proper provider prefixes
 MODEL1 = "anthropic:claude-sonnet-4"
@@ -14,6 +16,21 @@ MODEL2 = "openai:gpt-4o"
 MODEL3 = "gemini:gemini-2.0-flash"
 
 
+class StubEmbeddingProvider:
+    """Embedding provider returning a fixed vector."""
+
+    def __init__(self, configured: bool = True):
+        self._configured = configured
+
+    def is_configured(self) -> bool:
+        return self._configured
+
+    def embed(self, text: str) -> EmbeddingResponse:
+        return EmbeddingResponse(
+            vector=[1.0, 0.5, 0.25], model="stub", input_tokens=1, dimensions=3
+        )
+
+
 @pytest.mark.asyncio
 class TestMultiModelVerifier:
     """Tests for MultiModelVerifier."""
@@ -118,7 +135,66 @@ class TestMultiModelVerifier:
         )
 
         assert isinstance(reports, list)
-        assert len(reports) > 0
+        assert len(reports) == 3
+
+    async def test_verify_batch_one_report_per_persona(self):
+        """Test batch reports cover each aligned persona across models."""
+        config = VerificationConfig(models=[MODEL1, MODEL2])
+
+        verifier = MultiModelVerifier(config)
+        reports = await verifier.verify_batch(data="Test data", count=2)
+
+        assert [r.persona_id for r in reports] == [
+            "persona-1-claude-sonnet-4",
+            "persona-2-claude-sonnet-4",
+        ]
+        for i, report in enumerate(reports, 1):
+            assert set(report.model_outputs) == {MODEL1, MODEL2}
+            assert report.model_outputs[MODEL2][0]["name"] == f"Test Persona {i}"
+            assert report.consensus_persona["name"] == f"Test Persona {i}"
+            assert "name" in report.agreed_attributes
+
+    async def test_verify_batch_model_outputs_match_verify(self):
+        """Test batch and single reports share the model_outputs shape."""
+        config = VerificationConfig(models=[MODEL1, MODEL2])
+        verifier = MultiModelVerifier(config)
+
+        single = await verifier.verify(data="Test data", count=1)
+        batch = await verifier.verify_batch(data="Test data", count=1)
+
+        for report in (single, batch[0]):
+            assert all(
+                isinstance(output, list) and isinstance(output[0], dict)
+                for output in report.model_outputs.values()
+            )
+        assert batch[0].get_agreement_details()["name"].present_count == 2
+
+    async def test_verify_batch_process_pool(self):
+        """Test opting into worker processes gives the same reports."""
+        config = VerificationConfig(models=[MODEL1, MODEL2])
+        checker = ConsistencyChecker(
+            embedding_provider=StubEmbeddingProvider(configured=False)
+        )
+        verifier = MultiModelVerifier(config, checker=checker)
+
+        serial = await verifier.verify_batch(data="Test data", count=3)
+        pooled = await verifier.verify_batch(data="Test data", count=3, max_workers=2)
+
+        assert [r.persona_id for r in pooled] == [r.persona_id for r in serial]
+        assert [r.consistency_score for r in pooled] == [
+            r.consistency_score for r in serial
+        ]
+
+    async def test_verify_batch_with_embeddings(self):
+        """Test groups needing embedding calls are verified on threads."""
+        config = VerificationConfig(models=[MODEL1, MODEL2])
+        checker = ConsistencyChecker(embedding_provider=StubEmbeddingProvider())
+        verifier = MultiModelVerifier(config, checker=checker)
+
+        reports = await verifier.verify_batch(data="Test data", count=3)
+
+        assert len(reports) == 3
+        assert all(r.metrics.semantic_consistency > 0 for r in reports)
 
     async def test_passed_status(self):
         """Test verification pass/fail status."""
@@ -99,6 +99,23 @@ class TestMajorityVotingStrategy:
 
         assert result == {"age": 30}
 
+    def test_select_majority_value_nested(self):
+        """Test nested values are voted on without lossy conversion."""
+        strategy = MajorityVotingStrategy()
+
+        values = [[{"a": 1}], [{"a": 1}], [{"a": 2}]]
+        result = strategy._select_majority_value(values)
+
+        assert result == [{"a": 1}]
+
+    def test_select_majority_value_uses_keys(self):
+        """Test pre-computed value keys drive the vote."""
+        strategy = MajorityVotingStrategy()
+
+        result = strategy._select_majority_value(["x", "y", "z"], ["k1", "k2", "k2"])
+
+        assert result == "y"
+
 
 class TestUnanimousVotingStrategy:
     """Tests for UnanimousVotingStrategy."""
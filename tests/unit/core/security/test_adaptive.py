@@ -0,0 +1,304 @@
+"""Tests for adaptive concurrency and rate control."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from persona.core.providers.http_base import HTTPProvider
+from persona.core.security.adaptive import (
+    AdaptiveConfig,
+    AdaptiveLimiter,
+    AdaptiveRateController,
+    LimiterKey,
+    get_rate_controller,
+    key_fingerprint,
+    parse_duration,
+    parse_rate_limit_headers,
+    set_rate_controller,
+)
+from persona.core.security.rate_limiter import RateLimitConfig, RateLimitExceeded
+
+
+def make_limiter(initial: int = 4, **kwargs) -> AdaptiveLimiter:
+    """Create a limiter for tests."""
+    return AdaptiveLimiter(
+        LimiterKey("test", "model", ""),
+        AdaptiveConfig(initial_limit=initial, **kwargs),
+        RateLimitConfig(),
+    )
+
+
+def fill(limiter: AdaptiveLimiter) -> None:
+    """Take every free slot."""
+    while limiter.try_acquire():
+        pass
+
+
+class TestParsing:
+    """Tests for header and duration parsing."""
+
+    def test_parse_duration(self):
+        """Parses seconds, Go durations and timestamps."""
+        now = datetime(2025, 1, 1, tzinfo=UTC)
+        later = (now + timedelta(seconds=30)).isoformat().replace("+00:00", "Z")
+
+        assert parse_duration("12") == 12.0
+        assert parse_duration("6m0s") == 360.0
+        assert parse_duration("1m30.5s") == 90.5
+        assert parse_duration("20ms") == pytest.approx(0.02)
+        assert parse_duration(later, now=now) == 30.0
+        assert parse_duration("soon") is None
+
+    def test_openai_headers(self):
+        """Reads OpenAI x-ratelimit headers."""
+        info = parse_rate_limit_headers(
+            httpx.Headers(
+                {
+                    "X-RateLimit-Limit-Requests": "100",
+                    "X-RateLimit-Remaining-Requests": "5",
+                    "X-RateLimit-Reset-Requests": "1s",
+                    "X-RateLimit-Limit-Tokens": "10000",
+                    "X-RateLimit-Remaining-Tokens": "0",
+                    "X-RateLimit-Reset-Tokens": "6m0s",
+                }
+            )
+        )
+
+        assert info.remaining_requests == 5
+        assert info.headroom == 0.0
+        assert info.pause == 360.0
+
+    def test_anthropic_headers(self):
+        """Reads Anthropic anthropic-ratelimit headers and Retry-After."""
+        info = parse_rate_limit_headers(
+            {
+                "anthropic-ratelimit-requests-limit": "50",
+                "anthropic-ratelimit-requests-remaining": "25",
+                "anthropic-ratelimit-input-tokens-limit": "1000",
+                "anthropic-ratelimit-input-tokens-remaining": "800",
+                "retry-after": "3",
+            }
+        )
+
+        assert info.limit_requests == 50
+        assert info.remaining_tokens == 800
+        assert info.headroom == 0.5
+        assert info.pause == 3.0
+
+    def test_missing_headers(self):
+        """Non-mappings and absent headers report nothing."""
+        assert parse_rate_limit_headers(None).to_dict() == {}
+        assert parse_rate_limit_headers({"content-type": "json"}).headroom is None
+
+
+class TestAdaptiveLimiter:
+    """Tests for AIMD limit adjustment."""
+
+    def test_additive_increase_when_saturated(self):
+        """Healthy saturated traffic grows the limit by about one per round trip."""
+        limiter = make_limiter(initial=4)
+
+        for _ in range(5):
+            fill(limiter)
+            limiter.complete(0.1, status=200)
+
+        assert limiter.limit == 5
+
+    def test_no_increase_when_unsaturated(self):
+        """The limit only grows when it is actually being used."""
+        limiter = make_limiter(initial=4)
+
+        for _ in range(20):
+            limiter.try_acquire()
+            limiter.complete(0.1, status=200)
+
+        assert limiter.limit == 4
+
+    def test_multiplicative_decrease_on_429(self):
+        """A 429 halves the limit and Retry-After holds new requests."""
+        limiter = make_limiter(initial=8)
+        limiter.try_acquire()
+
+        limiter.complete(0.1, status=429, headers={"retry-after": "30"})
+
+        assert limiter.limit == 4
+        assert limiter.rate_limited == 1
+        assert not limiter.try_acquire()
+
+    def test_one_decrease_per_round_trip(self):
+        """A burst of 429s from one window cuts the limit once."""
+        limiter = make_limiter(initial=8)
+        limiter.latency = 10.0
+        fill(limiter)
+
+        for _ in range(8):
+            limiter.complete(0.1, status=429)
+
+        assert limiter.limit == 4
+
+    def test_low_headroom_decreases_before_429(self):
+        """Nearly exhausted budgets reduce the limit proactively."""
+        limiter = make_limiter(initial=8)
+        limiter.try_acquire()
+
+        limiter.complete(
+            0.1,
+            status=200,
+            headers={
+                "x-ratelimit-limit-tokens": "10000",
+                "x-ratelimit-remaining-tokens": "500",
+            },
+        )
+
+        assert limiter.limit == 4
+
+    def test_remaining_requests_caps_limit(self):
+        """The limit never exceeds the requests left in the window."""
+        limiter = make_limiter(initial=8)
+        limiter.try_acquire()
+
+        limiter.complete(
+            0.1, status=200, headers={"x-ratelimit-remaining-requests": "2"}
+        )
+
+        assert limiter.limit == 2
+
+    def test_error_rate_decrease(self):
+        """Repeated failures reduce the limit."""
+        limiter = make_limiter(initial=8, error_threshold=0.3)
+
+        for _ in range(3):
+            limiter.try_acquire()
+            limiter.complete(1.0, error=True)
+
+        assert limiter.limit < 8
+        assert limiter.errors == 3
+
+    def test_latency_climb_decreases(self):
+        """Latency well above its usual level reduces the limit."""
+        limiter = make_limiter(initial=8)
+        for _ in range(10):
+            limiter.try_acquire()
+            limiter.complete(1.0, status=200)
+
+        for _ in range(10):
+            limiter.try_acquire()
+            limiter.complete(10.0, status=200)
+
+        assert limiter.limit < 8
+
+    def test_acquire_timeout(self):
+        """Raises RateLimitExceeded when no slot frees up in time."""
+        limiter = make_limiter(initial=1)
+        limiter.acquire()
+
+        with pytest.raises(RateLimitExceeded):
+            limiter.acquire(timeout=0.01)
+
+    def test_async_waiters_bounded_and_woken(self):
+        """Async callers never exceed the limit and resume on release."""
+        limiter = make_limiter(initial=2)
+        active = peak = 0
+
+        async def request():
+            nonlocal active, peak
+            await limiter.acquire_async()
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            limiter.complete(0.01, status=200)
+
+        async def main():
+            await asyncio.wait_for(
+                asyncio.gather(*(request() for _ in range(8))), timeout=5
+            )
+
+        asyncio.run(main())
+
+        assert peak <= 3
+        assert limiter.in_flight == 0
+        assert limiter.requests == 8
+
+
+class TestAdaptiveRateController:
+    """Tests for the controller and provider integration."""
+
+    def test_limiters_keyed_by_provider_model_and_key(self):
+        """Each provider, model and key gets its own limiter."""
+        controller = AdaptiveRateController()
+
+        first = controller.limiter("openai", "gpt-4o", "sk-secret-one")
+        assert controller.limiter("openai", "gpt-4o", "sk-secret-one") is first
+        assert controller.limiter("openai", "gpt-4o", "sk-secret-two") is not first
+        assert controller.limiter("openai", "gpt-4o-mini", "sk-secret-one") is not first
+        assert first.limit == 10
+        assert "sk-secret" not in str(controller.get_status())
+
+    def test_slot_records_errors(self):
+        """Exceptions without a response count as errors."""
+        controller = AdaptiveRateController()
+
+        with pytest.raises(httpx.ConnectError):
+            with controller.slot("test", "model"):
+                raise httpx.ConnectError("refused")
+
+        status = controller.get_status()[0]
+        assert status["errors"] == 1
+        assert status["in_flight"] == 0
+
+    def test_disabled_controller(self):
+        """Disabled controllers neither wait nor record."""
+        controller = AdaptiveRateController(enabled=False)
+
+        with controller.slot("test") as slot:
+            assert slot is None
+        assert controller.get_status() == []
+
+    def test_http_provider_reports_headers(self):
+        """Provider requests feed status and headers to the controller."""
+
+        class Provider(HTTPProvider):
+            name = "openai"
+            api_key = "sk-test"
+
+        def handler(request):
+            return httpx.Response(
+                429, headers={"retry-after": "0.01"}, json={"error": "slow down"}
+            )
+
+        controller = AdaptiveRateController(AdaptiveConfig(initial_limit=8))
+        previous = set_rate_controller(controller)
+        HTTPProvider._sync_client = httpx.Client(transport=httpx.MockTransport(handler))
+        try:
+            response = Provider()._post("https://example.test", model="gpt-4o", json={})
+        finally:
+            HTTPProvider.cleanup_sync()
+            set_rate_controller(previous)
+
+        assert response.status_code == 429
+        status = controller.get_status()[0]
+        assert status["model"] == "gpt-4o"
+        assert status["key"] == key_fingerprint("sk-test")
+        assert status["rate_limited"] == 1
+        assert status["limit"] == 4
+        assert 'provider="openai"' in controller.to_prometheus()
+
+    @pytest.mark.parametrize("name", ["anthropic", "openai", "gemini"])
+    def test_providers_expose_api_key(self, name):
+        """Keyed providers report their key for per-account limiting."""
+        from persona.core.providers import ProviderFactory
+
+        assert ProviderFactory.create(name, api_key="sk-test").api_key == "sk-test"
+
+    def test_set_rate_controller(self):
+        """Replacing the controller returns the previous one."""
+        original = get_rate_controller()
+        previous = set_rate_controller(None)
+        try:
+            assert previous is original
+            assert not get_rate_controller().enabled
+        finally:
+            set_rate_controller(original)
@@ -156,6 +156,18 @@ class TestRateLimiter:
         with pytest.raises(RateLimitExceeded):
             await limiter.acquire("slow", timeout=0.01)
 
+    def test_record_response_headers(self):
+        """Aligns the bucket and backoff with provider headers."""
+        limiter = RateLimiter()
+        limiter.record_response_headers(
+            "openai",
+            {"x-ratelimit-remaining-requests": "3", "retry-after": "2"},
+        )
+
+        state = limiter._get_state("openai")
+        assert state.tokens <= 3
+        assert state.backoff_delay == 2.0
+
 
 class TestSyncRateLimiter:
     """Tests for synchronous RateLimiter."""
@@ -241,3 +241,68 @@ def test_analyse_empty_data():
 
     with pytest.raises(ValueError, match="No data to analyse"):
         analyser.analyse_data([], format_type="csv")
+
+
+def test_numeric_quantiles_and_histogram(temp_csv):
+    """Test numeric columns report quantiles and a histogram."""
+    analyser = DataAnalyser()
+    schema = analyser.analyse_file(temp_csv)
+
+    age_col = schema.get_column("age")
+    assert age_col.numeric_stats["p50"] == 30.0
+    assert age_col.numeric_stats["p05"] <= age_col.numeric_stats["p95"]
+    assert sum(age_col.histogram_counts) == 5
+    assert len(age_col.histogram_edges) == len(age_col.histogram_counts) + 1
+    assert age_col.histogram_edges[0] == 25.0
+    assert age_col.histogram_edges[-1] == 35.0
+
+
+def test_high_cardinality_column_is_text():
+    """Test columns with many distinct values have no distribution."""
+    analyser = DataAnalyser()
+    data = [{"comment": f"note {i % 60}", "team": "a"} for i in range(200)]
+
+    schema = analyser.analyse_data(data)
+
+    comment_col = schema.get_column("comment")
+    assert comment_col.column_type == ColumnType.TEXT
+    assert comment_col.unique_count == 60
+    assert comment_col.categorical_distribution is None
+
+
+def test_null_count():
+    """Test missing values are counted as nulls."""
+    analyser = DataAnalyser()
+    data = [{"score": "1"}, {"score": ""}, {"score": None}, {"other": "x"}]
+
+    schema = analyser.analyse_data(data)
+
+    assert schema.get_column("score").null_count == 3
+    assert schema.get_column("other").null_count == 3
+
+
+def test_sample_size_limits_rows(tmp_path):
+    """Test large inputs are analysed from a reproducible sample."""
+    csv_file = tmp_path / "large.csv"
+    with open(csv_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "score"])
+        for i in range(1000):
+            writer.writerow([i, i % 10])
+
+    first = DataAnalyser(sample_size=100, seed=7).analyse_file(csv_file)
+    second = DataAnalyser(sample_size=100, seed=7).analyse_file(csv_file)
+
+    assert first.row_count == 100
+    assert first.source_row_count == 1000
+    assert first.get_column("score").numeric_stats == (
+        second.get_column("score").numeric_stats
+    )
+
+
+def test_sample_size_larger_than_input(temp_csv):
+    """Test sampling is a no-op for small inputs."""
+    schema = DataAnalyser(sample_size=100).analyse_file(temp_csv)
+
+    assert schema.row_count == 5
+    assert schema.source_row_count is None
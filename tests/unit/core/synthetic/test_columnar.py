@@ -0,0 +1,85 @@
+"""
+Unit tests for columnar statistics.
+"""
+
+from array import array
+
+import pytest
+from persona.core.synthetic.columnar import (
+    ColumnAccumulator,
+    accumulate,
+    histogram,
+    numeric_summary,
+    reservoir_sample,
+)
+
+
+def test_numeric_summary():
+    """Test summary statistics and interpolated quantiles."""
+    stats = numeric_summary(array("d", [1.0, 2.0, 3.0, 4.0, 5.0]))
+
+    assert stats["min"] == 1.0
+    assert stats["max"] == 5.0
+    assert stats["mean"] == 3.0
+    assert stats["std"] == pytest.approx(2**0.5)
+    assert stats["p25"] == 2.0
+    assert stats["p50"] == 3.0
+    assert stats["p95"] == pytest.approx(4.8)
+
+
+def test_numeric_summary_empty():
+    """Test empty input gives zeroed statistics."""
+    assert numeric_summary(array("d")) == {
+        "min": 0.0,
+        "max": 0.0,
+        "mean": 0.0,
+        "std": 0.0,
+    }
+
+
+def test_histogram():
+    """Test equal-width binning includes the maximum in the last bin."""
+    counts, edges = histogram(array("d", [0.0, 1.0, 2.0, 3.0, 4.0]), bins=2)
+
+    assert counts == [2, 3]
+    assert edges == [0.0, 2.0, 4.0]
+
+
+def test_histogram_constant_values():
+    """Test a constant column gets a unit-width range."""
+    counts, edges = histogram(array("d", [3.0, 3.0]), bins=1)
+
+    assert counts == [2]
+    assert edges == [2.5, 3.5]
+
+
+def test_reservoir_sample_keeps_source_order():
+    """Test sampled rows are returned in source order."""
+    rows = ({"i": i} for i in range(500))
+
+    sample, total = reservoir_sample(rows, 50, seed=1)
+
+    assert total == 500
+    assert len(sample) == 50
+    indices = [row["i"] for row in sample]
+    assert indices == sorted(indices)
+
+
+def test_accumulator_stops_numeric_parsing():
+    """Test non-numeric values in the type sample disable numeric stats."""
+    acc = ColumnAccumulator("mixed")
+    for value in ["1", "two", "3"]:
+        acc.add(value)
+
+    assert len(acc.numbers) == 0
+    assert acc.frequencies == {"1": 1, "two": 1, "3": 1}
+
+
+def test_accumulate():
+    """Test accumulating rows creates one accumulator per column."""
+    columns, row_count = accumulate([{"a": 1, "b": ""}, {"a": 2}])
+
+    assert row_count == 2
+    assert columns["a"].count == 2
+    assert columns["b"].count == 0
+    assert list(columns["a"].numbers) == [1.0, 2.0]
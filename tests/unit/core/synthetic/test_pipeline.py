@@ -264,3 +264,193 @@ def test_save_data_json(tmp_path):
 
         assert len(loaded_data) == 2
         assert loaded_data[0]["name"] == "John"
+
+
+def _numbered_provider(delay: float = 0.0):
+    """Create a provider returning distinct records for each call."""
+    import threading
+    import time
+
+    mock = MagicMock()
+    mock.default_model = "test-model"
+    lock = threading.Lock()
+    state = {"calls": 0, "in_flight": 0, "max_in_flight": 0}
+
+    def generate(prompt, **kwargs):
+        with lock:
+            state["calls"] += 1
+            call = state["calls"]
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(delay)
+        with lock:
+            state["in_flight"] -= 1
+        response = MagicMock()
+        response.content = json.dumps(
+            [
+                {"name": f"Person {call}-{i}", "age": "30", "role": "Engineer"}
+                for i in range(2)
+            ]
+        )
+        return response
+
+    mock.generate.side_effect = generate
+    return mock, state
+
+
+def test_synthesise_concurrent_batches(temp_csv_input, tmp_path):
+    """Test batches are requested concurrently and streamed to the output."""
+    output_path = tmp_path / "output.csv"
+    provider, state = _numbered_provider(delay=0.05)
+
+    with patch(
+        "persona.core.synthetic.pipeline.ProviderFactory.create",
+        return_value=provider,
+    ):
+        pipeline = SyntheticPipeline(provider="ollama")
+        result = pipeline.synthesise(
+            input_path=temp_csv_input,
+            output_path=output_path,
+            count=10,
+            batch_size=2,
+            validate=False,
+            max_concurrency=5,
+        )
+
+    with open(output_path, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert result.row_count == 10
+    assert len(rows) == 10
+    assert state["max_in_flight"] > 1
+    assert state["max_in_flight"] <= 5
+    assert not (tmp_path / "output.csv.partial.jsonl").exists()
+
+
+def test_synthesise_drops_duplicates(temp_csv_input, tmp_path, mock_provider):
+    """Test records repeated across batches are only written once."""
+    output_path = tmp_path / "output.csv"
+
+    with patch(
+        "persona.core.synthetic.pipeline.ProviderFactory.create",
+        return_value=mock_provider,
+    ):
+        pipeline = SyntheticPipeline(provider="ollama")
+        result = pipeline.synthesise(
+            input_path=temp_csv_input,
+            output_path=output_path,
+            count=6,
+            batch_size=3,
+            validate=False,
+            max_concurrency=1,
+        )
+
+    with open(output_path, encoding="utf-8") as f:
+        records = list(csv.DictReader(f))
+
+    # The mock returns the same three records for every batch
+    assert len(records) == 3
+    assert result.row_count == 3
+    assert result.metadata["duplicates_dropped"] > 0
+    assert mock_provider.generate.call_count == 4
+
+
+def test_synthesise_resume(temp_csv_input, tmp_path):
+    """Test an interrupted run continues from its progress file."""
+    output_path = tmp_path / "output.csv"
+    progress_path = tmp_path / "output.csv.partial.jsonl"
+    previous = [
+        {"name": f"Earlier {i}", "age": "40", "role": "Manager"} for i in range(4)
+    ]
+    progress_path.write_text(
+        "".join(json.dumps(r) + "\n" for r in previous) + '{"name": "trunc'
+    )
+    provider, state = _numbered_provider()
+
+    with patch(
+        "persona.core.synthetic.pipeline.ProviderFactory.create",
+        return_value=provider,
+    ):
+        pipeline = SyntheticPipeline(provider="ollama")
+        result = pipeline.synthesise(
+            input_path=temp_csv_input,
+            output_path=output_path,
+            count=8,
+            batch_size=2,
+            validate=False,
+            resume=True,
+        )
+
+    with open(output_path, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert result.row_count == 8
+    assert result.metadata["resumed_records"] == 4
+    assert state["calls"] == 2
+    assert [r["name"] for r in rows[:4]] == [r["name"] for r in previous]
+
+
+def test_save_data_json_streams_same_layout(tmp_path):
+    """Test streamed JSON output matches json.dump formatting."""
+    with patch("persona.core.synthetic.pipeline.ProviderFactory.create"):
+        pipeline = SyntheticPipeline(provider="ollama")
+
+    data = [{"name": "John", "tags": ["a", "b"]}, {"name": "Jane", "tags": []}]
+    output_path = tmp_path / "output.json"
+    pipeline._save_data(iter(data), output_path, "json")
+
+    assert output_path.read_text() == json.dumps(data, indent=2)
+
+
+def test_synthesise_resume_truncates_to_count(temp_csv_input, tmp_path):
+    """Test resuming with a smaller count keeps only the first records."""
+    output_path = tmp_path / "output.csv"
+    progress_path = tmp_path / "output.csv.partial.jsonl"
+    previous = [
+        {"name": f"Earlier {i}", "age": "40", "role": "Manager"} for i in range(6)
+    ]
+    progress_path.write_text("".join(json.dumps(r) + "\n" for r in previous))
+    provider, state = _numbered_provider()
+
+    with patch(
+        "persona.core.synthetic.pipeline.ProviderFactory.create",
+        return_value=provider,
+    ):
+        pipeline = SyntheticPipeline(provider="ollama")
+        result = pipeline.synthesise(
+            input_path=temp_csv_input,
+            output_path=output_path,
+            count=4,
+            batch_size=2,
+            validate=False,
+            resume=True,
+        )
+
+    with open(output_path, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert result.row_count == 4
+    assert result.metadata["resumed_records"] == 4
+    assert state["calls"] == 0
+    assert [r["name"] for r in rows] == [r["name"] for r in previous[:4]]
+
+
+def test_synthesise_rejects_invalid_concurrency(temp_csv_input, tmp_path):
+    """Test max_concurrency below 1 is rejected."""
+    provider, state = _numbered_provider()
+
+    with patch(
+        "persona.core.synthetic.pipeline.ProviderFactory.create",
+        return_value=provider,
+    ):
+        pipeline = SyntheticPipeline(provider="ollama")
+        with pytest.raises(ValueError, match="max_concurrency"):
+            pipeline.synthesise(
+                input_path=temp_csv_input,
+                output_path=tmp_path / "output.csv",
+                count=4,
+                validate=False,
+                max_concurrency=0,
+            )
+
+    assert state["calls"] == 0
@@ -242,3 +242,57 @@ def test_pii_check_no_privacy_module(temp_synthetic_csv_good):
     assert pii_detected is False
     assert count == 0
     assert types == []
+
+
+def test_pii_check_streams_chunks(tmp_path, monkeypatch):
+    """Test PII detection runs over bounded chunks of the output."""
+    import persona.core.privacy
+    from persona.core.synthetic import validator as validator_module
+
+    rows = "".join(f"{i},Contact person{i}@example.com\n" for i in range(40))
+    path = tmp_path / "synthetic.csv"
+    path.write_text("id,note\n" + rows)
+    chunks: list[str] = []
+
+    class StubDetector:
+        def __init__(self, **kwargs):
+            pass
+
+        def is_available(self) -> bool:
+            return True
+
+        def detect(self, text: str):
+            chunks.append(text)
+            return [
+                type("Entity", (), {"type": "EMAIL_ADDRESS"})()
+                for _ in range(text.count("@"))
+            ]
+
+    monkeypatch.setattr(persona.core.privacy, "PIIDetector", StubDetector)
+    monkeypatch.setattr(validator_module, "PII_CHUNK_CHARS", 300)
+
+    detected, count, types = SyntheticValidator()._check_pii(path)
+
+    assert (detected, count, types) == (True, 40, ["EMAIL_ADDRESS"])
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 400 for chunk in chunks)
+
+
+def test_numeric_similarity_uses_quantiles():
+    """Test quantile differences lower similarity when available."""
+    validator = SyntheticValidator()
+    base = {"min": 0.0, "max": 100.0, "mean": 50.0, "std": 10.0}
+    quantiles = {"p05": 10.0, "p25": 30.0, "p50": 50.0, "p75": 70.0, "p95": 90.0}
+    skewed = {"p05": 40.0, "p25": 45.0, "p50": 50.0, "p75": 55.0, "p95": 60.0}
+
+    same = validator._numeric_similarity(
+        {**base, **quantiles},
+        {**base, **quantiles},
+    )
+    different = validator._numeric_similarity(
+        {**base, **quantiles},
+        {**base, **skewed},
+    )
+
+    assert same == pytest.approx(1.0)
+    assert different < same
@@ -5,6 +5,8 @@ Tests for batch processing functionality (F-020).
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from persona.core.batch import BatchConfig, BatchProcessor, BatchResult
 from persona.core.batch.processor import FileResult
 from persona.core.generation.parser import Persona
@@ -180,6 +182,23 @@ class TestBatchProcessor:
         assert estimate["total_input_tokens"] > 0
         assert estimate["estimated_total_personas"] == 6  # 2 files * 3 per file
 
+    def test_estimate_batch_streams_records(self, tmp_path: Path, monkeypatch):
+        """Test estimation sums streamed record tokens for each file."""
+        rows = "".join(f"{i},Response {i}\n" for i in range(20))
+        (tmp_path / "survey.csv").write_text("id,text\n" + rows)
+        processor = BatchProcessor()
+        expected = len(processor._loader.load_path(tmp_path / "survey.csv")[0])
+        monkeypatch.setattr(processor._loader, "count_tokens", len)
+        monkeypatch.setattr(
+            processor._loader,
+            "load_file",
+            lambda path: pytest.fail("estimate_batch loaded a whole file"),
+        )
+
+        estimate = processor.estimate_batch([tmp_path / "survey.csv"])
+
+        assert estimate["total_input_tokens"] == expected
+
     def test_estimate_batch_with_config(self, tmp_path: Path):
         """Test batch estimation with custom config."""
         (tmp_path / "file.csv").write_text("id,text\n1,Content\n")
@@ -256,6 +275,28 @@ class TestBatchProcessor:
         # Should stop after first error
         assert len(result.file_results) == 1
 
+    def test_process_files_with_provider(self, tmp_path: Path):
+        """Test the given provider is used by the real generation pipeline."""
+        from persona.core.providers.base import LLMResponse
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Interview notes")
+
+        provider = Mock()
+        provider.generate.return_value = LLMResponse(
+            content='<output>{"personas": [{"id": "p001", "name": "Test"}]}</output>',
+            model="stub-model",
+            input_tokens=10,
+            output_tokens=5,
+        )
+
+        processor = BatchProcessor(provider, BatchConfig(provider="stub"))
+        result = processor.process_files([test_file])
+
+        assert result.success_count == 1
+        assert result.file_results[0].personas[0].name == "Test"
+        provider.generate.assert_called_once()
+
     def test_process_directory(self, tmp_path: Path):
         """Test processing a directory."""
         # Create test files
@@ -305,3 +346,189 @@ class TestBatchProcessor:
         assert len(progress_calls) == 2
         assert progress_calls[0] == (1, 2)
         assert progress_calls[1] == (2, 2)
+
+
+class TestIncrementalBatch:
+    """Tests for incremental batch processing."""
+
+    def _mock_generation(self, mock_factory, mock_pipeline):
+        mock_factory.create.return_value = Mock()
+
+        def generate(config):
+            path = config.data_path
+            result = Mock()
+            result.personas = [Persona(id=path.stem, name=f"From {path.name}")]
+            result.input_tokens = 10
+            result.output_tokens = 20
+            return result
+
+        mock_pipeline.return_value.generate.side_effect = generate
+        return mock_pipeline.return_value.generate
+
+    def test_requires_output_location(self):
+        """Test incremental mode needs somewhere to keep its manifest."""
+        config = BatchConfig(incremental=True)
+
+        with pytest.raises(ValueError):
+            config.get_manifest_path()
+
+    @patch("persona.core.batch.processor.GenerationPipeline")
+    @patch("persona.core.batch.processor.ProviderFactory")
+    def test_second_run_skips_unchanged(
+        self, mock_factory, mock_pipeline, tmp_path: Path
+    ):
+        """Test unchanged files reuse their previous personas."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "a.txt").write_text("Interview A")
+        (data_dir / "b.txt").write_text("Interview B")
+        generate = self._mock_generation(mock_factory, mock_pipeline)
+
+        config = BatchConfig(incremental=True, output_dir=tmp_path / "out")
+        processor = BatchProcessor(config=config)
+        first = processor.process_directory(data_dir)
+
+        assert generate.call_count == 2
+        assert first.skipped_count == 0
+
+        second = processor.process_directory(data_dir)
+
+        assert generate.call_count == 2
+        assert second.skipped_count == 2
+        assert second.total_personas == 2
+        assert {p.id for p in second.all_personas} == {"a", "b"}
+        assert all(r.run_id == first.run_id for r in second.file_results)
+
+    @patch("persona.core.batch.processor.GenerationPipeline")
+    @patch("persona.core.batch.processor.ProviderFactory")
+    def test_modified_file_regenerated(
+        self, mock_factory, mock_pipeline, tmp_path: Path
+    ):
+        """Test only modified and new files are regenerated."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "a.txt").write_text("Interview A")
+        (data_dir / "b.txt").write_text("Interview B")
+        generate = self._mock_generation(mock_factory, mock_pipeline)
+
+        config = BatchConfig(incremental=True, output_dir=tmp_path / "out")
+        processor = BatchProcessor(config=config)
+        processor.process_directory(data_dir)
+
+        (data_dir / "b.txt").write_text("Interview B, follow-up")
+        (data_dir / "c.txt").write_text("Interview C")
+        generate.reset_mock()
+        result = processor.process_directory(data_dir)
+
+        regenerated = sorted(c.args[0].data_path.name for c in generate.call_args_list)
+        assert regenerated == ["b.txt", "c.txt"]
+        assert result.skipped_count == 1
+        assert result.total_personas == 3
+        assert result.total_tokens == 60
+        # The result stored for the previous version of b.txt is deleted
+        assert len(list((tmp_path / "out" / "results").iterdir())) == 3
+
+    @patch("persona.core.batch.processor.GenerationPipeline")
+    @patch("persona.core.batch.processor.ProviderFactory")
+    def test_changed_config_regenerates(
+        self, mock_factory, mock_pipeline, tmp_path: Path
+    ):
+        """Test changing the model regenerates every file."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "a.txt").write_text("Interview A")
+        (data_dir / "b.txt").write_text("Interview B")
+        generate = self._mock_generation(mock_factory, mock_pipeline)
+
+        processor = BatchProcessor()
+        processor.process_directory(
+            data_dir,
+            BatchConfig(incremental=True, output_dir=tmp_path / "out", model="m1"),
+        )
+        generate.reset_mock()
+        result = processor.process_directory(
+            data_dir,
+            BatchConfig(incremental=True, output_dir=tmp_path / "out", model="m2"),
+        )
+
+        assert generate.call_count == 2
+        assert result.skipped_count == 0
+        # Results from the previous model are deleted
+        assert len(list((tmp_path / "out" / "results").iterdir())) == 2
+
+    @patch("persona.core.batch.processor.GenerationPipeline")
+    @patch("persona.core.batch.processor.ProviderFactory")
+    def test_removed_file_dropped(self, mock_factory, mock_pipeline, tmp_path: Path):
+        """Test deleted inputs are removed from the manifest."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "a.txt").write_text("Interview A")
+        (data_dir / "b.txt").write_text("Interview B")
+        self._mock_generation(mock_factory, mock_pipeline)
+
+        config = BatchConfig(incremental=True, output_dir=tmp_path / "out")
+        processor = BatchProcessor(config=config)
+        processor.process_directory(data_dir)
+
+        (data_dir / "b.txt").unlink()
+        result = processor.process_directory(data_dir)
+
+        assert result.removed_files == ["b.txt"]
+        assert result.total_personas == 1
+        assert len(list((tmp_path / "out" / "results").iterdir())) == 1
+
+    @patch("persona.core.batch.processor.GenerationPipeline")
+    @patch("persona.core.batch.processor.ProviderFactory")
+    def test_interrupted_run_resumes(
+        self, mock_factory, mock_pipeline, tmp_path: Path
+    ):
+        """Test files completed before an interruption are not regenerated."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        for name in ("a", "b", "c"):
+            (data_dir / f"{name}.txt").write_text(f"Interview {name}")
+        generate = self._mock_generation(mock_factory, mock_pipeline)
+        succeed = generate.side_effect
+
+        def interrupt_on_c(config):
+            if config.data_path.name == "c.txt":
+                raise KeyboardInterrupt
+            return succeed(config)
+
+        generate.side_effect = interrupt_on_c
+        config = BatchConfig(incremental=True, output_dir=tmp_path / "out")
+        processor = BatchProcessor(config=config)
+        with pytest.raises(KeyboardInterrupt):
+            processor.process_directory(data_dir)
+
+        generate.side_effect = succeed
+        generate.reset_mock()
+        result = processor.process_directory(data_dir)
+
+        assert [c.args[0].data_path.name for c in generate.call_args_list] == [
+            "c.txt"
+        ]
+        assert result.skipped_count == 2
+
+    @patch("persona.core.batch.processor.GenerationPipeline")
+    @patch("persona.core.batch.processor.ProviderFactory")
+    def test_shared_result_kept_while_referenced(
+        self, mock_factory, mock_pipeline, tmp_path: Path
+    ):
+        """Test a result shared by identical inputs outlives one of them."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "a.txt").write_text("Same interview")
+        (data_dir / "b.txt").write_text("Same interview")
+        self._mock_generation(mock_factory, mock_pipeline)
+
+        config = BatchConfig(incremental=True, output_dir=tmp_path / "out")
+        processor = BatchProcessor(config=config)
+        processor.process_directory(data_dir)
+
+        (data_dir / "b.txt").write_text("Different interview")
+        processor.process_directory(data_dir)
+        result = processor.process_directory(data_dir)
+
+        assert result.skipped_count == 2
+        assert len(list((tmp_path / "out" / "results").iterdir())) == 2
@@ -4,6 +4,7 @@ Tests for persona comparison functionality (F-021).
 
 
 from persona.core.comparison import ComparisonResult, PersonaComparator, SimilarityScore
+from persona.core.generation.compact import CompactPersona
 from persona.core.generation.parser import Persona
 
 
@@ -202,6 +203,30 @@ class TestPersonaComparator:
         # 3 personas = 3 pairs (p1-p2, p1-p3, p2-p3)
         assert len(results) == 3
 
+    def test_compare_accepts_compact_personas(self):
+        """Test compact personas compare the same as regular personas."""
+        persona_a = Persona(
+            id="p001",
+            name="Alice",
+            goals=["Learn Python"],
+            demographics={"age": "30", "city": "Leeds"},
+        )
+        persona_b = Persona(
+            id="p002",
+            name="Bob",
+            goals=["Learn Python", "Cook"],
+            demographics={"age": "30", "city": "York"},
+        )
+
+        comparator = PersonaComparator()
+        expected = comparator.compare(persona_a, persona_b)
+        result = comparator.compare(
+            CompactPersona.from_persona(persona_a),
+            CompactPersona.from_persona(persona_b),
+        )
+
+        assert result.to_dict() == expected.to_dict()
+
     def test_find_most_similar(self):
         """Test finding most similar persona."""
         target = Persona(
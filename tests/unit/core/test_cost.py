@@ -3,8 +3,10 @@ Tests for cost estimation functionality (F-007, F-014).
 """
 
 from decimal import Decimal
+from pathlib import Path
 
 from persona.core.cost import CostEstimator, ModelPricing, PricingData
+from persona.core.data import LoadResult
 
 
 class TestModelPricing:
@@ -123,6 +125,21 @@ class TestPricingData:
 class TestCostEstimator:
     """Tests for CostEstimator class."""
 
+    def test_estimate_from_load(self):
+        """Test estimating from per-file token counts."""
+        load_result = LoadResult(
+            content="ignored",
+            files=[Path("a.txt"), Path("b.txt")],
+            file_tokens={Path("a.txt"): 6_000, Path("b.txt"): 4_000},
+        )
+
+        estimate = CostEstimator().estimate_from_load(
+            load_result, model="claude-sonnet-4-20250514"
+        )
+
+        assert estimate.input_tokens == 10_000
+        assert estimate.total_cost > 0
+
     def test_estimate_known_model(self):
         """Test estimating cost for known model."""
         estimator = CostEstimator()
@@ -2,10 +2,17 @@
 Tests for data loading functionality (F-001).
 """
 
+import json
 from pathlib import Path
 
 import pytest
-from persona.core.data import CSVLoader, DataLoader, JSONLoader, TextLoader
+from persona.core.data import (
+    CSVLoader,
+    DataLoader,
+    JSONLLoader,
+    JSONLoader,
+    TextLoader,
+)
 
 
 class TestDataLoader:
@@ -165,6 +172,126 @@ class TestDataLoader:
         assert token_count > 0
         assert token_count < len(text)  # Tokens should be fewer than characters
 
+    def test_iter_records_matches_load_path(self, tmp_path: Path):
+        """Test streamed records reassemble the combined content."""
+        (tmp_path / "a.csv").write_text("id,text\n1,First\n2,Second\n")
+        (tmp_path / "b.jsonl").write_text('{"text": "Third"}\n{"text": "Fourth"}\n')
+        (tmp_path / "c.txt").write_text("Plain notes")
+
+        loader = DataLoader()
+        records = list(loader.iter_records(tmp_path, count_tokens=False))
+        content, _ = loader.load_path(tmp_path)
+
+        assert "".join(r.text for r in records) == content
+        assert [r.source.name for r in records] == [
+            "a.csv",
+            "a.csv",
+            "b.jsonl",
+            "b.jsonl",
+            "c.txt",
+        ]
+        assert records[0].content.startswith("# Source: a.csv")
+        assert records[2].separator == DataLoader.FILE_SEPARATOR
+
+    def test_iter_records_raises_on_partial_failure(self, tmp_path: Path):
+        """Test a file failing part-way raises instead of truncating."""
+        (tmp_path / "a.jsonl").write_text('{"text": "First"}\nnot json\n')
+
+        records = DataLoader().iter_records(tmp_path, count_tokens=False)
+
+        assert next(records).content.startswith("# Source: a.jsonl")
+        with pytest.raises(ValueError, match="after 1 records"):
+            next(records)
+
+    def test_iter_records_running_token_counts(self, tmp_path: Path, monkeypatch):
+        """Test records carry running token totals."""
+        (tmp_path / "a.csv").write_text("id,text\n1,First\n2,Second\n")
+        loader = DataLoader()
+        monkeypatch.setattr(loader, "count_tokens", lambda text: len(text))
+
+        records = list(loader.iter_records(tmp_path))
+
+        assert all(r.tokens == len(r.text) for r in records)
+        assert records[-1].total_tokens == sum(r.tokens for r in records)
+
+    def test_iter_chunks_respects_budget(self, tmp_path: Path, monkeypatch):
+        """Test chunks stay within the token budget."""
+        rows = "".join(f"{i},Response number {i}\n" for i in range(50))
+        (tmp_path / "survey.csv").write_text("id,text\n" + rows)
+        loader = DataLoader()
+        monkeypatch.setattr(loader, "count_tokens", lambda text: len(text))
+
+        chunks = list(loader.iter_chunks(tmp_path, max_tokens=200))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        assert "Response number 49" in chunks[-1]
+
+    def test_iter_chunks_invalid_budget(self, tmp_path: Path):
+        """Test non-positive budgets are rejected."""
+        with pytest.raises(ValueError):
+            next(DataLoader().iter_chunks(tmp_path, max_tokens=0))
+
+    def test_load_path_parallel_matches_load_path(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """Test pooled loading keeps discovery order and content."""
+        monkeypatch.setattr(DataLoader, "PARALLEL_MIN_BYTES", 0)
+        for i in range(6):
+            (tmp_path / f"interview{i}.txt").write_text(f"Interview {i} content")
+        (tmp_path / "survey.csv").write_text("id,text\n1,Answer\n")
+
+        loader = DataLoader()
+        result = loader.load_path_parallel(tmp_path, max_workers=3, count_tokens=False)
+        content, files = loader.load_path(tmp_path)
+
+        assert result.content == content
+        assert result.files == files
+        assert list(result.file_tokens) == files
+        assert result.workers == 3
+        assert result.bytes_read == sum(f.stat().st_size for f in files)
+
+    def test_load_path_parallel_small_input_in_process(self, tmp_path: Path):
+        """Test small inputs are loaded without starting a pool."""
+        for i in range(4):
+            (tmp_path / f"interview{i}.txt").write_text(f"Interview {i} content")
+
+        result = DataLoader().load_path_parallel(
+            tmp_path, max_workers=4, count_tokens=False
+        )
+
+        assert result.workers == 1
+        assert len(result.file_tokens) == 4
+
+    def test_load_path_parallel_token_counts(self, tmp_path: Path, monkeypatch):
+        """Test per-file token counts are returned with the content."""
+        (tmp_path / "a.txt").write_text("First interview")
+        (tmp_path / "b.txt").write_text("Second interview, longer")
+        loader = DataLoader()
+        monkeypatch.setattr(loader, "count_tokens", lambda text: len(text))
+
+        result = loader.load_path_parallel(tmp_path, use_processes=False)
+
+        assert result.file_tokens[tmp_path / "a.txt"] == len(
+            "# Source: a.txt\n\nFirst interview"
+        )
+        assert result.total_tokens == len(result.content)
+        assert result.to_dict()["total_tokens"] == result.total_tokens
+        assert result.tokens_per_second > 0
+
+    def test_load_path_parallel_records_errors(self, tmp_path: Path):
+        """Test files that fail to load are reported, not fatal."""
+        (tmp_path / "good.txt").write_text("Good content")
+        (tmp_path / "bad.json").write_text("{not json")
+
+        result = DataLoader().load_path_parallel(
+            tmp_path, use_processes=False, count_tokens=False
+        )
+
+        assert "Good content" in result.content
+        assert list(result.errors) == [tmp_path / "bad.json"]
+        assert list(result.file_tokens) == [tmp_path / "good.txt"]
+
     def test_validate_content_valid(self):
         """Test content validation with valid content."""
         loader = DataLoader()
@@ -217,6 +344,18 @@ class TestCSVLoader:
 
         assert content == ""
 
+    def test_iter_records(self, tmp_path: Path):
+        """Test streaming rows matches loading the whole file."""
+        test_file = tmp_path / "test.csv"
+        test_file.write_text("participant_id,response\nP001,Great\nP002,\n")
+
+        loader = CSVLoader()
+        records = list(loader.iter_records(test_file))
+
+        assert len(records) == 2
+        assert loader.RECORD_SEPARATOR.join(records) == loader.load(test_file)
+        assert loader.load(test_file) == loader.load_content(test_file.read_text())
+
 
 class TestJSONLoader:
     """Tests for the JSON loader."""
@@ -248,6 +387,91 @@ class TestJSONLoader:
         assert "Item 1" in content
         assert "Item 2" in content
 
+    def test_iter_records_streams_array(self, tmp_path: Path):
+        """Test top-level arrays are decoded item by item."""
+        items = [{"id": i, "notes": ["a" * 20, {"n": 12345}]} for i in range(20)]
+        test_file = tmp_path / "test.json"
+        test_file.write_text(json.dumps(items, indent=2))
+
+        loader = JSONLoader()
+        loader.STREAM_CHUNK_SIZE = 7
+        records = list(loader.iter_records(test_file))
+
+        assert len(records) == 20
+        assert loader.RECORD_SEPARATOR.join(records) == loader.load(test_file)
+
+    def test_iter_records_object(self, tmp_path: Path):
+        """Test non-array documents are formatted whole."""
+        test_file = tmp_path / "test.json"
+        test_file.write_text('{"name": "Alice"}')
+
+        assert list(JSONLoader().iter_records(test_file)) == ["**name**: Alice"]
+
+    def test_iter_records_truncated_array(self, tmp_path: Path):
+        """Test unterminated arrays raise an error."""
+        test_file = tmp_path / "test.json"
+        test_file.write_text('[{"id": 1}, {"id": 2')
+
+        with pytest.raises(ValueError):
+            list(JSONLoader().iter_records(test_file))
+
+    @pytest.mark.parametrize(
+        "content", ["[1 2]", '[{"id": 1} {"id": 2}]', "[1,]", "[1,,2]", "[1] x"]
+    )
+    def test_iter_records_rejects_invalid_array(self, tmp_path: Path, content):
+        """Test arrays json.loads rejects are rejected when streamed."""
+        test_file = tmp_path / "test.json"
+        test_file.write_text(content)
+        loader = JSONLoader()
+        loader.STREAM_CHUNK_SIZE = 3
+
+        with pytest.raises(ValueError):
+            list(loader.iter_records(test_file))
+
+    def test_iter_records_numbers_across_chunks(self, tmp_path: Path):
+        """Test numbers split across read chunks are decoded whole."""
+        test_file = tmp_path / "test.json"
+        test_file.write_text("[3.25, -2e3, 12345]")
+        loader = JSONLoader()
+        loader.STREAM_CHUNK_SIZE = 2
+
+        assert loader.RECORD_SEPARATOR.join(
+            loader.iter_records(test_file)
+        ) == loader.load(test_file)
+
+
+class TestJSONLLoader:
+    """Tests for the JSON Lines loader."""
+
+    def test_extensions(self):
+        """Test supported extensions."""
+        loader = JSONLLoader()
+        assert ".jsonl" in loader.extensions
+        assert ".ndjson" in loader.extensions
+
+    def test_load(self, tmp_path: Path):
+        """Test loading one record per line, skipping blank lines."""
+        test_file = tmp_path / "test.jsonl"
+        test_file.write_text('{"name": "Alice"}\n\n{"name": "Bob"}\n')
+
+        loader = JSONLLoader()
+        content = loader.load(test_file)
+
+        assert "Record 1" in content
+        assert "Record 2" in content
+        assert "Bob" in content
+        assert content == loader.load_content(test_file.read_text())
+
+    def test_invalid_line(self, tmp_path: Path):
+        """Test invalid lines report their line number."""
+        test_file = tmp_path / "test.jsonl"
+        test_file.write_text('{"name": "Alice"}\nnot json\n')
+
+        with pytest.raises(ValueError) as excinfo:
+            JSONLLoader().load(test_file)
+
+        assert "line 2" in str(excinfo.value)
+
 
 class TestTextLoader:
     """Tests for the text loader."""
@@ -0,0 +1,125 @@
+"""
+Tests for the incremental input manifest.
+"""
+
+import os
+from pathlib import Path
+
+from persona.core.data import FileChange, FileManifest
+
+
+class TestFileManifest:
+    """Tests for FileManifest."""
+
+    def test_new_file(self, tmp_path: Path):
+        """Test files not in the manifest are new."""
+        data_file = tmp_path / "a.txt"
+        data_file.write_text("content")
+
+        manifest = FileManifest(tmp_path / "manifest.json")
+
+        assert manifest.check(data_file) == FileChange.NEW
+
+    def test_recorded_file_unchanged(self, tmp_path: Path):
+        """Test recorded files are unchanged until edited."""
+        data_file = tmp_path / "a.txt"
+        data_file.write_text("content")
+
+        manifest = FileManifest(tmp_path / "manifest.json")
+        entry = manifest.record(data_file, output="out.json", run_id="run1")
+
+        assert entry.path == "a.txt"
+        assert entry.content_hash.startswith("sha256:")
+        assert manifest.check(data_file) == FileChange.UNCHANGED
+
+    def test_modified_file(self, tmp_path: Path):
+        """Test content changes are detected."""
+        data_file = tmp_path / "a.txt"
+        data_file.write_text("content")
+        manifest = FileManifest(tmp_path / "manifest.json")
+        manifest.record(data_file)
+
+        data_file.write_text("changed content")
+
+        assert manifest.check(data_file) == FileChange.MODIFIED
+
+    def test_changed_config_is_modified(self, tmp_path: Path):
+        """Test entries recorded under other settings count as modified."""
+        data_file = tmp_path / "a.txt"
+        data_file.write_text("content")
+        manifest = FileManifest(tmp_path / "manifest.json")
+        manifest.record(data_file, config_hash="sha256:old")
+        manifest.save()
+
+        reloaded = FileManifest(tmp_path / "manifest.json")
+
+        assert reloaded.check(data_file, "sha256:old") == FileChange.UNCHANGED
+        assert reloaded.check(data_file, "sha256:new") == FileChange.MODIFIED
+        assert reloaded.check(data_file) == FileChange.UNCHANGED
+
+    def test_touched_identical_file_unchanged(self, tmp_path: Path):
+        """Test a new mtime with identical content is not a change."""
+        data_file = tmp_path / "a.txt"
+        data_file.write_text("content")
+        manifest = FileManifest(tmp_path / "manifest.json")
+        manifest.record(data_file)
+
+        stat = data_file.stat()
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert manifest.check(data_file) == FileChange.UNCHANGED
+        assert manifest.get(data_file).mtime_ns == data_file.stat().st_mtime_ns
+
+    def test_diff(self, tmp_path: Path):
+        """Test grouping files by change status."""
+        kept = tmp_path / "kept.txt"
+        edited = tmp_path / "edited.txt"
+        gone = tmp_path / "gone.txt"
+        for path in (kept, edited, gone):
+            path.write_text(path.stem)
+
+        manifest = FileManifest(tmp_path / "manifest.json")
+        for path in (kept, edited, gone):
+            manifest.record(path)
+
+        edited.write_text("edited again")
+        added = tmp_path / "added.txt"
+        added.write_text("added")
+
+        changes = manifest.diff([kept, edited, added])
+
+        assert changes.new == [added]
+        assert changes.modified == [edited]
+        assert changes.unchanged == [kept]
+        assert changes.removed == ["gone.txt"]
+        assert changes.changed == [added, edited]
+        assert changes.has_changes
+
+    def test_save_and_reload(self, tmp_path: Path):
+        """Test the manifest persists across instances."""
+        data_file = tmp_path / "a.txt"
+        data_file.write_text("content")
+        manifest_path = tmp_path / "out" / "manifest.json"
+
+        manifest = FileManifest(manifest_path, root=tmp_path)
+        manifest.record(data_file, output="results/a.json", run_id="run1")
+        manifest.save()
+
+        reloaded = FileManifest(manifest_path, root=tmp_path)
+        entry = reloaded.get(data_file)
+
+        assert len(reloaded) == 1
+        assert entry.output == "results/a.json"
+        assert entry.run_id == "run1"
+        assert reloaded.check(data_file) == FileChange.UNCHANGED
+
+    def test_forget(self, tmp_path: Path):
+        """Test removing entries."""
+        data_file = tmp_path / "a.txt"
+        data_file.write_text("content")
+        manifest = FileManifest(tmp_path / "manifest.json")
+        manifest.record(data_file)
+
+        manifest.forget(["a.txt"])
+
+        assert len(manifest) == 0
@@ -2,8 +2,15 @@
 Tests for persona generation pipeline (F-004).
 """
 
-
-from persona.core.generation import GenerationPipeline, Persona, PersonaParser
+import pickle
+
+import pytest
+from persona.core.generation import (
+    CompactPersona,
+    GenerationPipeline,
+    Persona,
+    PersonaParser,
+)
 from persona.core.generation.pipeline import GenerationConfig, GenerationResult
 
 
@@ -88,6 +95,75 @@ class TestPersona:
         assert data["extra"] == "value"
 
 
+class TestCompactPersona:
+    """Tests for CompactPersona."""
+
+    DATA = {
+        "id": "p1",
+        "name": "Alice",
+        "demographics": {"age": 30, "occupation": "Engineer"},
+        "goals": ["Ship  faster"],
+        "painPoints": ["Slow builds"],
+        "behaviors": ["Reads docs"],
+        "quotes": [],
+        "team": "Platform",
+    }
+
+    def test_matches_persona_dict_form(self):
+        """Test conversions agree with Persona's dictionary form."""
+        compact = CompactPersona.from_dict(self.DATA)
+        persona = Persona.from_dict(dict(self.DATA))
+
+        assert compact.to_dict() == persona.to_dict()
+        assert compact.to_persona() == persona
+        assert CompactPersona.from_persona(persona) == compact
+        assert "painPoints" in self.DATA
+
+    def test_views_do_not_copy(self):
+        """Test dictionary views read the stored values."""
+        compact = CompactPersona.from_dict(self.DATA)
+        view = compact.as_dict()
+
+        assert view["goals"] is compact.goals
+        assert view["team"] == "Platform"
+        assert dict(view["demographics"]) == self.DATA["demographics"]
+        assert list(view) == [*compact.to_dict()]
+
+    def test_interned_keys_shared(self):
+        """Test personas with the same demographic keys share one key tuple."""
+        a = CompactPersona(id="a", name="A", demographics={"age": 1, "role": "x"})
+        b = CompactPersona(id="b", name="B", demographics={"age": 2, "role": "y"})
+
+        assert a._demographic_keys is b._demographic_keys
+
+    def test_interned_demographic_values_shared(self):
+        """Test repeated demographic string values are stored once."""
+        city = "".join(["Lon", "don"])
+        a = CompactPersona(id="a", name="A", demographics={"city": "London"})
+        b = CompactPersona(id="b", name="B", demographics={"city": city})
+
+        assert a.demographics["city"] is b.demographics["city"]
+
+    def test_immutable_and_hashable(self):
+        """Test compact personas are immutable and deduplicate by content."""
+        a = CompactPersona.from_dict(self.DATA)
+        b = CompactPersona.from_dict(self.DATA)
+
+        with pytest.raises(AttributeError):
+            a.name = "Bob"
+        assert len({a, b}) == 1
+        assert a.content_hash == b.content_hash
+        assert pickle.loads(pickle.dumps(a)) == a
+
+    def test_normalised_text(self):
+        """Test normalised text is lower-cased with collapsed whitespace."""
+        compact = CompactPersona.from_dict(self.DATA)
+
+        assert compact.normalised_text == (
+            "alice 30 engineer platform ship faster slow builds reads docs"
+        )
+
+
 class TestPersonaParser:
     """Tests for PersonaParser class."""
 
@@ -202,6 +278,41 @@ class TestPersonaParser:
 
         assert len(result.personas) == 0
 
+    def test_parse_truncated_keeps_complete_personas(self):
+        """Test personas before a truncated tail are recovered."""
+        response = (
+            '<output>{"personas": [{"id": "p1", "name": "Alice"}, '
+            '{"id": "p2", "name": "Bob"}, {"id": "p3", "na'
+        )
+
+        result = PersonaParser().parse(response, finish_reason="length")
+
+        assert [p.name for p in result.personas] == ["Alice", "Bob"]
+        assert result.truncated
+
+    def test_parse_complete_not_truncated(self):
+        """Test a closed response is not marked truncated."""
+        result = PersonaParser().parse('[{"id": "p1", "name": "Alice"}]')
+
+        assert not result.truncated
+
+    def test_parse_example_object_before_array(self):
+        """Test a leading example object does not hide the persona array."""
+        response = (
+            'Example {"id":"x"} then\n'
+            '[{"id":"a","name":"Ana"},{"id":"b","name":"Ben"}]'
+        )
+
+        result = PersonaParser().parse(response)
+
+        assert [p.id for p in result.personas] == ["a", "b"]
+
+    def test_parse_single_object(self):
+        """Test a lone persona object is still returned."""
+        result = PersonaParser().parse('Here: {"id": "p1", "name": "Alice"}')
+
+        assert [p.id for p in result.personas] == ["p1"]
+
 
 class TestGenerationConfig:
     """Tests for GenerationConfig dataclass."""
@@ -283,3 +394,66 @@ class TestGenerationPipeline:
 
         assert workflow is not None
         assert workflow.name == "default"
+
+    def test_generate_async_stays_on_event_loop(self, tmp_path, monkeypatch):
+        """Test built-in workflows and small responses skip the executor."""
+        import asyncio
+
+        from persona.core.generation import pipeline as pipeline_module
+        from persona.core.providers import LLMResponse
+
+        class AsyncProvider:
+            name = "test"
+
+            async def generate_async(self, prompt, **kwargs):
+                return LLMResponse(
+                    content='{"personas": [{"id": "p1", "name": "Ana"}]}',
+                    model="test-model",
+                )
+
+        async def no_executor(func, *args, **kwargs):
+            raise AssertionError(f"{func.__name__} left the event loop")
+
+        async def load_path_async(path):
+            return "data", [path]
+
+        monkeypatch.setattr(pipeline_module, "run_blocking", no_executor)
+        pipeline = GenerationPipeline(provider=AsyncProvider())
+        monkeypatch.setattr(pipeline._data_loader, "load_path_async", load_path_async)
+        config = GenerationConfig(data_path=tmp_path, provider="test")
+
+        result = asyncio.run(pipeline.generate_async(config))
+
+        assert [p.name for p in result.personas] == ["Ana"]
+        assert pipeline._workflows["default"] is pipeline._load_workflow("default")
+
+    def test_generate_uses_preloaded_data(self, tmp_path, monkeypatch):
+        """Test data loaded by the caller is used instead of reloading."""
+        from persona.core.data import LoadResult
+        from persona.core.providers import LLMResponse
+
+        prompts = []
+
+        class Provider:
+            name = "test"
+
+            def generate(self, prompt, **kwargs):
+                prompts.append(prompt)
+                return LLMResponse(
+                    content='{"personas": [{"id": "p1", "name": "Ana"}]}',
+                    model="test-model",
+                )
+
+        def no_reload(*args, **kwargs):
+            raise AssertionError("data was loaded again")
+
+        pipeline = GenerationPipeline(provider=Provider())
+        monkeypatch.setattr(pipeline._data_loader, "load_path", no_reload)
+        source = tmp_path / "interviews.txt"
+        loaded = LoadResult(content="[REDACTED] said hello", files=[source])
+        config = GenerationConfig(data_path=tmp_path, provider="test")
+
+        result = pipeline.generate(config, loaded=loaded)
+
+        assert "[REDACTED] said hello" in prompts[0]
+        assert result.source_files == [source]
@@ -3,11 +3,20 @@ Tests for output formatting functionality (F-005).
 """
 
 import json
+import os
+import time
 from pathlib import Path
 
+import pytest
+
 from persona.core.generation.parser import Persona
 from persona.core.generation.pipeline import GenerationResult
-from persona.core.output import JSONFormatter, MarkdownFormatter, OutputManager
+from persona.core.output import (
+    BlobStore,
+    JSONFormatter,
+    MarkdownFormatter,
+    OutputManager,
+)
 from persona.core.output.formatters import TextFormatter
 
 
@@ -184,6 +193,18 @@ class TestOutputManager:
         assert metadata["input_tokens"] == 50
         assert metadata["output_tokens"] == 100
         assert metadata["total_tokens"] == 150
+        assert "truncated" not in metadata
+
+    def test_save_metadata_truncated(self, tmp_path: Path):
+        """Test a cut-off response is flagged in metadata."""
+        manager = OutputManager(base_dir=tmp_path)
+        result = GenerationResult(
+            personas=[Persona(id="p001", name="Test")], truncated=True
+        )
+
+        output_dir = manager.save(result, name="test-truncated")
+
+        assert manager.load_metadata(output_dir)["truncated"] is True
 
     def test_list_outputs(self, tmp_path: Path):
         """Test listing output directories."""
@@ -396,3 +417,217 @@ class TestOutputManager:
         assert "url_sources" in metadata
         assert len(metadata["url_sources"]) == 1
         assert metadata["url_sources"][0]["original_url"] == "https://example.com/data.csv"
+
+
+class TestBlobStore:
+    """Tests for content-addressed blob storage."""
+
+    def test_put_and_get(self, tmp_path: Path):
+        """Test storing and reading back content."""
+        store = BlobStore(tmp_path / "blobs")
+        digest = store.put("hello world")
+
+        assert digest.startswith("sha256:")
+        assert store.get_text(digest) == "hello world"
+        assert store.exists(digest)
+
+    def test_put_deduplicates(self, tmp_path: Path):
+        """Test identical content is stored once."""
+        store = BlobStore(tmp_path / "blobs")
+        first = store.put("same content")
+        second = store.put(b"same content")
+
+        assert first == second
+        assert len(list(store.iter_blobs())) == 1
+
+    def test_gzip_compression(self, tmp_path: Path):
+        """Test gzip-compressed blobs round-trip."""
+        store = BlobStore(tmp_path / "blobs", compression="gzip")
+        content = "repeated source data " * 1000
+        digest = store.put(content)
+
+        info = store.find(digest)
+        assert info is not None
+        assert info.path.suffix == ".gz"
+        assert info.stored_bytes < len(content)
+        assert store.get_text(digest) == content
+
+    def test_digest_independent_of_compression(self, tmp_path: Path):
+        """Test content stored uncompressed is found by a gzip store."""
+        BlobStore(tmp_path / "blobs").put("shared")
+        gzip_store = BlobStore(tmp_path / "blobs", compression="gzip")
+        digest = gzip_store.put("shared")
+
+        assert len(list(gzip_store.iter_blobs())) == 1
+        assert gzip_store.get_text(digest) == "shared"
+
+    def test_get_missing(self, tmp_path: Path):
+        """Test reading a missing blob raises."""
+        store = BlobStore(tmp_path / "blobs")
+        with pytest.raises(FileNotFoundError):
+            store.get("sha256:" + "0" * 64)
+
+    def test_invalid_digest(self, tmp_path: Path):
+        """Test malformed digests are rejected."""
+        store = BlobStore(tmp_path / "blobs")
+        with pytest.raises(ValueError):
+            store.find("sha256:../../etc/passwd")
+
+    def test_collect_garbage(self, tmp_path: Path):
+        """Test unreferenced blobs are removed."""
+        store = BlobStore(tmp_path / "blobs")
+        keep = store.put("keep me")
+        drop = store.put("drop me")
+        _age_blobs(store)
+
+        result = store.collect_garbage({keep})
+
+        assert result.removed == [drop]
+        assert result.kept == 1
+        assert result.bytes_freed > 0
+        assert store.exists(keep)
+        assert not store.exists(drop)
+
+    def test_collect_garbage_keeps_recent_blobs(self, tmp_path: Path):
+        """Test blobs written after collection starts are not deleted."""
+        store = BlobStore(tmp_path / "blobs")
+        started_at = time.time()
+        pending = store.put("saved but not yet referenced")
+
+        result = store.collect_garbage(set(), started_at)
+
+        assert result.removed == []
+        assert result.recent == 1
+        assert store.exists(pending)
+
+    def test_put_existing_refreshes_mtime(self, tmp_path: Path):
+        """Test reusing a blob marks it as in use for garbage collection."""
+        store = BlobStore(tmp_path / "blobs")
+        digest = store.put("shared prompt")
+        _age_blobs(store)
+        started_at = time.time()
+
+        assert store.put("shared prompt") == digest
+        result = store.collect_garbage(set(), started_at)
+
+        assert result.removed == []
+        assert store.exists(digest)
+
+
+def _age_blobs(store: BlobStore, seconds: float = 3600) -> None:
+    """Backdate every blob so garbage collection treats it as old."""
+    past = time.time() - seconds
+    for info in store.iter_blobs():
+        os.utime(info.path, (past, past))
+
+
+class TestOutputManagerBlobStore:
+    """Tests for OutputManager with a blob store."""
+
+    def _result(self, prompt: str = "Prompt with source data") -> GenerationResult:
+        return GenerationResult(
+            personas=[Persona(id="p001", name="Test")],
+            model="test",
+            provider="test",
+            prompt=prompt,
+            raw_response="Response body",
+        )
+
+    def test_save_references_blobs(self, tmp_path: Path):
+        """Test artefacts are stored by digest instead of inline."""
+        store = BlobStore(tmp_path / ".blobs")
+        manager = OutputManager(base_dir=tmp_path, blob_store=store)
+
+        output_dir = manager.save(self._result(), name="run-1")
+
+        assert not (output_dir / "prompt.txt").exists()
+        assert not (output_dir / "full_response.txt").exists()
+        metadata = manager.load_metadata(output_dir)
+        assert set(metadata["artefacts"]) == {"prompt.txt", "full_response.txt"}
+
+    def test_identical_prompts_stored_once(self, tmp_path: Path):
+        """Test repeated runs share prompt blobs."""
+        store = BlobStore(tmp_path / ".blobs")
+        manager = OutputManager(base_dir=tmp_path, blob_store=store)
+
+        for i in range(5):
+            manager.save(self._result(), name=f"run-{i}")
+
+        assert len(list(store.iter_blobs())) == 2
+        assert len(manager.list_outputs()) == 5
+
+    def test_load_metadata_resolves_artefacts(self, tmp_path: Path):
+        """Test transparent read-back of blob artefacts."""
+        store = BlobStore(tmp_path / ".blobs", compression="gzip")
+        manager = OutputManager(base_dir=tmp_path, blob_store=store)
+        output_dir = manager.save(self._result("My prompt"), name="run")
+
+        metadata = manager.load_metadata(output_dir, resolve_artefacts=True)
+
+        assert metadata["artefact_content"]["prompt.txt"] == "My prompt"
+        assert manager.load_artefact(output_dir, "full_response.txt") == (
+            "Response body"
+        )
+        assert manager.load_artefact(output_dir, "reasoning.txt") is None
+
+    def test_load_artefact_inline(self, tmp_path: Path):
+        """Test read-back of outputs saved without a blob store."""
+        manager = OutputManager(base_dir=tmp_path)
+        output_dir = manager.save(self._result("Inline prompt"), name="run")
+
+        assert manager.load_artefact(output_dir, "prompt.txt") == "Inline prompt"
+
+    def test_collect_garbage(self, tmp_path: Path):
+        """Test blobs of deleted outputs are collected."""
+        import shutil
+
+        store = BlobStore(tmp_path / ".blobs")
+        manager = OutputManager(base_dir=tmp_path, blob_store=store)
+        manager.save(self._result("Prompt A"), name="run-a")
+        removed_dir = manager.save(self._result("Prompt B"), name="run-b")
+
+        shutil.rmtree(removed_dir)
+        _age_blobs(store)
+        result = manager.collect_garbage()
+
+        assert len(result.removed) == 1
+        assert result.kept == 2
+
+    def test_migrate_existing_outputs(self, tmp_path: Path):
+        """Test inline outputs are migrated into the blob store."""
+        OutputManager(base_dir=tmp_path).save(self._result(), name="old-1")
+        OutputManager(base_dir=tmp_path).save(self._result(), name="old-2")
+
+        store = BlobStore(tmp_path / ".blobs")
+        manager = OutputManager(base_dir=tmp_path, blob_store=store)
+        result = manager.migrate_all()
+
+        assert result.outputs_migrated == 2
+        assert result.files_migrated == 4
+        assert len(list(store.iter_blobs())) == 2
+        for output_dir in manager.list_outputs():
+            assert not (output_dir / "prompt.txt").exists()
+            assert manager.load_artefact(output_dir, "prompt.txt") == (
+                "Prompt with source data"
+            )
+
+        # Second run is a no-op
+        assert manager.migrate_all().files_migrated == 0
+
+    def test_gc_requires_store(self, tmp_path: Path):
+        """Test GC without a blob store raises."""
+        manager = OutputManager(base_dir=tmp_path)
+        with pytest.raises(ValueError):
+            manager.collect_garbage()
+
+    def test_with_blob_store(self, tmp_path: Path):
+        """Test the shared store lives inside the base directory."""
+        manager = OutputManager.with_blob_store(tmp_path)
+        output_dir = manager.save(self._result(), name="run")
+
+        assert manager.blob_store.root == tmp_path / ".blobs"
+        assert manager.blob_store.compression.value == "gzip"
+        assert manager.list_outputs() == [output_dir]
+        assert manager.load_artefact(output_dir, "prompt.txt") == (
+            "Prompt with source data"
+        )
@@ -2,10 +2,19 @@
 Tests for prompt templating functionality (F-003).
 """
 
+import os
 from pathlib import Path
 
 import pytest
-from persona.core.prompts import PromptTemplate, Workflow, WorkflowLoader
+import yaml
+from persona.core.prompts import (
+    PromptTemplate,
+    TemplateCache,
+    Workflow,
+    WorkflowLoader,
+    get_template_cache,
+    set_template_cache,
+)
 from persona.core.prompts.template import DEFAULT_PERSONA_TEMPLATE
 
 
@@ -248,3 +257,116 @@ variables:
         assert workflow.name == "dict-workflow"
         assert workflow.provider == "gemini"
         assert workflow.max_tokens == 2000
+
+
+@pytest.fixture
+def template_cache(tmp_path: Path):
+    """Install a fresh process-wide template cache."""
+    cache = TemplateCache(bytecode_dir=tmp_path / "bytecode")
+    set_template_cache(cache)
+    yield cache
+    set_template_cache(None)
+
+
+def _settle(path: Path) -> None:
+    """Backdate a file so it is outside the racy-write window."""
+    os.utime(path, ns=(0, 1_000_000_000))
+
+
+class TestTemplateCache:
+    """Tests for TemplateCache."""
+
+    def test_templates_compiled_once(self, template_cache: TemplateCache):
+        """Test identical template strings share one compiled template."""
+        first = PromptTemplate("Hello {{ name }}")
+        second = PromptTemplate("Hello {{ name }}")
+
+        assert second.render(name="World") == "Hello World"
+        assert first._template is second._template
+        assert template_cache.stats.templates.misses == 1
+        assert template_cache.stats.templates.hits == 1
+
+    def test_strict_and_default_modes_separate(self, template_cache: TemplateCache):
+        """Test the default environment renders missing variables as empty."""
+        template = template_cache.compile("Hi {{ name }}", strict=False)
+
+        assert template.render() == "Hi "
+        with pytest.raises(Exception):
+            template_cache.compile("Hi {{ name }}").render()
+
+    def test_bytecode_written_to_disk(self, template_cache: TemplateCache):
+        """Test compiled templates are stored in the bytecode cache."""
+        template_cache.compile("Cached {{ value }}")
+
+        assert list(template_cache.bytecode_dir.iterdir())
+
+    def test_max_templates(self):
+        """Test least recently used templates are dropped."""
+        cache = TemplateCache(max_templates=2)
+        for i in range(3):
+            cache.compile(f"Template {i} {{{{ x }}}}")
+
+        assert len(cache) == 2
+
+    def test_variables_cached(self, template_cache: TemplateCache):
+        """Test variable extraction is cached."""
+        template = PromptTemplate("{{ b }} {{ a }}")
+
+        assert template.get_variables() == ["a", "b"]
+        assert template.get_variables() == ["a", "b"]
+        assert template_cache.stats.variables.hits == 1
+
+    def test_workflow_file_cached_until_modified(
+        self, tmp_path: Path, template_cache: TemplateCache
+    ):
+        """Test workflow YAML is re-read only when the file changes."""
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text("name: first\n")
+        _settle(workflow_file)
+        loader = WorkflowLoader()
+
+        assert loader.load(workflow_file).name == "first"
+        assert loader.load(workflow_file).name == "first"
+        assert template_cache.stats.files.hits == 1
+
+        workflow_file.write_text("name: second\n")
+
+        assert loader.load(workflow_file).name == "second"
+        assert template_cache.stats.files.invalidations == 1
+
+    def test_recently_written_file_not_served_from_memory(
+        self, tmp_path: Path, template_cache: TemplateCache
+    ):
+        """Test files inside the racy window are always re-read."""
+        path = tmp_path / "prompt.j2"
+        path.write_text("one")
+        assert template_cache.read_text(path) == "one"
+
+        path.write_text("two")
+
+        assert template_cache.read_text(path) == "two"
+        assert template_cache.stats.files.hits == 0
+
+    def test_loaded_values_are_copies(
+        self, tmp_path: Path, template_cache: TemplateCache
+    ):
+        """Test callers cannot mutate the cached value."""
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text("name: wf\nvariables:\n  a: 1\n")
+        _settle(workflow_file)
+
+        template_cache.load_file(workflow_file, yaml.safe_load)["variables"]["a"] = 2
+
+        assert template_cache.load_file(workflow_file, yaml.safe_load) == {
+            "name": "wf",
+            "variables": {"a": 1},
+        }
+
+    def test_default_cache_is_shared(self, template_cache: TemplateCache):
+        """Test get_template_cache returns the installed instance."""
+        assert get_template_cache() is template_cache
+        assert set(template_cache.stats.to_dict()) == {
+            "templates",
+            "variables",
+            "files",
+        }
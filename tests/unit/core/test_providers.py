@@ -2,6 +2,8 @@
 Tests for LLM provider functionality (F-002).
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 from persona.core.providers import (
     AnthropicProvider,
@@ -13,6 +15,7 @@ from persona.core.providers import (
 from persona.core.providers.base import (
     AuthenticationError,
     ModelNotFoundError,
+    RateLimitError,
 )
 
 
@@ -141,6 +144,15 @@ class TestAnthropicProvider:
         provider = AnthropicProvider()
         assert provider.is_configured() is True
 
+    def test_generate_with_image_rate_limited(self):
+        """Test vision requests share the provider's error handling."""
+        provider = AnthropicProvider(api_key="test-key")
+        response = MagicMock(status_code=429)
+
+        with patch.object(provider, "_post", return_value=response):
+            with pytest.raises(RateLimitError):
+                provider.generate_with_image("Read the notes", "aGVsbG8=")
+
 
 class TestGeminiProvider:
     """Tests for Gemini provider."""
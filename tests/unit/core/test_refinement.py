@@ -2,7 +2,7 @@
 Tests for interactive refinement functionality (F-025).
 """
 
-
+import pytest
 from persona.core.generation.parser import Persona
 from persona.core.refinement import (
     PersonaRefiner,
@@ -157,6 +157,87 @@ class TestRefinementHistory:
         assert data["persona_id"] == "p001"
         assert data["version_count"] == 1
 
+    def test_reconstructs_across_checkpoints(self):
+        """Test every version is rebuilt exactly from deltas."""
+        history = RefinementHistory(persona_id="p001", checkpoint_interval=4)
+        expected = []
+        for i in range(11):
+            persona = Persona(
+                id="p001", name=f"V{i}", goals=[f"G{j}" for j in range(i)]
+            )
+            expected.append(persona)
+            history.append(persona)
+
+        assert history.version_count == 11
+        for i, persona in enumerate(expected):
+            assert history.get(i) == persona
+
+    def test_deltas_store_changed_fields_only(self):
+        """Test a delta holds just the fields that changed."""
+        history = RefinementHistory(
+            persona_id="p001",
+            versions=[
+                Persona(id="p001", name="V1", goals=["A"] * 100),
+                Persona(id="p001", name="V2", goals=["A"] * 100),
+            ],
+        )
+
+        delta = history.to_dict()["deltas"][0]
+
+        assert delta == {"set": {"name": "V2"}, "unset": []}
+
+    def test_versions_independent_of_callers(self):
+        """Test mutating a recorded or returned persona leaves history intact."""
+        persona = Persona(id="p001", name="V1", goals=["A"])
+        history = RefinementHistory(persona_id="p001", versions=[persona])
+
+        persona.goals.append("B")
+        history.get(0).goals.append("C")
+
+        assert history.get(0).goals == ["A"]
+
+    def test_versions_property_rebuilds_versions(self):
+        """Test versions is a read-only view rebuilt from the deltas."""
+        history = RefinementHistory(
+            persona_id="p001",
+            versions=[Persona(id="p001", name="V1"), Persona(id="p001", name="V2")],
+            checkpoint_interval=1,
+        )
+
+        assert [v.name for v in history.versions] == ["V1", "V2"]
+        assert RefinementHistory(persona_id="p001").versions == []
+        with pytest.raises(AttributeError):
+            history.versions = []
+
+    def test_truncate(self):
+        """Test truncating drops later versions and instructions."""
+        history = RefinementHistory(persona_id="p001", checkpoint_interval=2)
+        for i in range(5):
+            history.append(Persona(id="p001", name=f"V{i}"))
+        history.instructions = [
+            RefinementInstruction(instruction=str(i)) for i in range(4)
+        ]
+
+        history.truncate(1)
+        history.append(Persona(id="p001", name="new"))
+
+        assert history.version_count == 3
+        assert len(history.instructions) == 1
+        assert [history.get(i).name for i in range(3)] == ["V0", "V1", "new"]
+
+    def test_round_trip(self):
+        """Test history survives serialisation."""
+        history = RefinementHistory(persona_id="p001", checkpoint_interval=2)
+        for i in range(5):
+            history.append(Persona(id="p001", name=f"V{i}"))
+        history.current_version = 3
+
+        restored = RefinementHistory.from_dict(history.to_dict())
+
+        assert restored.version_count == 5
+        assert restored.current.name == "V3"
+        assert restored.get(4).name == "V4"
+
 
 class TestRefinementSession:
     """Tests for RefinementSession dataclass."""
@@ -535,3 +616,35 @@ class TestPersonaRefiner:
         assert session.version == 3
         assert len(session.persona.goals) == 3
         assert session.persona.demographics.get("technical_level") == "advanced"
+
+    def test_evict_and_reload_session(self, tmp_path):
+        """Test an evicted session is reloaded with its history."""
+        refiner = PersonaRefiner(session_dir=tmp_path)
+        session = refiner.create_session(Persona(id="p001", name="Alice"))
+        refiner.refine(session, 'Rename to "Alicia"')
+
+        assert refiner.evict_session("p001") is True
+        assert "p001" not in refiner._sessions
+
+        restored = refiner.get_session("p001")
+        assert restored.persona.name == "Alicia"
+        assert restored.undo().name == "Alice"
+
+    def test_max_sessions_evicts_least_recent(self, tmp_path):
+        """Test sessions beyond the limit are evicted to disk."""
+        refiner = PersonaRefiner(session_dir=tmp_path, max_sessions=2)
+        for persona_id in ("p1", "p2", "p3"):
+            refiner.create_session(Persona(id=persona_id, name=persona_id))
+
+        assert list(refiner._sessions) == ["p2", "p3"]
+        assert refiner.get_session("p1").persona.name == "p1"
+        assert refiner.close_session("p1") is True
+        assert refiner.get_session("p1") is None
+
+    def test_evict_without_session_dir(self):
+        """Test eviction is refused when sessions cannot be persisted."""
+        refiner = PersonaRefiner()
+        refiner.create_session(Persona(id="p001", name="Alice"))
+
+        assert refiner.evict_session("p001") is False
+        assert refiner.get_session("p001") is not None
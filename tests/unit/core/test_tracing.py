@@ -0,0 +1,140 @@
+"""
+Tests for span tracing.
+"""
+
+import asyncio
+import json
+
+import pytest
+from persona.core.logging.tracing import (
+    JSONLSpanExporter,
+    NoOpTracer,
+    TimingSummary,
+    Tracer,
+    get_tracer,
+    set_tracer,
+    span,
+    traced,
+)
+from persona.core.providers.http_base import RequestTiming
+
+
+@pytest.fixture
+def tracer():
+    """Install a recording tracer for the test."""
+    tracer = Tracer()
+    previous = set_tracer(tracer)
+    yield tracer
+    set_tracer(previous)
+
+
+class TestTracer:
+    """Tests for Tracer."""
+
+    def test_nested_spans_share_trace(self, tracer):
+        """Test child spans record their parent and trace."""
+        with span("outer") as outer:
+            with span("inner", files=2) as inner:
+                pass
+
+        assert inner.parent_id == outer.span_id
+        assert inner.trace_id == outer.trace_id
+        assert inner.attributes == {"files": 2}
+        assert outer.duration_ms >= inner.duration_ms
+        assert tracer.current_span() is None
+
+    def test_error_recorded(self, tracer):
+        """Test exceptions mark the span as failed and propagate."""
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError("boom")
+
+        stats = tracer.summary.stats()["failing"]
+        assert stats.count == 1
+        assert stats.errors == 1
+
+    def test_traced_async(self, tracer):
+        """Test the decorator times coroutine functions."""
+
+        @traced("work")
+        async def work(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        assert asyncio.run(work(21)) == 42
+        assert tracer.summary.stats()["work"].count == 1
+
+    def test_record_external_timing(self, tracer):
+        """Test durations measured elsewhere can be recorded."""
+        tracer.record("provider.queue", 12.5, provider="openai")
+
+        assert tracer.summary.stats()["provider.queue"].total_ms == pytest.approx(12.5)
+
+    def test_noop_default(self):
+        """Test tracing is disabled unless a tracer is installed."""
+        previous = set_tracer(None)
+        try:
+            assert isinstance(get_tracer(), NoOpTracer)
+            assert not get_tracer().enabled
+            with span("ignored") as s:
+                s.set_attribute("key", "value")
+            assert get_tracer().summary.stats() == {}
+        finally:
+            set_tracer(previous)
+
+
+class TestExporters:
+    """Tests for span exporters and summaries."""
+
+    def test_jsonl_export(self, tmp_path):
+        """Test finished spans are appended as JSON lines."""
+        path = tmp_path / "spans.jsonl"
+        tracer = Tracer([JSONLSpanExporter(path)])
+
+        with tracer.span("generation.parse", personas=3):
+            pass
+        tracer.shutdown()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(records) == 1
+        assert records[0]["name"] == "generation.parse"
+        assert records[0]["attributes"]["personas"] == 3
+        assert records[0]["duration_ms"] >= 0
+
+    def test_summary_prometheus(self):
+        """Test the summary renders Prometheus text."""
+        summary = TimingSummary()
+        tracer = Tracer([summary])
+        tracer.record("generation.load", 5.0)
+        tracer.record("generation.load", 15.0)
+
+        text = summary.to_prometheus()
+
+        assert 'persona_span_duration_seconds_count{span="generation.load"} 2' in text
+        assert summary.stats()["generation.load"].mean_ms == pytest.approx(10.0)
+        assert "generation.load" in summary.format_table()
+
+
+class TestRequestTiming:
+    """Tests for RequestTiming."""
+
+    def test_splits_wait_and_network(self):
+        """Test transport events split queue wait from network time."""
+        timing = RequestTiming()
+        timing.start_ns = 0
+        timing.events = {
+            "connection.connect_tcp.started": 1_000_000,
+            "connection.connect_tcp.complete": 3_000_000,
+            "http11.send_request_headers.started": 4_000_000,
+            "http11.receive_response_body.complete": 54_000_000,
+        }
+
+        attributes = timing.attributes()
+
+        assert attributes["queue_wait_ms"] == pytest.approx(1.0)
+        assert attributes["connect_ms"] == pytest.approx(2.0)
+        assert attributes["network_ms"] == pytest.approx(50.0)
+
+    def test_no_events(self):
+        """Test mocked transports yield no timing attributes."""
+        assert RequestTiming().attributes() == {}
@@ -204,6 +204,55 @@ class TestPersonaValidator:
         assert results[1].is_valid
         assert not results[2].is_valid
 
+    def test_validate_batch_parallel_matches_serial(self):
+        """Test process-pool validation returns the same results in order."""
+        personas = [
+            Persona(id=f"p{i:03d}", name="User" if i % 3 else f"Person {i}")
+            for i in range(70)
+        ]
+        validator = PersonaValidator()
+
+        serial = validator.validate_batch(personas, max_workers=1)
+        parallel = validator.validate_batch(personas, max_workers=2)
+
+        assert [r.to_dict() for r in parallel] == [r.to_dict() for r in serial]
+
+    def test_validate_batch_in_process_by_default(self, monkeypatch):
+        """Test large batches stay in-process unless workers are requested."""
+        personas = [Persona(id=f"p{i:03d}", name=f"Person {i}") for i in range(70)]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(
+            "persona.core.validation.validator.ProcessPoolExecutor", fail
+        )
+
+        assert len(PersonaValidator().validate_batch(personas)) == 70
+
+    def test_compile_cached_until_rules_change(self):
+        """Test the compiled plan is reused until the rule set changes."""
+        validator = PersonaValidator()
+        plan = validator.compile()
+
+        assert validator.compile() is plan
+
+        validator.disable_rule("minimum_detail")
+        assert validator.compile() is not plan
+
+    def test_compile_skips_disabled_and_detects_closures(self):
+        """Test a plan drops disabled rules and keeps closures in-process."""
+        validator = PersonaValidator()
+        validator.disable_rule("minimum_detail")
+
+        assert "minimum_detail" not in [name for name, _ in validator.compile().checks]
+        assert validator.compile().parallelisable
+
+        validator.add_rule(
+            ValidationRule(name="custom", description="", check=lambda p: [])
+        )
+        assert not validator.compile().parallelisable
+
     def test_disable_rule(self):
         """Test disabling a validation rule."""
         persona = Persona(id="p001", name="User")  # Generic name
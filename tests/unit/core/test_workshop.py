@@ -2,16 +2,22 @@
 Tests for workshop data import functionality (F-031).
 """
 
+import asyncio
+import io
 from pathlib import Path
 
 import pytest
 from persona.core.data import (
+    ExtractionCache,
+    LLMVisionExtractor,
     MockVisionExtractor,
     PostItNote,
     WorkshopCategory,
     WorkshopExtractionResult,
     WorkshopImportConfig,
     WorkshopImporter,
+    prepare_image,
+    workshop,
 )
 
 
@@ -379,3 +385,207 @@ class TestWorkshopImportIntegration:
 
         assert len(em.data) == 1
         assert em.data[0].participant_type == "workshop_participant"
+
+
+class SlowExtractor(MockVisionExtractor):
+    """Mock extractor recording concurrency and call count."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def extract_from_image_async(self, image_path: Path):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        # Later images finish first so completion order differs from input
+        await asyncio.sleep(self.delay * (10 - int(image_path.stem[-1])))
+        self.active -= 1
+        return self.extract_from_image(image_path)
+
+
+class TestConcurrentImport:
+    """Tests for concurrent, cached workshop extraction."""
+
+    @pytest.fixture
+    def images(self, tmp_path: Path) -> list[Path]:
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"board_tasks_{i}.jpg"
+            path.write_bytes(f"image {i}".encode())
+            paths.append(path)
+        return paths
+
+    def test_concurrency_bounded_and_order_preserved(self, images: list[Path]):
+        """Test at most max_concurrency images are in flight."""
+        extractor = SlowExtractor()
+        importer = WorkshopImporter(
+            WorkshopImportConfig(max_concurrency=2), extractor=extractor
+        )
+
+        results = importer.import_images(images)
+
+        assert extractor.max_active == 2
+        assert [r.source_image for r in results] == images
+
+    def test_on_result_called_as_results_arrive(self, images: list[Path]):
+        """Test the callback receives results in completion order."""
+        arrived: list[Path] = []
+        importer = WorkshopImporter(
+            WorkshopImportConfig(max_concurrency=6), extractor=SlowExtractor()
+        )
+
+        importer.import_images(
+            images, on_result=lambda r: arrived.append(r.source_image)
+        )
+
+        assert arrived == list(reversed(images))
+
+    def test_sync_extractor_supported(self, images: list[Path]):
+        """Test extractors without an async method still work."""
+        results = WorkshopImporter().import_images(images)
+
+        assert len(results) == 6
+
+    def test_cache_skips_repeat_extraction(self, images: list[Path], tmp_path: Path):
+        """Test unchanged images are served from the cache."""
+        config = WorkshopImportConfig(cache_dir=tmp_path / "cache")
+        extractor = SlowExtractor(delay=0)
+
+        first = WorkshopImporter(config, extractor).import_images(images)
+        second = WorkshopImporter(config, extractor).import_images(images)
+
+        assert extractor.calls == 6
+        assert [r.to_dict() for r in second] == [r.to_dict() for r in first]
+
+    def test_cache_keyed_by_content(self, tmp_path: Path):
+        """Test a copied image hits the cache under its new path."""
+        original = tmp_path / "board_tasks_1.jpg"
+        original.write_bytes(b"same")
+        copy = tmp_path / "copy" / "board_tasks_1.jpg"
+        copy.parent.mkdir()
+        copy.write_bytes(b"same")
+        config = WorkshopImportConfig(cache_dir=tmp_path / "cache")
+        extractor = SlowExtractor(delay=0)
+        importer = WorkshopImporter(config, extractor)
+
+        importer.import_images([original])
+        result = importer.import_images([copy])[0]
+
+        assert extractor.calls == 1
+        assert result.source_image == copy
+
+    def test_extraction_cache_miss(self, tmp_path: Path):
+        """Test an unknown key is a miss."""
+        cache = ExtractionCache(tmp_path)
+
+        assert cache.get(cache.key(b"data", "x"), tmp_path / "a.jpg") is None
+        assert cache.key(b"data", "x") != cache.key(b"data", "y")
+        assert cache.misses == 1
+
+
+class TestStreamedYAML:
+    """Tests for streaming YAML output."""
+
+    def test_documents_written_per_result(self, tmp_path: Path):
+        """Test each result is appended as its own YAML document."""
+        import yaml
+
+        images = []
+        for name in ["board_tasks.jpg", "board_goals.jpg"]:
+            (tmp_path / name).write_bytes(b"data")
+            images.append(tmp_path / name)
+
+        importer = WorkshopImporter()
+        stream = io.StringIO()
+        importer.import_images(
+            images, on_result=lambda r: importer.write_result_yaml(r, stream)
+        )
+
+        documents = list(yaml.safe_load_all(stream.getvalue()))
+        assert {d["source_image"] for d in documents} == {str(p) for p in images}
+        assert all("extraction_confidence" in d for d in documents)
+
+
+class TestImagePreparation:
+    """Tests for pre-upload image preparation."""
+
+    def test_passthrough_without_pillow(self, tmp_path: Path, monkeypatch):
+        """Test original bytes are sent when Pillow is unavailable."""
+        monkeypatch.setattr(workshop, "PIL_AVAILABLE", False)
+        path = tmp_path / "board.png"
+        path.write_bytes(b"png bytes")
+
+        assert prepare_image(path) == (b"png bytes", "image/png")
+
+    @pytest.mark.skipif(not workshop.PIL_AVAILABLE, reason="Pillow not installed")
+    def test_large_image_downscaled(self, tmp_path: Path):
+        """Test images above the limit are resized and recompressed."""
+        from PIL import Image
+
+        path = tmp_path / "board.png"
+        Image.new("RGB", (4000, 3000), "yellow").save(path)
+
+        data, media_type = prepare_image(path, max_dimension=1000)
+
+        assert media_type == "image/jpeg"
+        with Image.open(io.BytesIO(data)) as image:
+            assert max(image.size) == 1000
+
+    def test_llm_extractor_uses_async_provider(self, tmp_path: Path):
+        """Test the LLM extractor calls the provider's async vision API."""
+
+        class AsyncVisionProvider:
+            name = "stub"
+
+            media_types: list[str] = []
+
+            async def generate_with_image_async(
+                self, prompt: str, image: str, media_type: str
+            ):
+                self.media_types.append(media_type)
+                return '{"post_its": [{"text": "Plan", "category": "tasks"}]}'
+
+        path = tmp_path / "board.png"
+        path.write_bytes(b"data")
+        provider = AsyncVisionProvider()
+        extractor = LLMVisionExtractor(provider)
+
+        result = asyncio.run(extractor.extract_from_image_async(path))
+
+        assert result.post_its[0].text == "Plan"
+        assert provider.media_types == ["image/png"]
+        assert "stub" in extractor.cache_namespace
+
+    def test_llm_extractor_passes_media_type_to_sync_provider(self, tmp_path: Path):
+        """Test the sync path sends the media type and reads LLMResponse text."""
+        from persona.core.providers.base import LLMResponse
+
+        calls: list[str] = []
+
+        class VisionProvider:
+            def generate_with_image(self, prompt: str, image: str, media_type: str):
+                calls.append(media_type)
+                return LLMResponse(
+                    content='{"post_its": [{"text": "Note"}]}', model="stub"
+                )
+
+        path = tmp_path / "board.webp"
+        path.write_bytes(b"data")
+
+        result = LLMVisionExtractor(VisionProvider()).extract_from_image(path)
+
+        assert result.post_its[0].text == "Note"
+        assert calls == ["image/webp"]
+
+    def test_import_images_in_running_loop_raises(self, tmp_path: Path):
+        """Test the sync import refuses to run inside an event loop."""
+        importer = WorkshopImporter()
+
+        async def run() -> None:
+            importer.import_images([tmp_path / "board.jpg"])
+
+        with pytest.raises(RuntimeError, match="async context"):
+            asyncio.run(run())
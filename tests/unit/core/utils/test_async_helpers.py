@@ -6,7 +6,15 @@ import asyncio
 
 import pytest
 
-from persona.core.utils.async_helpers import is_async_context, run_sync, to_thread
+from persona.core.utils.async_helpers import (
+    BLOCKING_EXECUTOR_WORKERS,
+    get_blocking_executor,
+    is_async_context,
+    run_blocking,
+    run_sync,
+    shutdown_blocking_executor,
+    to_thread,
+)
 
 
 class TestRunSync:
@@ -139,6 +147,50 @@ class TestToThread:
         assert elapsed < 0.12
 
 
+class TestRunBlocking:
+    """Tests for the shared bounded blocking executor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_dedicated_executor(self):
+        """Test calls run on the named pool, not the default executor."""
+        import threading
+
+        name = await run_blocking(lambda: threading.current_thread().name)
+
+        assert name.startswith("persona-blocking")
+
+    @pytest.mark.asyncio
+    async def test_passes_arguments(self):
+        """Test positional and keyword arguments are forwarded."""
+
+        def greet(name: str, prefix: str = "Hello") -> str:
+            return f"{prefix}, {name}!"
+
+        assert await run_blocking(greet, "Test", prefix="Hi") == "Hi, Test!"
+
+    @pytest.mark.asyncio
+    async def test_copies_context_variables(self):
+        """Test the worker sees the caller's context variables."""
+        import contextvars
+
+        request_id: contextvars.ContextVar[str] = contextvars.ContextVar(
+            "request_id", default="unset"
+        )
+        request_id.set("req-1")
+
+        assert await run_blocking(request_id.get) == "req-1"
+
+    def test_executor_is_bounded_and_shared(self):
+        """Test one bounded executor is reused until shut down."""
+        executor = get_blocking_executor()
+
+        assert get_blocking_executor() is executor
+        assert executor._max_workers == BLOCKING_EXECUTOR_WORKERS
+
+        shutdown_blocking_executor()
+        assert get_blocking_executor() is not executor
+
+
 class TestImports:
     """Tests for module imports."""
 
@@ -0,0 +1,92 @@
+"""
+Tests for incremental JSON record scanning.
+"""
+
+import json
+
+import pytest
+
+from persona.core.utils import StreamingJSONParser
+
+PERSONAS = [
+    {"id": "p1", "name": "Alice", "quote": "I use {braces} and [brackets]"},
+    {"id": "p2", "name": "Bob", "quote": 'She said "hi" \\ bye'},
+    {"id": "p3", "name": "Carol", "goals": [{"nested": True}]},
+]
+
+
+def scan(text: str, size: int) -> tuple[list, StreamingJSONParser]:
+    """Feed text in fixed-size chunks and collect all records."""
+    parser = StreamingJSONParser()
+    records = []
+    for start in range(0, len(text), size):
+        records.extend(parser.feed(text[start : start + size]))
+    records.extend(parser.close())
+    return records, parser
+
+
+class TestStreamingJSONParser:
+    """Tests for StreamingJSONParser."""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 4096])
+    def test_array_any_chunking(self, size):
+        """Test records are identical however the text is split."""
+        records, parser = scan(json.dumps(PERSONAS), size)
+
+        assert records == PERSONAS
+        assert parser.complete
+        assert not parser.truncated
+
+    @pytest.mark.parametrize("size", [1, 5, 4096])
+    def test_personas_key_with_fences_and_reasoning(self, size):
+        """Test text around the payload is skipped."""
+        text = (
+            "<reasoning>Looking at [the data] and {themes}</reasoning>\n"
+            "<output>```json\n"
+            + json.dumps({"personas": PERSONAS, "meta": [{"id": "x"}]})
+            + "\n```</output>"
+        )
+
+        records, _ = scan(text, size)
+
+        assert records == PERSONAS
+
+    def test_records_yielded_when_closed(self):
+        """Test a record is returned by the chunk that closes it."""
+        parser = StreamingJSONParser()
+
+        assert parser.feed('[{"id": "p1"') == []
+        assert parser.feed('}, {"id"') == [{"id": "p1"}]
+        assert parser.feed(': "p2"}]') == [{"id": "p2"}]
+
+    def test_truncated_tail(self):
+        """Test completed records survive a truncated response."""
+        text = json.dumps(PERSONAS)[:-30]
+
+        records, parser = scan(text, 16)
+
+        assert records == PERSONAS[:2]
+        assert parser.truncated
+
+    def test_single_object_returned_on_close(self):
+        """Test a lone object is returned once the stream ends."""
+        parser = StreamingJSONParser()
+
+        assert parser.feed('{"id": "p1", "name": "Alice"}') == []
+        assert parser.close() == [{"id": "p1", "name": "Alice"}]
+
+    def test_no_json(self):
+        """Test text without JSON yields nothing."""
+        records, parser = scan("No personas here.", 4)
+
+        assert records == []
+        assert not parser.started
+
+    def test_large_stream_buffer_bounded(self):
+        """Test consumed text is dropped from the buffer."""
+        personas = [{"id": f"p{i}", "bio": "x" * 500} for i in range(200)]
+
+        records, parser = scan(json.dumps(personas), 64)
+
+        assert records == personas
+        assert len(parser._buffer) < 16384
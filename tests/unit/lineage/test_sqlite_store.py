@@ -1,5 +1,6 @@
 """Tests for SQLite lineage store."""
 
+import sqlite3
 import tempfile
 from pathlib import Path
 
@@ -501,3 +502,119 @@ class TestContextManager:
                 assert entity_id.startswith("ent-")
         finally:
             db_path.unlink()
+
+
+class TestBatchRecording:
+    """Tests for bulk lineage recording."""
+
+    def _agent(self, store):
+        return store.get_or_create_agent("cli_tool", "persona", version="1.0")
+
+    def test_batch_records_graph(self, store):
+        """Test a batch writes entities, activities and links together."""
+        agent_id = self._agent(store)
+
+        with store.batch() as batch:
+            input_id = batch.create_entity(
+                entity_type="input_file",
+                name="data.csv",
+                hash=hash_content("data"),
+            )
+            activity_id = batch.create_activity(
+                activity_type="llm_generation",
+                name="Generate",
+                agent_id=agent_id,
+                used_entities=[input_id],
+            )
+            outputs = [
+                batch.create_entity(
+                    entity_type="persona",
+                    name=f"Persona {i}",
+                    hash=hash_content(f"persona {i}"),
+                )
+                for i in range(50)
+            ]
+            batch.complete_activity(activity_id, generated_entities=outputs)
+            assert store.get_entity(input_id) is None
+
+        activity = store.get_activity(activity_id)
+        assert activity.status == "completed"
+        assert activity.used_entities == [input_id]
+        assert sorted(activity.generated_entities) == sorted(outputs)
+        assert store.get_entity(outputs[0]).generated_by == activity_id
+
+        ancestors = store.get_ancestors(outputs[0])
+        assert input_id in {e.entity_id for e in ancestors.entities}
+        descendants = store.get_descendants(input_id)
+        assert len(descendants.entities) == 51
+
+    def test_batch_discarded_on_error(self, store):
+        """Test nothing is written when the block raises."""
+        with pytest.raises(RuntimeError):
+            with store.batch() as batch:
+                batch.create_entity(
+                    entity_type="input_file",
+                    name="data.csv",
+                    hash=hash_content("data"),
+                )
+                raise RuntimeError("abort")
+
+        assert store.list_entities() == []
+
+    def test_batch_is_atomic(self, store):
+        """Test a failing row rolls back the whole batch."""
+        with pytest.raises(sqlite3.IntegrityError):
+            with store.batch() as batch:
+                batch.create_entity(
+                    entity_type="input_file",
+                    name="data.csv",
+                    hash=hash_content("data"),
+                )
+                batch.create_activity(
+                    activity_type="llm_generation",
+                    name="Generate",
+                    agent_id="agt-missing",
+                )
+
+        assert store.list_entities() == []
+
+    def test_explicit_flush(self, store):
+        """Test flush writes buffered rows and empties the batch."""
+        with store.batch() as batch:
+            batch.create_entity(
+                entity_type="input_file",
+                name="data.csv",
+                hash=hash_content("data"),
+            )
+            assert batch.pending == 1
+            assert batch.flush() == 1
+            assert batch.pending == 0
+            assert len(store.list_entities()) == 1
+
+    def test_wal_mode(self, store):
+        """Test the database uses write-ahead logging."""
+        with store._get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_reader_not_blocked_by_writer(self, store):
+        """Test another connection can read while a write is in progress."""
+        entity_id = store.create_entity(
+            entity_type="input_file",
+            name="data.csv",
+            hash=hash_content("data"),
+        )
+
+        with store._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE lineage_entities SET name = 'renamed' WHERE entity_id = ?",
+                (entity_id,),
+            )
+
+            reader = SQLiteLineageStore(store._db_path, busy_timeout=0.1)
+            try:
+                assert reader.get_entity(entity_id).name == "data.csv"
+            finally:
+                reader.close()
+            conn.rollback()
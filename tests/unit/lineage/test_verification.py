@@ -0,0 +1,160 @@
+"""Tests for lineage integrity verification."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from persona.core.lineage import (
+    HashCache,
+    IntegrityVerifier,
+    LineageEntity,
+    SQLiteLineageStore,
+    hash_content,
+    hash_file,
+    hashing,
+)
+
+
+def _settled_file(path: Path, content: str) -> Path:
+    """Write a file and backdate it outside the racy window."""
+    path.write_text(content)
+    past = time.time() - 60
+    os.utime(path, (past, past))
+    return path
+
+
+def _entity(entity_id: str, path: Path | None, content: str) -> LineageEntity:
+    return LineageEntity(
+        entity_id=entity_id,
+        entity_type="input_file",
+        name=entity_id,
+        hash=hash_content(content),
+        path=str(path) if path else None,
+    )
+
+
+class TestHashFile:
+    """Tests for buffered and memory-mapped file hashing."""
+
+    def test_mmap_matches_buffered(self, tmp_path, monkeypatch):
+        """Test both read strategies produce the same hash."""
+        path = tmp_path / "data.bin"
+        content = os.urandom(300_000)
+        path.write_bytes(content)
+        expected = "sha256:" + hashlib.sha256(content).hexdigest()
+
+        assert hash_file(path) == expected
+        monkeypatch.setattr(hashing, "MMAP_THRESHOLD", 1)
+        assert hash_file(path) == expected
+
+    def test_empty_file(self, tmp_path):
+        """Test empty files hash like empty content."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        assert hash_file(path) == hash_content(b"")
+
+
+class TestIntegrityVerifier:
+    """Tests for IntegrityVerifier."""
+
+    def test_shared_file_hashed_once(self, tmp_path):
+        """Test entities sharing a file trigger a single hash."""
+        path = _settled_file(tmp_path / "shared.csv", "data")
+        entities = [_entity(f"ent-{i}", path, "data") for i in range(5)]
+
+        verifier = IntegrityVerifier()
+        results = verifier.verify_entities(entities)
+
+        assert all(r["verified"] for r in results)
+        assert verifier.stats.files == 1
+        assert verifier.stats.files_hashed == 1
+
+    def test_parallel_results_in_order(self, tmp_path):
+        """Test concurrent hashing keeps results aligned with entities."""
+        entities = []
+        for i in range(6):
+            path = _settled_file(tmp_path / f"file{i}.txt", f"content {i}")
+            stored = "tampered" if i == 3 else f"content {i}"
+            entities.append(_entity(f"ent-{i}", path, stored))
+
+        results = IntegrityVerifier(max_workers=4).verify_entities(entities)
+
+        assert [r["entity_id"] for r in results] == [e.entity_id for e in entities]
+        assert [r["verified"] for r in results] == [True] * 3 + [False] + [True] * 2
+        assert "Hash mismatch" in results[3]["error"]
+
+    def test_missing_and_unverifiable(self, tmp_path):
+        """Test missing files fail and path-less entities pass."""
+        results = IntegrityVerifier().verify_entities(
+            [
+                _entity("ent-missing", tmp_path / "missing.csv", "x"),
+                _entity("ent-nopath", None, "x"),
+            ]
+        )
+
+        assert results[0]["verified"] is False
+        assert "File not found" in results[0]["error"]
+        assert results[1]["verified"] is True
+        assert "note" in results[1]
+
+    def test_persistent_cache_skips_unchanged(self, tmp_path):
+        """Test a later run reuses hashes of unchanged files only."""
+        cache_path = tmp_path / "hashes.json"
+        same = _settled_file(tmp_path / "same.csv", "unchanged")
+        changed = _settled_file(tmp_path / "changed.csv", "before")
+        entities = [
+            _entity("ent-same", same, "unchanged"),
+            _entity("ent-changed", changed, "before"),
+        ]
+
+        first = HashCache(cache_path)
+        IntegrityVerifier(cache=first).verify_entities(entities)
+        first.save()
+
+        _settled_file(changed, "after edit")
+        verifier = IntegrityVerifier(cache=HashCache(cache_path))
+        results = verifier.verify_entities(entities)
+
+        assert verifier.stats.cache_hits == 1
+        assert verifier.stats.files_hashed == 1
+        assert results[0]["verified"] is True
+        assert results[1]["verified"] is False
+
+    def test_recently_modified_file_rehashed(self, tmp_path):
+        """Test files modified within the racy window are not cached."""
+        path = tmp_path / "fresh.csv"
+        path.write_text("fresh")
+        cache = HashCache()
+
+        IntegrityVerifier(cache=cache).verify_entities([_entity("e", path, "fresh")])
+        verifier = IntegrityVerifier(cache=cache)
+        verifier.verify_entities([_entity("e", path, "fresh")])
+
+        assert verifier.stats.cache_hits == 0
+
+    def test_store_verify_chain_reports_stats(self, tmp_path):
+        """Test verify_chain uses the verifier and reports its stats."""
+        path = _settled_file(tmp_path / "input.csv", "data")
+        with SQLiteLineageStore(tmp_path / "lineage.db") as store:
+            agent = store.get_or_create_agent("cli_tool", "persona")
+            input_id = store.create_entity(
+                "input_file", "input.csv", hash_content("data"), path=str(path)
+            )
+            activity = store.create_activity(
+                "llm_generation", "generate", agent, used_entities=[input_id]
+            )
+            output_id = store.create_entity(
+                "persona",
+                "persona",
+                hash_content("p"),
+                path=str(path),
+                generated_by=activity,
+            )
+
+            result = store.verify_chain(output_id)
+
+        assert result["entities_checked"] == 2
+        assert result["stats"]["files"] == 1
+        assert result["entities_invalid"] == [output_id]
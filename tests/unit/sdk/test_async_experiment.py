@@ -2,7 +2,7 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from persona.sdk import AsyncExperimentSDK, ExperimentConfig, PersonaConfig
@@ -339,7 +339,8 @@ class TestAsyncExperimentSDKGenerate:
                 mock_result.model = "test-model"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = [source]
-                mock_instance.generate.return_value = mock_result
+                mock_result.truncated = False
+                mock_instance.generate_async = AsyncMock(return_value=mock_result)
 
                 result = await sdk.agenerate("gen-test")
 
@@ -366,7 +367,8 @@ class TestAsyncExperimentSDKGenerate:
                 mock_result.model = "test-model"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = [source]
-                mock_instance.generate.return_value = mock_result
+                mock_result.truncated = False
+                mock_instance.generate_async = AsyncMock(return_value=mock_result)
 
                 custom_config = PersonaConfig(count=10, complexity="complex")
                 result = await sdk.agenerate("gen-test", config=custom_config)
@@ -3,7 +3,7 @@
 import asyncio
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from persona.sdk import AsyncPersonaGenerator, PersonaConfig
@@ -114,13 +114,14 @@ class TestAsyncPersonaGeneratorGenerate:
                 mock_result.model = "test-model"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = [Path(f.name)]
-                mock_instance.generate.return_value = mock_result
+                mock_result.truncated = False
+                mock_instance.generate_async = AsyncMock(return_value=mock_result)
 
                 config = PersonaConfig(count=5)
                 result = await generator.agenerate(f.name, config=config)
 
                 assert result is not None
-                mock_instance.generate.assert_called_once()
+                mock_instance.generate_async.assert_awaited_once()
 
             Path(f.name).unlink()
 
@@ -143,7 +144,8 @@ class TestAsyncPersonaGeneratorGenerate:
                 mock_result.model = "test-model"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = [Path(f.name)]
-                mock_instance.generate.return_value = mock_result
+                mock_result.truncated = False
+                mock_instance.generate_async = AsyncMock(return_value=mock_result)
 
                 result = await generator.agenerate(f.name)
                 assert result is not None
@@ -162,7 +164,9 @@ class TestAsyncPersonaGeneratorGenerate:
 
             with patch("persona.core.generation.GenerationPipeline") as MockPipeline:
                 mock_instance = MockPipeline.return_value
-                mock_instance.generate.side_effect = Exception("Unexpected error")
+                mock_instance.generate_async = AsyncMock(
+                    side_effect=Exception("Unexpected error")
+                )
 
                 with pytest.raises(GenerationError):
                     await generator.agenerate(temp_path)
@@ -198,9 +202,10 @@ class TestAsyncPersonaGeneratorBatch:
                     mock_result.model = "test-model"
                     mock_result.provider = "anthropic"
                     mock_result.source_files = [data_path]
+                    mock_result.truncated = False
                     return mock_result
 
-                mock_instance.generate.side_effect = create_mock_result
+                mock_instance.generate_async = AsyncMock(side_effect=create_mock_result)
 
                 results = await generator.agenerate_batch(
                     files,
@@ -209,7 +214,7 @@ class TestAsyncPersonaGeneratorBatch:
                 )
 
                 assert len(results) == 3
-                assert mock_instance.generate.call_count == 3
+                assert mock_instance.generate_async.await_count == 3
 
     @pytest.mark.asyncio
     async def test_agenerate_batch_respects_concurrency_limit(self):
@@ -240,16 +245,17 @@ class TestAsyncPersonaGeneratorBatch:
                     mock_result.model = "test-model"
                     mock_result.provider = "anthropic"
                     mock_result.source_files = [data_path]
+                    mock_result.truncated = False
                     concurrent_count -= 1
                     return mock_result
 
-                mock_instance.generate.side_effect = create_mock_result
+                mock_instance.generate_async = AsyncMock(side_effect=create_mock_result)
 
                 await generator.agenerate_batch(files, max_concurrent=2)
 
                 # Due to threading, we can't guarantee exact concurrency
                 # but the semaphore should limit it
-                assert mock_instance.generate.call_count == 5
+                assert mock_instance.generate_async.await_count == 5
 
 
 class TestAsyncPersonaGeneratorEstimateCost:
@@ -320,9 +326,10 @@ class TestAGenerateParallel:
                     mock_result.model = "test-model"
                     mock_result.provider = "openai"
                     mock_result.source_files = [data_path]
+                    mock_result.truncated = False
                     return mock_result
 
-                mock_instance.generate.side_effect = create_mock_result
+                mock_instance.generate_async = AsyncMock(side_effect=create_mock_result)
 
                 results = await agenerate_parallel(
                     files,
@@ -372,7 +379,8 @@ class TestAsyncProgressCallback:
                 mock_result.model = "test"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = []
-                mock_instance.generate.return_value = mock_result
+                mock_result.truncated = False
+                mock_instance.generate_async = AsyncMock(return_value=mock_result)
 
                 await generator.agenerate(f.name)
 
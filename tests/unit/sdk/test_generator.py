@@ -128,6 +128,7 @@ class TestPersonaGeneratorGenerate:
                 mock_result.model = "test-model"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = [Path(f.name)]
+                mock_result.truncated = False
                 mock_instance.generate.return_value = mock_result
 
                 config = PersonaConfig(count=5)
@@ -210,6 +211,7 @@ class TestPersonaGeneratorGenerate:
                 mock_result.model = "test-model"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = [Path(f.name)]
+                mock_result.truncated = False
                 mock_instance.generate.return_value = mock_result
 
                 # No config provided
@@ -298,6 +300,7 @@ class TestPersonaGeneratorIntegration:
                 mock_result.model = "claude-sonnet-4.5"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = [data_file]
+                mock_result.truncated = False
                 mock_instance.generate.return_value = mock_result
 
                 result = generator.generate(data_file, config=PersonaConfig(count=3))
@@ -341,6 +344,7 @@ class TestPersonaGeneratorIntegration:
                 mock_result.model = "test"
                 mock_result.provider = "anthropic"
                 mock_result.source_files = []
+                mock_result.truncated = False
                 mock_instance.generate.return_value = mock_result
 
                 generator.generate(f.name)
@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 
 import pytest
+from persona.core.generation.compact import CompactPersona
 from persona.sdk.models import (
     ComplexityLevel,
     DetailLevel,
@@ -220,6 +221,33 @@ class TestPersonaModel:
         assert parsed["id"] == "p-001"
         assert parsed["name"] == "Test"
 
+    def test_compact_round_trip(self):
+        """Test conversion to and from CompactPersona."""
+        persona = PersonaModel(
+            id="p-001",
+            name="Test",
+            title="Analyst",
+            goals=["Goal 1"],
+            demographics={"age": 30},
+        )
+
+        compact = persona.to_compact()
+        restored = PersonaModel.from_compact(compact)
+
+        assert compact.goals == ("Goal 1",)
+        assert restored.to_dict() == persona.to_dict() | {
+            "title": "",
+            "additional": {"title": "Analyst"},
+        }
+        assert restored == PersonaModel.from_core_persona(compact.to_persona())
+
+    def test_from_compact_validates(self):
+        """Test invalid compact values are rejected."""
+        compact = CompactPersona(id="p-001", name="Test", goals=[42])
+
+        with pytest.raises(PydanticValidationError):
+            PersonaModel.from_compact(compact)
+
 
 class TestTokenUsageModel:
     """Tests for TokenUsageModel."""
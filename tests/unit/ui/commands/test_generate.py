@@ -30,6 +30,60 @@ class TestGenerateCommand:
         assert result.exit_code == 0
         assert "--all" in result.output
 
+    def test_generate_help_shows_models_option(self):
+        """Test that --models option appears in help."""
+        result = runner.invoke(app, ["generate", "--help"])
+        assert result.exit_code == 0
+        assert "--models" in result.output
+
+    def test_generate_rejects_invalid_models(self, tmp_path):
+        """Test that an unparseable --models entry exits with an error."""
+        data = tmp_path / "data.csv"
+        data.write_text("a,b\n1,2\n")
+
+        result = runner.invoke(
+            app, ["generate", "--from", str(data), "--models", "mystery-model"]
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid --models value" in result.output
+        assert "mystery-model" in result.output
+
+    def test_cache_closed_when_command_exits(self, tmp_path):
+        """Test the --cache response cache is closed when the command ends."""
+        data = tmp_path / "data.csv"
+        data.write_text("a,b\n1,2\n")
+
+        with patch("persona.ui.commands.generate.ResponseCache") as cache_cls:
+            result = runner.invoke(
+                app,
+                ["generate", "--from", str(data), "--cache", "--models", "bad"],
+            )
+
+        assert result.exit_code == 1
+        cache_cls.return_value.close.assert_called_once()
+
+    def test_cache_warns_for_sampled_requests(self):
+        """Test --cache warns when the temperature rules out caching."""
+        from persona.ui.commands.generate import _make_response_cache
+
+        console = MagicMock()
+        with patch("persona.ui.commands.generate.ResponseCache"):
+            _make_response_cache(console, True, temperature=0.7)
+            _make_response_cache(console, True, cache_sampled=True, temperature=0.7)
+            _make_response_cache(console, True, temperature=0.0)
+
+        console.print.assert_called_once()
+        assert "--temperature 0" in console.print.call_args.args[0]
+
+    def test_dedupe_uses_output_blob_store(self, tmp_path):
+        """Test --dedupe saves artefacts through the shared blob store."""
+        from persona.ui.commands.generate import _make_output_manager
+
+        assert _make_output_manager(tmp_path).blob_store is None
+        manager = _make_output_manager(tmp_path, dedupe=True)
+        assert manager.blob_store.root == tmp_path / ".blobs"
+
 
 class TestOllamaModelSelection:
     """Tests for Ollama model selection helper."""
@@ -122,3 +176,97 @@ class TestMultiModelGeneration:
                     # Verify dry run message was printed
                     call_args = [str(call) for call in console.print.call_args_list]
                     assert any("Dry run" in str(arg) for arg in call_args)
+
+
+class StubAsyncProvider:
+    """Provider stub answering every request with one persona."""
+
+    name = "stub"
+    default_model = "stub-model"
+
+    def __init__(self):
+        self.prompts = []
+
+    def is_configured(self):
+        return True
+
+    async def generate_async(
+        self, prompt, model=None, max_tokens=4096, temperature=0.7, **kwargs
+    ):
+        import json
+
+        from persona.core.providers.base import LLMResponse
+
+        self.prompts.append(prompt)
+        persona = {"id": "p1", "name": f"Persona from {model}"}
+        return LLMResponse(
+            content=json.dumps({"personas": [persona]}),
+            model=model,
+            input_tokens=100,
+            output_tokens=50,
+        )
+
+
+class TestMultiModelGenerator:
+    """Tests for --models generation through MultiModelGenerator."""
+
+    def _run(self, tmp_path, provider, **kwargs):
+        from persona.core.multimodel import ModelSpec
+        from persona.ui.commands.generate import _handle_multi_model_generation
+
+        data_file = tmp_path / "data.csv"
+        data_file.write_text("a,b\n1,2\n")
+
+        with (
+            patch("persona.ui.commands.generate.ProviderFactory") as factory,
+            patch("persona.ui.commands.generate.DataLoader") as loader_cls,
+        ):
+            factory.create.return_value = provider
+            loader = loader_cls.return_value
+            loader.load_path.return_value = ("interview text", [data_file])
+            loader.count_tokens.return_value = 10
+
+            _handle_multi_model_generation(
+                console=MagicMock(),
+                data_path=data_file,
+                output=tmp_path / "out",
+                count=1,
+                workflow="default",
+                experiment=None,
+                dry_run=False,
+                no_progress=True,
+                anonymise=False,
+                anonymise_strategy="redact",
+                verify=False,
+                verify_models=None,
+                verify_threshold=0.7,
+                model_specs=[ModelSpec("openai", "a"), ModelSpec("openai", "b")],
+                **kwargs,
+            )
+
+        return loader
+
+    def test_loads_data_once_and_saves_each_model(self, tmp_path):
+        """Test the data is loaded once and every model's output is saved."""
+        provider = StubAsyncProvider()
+
+        loader = self._run(tmp_path, provider)
+
+        assert loader.load_path.call_count == 1
+        assert len(provider.prompts) == 2
+        assert all("interview text" in p for p in provider.prompts)
+        outputs = sorted(p.name for p in (tmp_path / "out").iterdir())
+        assert outputs == ["multi-model-openai-a", "multi-model-openai-b"]
+
+    def test_response_cache_wraps_providers(self, tmp_path):
+        """Test a repeated deterministic run is served from the cache."""
+        from persona.core.providers import ResponseCache
+
+        provider = StubAsyncProvider()
+        cache = ResponseCache(tmp_path / "cache.db")
+
+        self._run(tmp_path, provider, temperature=0.0, response_cache=cache)
+        self._run(tmp_path, provider, temperature=0.0, response_cache=cache)
+
+        assert len(provider.prompts) == 2
+        assert cache.stats.hits == 2
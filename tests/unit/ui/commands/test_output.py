@@ -0,0 +1,78 @@
+"""Tests for output maintenance CLI commands."""
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+from persona.core.generation.parser import Persona
+from persona.core.generation.pipeline import GenerationResult
+from persona.core.output import OutputManager
+from persona.ui.cli import app
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def _save(manager: OutputManager, name: str, prompt: str = "Prompt") -> Path:
+    """Save a minimal generation result."""
+    result = GenerationResult(
+        personas=[Persona(id="p001", name="Test")],
+        model="test",
+        provider="test",
+        prompt=prompt,
+        raw_response="Response body",
+    )
+    return manager.save(result, name=name)
+
+
+class TestOutputMigrate:
+    """Tests for output migrate command."""
+
+    def test_migrate_inline_outputs(self, tmp_path: Path):
+        """Test inline artefacts move into the shared blob store."""
+        for name in ("run-1", "run-2"):
+            _save(OutputManager(base_dir=tmp_path), name)
+
+        result = runner.invoke(app, ["output", "migrate", "--dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Migrated 4 files from 2 outputs" in result.output
+        assert not (tmp_path / "run-1" / "prompt.txt").exists()
+        manager = OutputManager.with_blob_store(tmp_path)
+        assert manager.load_artefact(tmp_path / "run-2", "prompt.txt") == "Prompt"
+
+    def test_migrate_nothing(self, tmp_path: Path):
+        """Test migrating a directory without inline artefacts."""
+        result = runner.invoke(app, ["output", "migrate", "--dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "No inline artefacts" in result.output
+
+    def test_migrate_invalid_compression(self, tmp_path: Path):
+        """Test an unknown compression is rejected."""
+        result = runner.invoke(
+            app, ["output", "migrate", "--dir", str(tmp_path), "-c", "lz4"]
+        )
+
+        assert result.exit_code == 1
+        assert "Error" in result.output
+
+
+class TestOutputGc:
+    """Tests for output gc command."""
+
+    def test_gc_removes_unreferenced_blobs(self, tmp_path: Path):
+        """Test blobs of deleted outputs are collected."""
+        manager = OutputManager.with_blob_store(tmp_path)
+        _save(manager, "run-a", prompt="Prompt A")
+        shutil.rmtree(_save(manager, "run-b", prompt="Prompt B"))
+        past = time.time() - 3600
+        for info in manager.blob_store.iter_blobs():
+            os.utime(info.path, (past, past))
+
+        result = runner.invoke(app, ["output", "gc", "--dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Removed 1 unreferenced blobs" in result.output
+        assert manager.load_artefact(tmp_path / "run-a", "prompt.txt") == "Prompt A"
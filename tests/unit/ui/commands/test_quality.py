@@ -0,0 +1,97 @@
+"""
+Tests for the quality score CLI command.
+"""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from persona.core.quality.base import QualityMetric
+from persona.core.quality.models import DimensionScore
+from persona.ui.cli import app
+
+
+class StubMetric(QualityMetric):
+    """Additional metric with a fixed score."""
+
+    @property
+    def name(self) -> str:
+        return "stub"
+
+    @property
+    def requires_source_data(self) -> bool:
+        return False
+
+    @property
+    def requires_other_personas(self) -> bool:
+        return False
+
+    @property
+    def requires_evidence_report(self) -> bool:
+        return False
+
+    def evaluate(
+        self, persona, source_data=None, other_personas=None, evidence_report=None
+    ):
+        return DimensionScore(dimension=self.name, score=75.0, weight=0.0)
+
+
+class SourceOnlyMetric(StubMetric):
+    """Additional metric that needs source data."""
+
+    @property
+    def name(self) -> str:
+        return "source_only"
+
+    @property
+    def requires_source_data(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def runner():
+    """Create CLI test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def personas_file(tmp_path):
+    """Create a personas file."""
+    personas = [
+        {"id": "p1", "name": "Alice", "goals": ["Learn"]},
+        {"id": "p2", "name": "Bob", "goals": ["Teach"]},
+    ]
+    path = tmp_path / "personas.json"
+    path.write_text(json.dumps(personas))
+    return path
+
+
+class TestScoreAll:
+    """Tests for score --all."""
+
+    def test_all_runs_additional_metrics(self, runner, personas_file, monkeypatch):
+        """Test --all reports additional metrics alongside the dimensions."""
+        monkeypatch.setattr(
+            "persona.ui.commands.quality._additional_metrics",
+            lambda *args: {"stub": StubMetric(), "source_only": SourceOnlyMetric()},
+        )
+
+        result = runner.invoke(
+            app, ["score", "--all", "--output", "json", str(personas_file)]
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)["data"]
+        metrics = {m["metric"]: m for m in data["additional_metrics"]}
+        assert metrics["stub"]["average_score"] == 75.0
+        assert metrics["stub"]["evaluated"] == 2
+        assert metrics["source_only"]["skipped"]
+        assert "average_by_dimension" in data
+
+    def test_without_all_skips_additional_metrics(self, runner, personas_file):
+        """Test the dimensions alone are reported by default."""
+        result = runner.invoke(app, ["score", "--output", "json", str(personas_file)])
+
+        assert result.exit_code == 0
+        assert "additional_metrics" not in json.loads(result.output)["data"]
@@ -0,0 +1,71 @@
+"""Tests for refine CLI commands."""
+
+import json
+from pathlib import Path
+
+from persona.core.generation.parser import Persona
+from persona.core.refinement import PersonaRefiner
+from persona.ui.cli import app
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def _write_persona(path: Path) -> Path:
+    """Write a minimal persona file."""
+    persona = Persona(id="p001", name="Alex", goals=["Ship faster"])
+    path.write_text(json.dumps(persona.to_dict()))
+    return path
+
+
+class TestRefineSessions:
+    """Tests for refine --session-dir."""
+
+    def test_versions_accumulate_across_runs(self, tmp_path: Path):
+        """Test each run continues the saved session."""
+        path = _write_persona(tmp_path / "persona.json")
+        sessions = tmp_path / "sessions"
+
+        for instruction in ("Add goal: reduce cost", "Add goal: hire well"):
+            result = runner.invoke(
+                app,
+                [
+                    "refine",
+                    "--session-dir",
+                    str(sessions),
+                    "-i",
+                    instruction,
+                    "--json",
+                    str(path),
+                ],
+            )
+            assert result.exit_code == 0, result.output
+
+        assert json.loads(result.output)["data"]["version"] == 2
+        session = PersonaRefiner(session_dir=sessions).get_session("p001")
+        assert session is not None
+        assert len(session.history.versions) == 3
+
+    def test_edited_file_starts_new_session(self, tmp_path: Path):
+        """Test a persona changed outside the session is not resumed."""
+        path = _write_persona(tmp_path / "persona.json")
+        sessions = tmp_path / "sessions"
+        args = ["refine", "--session-dir", str(sessions), "--json"]
+
+        runner.invoke(app, [*args, "-i", "Add goal: reduce cost", str(path)])
+        _write_persona(path)
+        result = runner.invoke(app, [*args, "-i", "Add goal: hire", str(path)])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["data"]["version"] == 1
+
+    def test_without_session_dir_nothing_persisted(self, tmp_path: Path):
+        """Test sessions stay in memory by default."""
+        path = _write_persona(tmp_path / "persona.json")
+
+        result = runner.invoke(
+            app, ["refine", "-i", "Add goal: reduce cost", "--json", str(path)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["persona.json"]
@@ -92,6 +92,16 @@ class TestOutputModes:
         assert result.exit_code == 0
         assert "Persona Health Check" in result.stdout
 
+    def test_profile_summary_printed_to_console(self, tmp_path: Path):
+        """Test --profile-output reports timings through the CLI console."""
+        spans = tmp_path / "spans.jsonl"
+        result = runner.invoke(app, ["--profile-output", str(spans), "check"])
+
+        assert result.exit_code == 0
+        assert "Persona Health Check" in result.stdout
+        assert "No spans recorded." in result.stdout
+        assert "Spans written to" in result.stdout
+
     def test_no_color_env_variable(self, monkeypatch):
         """Test NO_COLOR environment variable is respected."""
         monkeypatch.setenv("NO_COLOR", "1")